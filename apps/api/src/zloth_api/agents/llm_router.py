@@ -3,13 +3,13 @@
 from dataclasses import dataclass
 from typing import Any, cast
 
-import httpx
 from anthropic import AsyncAnthropic
 from anthropic.types import MessageParam
 from openai import AsyncOpenAI
 from openai.types.chat import ChatCompletionMessageParam
 
 from zloth_api.domain.enums import Provider
+from zloth_api.utils.http_client import get_shared_http_client
 
 
 @dataclass
@@ -142,15 +142,14 @@ class LLMClient:
         if system:
             request_body["systemInstruction"] = {"parts": [{"text": system}]}
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                url,
-                json=request_body,
-                params={"key": self.config.api_key},
-                timeout=120.0,
-            )
-            response.raise_for_status()
-            data = response.json()
+        response = await get_shared_http_client().post(
+            url,
+            json=request_body,
+            params={"key": self.config.api_key},
+            timeout=120.0,
+        )
+        response.raise_for_status()
+        data = response.json()
 
         # Extract text from response
         candidates = data.get("candidates", [])
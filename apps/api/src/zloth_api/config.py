@@ -8,6 +8,8 @@ from dotenv import load_dotenv
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from zloth_api.domain.enums import ExecutorType
+
 # Get project root directory (4 levels up from this file)
 _PROJECT_ROOT = Path(__file__).parent.parent.parent.parent.parent
 
@@ -62,11 +64,174 @@ class Settings(BaseSettings):
     github_app_private_key: str = Field(default="")  # Base64 encoded
     github_app_installation_id: str = Field(default="")
 
+    # Outbound HTTP client pool (GitHub API, Slack, Gemini)
+    http_client_http2: bool = Field(
+        default=True,
+        description="Negotiate HTTP/2 for outbound API calls (requires the 'h2' package)",
+    )
+    http_client_max_connections: int = Field(
+        default=20, description="Maximum concurrent connections per HTTP client pool"
+    )
+    http_client_max_keepalive_connections: int = Field(
+        default=10, description="Maximum idle keep-alive connections per HTTP client pool"
+    )
+    http_client_keepalive_expiry_seconds: float = Field(
+        default=60.0, description="Idle time before a pooled connection is closed (seconds)"
+    )
+    http_client_timeout_seconds: float = Field(
+        default=30.0, description="Default read/write/pool timeout for API calls (seconds)"
+    )
+    http_client_connect_timeout_seconds: float = Field(
+        default=10.0, description="Connect timeout for API calls (seconds)"
+    )
+
+    # GitHub API response cache (conditional requests with ETag / Last-Modified)
+    github_cache_enabled: bool = Field(
+        default=True,
+        description="Revalidate GitHub GET requests with If-None-Match; 304s are served "
+        "from cache and do not count against the primary rate limit",
+    )
+    github_cache_max_entries: int = Field(
+        default=2000, description="Maximum cached GitHub responses kept in memory (LRU)"
+    )
+    github_cache_max_mb: int = Field(
+        default=32, description="Maximum size of cached GitHub response bodies in memory (MB)"
+    )
+    github_cache_persist: bool = Field(
+        default=False,
+        description="Also persist cached GitHub responses in SQLite so they survive restarts",
+    )
+
+    # GitHub API rate governor
+    github_rate_burst: int = Field(
+        default=10, description="Burst size of the per-installation GitHub request token bucket"
+    )
+    github_rate_per_second: float = Field(
+        default=5.0,
+        description="Sustained GitHub requests per second per installation (bucket refill rate)",
+    )
+    github_rate_max_backoff_seconds: int = Field(
+        default=300, description="Upper bound for backoff after GitHub 403/429 rate limiting"
+    )
+    github_token_refresh_margin_seconds: int = Field(
+        default=300,
+        description="Refresh GitHub App installation tokens in the background this many "
+        "seconds before they expire",
+    )
+    github_installation_cache_ttl_seconds: int = Field(
+        default=600,
+        description="How long the list of GitHub App installations (owner mapping) is cached",
+    )
+    github_listing_cache_ttl_seconds: int = Field(
+        default=300,
+        description="Age after which cached repository/branch listings are refreshed in the "
+        "background (stale listings are still served immediately)",
+    )
+
     # CLI Executor Paths (optional, defaults to executable name in PATH)
     claude_cli_path: str = Field(default="claude")
     codex_cli_path: str = Field(default="codex")
     gemini_cli_path: str = Field(default="gemini")
 
+    # CLI Executor Models (passed with --model; the CLI's default model if unset)
+    claude_model: str | None = Field(default=None, description="Model used by Claude Code")
+    codex_model: str | None = Field(default=None, description="Model used by Codex")
+    gemini_model: str | None = Field(default=None, description="Model used by Gemini CLI")
+
+    # CLI Executor Admission (every claude/codex/gemini launch takes a slot)
+    executor_max_concurrent: int = Field(
+        default=8, description="Maximum CLI executor processes running at once"
+    )
+    executor_max_concurrent_per_type: dict[str, int] = Field(
+        default_factory=dict,
+        description='Per executor type limits, e.g. {"claude_code": 4, "codex_cli": 2}',
+    )
+    executor_max_concurrent_per_repo: int = Field(
+        default=4, description="Maximum CLI executor processes per repository (0 = unlimited)"
+    )
+    executor_min_available_memory_mb: int = Field(
+        default=1024,
+        description="Hold launches while less host memory than this is available (0 = off)",
+    )
+    executor_memory_per_launch_mb: int = Field(
+        default=512,
+        description="Memory assumed for a CLI that was just launched (not yet visible in "
+        "host memory stats)",
+    )
+    executor_max_load_per_cpu: float = Field(
+        default=2.0,
+        description="Hold launches while the 1-minute load average per CPU exceeds this (0 = off)",
+    )
+
+    # CLI Executor Isolation (limits apply to the whole process tree of a launch)
+    executor_isolation: str = Field(
+        default="auto",
+        description="Executor process isolation: auto, cgroup (cgroup v2), rlimit "
+        "(ulimit/nice wrapper fallback) or off",
+    )
+    executor_cgroup_root: str = Field(
+        default="/sys/fs/cgroup/zloth",
+        description="Delegated cgroup v2 directory under which per-launch cgroups are created",
+    )
+    executor_cpu_weight: int = Field(
+        default=50,
+        description="cgroup cpu.weight of executors (100 = same share as the API; "
+        "mapped to a nice level in rlimit mode)",
+    )
+    executor_memory_max_mb: int = Field(
+        default=0, description="Memory limit per executor process tree (0 = unlimited)"
+    )
+    executor_pids_max: int = Field(
+        default=4096, description="Process limit per executor tree, cgroup mode only (0 = off)"
+    )
+    executor_resource_limits: dict[str, dict[str, int]] = Field(
+        default_factory=dict,
+        description='Per executor type overrides, e.g. {"codex_cli": {"memory_max_mb": 4096}} '
+        "(keys: cpu_weight, memory_max_mb, pids_max)",
+    )
+    executor_output_memory_mb: int = Field(
+        default=8,
+        description="Raw CLI output kept in memory (and in run logs) per launch; output "
+        "beyond this is spilled to a file under data_dir/executor_output",
+    )
+    executor_idle_timeout_seconds: int = Field(
+        default=900,
+        description="Terminate a CLI that printed nothing for this long (0 = off; the "
+        "total timeout still applies)",
+    )
+    executor_stall_warning_seconds: int = Field(
+        default=120,
+        description="Report a 'stalled' event to log subscribers after this much silence (0 = off)",
+    )
+    executor_termination_grace_seconds: int = Field(
+        default=10,
+        description="Time between SIGTERM and SIGKILL when a CLI process tree is terminated",
+    )
+    executor_warm_sessions: bool = Field(
+        default=False,
+        description="Keep a long-lived CLI session per (task, executor) and feed follow-up "
+        "instructions into it instead of starting a new process (Claude Code only)",
+    )
+    executor_warm_session_ttl_seconds: int = Field(
+        default=600, description="Idle time after which a warm CLI session is recycled"
+    )
+    executor_warm_sessions_max: int = Field(
+        default=4, description="Maximum idle warm CLI sessions kept alive"
+    )
+
+    # CLI run result cache (content-addressed, opt-in)
+    executor_result_cache_enabled: bool = Field(
+        default=False,
+        description="Reuse the patch of an earlier CLI run with the same repository, "
+        "workspace tree, instruction, executor and model instead of running the CLI again",
+    )
+    executor_result_cache_ttl_seconds: int = Field(
+        default=7 * 24 * 3600, description="Age after which cached CLI run results expire"
+    )
+    executor_result_cache_max_mb: int = Field(
+        default=256, description="Maximum combined size of cached CLI run patches (MB)"
+    )
+
     # Agentic Mode Configuration
     agentic_enabled: bool = Field(default=True, description="Enable agentic mode")
     agentic_auto_merge: bool = Field(
@@ -79,9 +244,40 @@ class Settings(BaseSettings):
     agentic_max_review_iterations: int = Field(default=3, description="Max review fix iterations")
     agentic_timeout_minutes: int = Field(default=60, description="Total timeout in minutes")
 
+    # Agentic speculative coding (first coding iteration of a new task)
+    agentic_speculative_executors: list[ExecutorType] = Field(
+        default_factory=list,
+        description='Executors raced on the first coding iteration, e.g. ["claude_code", '
+        '"codex_cli"] (a type may be repeated); the first acceptable run wins and the others '
+        "are cancelled. Empty or a single entry disables speculation",
+    )
+    agentic_speculative_review: bool = Field(
+        default=False,
+        description="Also require a fast review with the minimum review score to accept a "
+        "speculative run",
+    )
+    agentic_speculative_check_command: str | None = Field(
+        default=None,
+        description="Shell command (e.g. tests and lint) that must exit 0 in a speculative "
+        "run's workspace for the run to be accepted",
+    )
+    agentic_speculative_check_timeout_seconds: int = Field(
+        default=600, description="Timeout of the speculative acceptance check command"
+    )
+
     # CI Polling Configuration
     ci_polling_interval_seconds: int = Field(
-        default=30, description="Interval between CI status polls (seconds)"
+        default=30,
+        description="Interval between CI status polls while CI is running longer than "
+        "expected (seconds)",
+    )
+    ci_watch_min_interval_seconds: int = Field(
+        default=10,
+        description="Poll interval right after a push and around the expected CI completion",
+    )
+    ci_watch_max_interval_seconds: int = Field(
+        default=120,
+        description="Longest wait between CI polls while a run is far from its expected duration",
     )
     ci_polling_timeout_minutes: int = Field(
         default=30, description="Timeout for CI polling (minutes)"
@@ -89,6 +285,19 @@ class Settings(BaseSettings):
     ci_polling_enabled: bool = Field(
         default=True, description="Enable CI polling (alternative to webhooks)"
     )
+    ci_log_excerpts_enabled: bool = Field(
+        default=True,
+        description="Download logs of failed GitHub Actions jobs and include failure excerpts "
+        "in CI-fix instructions (requires the 'actions: read' permission)",
+    )
+    ci_log_excerpt_max_chars: int = Field(
+        default=4000, description="Maximum size of the log excerpt kept per failed CI job"
+    )
+    ci_log_max_download_mb: int = Field(
+        default=20,
+        description="Scan at most this many megabytes of a CI job log for errors; the rest "
+        "is only read for the tail of the log",
+    )
 
     # Queue Configuration (architecture v2: UI-API-Queue-Worker pattern)
     queue_url: str | None = Field(
@@ -125,6 +334,14 @@ class Settings(BaseSettings):
     worker_id_prefix: str = Field(
         default="worker", description="Prefix for auto-generated worker IDs"
     )
+    worker_cancel_poll_interval_seconds: float = Field(
+        default=1.0,
+        description="Interval at which workers check for cancel requests of their running jobs",
+    )
+    worker_cancel_confirm_timeout_seconds: float = Field(
+        default=10.0,
+        description="Time a cancel waits for the worker running the job to confirm it",
+    )
     job_timeout_seconds: int = Field(
         default=600, description="Maximum time for a single job execution (10 minutes)"
     )
@@ -135,6 +352,14 @@ class Settings(BaseSettings):
 
     # Webhook
     webhook_secret: str = Field(default="", description="Webhook HMAC secret")
+    webhooks_enabled: bool = Field(
+        default=False,
+        description="Accept signed GitHub webhooks at /v1/webhooks/github; CI and PR "
+        "status polling then run at fallback intervals",
+    )
+    webhook_retention_days: int = Field(
+        default=7, description="Days to keep processed webhook deliveries in the inbox"
+    )
 
     # Merge Settings
     merge_method: str = Field(default="squash", description="Merge method: merge, squash, rebase")
@@ -147,6 +372,67 @@ class Settings(BaseSettings):
         "Clone mode provides better support for remote sync and conflict resolution.",
     )
 
+    # Large Repository Support
+    workspace_sparse_checkout: bool = Field(
+        default=True,
+        description="Apply cone-mode sparse checkout when a repo or task defines a sparse "
+        "profile. Directories touched outside the profile are hydrated lazily.",
+    )
+    workspace_partial_clone: bool = Field(
+        default=False,
+        description="Clone workspaces with --filter=blob:none so file contents are fetched "
+        "on demand. Always used for workspaces with a sparse checkout profile.",
+    )
+
+    workspace_seed_clones: bool = Field(
+        default=True,
+        description="Fetch each (repo, base branch) once into a shared seed clone and fork run "
+        "workspaces from it locally. Not used for sparse or partial-clone workspaces.",
+    )
+    workspace_seed_ttl_seconds: int = Field(
+        default=60,
+        description="A seed fetched within this window is reused without fetching again, and "
+        "runs forked from it skip their own remote sync when started within it",
+    )
+
+    # Workspace Garbage Collection
+    workspace_gc_enabled: bool = Field(
+        default=True, description="Enable the background workspace garbage collector"
+    )
+    workspace_gc_interval_seconds: int = Field(
+        default=600, description="Interval between workspace GC sweeps (seconds)"
+    )
+    workspace_quota_gb: float = Field(
+        default=50.0, description="Global disk quota for workspaces in GB (0 = unlimited)"
+    )
+    workspace_repo_quota_gb: float = Field(
+        default=0.0, description="Per-repository disk quota for workspaces in GB (0 = unlimited)"
+    )
+    workspace_idle_hours: int = Field(
+        default=72,
+        description="Workspaces of tasks without activity for this long become evictable",
+    )
+    workspace_orphan_grace_minutes: int = Field(
+        default=60,
+        description="Minimum age before a workspace directory with no DB row is reclaimed",
+    )
+    workspace_seed_expiry_hours: int = Field(
+        default=24,
+        description="Seed clones not fetched for this long are removed by the workspace GC",
+    )
+    workspace_git_gc_interval_hours: int = Field(
+        default=24, description="Run `git gc --auto` on long-lived workspaces at most this often"
+    )
+
+    # Diff Capture
+    diff_max_file_patch_kb: int = Field(
+        default=256,
+        description="Per-file cap on stored patch size (KB). Stats are kept for larger files.",
+    )
+    diff_max_run_patch_kb: int = Field(
+        default=2048, description="Cap on the combined patch stored per run (KB)"
+    )
+
     # Workspace Branch Sharing
     share_workspace_across_executors: bool = Field(
         default=False,
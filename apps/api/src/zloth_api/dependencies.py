@@ -7,8 +7,10 @@ from zloth_api.services.agentic_orchestrator import AgenticOrchestrator
 from zloth_api.services.analysis_service import AnalysisService
 from zloth_api.services.breakdown_service import BreakdownService
 from zloth_api.services.ci_check_service import CICheckService
+from zloth_api.services.ci_log_service import CILogService
 from zloth_api.services.ci_polling_service import CIPollingService
 from zloth_api.services.crypto_service import CryptoService
+from zloth_api.services.executor_result_cache import ExecutorResultCache
 from zloth_api.services.git_service import GitService
 from zloth_api.services.github_service import GitHubService
 from zloth_api.services.job_worker import JobWorker
@@ -18,11 +20,17 @@ from zloth_api.services.metrics_service import MetricsService
 from zloth_api.services.notification_service import NotificationService
 from zloth_api.services.output_manager import OutputManager
 from zloth_api.services.pr_service import PRService
-from zloth_api.services.pr_status_poller import PRStatusPoller
+from zloth_api.services.pr_status_poller import (
+    DEFAULT_POLL_INTERVAL,
+    WEBHOOK_FALLBACK_POLL_INTERVAL,
+    PRStatusPoller,
+)
 from zloth_api.services.repo_service import RepoService
 from zloth_api.services.review_service import ReviewService
 from zloth_api.services.run_service import RunService
 from zloth_api.services.settings_service import SettingsService
+from zloth_api.services.webhook_service import WebhookService
+from zloth_api.services.workspace_gc_service import WorkspaceGCService
 from zloth_api.services.workspace_service import WorkspaceService
 from zloth_api.storage.dao import (
     PRDAO,
@@ -30,6 +38,7 @@ from zloth_api.storage.dao import (
     AnalysisDAO,
     BacklogDAO,
     CICheckDAO,
+    ExecutorResultCacheDAO,
     JobDAO,
     MessageDAO,
     MetricsDAO,
@@ -38,6 +47,8 @@ from zloth_api.storage.dao import (
     RunDAO,
     TaskDAO,
     UserPreferencesDAO,
+    WebhookDeliveryDAO,
+    WorkspaceUsageDAO,
 )
 from zloth_api.storage.db import get_db
 
@@ -52,11 +63,17 @@ _review_service: ReviewService | None = None
 _notification_service: NotificationService | None = None
 _settings_service: SettingsService | None = None
 _ci_polling_service: CIPollingService | None = None
+_ci_log_service: CILogService | None = None
+_merge_gate_service: MergeGateService | None = None
 _agentic_orchestrator: AgenticOrchestrator | None = None
 _pr_status_poller: PRStatusPoller | None = None
 _pr_service: PRService | None = None
 _job_worker: JobWorker | None = None
 _sqlite_queue: SQLiteQueue | None = None
+_workspace_gc_service: WorkspaceGCService | None = None
+_github_service: GitHubService | None = None
+_webhook_service: WebhookService | None = None
+_executor_result_cache: ExecutorResultCache | None = None
 
 
 def get_crypto_service() -> CryptoService:
@@ -143,6 +160,15 @@ def get_output_manager() -> OutputManager:
     return _output_manager
 
 
+async def get_executor_result_cache() -> ExecutorResultCache:
+    """Get the CLI run result cache singleton."""
+    global _executor_result_cache
+    if _executor_result_cache is None:
+        db = await get_db()
+        _executor_result_cache = ExecutorResultCache(ExecutorResultCacheDAO(db))
+    return _executor_result_cache
+
+
 async def get_run_service() -> RunService:
     """Get the run service (singleton for queue management)."""
     global _run_service
@@ -166,6 +192,7 @@ async def get_run_service() -> RunService:
             user_preferences_dao,
             github_service,
             output_manager,
+            result_cache=await get_executor_result_cache(),
         )
     return _run_service
 
@@ -187,9 +214,12 @@ async def get_pr_service() -> PRService:
 
 
 async def get_github_service() -> GitHubService:
-    """Get the GitHub service."""
-    db = await get_db()
-    return GitHubService(db)
+    """Get the GitHub service singleton (owns the pooled GitHub API client)."""
+    global _github_service
+    if _github_service is None:
+        db = await get_db()
+        _github_service = GitHubService(db)
+    return _github_service
 
 
 async def get_user_preferences_dao() -> UserPreferencesDAO:
@@ -310,11 +340,23 @@ async def get_notification_service() -> NotificationService:
 
 
 async def get_merge_gate_service() -> MergeGateService:
-    """Get the merge gate service."""
-    github_service = await get_github_service()
-    review_dao = await get_review_dao()
-    settings_service = await get_settings_service()
-    return MergeGateService(github_service, review_dao, settings_service)
+    """Get the merge gate service singleton (shares its per-SHA CI cache)."""
+    global _merge_gate_service
+    if _merge_gate_service is None:
+        github_service = await get_github_service()
+        review_dao = await get_review_dao()
+        settings_service = await get_settings_service()
+        _merge_gate_service = MergeGateService(github_service, review_dao, settings_service)
+    return _merge_gate_service
+
+
+async def get_ci_log_service() -> CILogService:
+    """Get the CI log excerpt service singleton."""
+    global _ci_log_service
+    if _ci_log_service is None:
+        github_service = await get_github_service()
+        _ci_log_service = CILogService(github_service)
+    return _ci_log_service
 
 
 async def get_ci_polling_service() -> CIPollingService:
@@ -322,7 +364,8 @@ async def get_ci_polling_service() -> CIPollingService:
     global _ci_polling_service
     if _ci_polling_service is None:
         github_service = await get_github_service()
-        _ci_polling_service = CIPollingService(github_service)
+        ci_log_service = await get_ci_log_service()
+        _ci_polling_service = CIPollingService(github_service, ci_log_service)
     return _ci_polling_service
 
 
@@ -363,7 +406,10 @@ async def get_pr_status_poller() -> PRStatusPoller:
     if _pr_status_poller is None:
         pr_dao = await get_pr_dao()
         github_service = await get_github_service()
-        _pr_status_poller = PRStatusPoller(pr_dao, github_service)
+        poll_interval = (
+            WEBHOOK_FALLBACK_POLL_INTERVAL if settings.webhooks_enabled else DEFAULT_POLL_INTERVAL
+        )
+        _pr_status_poller = PRStatusPoller(pr_dao, github_service, poll_interval=poll_interval)
     return _pr_status_poller
 
 
@@ -380,7 +426,17 @@ async def get_ci_check_service() -> CICheckService:
     task_dao = await get_task_dao()
     repo_dao = await get_repo_dao()
     github_service = await get_github_service()
-    return CICheckService(ci_check_dao, pr_dao, task_dao, repo_dao, github_service)
+    ci_polling_service = await get_ci_polling_service()
+    ci_log_service = await get_ci_log_service()
+    return CICheckService(
+        ci_check_dao,
+        pr_dao,
+        task_dao,
+        repo_dao,
+        github_service,
+        ci_polling_service,
+        ci_log_service,
+    )
 
 
 async def get_metrics_dao() -> MetricsDAO:
@@ -405,3 +461,38 @@ async def get_analysis_service() -> AnalysisService:
     """Get the analysis service."""
     analysis_dao = await get_analysis_dao()
     return AnalysisService(analysis_dao)
+
+
+async def get_workspace_usage_dao() -> WorkspaceUsageDAO:
+    """Get Workspace usage DAO."""
+    db = await get_db()
+    return WorkspaceUsageDAO(db)
+
+
+async def get_workspace_gc_service() -> WorkspaceGCService:
+    """Get the workspace garbage collector singleton."""
+    global _workspace_gc_service
+    if _workspace_gc_service is None:
+        usage_dao = await get_workspace_usage_dao()
+        _workspace_gc_service = WorkspaceGCService(
+            usage_dao,
+            get_workspace_service(),
+            get_git_service(),
+        )
+    return _workspace_gc_service
+
+
+async def get_webhook_service() -> WebhookService:
+    """Get the GitHub webhook ingestion service singleton."""
+    global _webhook_service
+    if _webhook_service is None:
+        db = await get_db()
+        _webhook_service = WebhookService(
+            WebhookDeliveryDAO(db),
+            await get_pr_dao(),
+            await get_ci_check_dao(),
+            await get_ci_polling_service(),
+            await get_pr_status_poller(),
+            await get_ci_check_service(),
+        )
+    return _webhook_service
@@ -142,6 +142,23 @@ class PRUpdateMode(str, Enum):
     TITLE = "title"  # Update title only
 
 
+class GitHubRequestPriority(str, Enum):
+    """Scheduling priority of a GitHub API request (highest first)."""
+
+    USER = "user"  # Interactive, user-facing requests
+    MERGE_GATE = "merge_gate"  # Merge condition checks and merges
+    CI_POLLING = "ci_polling"  # CI status polling
+    BACKGROUND = "background"  # Background PR status polling
+
+
+class ExecutorPriority(str, Enum):
+    """Admission priority of a CLI executor launch (highest first)."""
+
+    USER = "user"  # A user waits on the output (breakdowns, PR descriptions)
+    RUN = "run"  # Coding runs
+    REVIEW = "review"  # Code reviews
+
+
 class ReviewSeverity(str, Enum):
     """Review feedback severity level."""
 
@@ -1,7 +1,7 @@
 """Pydantic domain models for zloth API."""
 
 from datetime import datetime
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -11,7 +11,9 @@ from zloth_api.domain.enums import (
     BrokenDownTaskType,
     CodingMode,
     EstimatedSize,
+    ExecutorPriority,
     ExecutorType,
+    GitHubRequestPriority,
     JobKind,
     JobStatus,
     MessageRole,
@@ -48,6 +50,7 @@ class Job(BaseModel):
     locked_at: datetime | None = None
     locked_by: str | None = None
     last_error: str | None = None
+    cancel_requested_at: datetime | None = None
     created_at: datetime
     updated_at: datetime
 
@@ -73,12 +76,23 @@ class Repo(BaseModel):
     selected_branch: str | None = None  # user-selected branch for worktree base
     latest_commit: str
     workspace_path: str
+    sparse_paths: list[str] = []  # Cone-mode sparse checkout profile (empty = full tree)
     created_at: datetime
 
     class Config:
         from_attributes = True
 
 
+class SparseProfileUpdate(BaseModel):
+    """Request for setting a sparse checkout profile on a repo or task."""
+
+    paths: list[str] = Field(
+        default_factory=list,
+        description="Directories (or files, converted to their directory) to check out. "
+        "An empty list disables sparse checkout.",
+    )
+
+
 class RepoTaskCounts(BaseModel):
     """Task counts by kanban status for a repository."""
 
@@ -129,6 +143,7 @@ class Task(BaseModel):
     base_ref: str | None = None  # Locked base branch for this task
     workspace_path: str | None = None  # Fixed workspace path for this task
     working_branch: str | None = None  # Fixed working branch for this task
+    sparse_paths: list[str] = []  # Task-specific sparse checkout profile (added to repo's)
     created_at: datetime
     updated_at: datetime
 
@@ -265,6 +280,37 @@ class FileDiff(BaseModel):
     patch: str = ""
 
 
+class RunResourceUsage(BaseModel):
+    """Resources used by the executor process tree of a run."""
+
+    isolation: str = Field(description="Isolation mode: 'cgroup' or 'rlimit'")
+    peak_memory_bytes: int | None = Field(None, description="Peak memory (RSS) of the tree")
+    cpu_user_seconds: float | None = None
+    cpu_system_seconds: float | None = None
+    io_read_bytes: int | None = None
+    io_write_bytes: int | None = None
+
+
+class ExecutionStats(BaseModel):
+    """Token usage, cost and timing of one executor invocation.
+
+    Filled from what the CLI reports in its output; fields a CLI does not
+    report stay None.
+    """
+
+    model: str | None = None
+    input_tokens: int | None = None
+    output_tokens: int | None = None
+    cache_read_tokens: int | None = None
+    cache_write_tokens: int | None = None
+    total_tokens: int | None = None
+    cost_usd: float | None = None
+    num_turns: int | None = None
+    tool_calls: int | None = None
+    wall_time_ms: int | None = Field(None, description="Time the CLI process ran")
+    api_time_ms: int | None = Field(None, description="Time spent waiting for the model API")
+
+
 class Run(BaseModel):
     """Run (model execution unit)."""
 
@@ -284,10 +330,13 @@ class Run(BaseModel):
     status: RunStatus
     summary: str | None = None
     patch: str | None = None
+    patch_truncated: bool = False  # Patch was cut at the size cap and cannot be applied
     files_changed: list[FileDiff] = []
     logs: list[str] = []
     warnings: list[str] = []
     error: str | None = None
+    resource_usage: RunResourceUsage | None = None
+    execution_stats: ExecutionStats | None = None
     created_at: datetime
     started_at: datetime | None = None
     completed_at: datetime | None = None
@@ -296,6 +345,22 @@ class Run(BaseModel):
         from_attributes = True
 
 
+class RunDiff(BaseModel):
+    """Diff view for a run, computed on demand.
+
+    ``scope="run"`` is the delta the run itself committed. ``scope="cumulative"``
+    covers all changes on the run's branch since it diverged from its base.
+    """
+
+    run_id: str
+    scope: Literal["run", "cumulative"]
+    files_changed: list[FileDiff] = []
+    patch: str = ""
+    added_lines: int = 0
+    removed_lines: int = 0
+    truncated: bool = False
+
+
 # ============================================================
 # Pull Request
 # ============================================================
@@ -402,6 +467,10 @@ class AgentConstraints(BaseModel):
         ],
         description="Git commands that are allowed for agents (including conflict resolution)",
     )
+    sparse_paths: list[str] = Field(
+        default_factory=list,
+        description="Sparse checkout profile of the workspace (empty for full checkouts)",
+    )
 
     def to_prompt(self) -> str:
         """Convert constraints to prompt format for injection into agent instructions.
@@ -412,6 +481,16 @@ class AgentConstraints(BaseModel):
         forbidden_paths_str = "\n".join(f"- {p}" for p in self.forbidden_paths)
         forbidden_commands_str = ", ".join(f"`{c}`" for c in self.forbidden_commands)
         allowed_commands_str = "\n".join(f"- `{c}`" for c in self.allowed_git_commands)
+        sparse_section = ""
+        if self.sparse_paths:
+            sparse_dirs_str = "\n".join(f"- {p}" for p in self.sparse_paths)
+            sparse_section = f"""
+### Sparse Checkout
+This workspace only contains the following directories (plus top-level files):
+{sparse_dirs_str}
+If you need to read files elsewhere, run `git sparse-checkout add <dir>` first.
+New files you create outside these directories are still picked up.
+"""
 
         return f"""## Important Constraints
 
@@ -426,7 +505,7 @@ Access to the following paths is forbidden:
 
 ### Allowed Git Commands (Read-only)
 {allowed_commands_str}
-
+{sparse_section}
 ### Response Language
 - Respond in the same language as the user's task instruction
 - If the user writes in Japanese, respond in Japanese
@@ -586,6 +665,34 @@ class GitHubRepository(BaseModel):
     private: bool
 
 
+class GitHubCacheStats(BaseModel):
+    """Statistics of the GitHub conditional-request (ETag) cache."""
+
+    enabled: bool
+    persistent: bool
+    entries: int = 0
+    size_bytes: int = 0
+    max_entries: int = 0
+    max_bytes: int = 0
+    hits: int = Field(default=0, description="304 Not Modified responses served from cache")
+    misses: int = Field(default=0, description="200 responses (new or changed resources)")
+    evictions: int = 0
+
+
+class GitHubRateLimitStatus(BaseModel):
+    """Request budget and queue state of one GitHub installation / API resource."""
+
+    installation: str
+    resource: str = Field(description="Rate limit bucket: 'core' (REST) or 'graphql'")
+    limit: int | None = None
+    remaining: int | None = None
+    reset_at: datetime | None = None
+    tokens: float = Field(description="Tokens available in the burst bucket")
+    backoff_seconds: float = Field(default=0.0, description="Remaining rate-limit backoff")
+    queue_depth: int = 0
+    queued: dict[GitHubRequestPriority, int] = Field(default_factory=dict)
+
+
 class RepoSelectRequest(BaseModel):
     """Request for selecting a repository by name."""
 
@@ -880,6 +987,7 @@ class Review(BaseModel):
     feedbacks: list[ReviewFeedbackItem] = []
     logs: list[str] = []
     error: str | None = None
+    execution_stats: ExecutionStats | None = None
     created_at: datetime
     started_at: datetime | None = None
     completed_at: datetime | None = None
@@ -965,6 +1073,15 @@ class AgenticConfig(BaseModel):
     auto_merge_enabled: bool = Field(default=True, description="Enable auto-merge")
     merge_method: str = Field(default="squash", description="Merge method: merge, squash, rebase")
     delete_branch_after_merge: bool = Field(default=True, description="Delete branch after merge")
+    speculative_executors: list[ExecutorType] | None = Field(
+        None,
+        description="Executors raced on the first coding iteration; the first acceptable "
+        "run wins (defaults to settings)",
+    )
+    speculative_review: bool | None = Field(
+        None,
+        description="Require a fast review to accept a speculative run (defaults to settings)",
+    )
 
 
 class AgenticStartRequest(BaseModel):
@@ -1051,6 +1168,28 @@ class CIWebhookResponse(BaseModel):
     failed_jobs: list[str] | None = None
 
 
+class WebhookDelivery(BaseModel):
+    """A GitHub webhook delivery stored in the inbox."""
+
+    delivery_id: str
+    event: str
+    action: str | None = None
+    payload: str
+    status: str  # "received" | "processed" | "failed"
+    error: str | None = None
+    attempts: int = 0
+    received_at: datetime
+    processed_at: datetime | None = None
+
+
+class WebhookIngestResponse(BaseModel):
+    """Response for a GitHub webhook delivery."""
+
+    status: str  # "accepted" | "duplicate" | "ignored"
+    event: str
+    delivery_id: str | None = None
+
+
 class CICheck(BaseModel):
     """CI check result record for a PR."""
 
@@ -1267,6 +1406,39 @@ class RealtimeMetrics(BaseModel):
     prs_merged_today: int = 0
 
 
+class ExecutionStatsBucket(BaseModel):
+    """Executor usage and cost of runs and reviews, aggregated by one key."""
+
+    key: str | None = Field(description="Executor type, repository ID or period start")
+    executions: int = 0
+    runs: int = 0
+    reviews: int = 0
+    cost_usd: float = 0.0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+    total_tokens: int = 0
+    tool_calls: int = 0
+    avg_cost_usd: float | None = None
+    avg_turns: float | None = None
+    avg_wall_time_seconds: float | None = None
+    avg_api_time_seconds: float | None = None
+
+
+class ExecutionCost(BaseModel):
+    """Executor usage and cost of one run or review."""
+
+    kind: Literal["run", "review"]
+    id: str
+    task_id: str
+    repo_id: str | None = None
+    executor_type: ExecutorType
+    status: str
+    created_at: datetime
+    stats: ExecutionStats
+
+
 class MetricsDetail(BaseModel):
     """Complete metrics detail response."""
 
@@ -1351,3 +1523,98 @@ class AnalysisDetail(BaseModel):
     executor_success_rates: list[ExecutorSuccessRate] = Field(default_factory=list)
     error_patterns: list[ErrorPattern] = Field(default_factory=list)
     recommendations: list[AnalysisRecommendation] = Field(default_factory=list)
+
+
+# ============================================================
+# Workspace Garbage Collection
+# ============================================================
+
+
+class WorkspaceUsage(BaseModel):
+    """Tracked disk usage of a single workspace directory."""
+
+    path: str
+    kind: str  # "task" (run workspace), "repo" (source clone)
+    repo_id: str | None = None
+    task_id: str | None = None
+    size_bytes: int = 0
+    last_used_at: datetime | None = None
+    measured_at: datetime | None = None
+    last_git_gc_at: datetime | None = None
+
+
+class RepoWorkspaceUsage(BaseModel):
+    """Aggregated workspace disk usage for a repository."""
+
+    repo_id: str
+    workspace_count: int = 0
+    size_bytes: int = 0
+    quota_bytes: int | None = None
+
+
+class WorkspaceGCStats(BaseModel):
+    """Cumulative statistics of the workspace garbage collector."""
+
+    sweeps: int = 0
+    evicted_workspaces: int = 0
+    evicted_bytes: int = 0
+    orphans_removed: int = 0
+    orphan_bytes: int = 0
+    seeds_removed: int = 0
+    seed_bytes: int = 0
+    git_gc_runs: int = 0
+    skipped_busy: int = 0
+    skipped_unpushed: int = 0
+    last_sweep_at: datetime | None = None
+    last_sweep_duration_ms: int | None = None
+    last_error: str | None = None
+
+
+class WorkspaceUsageSummary(BaseModel):
+    """Current workspace disk usage with GC statistics."""
+
+    total_bytes: int = 0
+    quota_bytes: int | None = None
+    workspace_count: int = 0
+    repos: list[RepoWorkspaceUsage] = Field(default_factory=list)
+    workspaces: list[WorkspaceUsage] = Field(default_factory=list)
+    gc: WorkspaceGCStats = Field(default_factory=WorkspaceGCStats)
+
+
+# ============================================================
+# Executor Admission
+# ============================================================
+
+
+class ExecutorResultCacheStats(BaseModel):
+    """Statistics of the CLI run result cache (counters since startup)."""
+
+    enabled: bool
+    entries: int = 0
+    size_bytes: int = 0
+    max_bytes: int = 0
+    ttl_seconds: int = 0
+    hits: int = Field(default=0, description="Runs answered with a cached patch")
+    misses: int = Field(default=0, description="Cacheable runs that had to run the CLI")
+    hit_rate: float = Field(default=0.0, description="hits / (hits + misses)")
+    stores: int = 0
+    evictions: int = Field(default=0, description="Entries removed by the TTL or size limit")
+    invalidations: int = Field(default=0, description="Cached patches that no longer applied")
+
+
+class ExecutorAdmissionStatus(BaseModel):
+    """Running and queued CLI executor launches with the admission limits."""
+
+    running: int = 0
+    running_by_type: dict[ExecutorType, int] = Field(default_factory=dict)
+    running_by_repo: dict[str, int] = Field(default_factory=dict)
+    queued: int = 0
+    queued_by_priority: dict[ExecutorPriority, int] = Field(default_factory=dict)
+    max_concurrent: int
+    max_concurrent_per_type: dict[str, int] = Field(default_factory=dict)
+    max_concurrent_per_repo: int = 0
+    available_memory_mb: float | None = Field(None, description="Host memory available")
+    load_per_cpu: float | None = Field(None, description="1-minute load average per CPU")
+    admitted_total: int = 0
+    host_deferrals: int = Field(0, description="Dispatches held back by host memory/CPU load")
+    average_wait_ms: float = 0.0
@@ -1,14 +1,35 @@
-"""Executors for zloth runs."""
+"""Executors for zloth runs.
 
-from zloth_api.executors.base_executor import BaseExecutor, ExecutorResult
-from zloth_api.executors.claude_code_executor import ClaudeCodeExecutor
-from zloth_api.executors.codex_executor import CodexExecutor
-from zloth_api.executors.gemini_executor import GeminiExecutor
+Importing this package registers every executor module with the registry.
+"""
+
+from zloth_api.executors.base_executor import BaseExecutor, ExecutorOptions, ExecutorResult
+from zloth_api.executors.claude_code_executor import ClaudeCodeExecutor, ClaudeCodeOptions
+from zloth_api.executors.codex_executor import CodexExecutor, CodexOptions
+from zloth_api.executors.gemini_executor import GeminiExecutor, GeminiOptions
+from zloth_api.executors.output_parser import OutputParser
+from zloth_api.executors.registry import (
+    create_executor,
+    create_executors,
+    executor_class,
+    register_executor,
+    registered_executor_types,
+)
 
 __all__ = [
     "BaseExecutor",
+    "ExecutorOptions",
     "ExecutorResult",
+    "OutputParser",
     "ClaudeCodeExecutor",
+    "ClaudeCodeOptions",
     "CodexExecutor",
+    "CodexOptions",
     "GeminiExecutor",
+    "GeminiOptions",
+    "create_executor",
+    "create_executors",
+    "executor_class",
+    "register_executor",
+    "registered_executor_types",
 ]
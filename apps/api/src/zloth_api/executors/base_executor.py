@@ -1,18 +1,78 @@
-"""Base executor interface for all CLI executors.
+"""Base executor interface and shared streaming pipeline for all CLI executors.
 
 This module defines the abstract base class for all executors in zloth,
 following the orchestrator management pattern where AI Agents only edit
 files and zloth manages git operations.
+
+Every executor runs its CLI through the same pipeline:
+
+1. ``execute`` waits for an admission slot,
+2. ``_spawn`` starts the CLI in its own process group (with resource limits),
+3. ``_stream`` reads the output in chunks under the timeout policy of
+   ``ProcessSupervisor``, keeps one bounded copy of it (``OutputSpool``) and
+   passes each line to the executor's ``OutputParser``; display text is
+   awaited into ``on_output`` line by line, so a slow consumer holds back
+   the reader (and the CLI, once the pipe is full) instead of buffering.
+
+An executor only builds the command line, provides a parser and turns the
+outcome into an ``ExecutorResult``. Executors register themselves in
+``zloth_api.executors.registry``.
 """
 
 from __future__ import annotations
 
+import asyncio
+import logging
+import os
+import time
 from abc import ABC, abstractmethod
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any, ClassVar, Self
+
+from zloth_api.config import settings
+from zloth_api.domain.enums import ExecutorPriority, ExecutorType
+from zloth_api.domain.models import AgentConstraints, ExecutionStats, FileDiff, RunResourceUsage
+from zloth_api.executors.output_parser import OutputParser
+from zloth_api.executors.output_spool import TAIL_LINES, OutputSpool
+from zloth_api.executors.process_isolation import (
+    IsolatedProcess,
+    ProcessIsolator,
+    get_process_isolator,
+)
+from zloth_api.executors.process_registry import get_process_registry
+from zloth_api.executors.process_supervisor import (
+    EventCallback,
+    LineReader,
+    ProcessSupervisor,
+    SupervisedExit,
+)
+from zloth_api.services.diff_parser import parse_unified_diff
+from zloth_api.services.executor_admission import (
+    ExecutorAdmissionController,
+    get_executor_admission,
+)
+
+logger = logging.getLogger(__name__)
+
+# Seconds `<cli> --version` may take
+CLI_VERSION_TIMEOUT = 10.0
+
+OutputCallback = Callable[[str], Awaitable[None]]
+
 
-from zloth_api.domain.models import AgentConstraints, FileDiff
+@dataclass
+class ExecutorOptions:
+    """Options shared by all CLI executors."""
+
+    timeout_seconds: int = 3600  # 1 hour default
+    max_output_lines: int = 10000  # Lines passed to on_output
+    env_vars: dict[str, str] = field(default_factory=dict)
+    # Model passed with --model (None: the CLI's default model)
+    model: str | None = None
+    # Pipe buffer of the CLI's output (lines may be longer; they are read in chunks)
+    stream_limit: int = 1024 * 1024
 
 
 @dataclass
@@ -31,6 +91,18 @@ class ExecutorResult:
     warnings: list[str] = field(default_factory=list)
     error: str | None = None
     session_id: str | None = None  # CLI session ID for conversation persistence
+    resource_usage: RunResourceUsage | None = None  # Usage of the CLI process tree
+    stats: ExecutionStats | None = None  # Tokens, cost and timing reported by the CLI
+
+
+@dataclass
+class StreamOutcome:
+    """A finished CLI process, as seen by the streaming pipeline."""
+
+    exit: SupervisedExit
+    tail: list[str]  # Last output lines, for error messages
+    resource_usage: RunResourceUsage | None
+    wall_time_ms: int
 
 
 class BaseExecutor(ABC):
@@ -49,28 +121,269 @@ class BaseExecutor(ABC):
     executor completion.
     """
 
-    @abstractmethod
+    executor_type: ClassVar[ExecutorType]
+    display_name: ClassVar[str]
+    options_class: ClassVar[type[ExecutorOptions]] = ExecutorOptions
+    # Name of both the options field and the setting holding the CLI path
+    cli_path_field: ClassVar[str]
+    # Name of the setting holding the model
+    model_setting: ClassVar[str]
+    # Output lines quoted in the error of a failed launch
+    error_tail_lines: ClassVar[int] = TAIL_LINES
+
+    def __init__(
+        self,
+        options: ExecutorOptions | None = None,
+        admission: ExecutorAdmissionController | None = None,
+        isolator: ProcessIsolator | None = None,
+    ):
+        """Initialize executor with options.
+
+        Args:
+            options: Execution options. Uses defaults if not provided.
+            admission: Admission controller every launch goes through.
+                Uses the process-wide controller if not provided.
+            isolator: Starts the CLI with resource limits and accounting.
+                Uses the process-wide isolator if not provided.
+        """
+        self.options = options or self.options_class()
+        self.admission = admission or get_executor_admission()
+        self.isolator = isolator or get_process_isolator()
+
+    @classmethod
+    def from_settings(cls, **options: Any) -> Self:
+        """Create the executor with the CLI path from settings.
+
+        Args:
+            **options: Option overrides (e.g. timeout_seconds).
+        """
+        options.setdefault(cls.cli_path_field, getattr(settings, cls.cli_path_field))
+        options.setdefault("model", getattr(settings, cls.model_setting))
+        return cls(cls.options_class(**options))
+
+    @property
+    def cli_path(self) -> str:
+        return str(getattr(self.options, self.cli_path_field))
+
+    async def model_identity(self) -> str | None:
+        """The model the CLI runs with, for keying results it produced.
+
+        The configured model, or the CLI's default model identified by the CLI
+        version. None if no model is configured and the version is unknown.
+        """
+        if self.options.model:
+            return self.options.model
+        version = await _cli_version(self.cli_path)
+        return f"default ({version})" if version else None
+
+    def _model_args(self, logs: list[str]) -> list[str]:
+        """``--model`` arguments for the configured model."""
+        if not self.options.model:
+            return []
+        logs.append(f"Model: {self.options.model}")
+        return ["--model", self.options.model]
+
     async def execute(
         self,
         worktree_path: Path,
         instruction: str,
-        constraints: AgentConstraints | None = None,
-        on_output: Callable[[str], Awaitable[None]] | None = None,
+        on_output: OutputCallback | None = None,
         resume_session_id: str | None = None,
+        read_only: bool = False,
+        *,
+        repo: str | None = None,
+        priority: ExecutorPriority = ExecutorPriority.RUN,
+        on_event: EventCallback | None = None,
+        session_key: str | None = None,
     ) -> ExecutorResult:
-        """Execute the CLI with the given instruction.
+        """Execute the CLI once the admission controller grants a slot.
 
         Args:
             worktree_path: Working directory for the execution.
             instruction: Natural language instruction for the agent.
-            constraints: Agent constraints (git ops forbidden, etc.).
-            on_output: Callback for output streaming.
-            resume_session_id: Session ID for conversation continuation.
+            on_output: Optional callback for streaming output.
+            resume_session_id: Optional session ID to resume a previous conversation.
+            read_only: If True, run without file modifications.
+            repo: Repository ID, for the per-repository executor limit.
+            priority: Admission priority of the launch.
+            on_event: Optional callback for process events (stalled, resumed).
+            session_key: Task ID under which executors that support warm
+                sessions keep the CLI running for follow-up instructions.
 
         Returns:
             ExecutorResult with execution results.
         """
-        pass
+        async with self.admission.slot(self.executor_type, repo=repo, priority=priority):
+            return await self._execute(
+                worktree_path,
+                instruction,
+                on_output,
+                resume_session_id,
+                read_only,
+                on_event,
+                session_key,
+            )
+
+    @abstractmethod
+    async def _execute(
+        self,
+        worktree_path: Path,
+        instruction: str,
+        on_output: OutputCallback | None,
+        resume_session_id: str | None,
+        read_only: bool,
+        on_event: EventCallback | None,
+        session_key: str | None,
+    ) -> ExecutorResult:
+        """Run the CLI (an admission slot is held). Arguments as for ``execute``."""
+
+    # ==========================================
+    # Streaming pipeline
+    # ==========================================
+
+    async def _spawn(
+        self,
+        cmd: list[str],
+        worktree_path: Path,
+        *,
+        stdin: int = asyncio.subprocess.DEVNULL,
+    ) -> IsolatedProcess:
+        """Start the CLI with stdout and stderr merged into one pipe.
+
+        Raises:
+            FileNotFoundError: The CLI executable does not exist.
+        """
+        env = os.environ.copy()
+        env.update(self.options.env_vars)
+        isolated = await self.isolator.spawn(
+            cmd,
+            self.executor_type,
+            stdin=stdin,  # DEVNULL prevents waiting for interactive input
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            cwd=str(worktree_path),
+            env=env,
+            limit=self.options.stream_limit,
+        )
+        # Lets a cancelled job kill the process even if its task cannot unwind
+        get_process_registry().register(isolated)
+        return isolated
+
+    async def _stream(
+        self,
+        isolated: IsolatedProcess,
+        parser: OutputParser,
+        spool: OutputSpool,
+        on_output: OutputCallback | None,
+        on_event: EventCallback | None,
+        *,
+        until: Callable[[], bool] | None = None,
+        reader: LineReader | None = None,
+    ) -> SupervisedExit:
+        """Read the CLI's output under the timeout policy.
+
+        Every line goes to the spool and the parser; the parser's display
+        text is passed to ``on_output`` (up to ``max_output_lines``).
+        """
+        shown = 0
+
+        async def on_line(line: bytes) -> None:
+            nonlocal shown
+            spool.append(line)
+            text = parser.feed(line)
+            if text and on_output and shown < self.options.max_output_lines:
+                shown += 1
+                await on_output(text)
+
+        supervisor = ProcessSupervisor(self.options.timeout_seconds)
+        return await supervisor.run(isolated, on_line, on_event, until=until, reader=reader)
+
+    async def _run_process(
+        self,
+        cmd: list[str],
+        worktree_path: Path,
+        parser: OutputParser,
+        logs: list[str],
+        on_output: OutputCallback | None,
+        on_event: EventCallback | None,
+    ) -> StreamOutcome:
+        """Run one CLI process to completion through the streaming pipeline.
+
+        Args:
+            cmd: Command line.
+            worktree_path: Working directory.
+            parser: Parser of the CLI's output.
+            logs: Run logs; receives the output up to the spool's memory budget.
+            on_output: Optional callback for display text.
+            on_event: Optional callback for process events.
+
+        Returns:
+            How the process ended, its last output lines and resource usage.
+
+        Raises:
+            FileNotFoundError: The CLI executable does not exist.
+        """
+        started_at = time.monotonic()
+        spool = OutputSpool(logs, name=self.executor_type.value, tail_lines=self.error_tail_lines)
+        isolated = await self._spawn(cmd, worktree_path)
+        logger.info(f"{self.display_name} process started with PID: {isolated.pid}")
+        try:
+            exit_status = await self._stream(isolated, parser, spool, on_output, on_event)
+        finally:
+            spool.close()
+            # Kills what is left of the process tree (also on cancellation)
+            resource_usage = await isolated.finish()
+        logger.info(
+            f"{self.display_name} process exited with code {exit_status.returncode} "
+            f"after {spool.line_count} output lines"
+        )
+        return StreamOutcome(
+            exit=exit_status,
+            tail=spool.tail(),
+            resource_usage=resource_usage,
+            wall_time_ms=round((time.monotonic() - started_at) * 1000),
+        )
+
+    # ==========================================
+    # Results
+    # ==========================================
+
+    def _failure_message(self, outcome: StreamOutcome) -> str:
+        """Error of a launch that timed out or exited with a non-zero code."""
+        if outcome.exit.timed_out:
+            return outcome.exit.error or "Execution timed out"
+        tail = "\n".join(outcome.tail) or "(no output)"
+        return (
+            f"{self.display_name} CLI exited with code {outcome.exit.returncode}"
+            f"\n\nLast output:\n{tail}"
+        )
+
+    def _success(self, logs: list[str], **fields: Any) -> ExecutorResult:
+        return ExecutorResult(
+            success=True, summary="", patch="", files_changed=[], logs=logs, **fields
+        )
+
+    def _failure(self, logs: list[str], error: str, **fields: Any) -> ExecutorResult:
+        return ExecutorResult(
+            success=False, summary="", patch="", files_changed=[], logs=logs, error=error, **fields
+        )
+
+    def _not_found(self, logs: list[str]) -> ExecutorResult:
+        return self._failure(logs, f"{self.display_name} CLI not found at: {self.cli_path}")
+
+    async def cancel(self, process: asyncio.subprocess.Process) -> None:
+        """Cancel a running CLI process.
+
+        Args:
+            process: The subprocess to cancel.
+        """
+        if process.returncode is None:
+            process.terminate()
+            try:
+                await asyncio.wait_for(process.wait(), timeout=5.0)
+            except TimeoutError:
+                process.kill()
+                await process.wait()
 
     def _build_instruction_with_constraints(
         self,
@@ -109,59 +422,7 @@ class BaseExecutor(ABC):
         Returns:
             List of FileDiff objects.
         """
-        files: list[FileDiff] = []
-        current_file: str | None = None
-        current_patch_lines: list[str] = []
-        added_lines = 0
-        removed_lines = 0
-
-        for line in diff.split("\n"):
-            if line.startswith("--- a/"):
-                # Save previous file if exists
-                if current_file:
-                    files.append(
-                        FileDiff(
-                            path=current_file,
-                            added_lines=added_lines,
-                            removed_lines=removed_lines,
-                            patch="\n".join(current_patch_lines),
-                        )
-                    )
-                # Reset for new file
-                current_patch_lines = [line]
-                added_lines = 0
-                removed_lines = 0
-            elif line.startswith("+++ b/"):
-                current_file = line[6:]
-                current_patch_lines.append(line)
-            elif line.startswith("--- /dev/null"):
-                # New file
-                current_patch_lines = [line]
-                added_lines = 0
-                removed_lines = 0
-            elif line.startswith("+++ b/") and current_file is None:
-                # New file path
-                current_file = line[6:]
-                current_patch_lines.append(line)
-            elif current_file:
-                current_patch_lines.append(line)
-                if line.startswith("+") and not line.startswith("+++"):
-                    added_lines += 1
-                elif line.startswith("-") and not line.startswith("---"):
-                    removed_lines += 1
-
-        # Save last file
-        if current_file:
-            files.append(
-                FileDiff(
-                    path=current_file,
-                    added_lines=added_lines,
-                    removed_lines=removed_lines,
-                    patch="\n".join(current_patch_lines),
-                )
-            )
-
-        return files
+        return parse_unified_diff(diff)
 
     def _generate_summary(
         self,
@@ -196,3 +457,33 @@ class BaseExecutor(ABC):
         summary_parts.append(f"Files: {file_list}")
 
         return ". ".join(summary_parts) + "."
+
+
+# CLI path -> output of `<cli> --version`
+_cli_versions: dict[str, str | None] = {}
+
+
+async def _cli_version(cli_path: str) -> str | None:
+    """Version of a CLI (looked up once per CLI path)."""
+    if cli_path not in _cli_versions:
+        try:
+            process = await asyncio.create_subprocess_exec(
+                cli_path,
+                "--version",
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+        except OSError as e:
+            logger.warning(f"Could not determine the version of {cli_path}: {e}")
+            return None
+        try:
+            stdout, _ = await asyncio.wait_for(process.communicate(), timeout=CLI_VERSION_TIMEOUT)
+        except TimeoutError:
+            process.kill()
+            await process.wait()
+            logger.warning(f"{cli_path} --version timed out")
+            return None
+        version = stdout.decode("utf-8", errors="replace").strip()
+        _cli_versions[cli_path] = version if process.returncode == 0 and version else None
+    return _cli_versions[cli_path]
@@ -3,115 +3,84 @@
 import asyncio
 import json
 import logging
-import os
-import re
-from collections.abc import Awaitable, Callable
-from dataclasses import dataclass, field
+import time
+from dataclasses import dataclass
 from pathlib import Path
-
-from zloth_api.domain.models import FileDiff
+from typing import Any
+
+from zloth_api.config import settings
+from zloth_api.domain.enums import ExecutorType
+from zloth_api.executors.base_executor import (
+    BaseExecutor,
+    ExecutorOptions,
+    ExecutorResult,
+    OutputCallback,
+)
+from zloth_api.executors.output_spool import OutputSpool
+from zloth_api.executors.process_isolation import ProcessIsolator
+from zloth_api.executors.process_supervisor import EventCallback
+from zloth_api.executors.registry import register_executor
+from zloth_api.executors.stream_json import StreamJsonDecoder
+from zloth_api.executors.warm_sessions import (
+    SessionKey,
+    WarmSession,
+    WarmSessionPool,
+    get_warm_session_pool,
+)
+from zloth_api.services.executor_admission import ExecutorAdmissionController
 
 logger = logging.getLogger(__name__)
 
+__all__ = ["ClaudeCodeExecutor", "ClaudeCodeOptions", "ExecutorResult"]
+
 
 @dataclass
-class ClaudeCodeOptions:
+class ClaudeCodeOptions(ExecutorOptions):
     """Options for Claude Code execution."""
 
-    timeout_seconds: int = 3600  # 1 hour default
-    max_output_lines: int = 10000
     claude_cli_path: str = "claude"
-    env_vars: dict[str, str] = field(default_factory=dict)
-    # Buffer limit for reading stdout/stderr lines (default: 1MB)
-    # Increase this if you encounter "chunk exceed the limit" errors
-    stream_limit: int = 1024 * 1024
-
-
-@dataclass
-class ExecutorResult:
-    """Result from Claude Code execution."""
 
-    success: bool
-    summary: str
-    patch: str
-    files_changed: list[FileDiff]
-    logs: list[str]
-    warnings: list[str] = field(default_factory=list)
-    error: str | None = None
-    session_id: str | None = None  # CLI session ID for conversation persistence
 
-
-class ClaudeCodeExecutor:
+@register_executor
+class ClaudeCodeExecutor(BaseExecutor):
     """Executes Claude Code CLI in a worktree."""
 
-    def __init__(self, options: ClaudeCodeOptions | None = None):
+    executor_type = ExecutorType.CLAUDE_CODE
+    display_name = "Claude Code"
+    options_class = ClaudeCodeOptions
+    cli_path_field = "claude_cli_path"
+    model_setting = "claude_model"
+
+    def __init__(
+        self,
+        options: ClaudeCodeOptions | None = None,
+        admission: ExecutorAdmissionController | None = None,
+        isolator: ProcessIsolator | None = None,
+        warm_sessions: WarmSessionPool | None = None,
+    ):
         """Initialize executor with options.
 
         Args:
             options: Execution options. Uses defaults if not provided.
+            admission: Admission controller every launch goes through.
+                Uses the process-wide controller if not provided.
+            isolator: Starts the CLI with resource limits and accounting.
+                Uses the process-wide isolator if not provided.
+            warm_sessions: Pool of long-lived sessions reused across the runs of
+                a task. Uses the process-wide pool if not provided.
         """
-        self.options = options or ClaudeCodeOptions()
-
-    def _extract_display_text(self, json_line: str) -> str | None:
-        """Extract human-readable text from a stream-json line.
-
-        Stream-json format outputs JSON objects with different types:
-        - {"type": "assistant", "message": {"content": [{"text": "..."}]}}
-        - {"type": "system", "message": "..."}
-        - {"type": "result", ...}
+        super().__init__(options, admission, isolator)
+        self.warm_sessions = warm_sessions if warm_sessions is not None else get_warm_session_pool()
 
-        Args:
-            json_line: A single line of stream-json output.
-
-        Returns:
-            Human-readable text for display, or None if not displayable.
-        """
-        try:
-            data = json.loads(json_line)
-            if not isinstance(data, dict):
-                return json_line
-
-            msg_type = data.get("type")
-
-            # Assistant messages contain the main content
-            if msg_type == "assistant":
-                message = data.get("message", {})
-                if isinstance(message, dict):
-                    content = message.get("content", [])
-                    if isinstance(content, list):
-                        texts = []
-                        for block in content:
-                            if isinstance(block, dict) and block.get("type") == "text":
-                                texts.append(block.get("text", ""))
-                        if texts:
-                            return "".join(texts)
-                return None
-
-            # System messages (e.g., init info)
-            if msg_type == "system":
-                message = data.get("message", "")
-                if isinstance(message, str) and message:
-                    return f"[system] {message}"
-                return None
-
-            # Result message - don't display raw JSON
-            if msg_type == "result":
-                return None
-
-            # Unknown type - return as-is for debugging
-            return None
-
-        except json.JSONDecodeError:
-            # Not JSON, return as-is
-            return json_line
-
-    async def execute(
+    async def _execute(
         self,
         worktree_path: Path,
         instruction: str,
-        on_output: Callable[[str], Awaitable[None]] | None = None,
-        resume_session_id: str | None = None,
-        read_only: bool = False,
+        on_output: OutputCallback | None,
+        resume_session_id: str | None,
+        read_only: bool,
+        on_event: EventCallback | None,
+        session_key: str | None,
     ) -> ExecutorResult:
         """Execute claude CLI with the given instruction.
 
@@ -121,17 +90,25 @@ class ClaudeCodeExecutor:
             on_output: Optional callback for streaming output.
             resume_session_id: Optional session ID to resume a previous conversation.
             read_only: If True, run in plan mode (read-only, no file modifications).
+            on_event: Optional callback for process events (stalled, resumed).
+            session_key: Task ID of a warm session (with executor_warm_sessions).
 
         Returns:
             ExecutorResult with success status, patch, and logs.
         """
-        logs: list[str] = []
-        output_lines: list[str] = []
+        if session_key and settings.executor_warm_sessions:
+            return await self._execute_warm(
+                session_key,
+                worktree_path,
+                instruction,
+                on_output,
+                resume_session_id,
+                read_only,
+                on_event,
+            )
 
-        # Prepare environment
-        env = os.environ.copy()
-        env.update(self.options.env_vars)
-        # Note: Don't change HOME as Claude CLI needs access to ~/.claude for auth
+        logs: list[str] = []
+        decoder = StreamJsonDecoder()
 
         # Build command
         # Use --print (-p) for non-interactive mode with instruction as argument
@@ -139,23 +116,17 @@ class ClaudeCodeExecutor:
         # Use --output-format stream-json for streaming output with structured JSON
         # This enables session_id extraction from the result message
         # Note: --verbose is required when using --output-format=stream-json with -p
+        # Note: Don't change HOME as Claude CLI needs access to ~/.claude for auth
         cmd = [
-            self.options.claude_cli_path,
+            self.cli_path,
             "-p",
             instruction,  # Pass instruction directly as argument
             "--verbose",  # Required for stream-json with -p mode
             "--output-format",
             "stream-json",  # Streaming JSON for session_id extraction
         ]
-
-        # Permission mode: read_only uses plan mode, otherwise use dangerously-skip-permissions
-        if read_only:
-            # Plan mode restricts Claude to read-only operations
-            cmd.extend(["--permission-mode", "plan"])
-            logs.append("Running in read-only mode (--permission-mode plan)")
-        else:
-            # Allow file edits without permission prompts for implementation
-            cmd.append("--dangerously-skip-permissions")
+        cmd.extend(self._permission_args(read_only, logs))
+        cmd.extend(self._model_args(logs))
 
         # Add --resume flag if we have a previous session ID
         # Note: Use --resume (not --session-id) to continue conversation
@@ -164,211 +135,195 @@ class ClaudeCodeExecutor:
             logs.append(f"Continuing session: {resume_session_id}")
 
         # Don't log full instruction - it can be very long
-        cmd_display = [
-            self.options.claude_cli_path,
-            "-p",
-            f"<instruction:{len(instruction)} chars>",
-        ]
+        cmd_display = [self.cli_path, "-p", f"<instruction:{len(instruction)} chars>"]
         logs.append(f"Executing: {' '.join(cmd_display)}")
         logs.append(f"Working directory: {worktree_path}")
         logs.append(f"Instruction length: {len(instruction)} chars")
         logger.info(f"Starting Claude Code CLI: {' '.join(cmd_display)}")
         logger.info(f"Working directory: {worktree_path}")
-        logger.info(f"Instruction length: {len(instruction)} chars")
 
         try:
-            logger.info("Creating subprocess...")
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdin=asyncio.subprocess.DEVNULL,  # Prevent interactive input waiting
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.STDOUT,
-                cwd=str(worktree_path),
-                env=env,
-                limit=self.options.stream_limit,  # Increase buffer limit for long output lines
+            outcome = await self._run_process(
+                cmd, worktree_path, decoder, logs, on_output, on_event
             )
-            logger.info(f"Process created successfully with PID: {process.pid}")
-
-            # Stream output from CLI
-            async def read_output() -> None:
-                line_count = 0
-                logger.info("Starting to read output lines...")
-                if process.stdout is None:
-                    logger.error("Process stdout is None")
-                    return
-                while True:
-                    # Add timeout per line to detect hanging
-                    try:
-                        line = await asyncio.wait_for(
-                            process.stdout.readline(),
-                            timeout=300.0,  # 5 min timeout per line
-                        )
-                    except TimeoutError:
-                        logger.warning("No output for 5 minutes, checking if process is alive...")
-                        if process.returncode is None:
-                            logger.warning(
-                                f"Process still running (PID: {process.pid}), continuing to wait..."
-                            )
-                            continue
-                        else:
-                            logger.info(f"Process has exited with code: {process.returncode}")
-                            break
-
-                    if not line:
-                        logger.info(f"EOF reached after {line_count} lines")
-                        break
-
-                    decoded = line.decode("utf-8", errors="replace").rstrip()
-                    output_lines.append(decoded)
-                    logs.append(decoded)
-                    line_count += 1
-
-                    # Log progress every 10 lines
-                    if line_count % 10 == 0:
-                        logger.info(f"Read {line_count} lines so far...")
-
-                    if len(output_lines) <= self.options.max_output_lines:
-                        if on_output:
-                            # Extract human-readable text from stream-json
-                            display_text = self._extract_display_text(decoded)
-                            if display_text:
-                                await on_output(display_text)
-                logger.info(f"Finished reading output: {line_count} lines total")
-
-            try:
-                logger.info("Reading output...")
-                await asyncio.wait_for(
-                    read_output(),
-                    timeout=self.options.timeout_seconds,
-                )
-                logger.info("Output reading completed")
-            except TimeoutError:
-                logger.error(f"Execution timed out after {self.options.timeout_seconds} seconds")
-                process.kill()
-                await process.wait()
-                return ExecutorResult(
-                    success=False,
-                    summary="",
-                    patch="",
-                    files_changed=[],
-                    logs=logs,
-                    error=f"Execution timed out after {self.options.timeout_seconds} seconds",
-                )
-
-            await process.wait()
-            logger.info(f"Process exited with code: {process.returncode}")
-
-            if process.returncode != 0:
-                # Include last few lines of output for debugging
-                tail_lines = logs[-20:] if logs else []
-                tail = "\n".join(tail_lines)
-                return ExecutorResult(
-                    success=False,
-                    summary="",
-                    patch="",
-                    files_changed=[],
-                    logs=logs,
-                    error=(
-                        f"Claude Code exited with code {process.returncode}\n\nLast output:\n{tail}"
-                    ),
-                )
-
-            # Extract session ID from JSON output
-            session_id = self._extract_session_id(output_lines)
-
-            return ExecutorResult(
-                success=True,
-                summary="",
-                patch="",
-                files_changed=[],
-                logs=logs,
-                session_id=session_id,
-            )
-
         except FileNotFoundError:
-            return ExecutorResult(
-                success=False,
-                summary="",
-                patch="",
-                files_changed=[],
-                logs=logs,
-                error=f"Claude CLI not found at: {self.options.claude_cli_path}",
-            )
+            return self._not_found(logs)
         except Exception as e:
-            return ExecutorResult(
-                success=False,
-                summary="",
-                patch="",
-                files_changed=[],
-                logs=logs,
-                error=str(e),
+            return self._failure(logs, str(e))
+
+        logger.info(
+            f"{decoder.skipped_events} tool result events skipped ({decoder.skipped_bytes} bytes)"
+        )
+        fields = self._result_fields(decoder, outcome.wall_time_ms)
+        if outcome.exit.timed_out or outcome.exit.returncode != 0:
+            return self._failure(
+                logs,
+                self._failure_message(outcome),
+                resource_usage=outcome.resource_usage,
+                **fields,
             )
+        return self._success(logs, resource_usage=outcome.resource_usage, **fields)
 
-    def _extract_session_id(self, output_lines: list[str]) -> str | None:
-        """Extract session ID from Claude CLI output.
-
-        With --output-format stream-json, Claude CLI outputs JSON lines:
-        - {"type": "system", "message": "..."}
-        - {"type": "assistant", "message": {...}}
-        - {"type": "result", "session_id": "uuid", ...}
+    async def _execute_warm(
+        self,
+        session_key: str,
+        worktree_path: Path,
+        instruction: str,
+        on_output: OutputCallback | None,
+        resume_session_id: str | None,
+        read_only: bool,
+        on_event: EventCallback | None,
+    ) -> ExecutorResult:
+        """Run one turn in the task's long-lived CLI session.
 
-        The session_id is in the final "result" type message.
+        The session is reused when it continues the requested conversation in
+        the same worktree; otherwise a new session is started (resuming
+        ``resume_session_id`` if given). It goes back to the pool after a turn
+        that ended with a result event and is closed after anything else.
 
         Args:
-            output_lines: Output lines from Claude CLI execution.
+            session_key: Task ID the session belongs to.
+            worktree_path: Path to the git worktree.
+            instruction: Natural language instruction for Claude Code.
+            on_output: Optional callback for streaming output.
+            resume_session_id: Conversation the instruction continues.
+            read_only: If True, run in plan mode (read-only, no file modifications).
+            on_event: Optional callback for process events (stalled, resumed).
 
         Returns:
-            Session ID if found, None otherwise.
+            ExecutorResult of the turn. Resource usage is recorded when the
+            session is closed, not per turn.
         """
-        # Primary: Look for stream-json "result" message with session_id
-        # Search from the end since "result" is the final message
-        for line in reversed(output_lines):
+        logs: list[str] = []
+        key = (session_key, ExecutorType.CLAUDE_CODE)
+        session = await self.warm_sessions.checkout(key)
+        if session is not None and not session.matches(worktree_path, read_only, resume_session_id):
+            await session.close()
+            session = None
+
+        if session is None:
             try:
-                data = json.loads(line)
-                if isinstance(data, dict):
-                    # stream-json format: {"type": "result", "session_id": "..."}
-                    if data.get("type") == "result" and "session_id" in data:
-                        session_id = data["session_id"]
-                        logger.info(f"Extracted session_id from result: {session_id}")
-                        return str(session_id)
-                    # Alternative field names
-                    if "session_id" in data:
-                        return str(data["session_id"])
-                    if "sessionId" in data:
-                        return str(data["sessionId"])
-            except json.JSONDecodeError:
-                continue
-
-        # Fallback: Search for session ID patterns in text output
-        uuid_pattern = r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"
-        patterns = [
-            # "Session ID: <uuid>" or "session_id: <uuid>"
-            re.compile(r"session[_\s]?id[:\s]+(" + uuid_pattern + r")", re.IGNORECASE),
-            # "--resume <uuid>" or "--session-id <uuid>" hint
-            re.compile(r"--(?:resume|session-id)\s+(" + uuid_pattern + r")", re.IGNORECASE),
-            # "session: <uuid>"
-            re.compile(r"\bsession[:\s]+(" + uuid_pattern + r")", re.IGNORECASE),
+                session = await self._start_warm_session(
+                    key, worktree_path, read_only, resume_session_id, logs
+                )
+            except FileNotFoundError:
+                return self._not_found(logs)
+        else:
+            logs.append(f"Continuing warm session: {session.session_id} (turn {session.turns + 1})")
+            logger.info(f"Reusing warm Claude Code session for task {session_key}")
+
+        spool = OutputSpool(logs, name=self.executor_type.value)
+        decoder = StreamJsonDecoder()
+        decoder.session_id = session.session_id
+        started_at = time.monotonic()
+        keep_session = False
+
+        def fields() -> dict[str, Any]:
+            return self._result_fields(decoder, round((time.monotonic() - started_at) * 1000))
+
+        try:
+            logs.append(f"Instruction length: {len(instruction)} chars")
+            await session.send(_user_message(instruction))
+            exit_status = await self._stream(
+                session.isolated,
+                decoder,
+                spool,
+                on_output,
+                on_event,
+                until=lambda: decoder.turn_complete,
+                reader=session.reader,
+            )
+
+            result_event = decoder.result
+            if exit_status.timed_out or result_event is None:
+                # Timed out, or the CLI exited before finishing the turn
+                tail = "\n".join(spool.tail())
+                error = exit_status.error or (
+                    f"Claude Code exited with code {exit_status.returncode}\n\nLast output:\n{tail}"
+                )
+                return self._failure(logs, error, **fields())
+
+            keep_session = True
+            session.turns += 1
+            session.session_id = decoder.session_id
+            if result_event.is_error:
+                tail = "\n".join(spool.tail())
+                return self._failure(
+                    logs,
+                    f"Claude Code reported an error ({result_event.subtype})"
+                    f"\n\nLast output:\n{tail}",
+                    **fields(),
+                )
+            return self._success(logs, **fields())
+
+        except Exception as e:
+            return self._failure(logs, str(e))
+        finally:
+            spool.close()
+            if keep_session and session.alive:
+                await self.warm_sessions.checkin(session)
+            else:
+                # Also on cancellation: a turn that did not finish leaves the
+                # conversation in an unknown state
+                await session.close()
+
+    async def _start_warm_session(
+        self,
+        key: SessionKey,
+        worktree_path: Path,
+        read_only: bool,
+        resume_session_id: str | None,
+        logs: list[str],
+    ) -> WarmSession:
+        """Start a CLI process that reads instructions as stream-json from stdin."""
+        cmd = [
+            self.cli_path,
+            "-p",
+            "--verbose",
+            "--input-format",
+            "stream-json",
+            "--output-format",
+            "stream-json",
         ]
+        cmd.extend(self._permission_args(read_only, logs))
+        cmd.extend(self._model_args(logs))
+        if resume_session_id:
+            cmd.extend(["--resume", resume_session_id])
+            logs.append(f"Continuing session: {resume_session_id}")
 
-        for line in reversed(output_lines):  # Check recent lines first
-            for pattern in patterns:
-                match = pattern.search(line)
-                if match:
-                    return match.group(1)
+        logs.append(f"Starting warm session: {' '.join(cmd)}")
+        logs.append(f"Working directory: {worktree_path}")
+        logger.info(f"Starting warm Claude Code session for task {key[0]}")
+        isolated = await self._spawn(cmd, worktree_path, stdin=asyncio.subprocess.PIPE)
+        return WarmSession(key, isolated, worktree_path, read_only, session_id=resume_session_id)
 
-        logger.warning("Could not extract session_id from CLI output")
-        return None
+    def _permission_args(self, read_only: bool, logs: list[str]) -> list[str]:
+        """Permission mode: plan mode for read-only runs, otherwise skip prompts."""
+        if read_only:
+            # Plan mode restricts Claude to read-only operations
+            logs.append("Running in read-only mode (--permission-mode plan)")
+            return ["--permission-mode", "plan"]
+        # Allow file edits without permission prompts for implementation
+        return ["--dangerously-skip-permissions"]
 
-    async def cancel(self, process: asyncio.subprocess.Process) -> None:
-        """Cancel a running Claude Code process.
+    def _result_fields(self, decoder: StreamJsonDecoder, wall_time_ms: int) -> dict[str, Any]:
+        """Session ID and execution stats taken from the stream-json events.
 
-        Args:
-            process: The subprocess to cancel.
+        The session_id is in the final "result" event (or the "system" init
+        event if the CLI did not get that far).
         """
-        if process.returncode is None:
-            process.terminate()
-            try:
-                await asyncio.wait_for(process.wait(), timeout=5.0)
-            except TimeoutError:
-                process.kill()
-                await process.wait()
+        if decoder.session_id is None:
+            logger.warning("Could not extract session_id from CLI output")
+        return {
+            "session_id": decoder.session_id,
+            "stats": decoder.stats(wall_time_ms=wall_time_ms),
+        }
+
+
+def _user_message(text: str) -> bytes:
+    """One user turn in Claude Code's stream-json input format."""
+    message = {
+        "type": "user",
+        "message": {"role": "user", "content": [{"type": "text", "text": text}]},
+    }
+    return json.dumps(message).encode() + b"\n"
@@ -1,46 +1,123 @@
 """Codex CLI executor for running OpenAI Codex in worktrees."""
 
-import asyncio
-import os
+import logging
 import re
-from collections.abc import Awaitable, Callable
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from pathlib import Path
 
-from zloth_api.executors.claude_code_executor import ExecutorResult
+from zloth_api.domain.enums import ExecutorType
+from zloth_api.domain.models import ExecutionStats, RunResourceUsage
+from zloth_api.executors.base_executor import (
+    BaseExecutor,
+    ExecutorOptions,
+    ExecutorResult,
+    OutputCallback,
+    StreamOutcome,
+)
+from zloth_api.executors.output_parser import OutputParser
+from zloth_api.executors.process_isolation import merge_usage
+from zloth_api.executors.process_supervisor import EventCallback
+from zloth_api.executors.registry import register_executor
+
+logger = logging.getLogger(__name__)
+
+# "tokens used: 12,345" (older CLIs) or "tokens used" followed by the count
+_TOKENS_USED_RE = re.compile(r"\btokens used:?\s*([\d,]*)\s*$", re.IGNORECASE)
+_COUNT_RE = re.compile(r"^\s*([\d,]+)\s*$")
+_MODEL_RE = re.compile(r"^\s*model:\s*(\S+)", re.IGNORECASE)
+# Shell command blocks: "exec" on its own line, or "[timestamp] exec <command>"
+_EXEC_RE = re.compile(r"^(?:\[[^\]]+\]\s+)?exec(?:\s|$)")
+_UUID = r"(?P<id>[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})"
+# "To continue this session, run codex resume <UUID>"
+_RESUME_HINT_RE = re.compile(
+    r"To continue this session,\s*run\s*codex\s+resume\s+" + _UUID, re.IGNORECASE
+)
+# "session id: <UUID>"
+_SESSION_LINE_RE = re.compile(r"\bsession id:\s*" + _UUID + r"\b", re.IGNORECASE)
 
 
 @dataclass
-class CodexOptions:
+class CodexOptions(ExecutorOptions):
     """Options for Codex CLI execution."""
 
-    timeout_seconds: int = 3600  # 1 hour default
-    max_output_lines: int = 10000
     codex_cli_path: str = "codex"
-    env_vars: dict[str, str] = field(default_factory=dict)
-    # Buffer limit for reading stdout/stderr lines (default: 1MB)
-    # Increase this if you encounter "chunk exceed the limit" errors
-    stream_limit: int = 1024 * 1024
 
 
-class CodexExecutor:
-    """Executes Codex CLI in a worktree."""
+class CodexOutputParser(OutputParser):
+    """Plain text ``codex exec`` output with model, token and session hints.
+
+    The output reports the model in its header, the total tokens at the end
+    and a hint to resume the session, e.g.::
+
+        model: gpt-5-codex
+        ...
+        tokens used
+        12,345
+        To continue this session, run codex resume <UUID>
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.model: str | None = None
+        self.tool_calls = 0
+        self.total_tokens: int | None = None
+        self._expect_token_count = False
+
+    def feed(self, line: bytes) -> str | None:
+        text = line.decode("utf-8", errors="replace").rstrip()
+        if self._expect_token_count:
+            self._expect_token_count = False
+            if m := _COUNT_RE.match(text):
+                self._set_tokens(m.group(1))
+                return text or None
+
+        if self.model is None and (m := _MODEL_RE.match(text)):
+            self.model = m.group(1)
+        elif _EXEC_RE.match(text):
+            self.tool_calls += 1
+        elif m := _TOKENS_USED_RE.search(text):
+            if m.group(1).replace(",", ""):
+                self._set_tokens(m.group(1))
+            else:
+                self._expect_token_count = True
+        # The last session hint wins
+        if m := _RESUME_HINT_RE.search(text) or _SESSION_LINE_RE.search(text):
+            self.session_id = m.group("id")
+        return text or None
+
+    def _set_tokens(self, count: str) -> None:
+        # Reported cumulatively; the last report is the total
+        self.total_tokens = int(count.replace(",", ""))
+
+    def stats(self, wall_time_ms: int | None = None) -> ExecutionStats:
+        return ExecutionStats(
+            model=self.model,
+            tool_calls=self.tool_calls,
+            total_tokens=self.total_tokens,
+            wall_time_ms=wall_time_ms,
+        )
 
-    def __init__(self, options: CodexOptions | None = None):
-        """Initialize executor with options.
 
-        Args:
-            options: Execution options. Uses defaults if not provided.
-        """
-        self.options = options or CodexOptions()
+@register_executor
+class CodexExecutor(BaseExecutor):
+    """Executes Codex CLI in a worktree."""
+
+    executor_type = ExecutorType.CODEX_CLI
+    display_name = "Codex"
+    options_class = CodexOptions
+    cli_path_field = "codex_cli_path"
+    model_setting = "codex_model"
+    error_tail_lines = 80
 
-    async def execute(
+    async def _execute(
         self,
         worktree_path: Path,
         instruction: str,
-        on_output: Callable[[str], Awaitable[None]] | None = None,
-        resume_session_id: str | None = None,
-        read_only: bool = False,
+        on_output: OutputCallback | None,
+        resume_session_id: str | None,
+        read_only: bool,
+        on_event: EventCallback | None,
+        session_key: str | None,
     ) -> ExecutorResult:
         """Execute codex CLI with the given instruction.
 
@@ -50,69 +127,21 @@ class CodexExecutor:
             on_output: Optional callback for streaming output.
             resume_session_id: Optional session ID to resume a previous conversation.
             read_only: If True, run in readonly approval mode (no file modifications).
+            on_event: Optional callback for process events (stalled, resumed).
+            session_key: Ignored; the Codex CLI has no streaming input mode, so
+                every launch starts a new process.
 
         Returns:
             ExecutorResult with success status, patch, and logs.
         """
         logs: list[str] = []
 
-        # Prepare environment
-        env = os.environ.copy()
-        env.update(self.options.env_vars)
-
-        async def _run_cmd(cmd: list[str]) -> tuple[int, list[str]]:
-            """Run a single Codex command and capture output."""
-            output_lines: list[str] = []
-
-            logs.append(f"Executing: {' '.join(cmd)}")
-            logs.append(f"Working directory: {worktree_path}")
-
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.STDOUT,
-                cwd=str(worktree_path),
-                env=env,
-                limit=self.options.stream_limit,  # Increase buffer limit for long output lines
-            )
-
-            async def read_output() -> None:
-                if process.stdout is None:
-                    return
-                while True:
-                    line = await process.stdout.readline()
-                    if not line:
-                        break
-                    decoded = line.decode("utf-8", errors="replace").rstrip()
-                    output_lines.append(decoded)
-                    logs.append(decoded)
-                    if len(output_lines) <= self.options.max_output_lines and on_output:
-                        await on_output(decoded)
-
-            try:
-                await asyncio.wait_for(read_output(), timeout=self.options.timeout_seconds)
-            except TimeoutError as te:
-                process.kill()
-                await process.wait()
-                raise TimeoutError(
-                    f"Execution timed out after {self.options.timeout_seconds} seconds"
-                ) from te
-
-            await process.wait()
-            return process.returncode or 0, output_lines
-
-        def _format_error_tail(output_lines: list[str], max_lines: int = 80) -> str:
-            tail = output_lines[-max_lines:] if output_lines else []
-            if not tail:
-                return "(no output)"
-            return "\n".join(tail)
-
         # Build candidate commands.
         #
         # Codex CLI has had different argument parsing behavior across versions.
         # Exit code 2 usually means a clap argument parse error, so we try a small
         # set of known-good orderings before giving up.
-        base = [self.options.codex_cli_path, "exec"]
+        base = [self.cli_path, "exec", *self._model_args(logs)]
 
         # Determine approval mode flag
         # Note: Codex CLI's `exec` subcommand does not support --approval-mode flag.
@@ -137,117 +166,46 @@ class CodexExecutor:
         else:
             cmds.append([*base, instruction, approval_flag])
 
-        try:
-            last_code: int | None = None
-            last_out: list[str] = []
+        # Summed over all attempts
+        resource_usage: RunResourceUsage | None = None
+        wall_time_ms = 0
+        parser = CodexOutputParser()
+        outcome: StreamOutcome | None = None
 
+        try:
             for idx, cmd in enumerate(cmds, start=1):
                 logs.append(f"--- codex attempt {idx}/{len(cmds)} ---")
-                code, out = await _run_cmd(cmd)
-                last_code = code
-                last_out = out
-
-                if code == 0:
-                    session_id = self._extract_session_id(out)
-                    return ExecutorResult(
-                        success=True,
-                        summary="",
-                        patch="",
-                        files_changed=[],
-                        logs=logs,
-                        session_id=session_id,
+                logs.append(f"Executing: {' '.join(cmd)}")
+                logs.append(f"Working directory: {worktree_path}")
+                parser = CodexOutputParser()
+                outcome = await self._run_process(
+                    cmd, worktree_path, parser, logs, on_output, on_event
+                )
+                resource_usage = merge_usage(resource_usage, outcome.resource_usage)
+                wall_time_ms += outcome.wall_time_ms
+
+                if not outcome.exit.timed_out and outcome.exit.returncode == 0:
+                    return self._success(
+                        logs,
+                        session_id=parser.session_id,
+                        resource_usage=resource_usage,
+                        stats=parser.stats(wall_time_ms),
                     )
 
                 # If it's not a parse error, don't keep retrying other permutations.
-                if code != 2:
+                if outcome.exit.timed_out or outcome.exit.returncode != 2:
                     break
 
-            # Failed all attempts
-            tail = _format_error_tail(last_out)
-            return ExecutorResult(
-                success=False,
-                summary="",
-                patch="",
-                files_changed=[],
-                logs=logs,
-                error=f"Codex CLI exited with code {last_code}\n\nLast output:\n{tail}",
-            )
-
         except FileNotFoundError:
-            return ExecutorResult(
-                success=False,
-                summary="",
-                patch="",
-                files_changed=[],
-                logs=logs,
-                error=f"Codex CLI not found at: {self.options.codex_cli_path}",
-            )
-        except TimeoutError as e:
-            return ExecutorResult(
-                success=False,
-                summary="",
-                patch="",
-                files_changed=[],
-                logs=logs,
-                error=str(e),
-            )
+            return self._not_found(logs)
         except Exception as e:
-            return ExecutorResult(
-                success=False,
-                summary="",
-                patch="",
-                files_changed=[],
-                logs=logs,
-                error=str(e),
-            )
-
-    def _extract_session_id(self, output_lines: list[str]) -> str | None:
-        """Extract Codex session/conversation UUID from CLI output.
-
-        Codex often prints a line like:
-            "To continue this session, run codex resume <UUID>"
-        Some versions also print:
-            "session id: <UUID>"
-        We capture that UUID so the next run can resume via `codex exec resume <UUID> ...`.
-        """
-        uuid_re = r"(?P<id>[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})"
-
-        # Prefer scanning line-by-line for the common hint.
-        hint_re = re.compile(
-            r"To continue this session,\s*run\s*codex\s+resume\s+" + uuid_re,
-            re.IGNORECASE,
+            return self._failure(logs, str(e))
+
+        # Failed all attempts
+        assert outcome is not None
+        return self._failure(
+            logs,
+            self._failure_message(outcome),
+            resource_usage=resource_usage,
+            stats=parser.stats(wall_time_ms),
         )
-        session_line_re = re.compile(r"\bsession id:\s*" + uuid_re + r"\b", re.IGNORECASE)
-
-        for line in reversed(output_lines):
-            m = hint_re.search(line)
-            if m:
-                return m.group("id")
-            m = session_line_re.search(line)
-            if m:
-                return m.group("id")
-
-        # Fallback: search combined output for any UUID that appears near "codex resume".
-        combined = "\n".join(output_lines[-2000:])  # avoid massive joins
-        m2 = hint_re.search(combined)
-        if m2:
-            return m2.group("id")
-        m3 = session_line_re.search(combined)
-        if m3:
-            return m3.group("id")
-
-        return None
-
-    async def cancel(self, process: asyncio.subprocess.Process) -> None:
-        """Cancel a running Codex process.
-
-        Args:
-            process: The subprocess to cancel.
-        """
-        if process.returncode is None:
-            process.terminate()
-            try:
-                await asyncio.wait_for(process.wait(), timeout=5.0)
-            except TimeoutError:
-                process.kill()
-                await process.wait()
@@ -1,45 +1,46 @@
 """Gemini CLI executor for running Google Gemini CLI in worktrees."""
 
-import asyncio
-import os
-from collections.abc import Awaitable, Callable
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from pathlib import Path
 
-from zloth_api.executors.claude_code_executor import ExecutorResult
+from zloth_api.domain.enums import ExecutorType
+from zloth_api.executors.base_executor import (
+    BaseExecutor,
+    ExecutorOptions,
+    ExecutorResult,
+    OutputCallback,
+)
+from zloth_api.executors.output_parser import OutputParser
+from zloth_api.executors.process_supervisor import EventCallback
+from zloth_api.executors.registry import register_executor
 
 
 @dataclass
-class GeminiOptions:
+class GeminiOptions(ExecutorOptions):
     """Options for Gemini CLI execution."""
 
-    timeout_seconds: int = 3600  # 1 hour default
-    max_output_lines: int = 10000
     gemini_cli_path: str = "gemini"
-    env_vars: dict[str, str] = field(default_factory=dict)
-    # Buffer limit for reading stdout/stderr lines (default: 1MB)
-    # Increase this if you encounter "chunk exceed the limit" errors
-    stream_limit: int = 1024 * 1024
 
 
-class GeminiExecutor:
+@register_executor
+class GeminiExecutor(BaseExecutor):
     """Executes Gemini CLI in a worktree."""
 
-    def __init__(self, options: GeminiOptions | None = None):
-        """Initialize executor with options.
+    executor_type = ExecutorType.GEMINI_CLI
+    display_name = "Gemini"
+    options_class = GeminiOptions
+    cli_path_field = "gemini_cli_path"
+    model_setting = "gemini_model"
 
-        Args:
-            options: Execution options. Uses defaults if not provided.
-        """
-        self.options = options or GeminiOptions()
-
-    async def execute(
+    async def _execute(
         self,
         worktree_path: Path,
         instruction: str,
-        on_output: Callable[[str], Awaitable[None]] | None = None,
-        resume_session_id: str | None = None,
-        read_only: bool = False,
+        on_output: OutputCallback | None,
+        resume_session_id: str | None,
+        read_only: bool,
+        on_event: EventCallback | None,
+        session_key: str | None,
     ) -> ExecutorResult:
         """Execute gemini CLI with the given instruction.
 
@@ -49,6 +50,9 @@ class GeminiExecutor:
             on_output: Optional callback for streaming output.
             resume_session_id: Optional session ID (not yet supported by Gemini CLI).
             read_only: If True, run in default approval mode (requires approval for all ops).
+            on_event: Optional callback for process events (stalled, resumed).
+            session_key: Ignored; the Gemini CLI has no streaming input mode, so
+                every launch starts a new process.
 
         Returns:
             ExecutorResult with success status, patch, and logs.
@@ -56,11 +60,6 @@ class GeminiExecutor:
         # Note: Gemini CLI does not currently support session persistence
         # The resume_session_id parameter is included for interface compatibility
         logs: list[str] = []
-        output_lines: list[str] = []
-
-        # Prepare environment
-        env = os.environ.copy()
-        env.update(self.options.env_vars)
 
         # Build command
         # Gemini CLI: gemini "prompt" [--yolo | --approval-mode default]
@@ -68,7 +67,7 @@ class GeminiExecutor:
         # --approval-mode default = prompt for all tool calls (for read-only review)
         # See: https://github.com/google-gemini/gemini-cli
         cmd = [
-            self.options.gemini_cli_path,
+            self.cli_path,
             instruction,  # Pass instruction as positional argument
         ]
 
@@ -80,11 +79,12 @@ class GeminiExecutor:
         else:
             # YOLO mode auto-approves all actions for implementation
             cmd.append("--yolo")
+        cmd.extend(self._model_args(logs))
 
         # Don't log full instruction - it can be very long
         approval_mode_display = "--approval-mode default" if read_only else "--yolo"
         cmd_display = [
-            self.options.gemini_cli_path,
+            self.cli_path,
             f"<instruction:{len(instruction)} chars>",
             approval_mode_display,
         ]
@@ -92,104 +92,19 @@ class GeminiExecutor:
         logs.append(f"Working directory: {worktree_path}")
         logs.append(f"Instruction length: {len(instruction)} chars")
 
+        # The text output of `gemini -p` does not report tokens; only timing is known
+        parser = OutputParser()
         try:
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdin=asyncio.subprocess.DEVNULL,  # Prevent interactive input waiting
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.STDOUT,
-                cwd=str(worktree_path),
-                env=env,
-                limit=self.options.stream_limit,  # Increase buffer limit for long output lines
-            )
-
-            # Stream output from CLI
-            async def read_output() -> None:
-                if process.stdout is None:
-                    return
-                while True:
-                    line = await process.stdout.readline()
-                    if not line:
-                        break
-                    decoded = line.decode("utf-8", errors="replace").rstrip()
-                    output_lines.append(decoded)
-                    logs.append(decoded)
-
-                    if len(output_lines) <= self.options.max_output_lines:
-                        if on_output:
-                            await on_output(decoded)
-
-            try:
-                await asyncio.wait_for(
-                    read_output(),
-                    timeout=self.options.timeout_seconds,
-                )
-            except TimeoutError:
-                process.kill()
-                await process.wait()
-                return ExecutorResult(
-                    success=False,
-                    summary="",
-                    patch="",
-                    files_changed=[],
-                    logs=logs,
-                    error=f"Execution timed out after {self.options.timeout_seconds} seconds",
-                )
-
-            await process.wait()
-
-            if process.returncode != 0:
-                # Include last few lines of output for debugging
-                tail_lines = logs[-20:] if logs else []
-                tail = "\n".join(tail_lines)
-                return ExecutorResult(
-                    success=False,
-                    summary="",
-                    patch="",
-                    files_changed=[],
-                    logs=logs,
-                    error=(
-                        f"Gemini CLI exited with code {process.returncode}\n\nLast output:\n{tail}"
-                    ),
-                )
-
-            return ExecutorResult(
-                success=True,
-                summary="",
-                patch="",
-                files_changed=[],
-                logs=logs,
-            )
-
+            outcome = await self._run_process(cmd, worktree_path, parser, logs, on_output, on_event)
         except FileNotFoundError:
-            return ExecutorResult(
-                success=False,
-                summary="",
-                patch="",
-                files_changed=[],
-                logs=logs,
-                error=f"Gemini CLI not found at: {self.options.gemini_cli_path}",
-            )
+            return self._not_found(logs)
         except Exception as e:
-            return ExecutorResult(
-                success=False,
-                summary="",
-                patch="",
-                files_changed=[],
-                logs=logs,
-                error=str(e),
-            )
-
-    async def cancel(self, process: asyncio.subprocess.Process) -> None:
-        """Cancel a running Gemini process.
-
-        Args:
-            process: The subprocess to cancel.
-        """
-        if process.returncode is None:
-            process.terminate()
-            try:
-                await asyncio.wait_for(process.wait(), timeout=5.0)
-            except TimeoutError:
-                process.kill()
-                await process.wait()
+            return self._failure(logs, str(e))
+
+        fields = {
+            "resource_usage": outcome.resource_usage,
+            "stats": parser.stats(outcome.wall_time_ms),
+        }
+        if outcome.exit.timed_out or outcome.exit.returncode != 0:
+            return self._failure(logs, self._failure_message(outcome), **fields)
+        return self._success(logs, **fields)
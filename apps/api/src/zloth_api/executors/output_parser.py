@@ -0,0 +1,45 @@
+"""Parsers that turn raw CLI output into display text and run metadata.
+
+The shared executor pipeline hands every output line to the executor's
+parser. A parser decides what is shown to the user, and collects the session
+ID and execution stats while the output streams by, so no executor has to
+keep its whole output around to scan it afterwards.
+"""
+
+from __future__ import annotations
+
+from zloth_api.domain.models import ExecutionStats
+
+
+class OutputParser:
+    """Plain text output: every line is displayed as is."""
+
+    def __init__(self) -> None:
+        self.session_id: str | None = None
+
+    def feed(self, line: bytes) -> str | None:
+        """Decode one output line.
+
+        Args:
+            line: Raw stdout line.
+
+        Returns:
+            Human-readable text for display, or None if not displayable.
+        """
+        return line.decode("utf-8", errors="replace").rstrip() or None
+
+    @property
+    def turn_complete(self) -> bool:
+        """Whether the CLI finished answering the current instruction.
+
+        Only meaningful for CLIs that keep running between instructions.
+        """
+        return False
+
+    def stats(self, wall_time_ms: int | None = None) -> ExecutionStats:
+        """Execution stats reported by the output seen so far.
+
+        Args:
+            wall_time_ms: Measured run time of the CLI process.
+        """
+        return ExecutionStats(wall_time_ms=wall_time_ms)
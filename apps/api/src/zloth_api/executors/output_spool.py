@@ -0,0 +1,155 @@
+"""Bounded storage of raw CLI executor output.
+
+Verbose CLI output can run to hundreds of megabytes on long runs (a single
+tool result in Claude Code's stream-json output can be several megabytes).
+The raw output is kept exactly once:
+
+- Lines are appended to the caller's log list while the launch stays within
+  ``executor_output_memory_mb``. These lines end up in the run logs.
+- A single line larger than ``LINE_SPILL_BYTES`` is written to a spill file
+  under ``data_dir/executor_output`` instead, and the log gets a short
+  placeholder pointing to it.
+- Once the memory budget is used up, all further output goes to the spill
+  file, announced by one marker line in the log.
+
+Spill files older than ``SPILL_RETENTION_SECONDS`` are removed when a new one
+is created.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import time
+import uuid
+from collections import deque
+from pathlib import Path
+from typing import BinaryIO
+
+from zloth_api.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Lines larger than this are always spilled (tool results, file dumps)
+LINE_SPILL_BYTES = 64 * 1024
+# Lines kept for error messages, regardless of where the output went
+TAIL_LINES = 20
+SPILL_RETENTION_SECONDS = 7 * 24 * 3600
+
+
+class OutputSpool:
+    """Raw output of one executor launch, in memory up to a budget, then on disk."""
+
+    def __init__(
+        self,
+        sink: list[str],
+        *,
+        name: str = "executor",
+        memory_limit_bytes: int | None = None,
+        spill_dir: Path | None = None,
+        tail_lines: int = TAIL_LINES,
+    ):
+        """Initialize the spool.
+
+        Args:
+            sink: Log list that receives the lines kept in memory.
+            name: Prefix of the spill file name (e.g. the executor type).
+            memory_limit_bytes: Raw output kept in the sink. Defaults to settings.
+            spill_dir: Directory for spill files. Defaults to data_dir/executor_output.
+            tail_lines: Last lines kept for error messages.
+        """
+        self.sink = sink
+        self.name = name
+        self.memory_limit_bytes = (
+            memory_limit_bytes
+            if memory_limit_bytes is not None
+            else settings.executor_output_memory_mb * 1024 * 1024
+        )
+        if spill_dir is None:
+            spill_dir = (settings.data_dir or Path.home() / ".zloth" / "data") / "executor_output"
+        self.spill_dir = spill_dir
+        self.spill_path: Path | None = None
+        self.line_count = 0
+        self.total_bytes = 0
+        self.spilled_bytes = 0
+        self._memory_bytes = 0
+        self._overflowing = False
+        self._file: BinaryIO | None = None
+        self._tail: deque[bytes] = deque(maxlen=tail_lines)
+
+    def append(self, raw: bytes) -> None:
+        """Record one raw output line (with or without its trailing newline)."""
+        raw = raw.rstrip(b"\r\n")
+        size = len(raw)
+        self.line_count += 1
+        self.total_bytes += size
+        self._tail.append(raw[:LINE_SPILL_BYTES])
+
+        if self._overflowing:
+            self._spill(raw)
+            return
+        if size > LINE_SPILL_BYTES:
+            offset = self._spill(raw)
+            if offset is None:
+                self.sink.append(f"[{size} byte line omitted]")
+            else:
+                self.sink.append(f"[{size} byte line spilled to {self.spill_path} @{offset}]")
+            return
+        if self._memory_bytes + size > self.memory_limit_bytes:
+            self._overflowing = True
+            offset = self._spill(raw)
+            where = f"spilled to {self.spill_path}" if offset is not None else "omitted"
+            self.sink.append(f"[output beyond {self._memory_bytes} bytes {where}]")
+            return
+        self._memory_bytes += size
+        self.sink.append(raw.decode("utf-8", errors="replace").rstrip())
+
+    def tail(self, lines: int | None = None) -> list[str]:
+        """Last output lines (long lines cut), for error messages."""
+        recent = list(self._tail)
+        if lines is not None:
+            recent = recent[-lines:] if lines > 0 else []
+        return [raw.decode("utf-8", errors="replace").rstrip() for raw in recent]
+
+    def close(self) -> None:
+        """Close the spill file."""
+        if self._file is not None:
+            with contextlib.suppress(OSError):
+                self._file.close()
+            self._file = None
+
+    def _spill(self, raw: bytes) -> int | None:
+        """Write a line to the spill file. Returns its offset, or None if unavailable."""
+        if self._file is None:
+            if self.spill_path is not None:
+                return None  # Opening failed before
+            self._open_spill_file()
+            if self._file is None:
+                return None
+        try:
+            offset = self._file.tell()
+            self._file.write(raw)
+            self._file.write(b"\n")
+        except OSError as e:
+            logger.warning(f"Could not write executor output to {self.spill_path}: {e}")
+            self.close()
+            return None
+        self.spilled_bytes += len(raw)
+        return offset
+
+    def _open_spill_file(self) -> None:
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        self.spill_path = self.spill_dir / f"{self.name}-{stamp}-{uuid.uuid4().hex[:8]}.log"
+        try:
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+            self._prune_old_files()
+            self._file = self.spill_path.open("ab")
+        except OSError as e:
+            logger.warning(f"Could not create executor output spill file {self.spill_path}: {e}")
+
+    def _prune_old_files(self) -> None:
+        cutoff = time.time() - SPILL_RETENTION_SECONDS
+        for path in self.spill_dir.glob("*.log"):
+            with contextlib.suppress(OSError):
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
@@ -0,0 +1,453 @@
+"""Resource isolation and accounting for CLI executor processes.
+
+Agents run test suites and builds, so one executor can otherwise starve the
+API and other runs. Every executor process is started in its own session
+(process group), and depending on ``executor_isolation``:
+
+- ``cgroup``: the process is placed in a per-launch cgroup v2 under
+  ``executor_cgroup_root`` *before* it execs (a ``sh`` wrapper writes its own
+  PID to ``cgroup.procs``), so its whole process tree is covered by
+  ``cpu.weight``, ``memory.max`` and ``pids.max``. Peak memory, CPU time and
+  I/O bytes come from the cgroup's ``memory.peak``, ``cpu.stat`` and
+  ``io.stat``, and ``cgroup.kill`` kills the tree.
+- ``rlimit``: a wrapper sets the data segment (memory) limit (``ulimit -d``)
+  and a nice level derived from the CPU weight (``nice``) before the CLI
+  execs, so every process the CLI starts inherits both. Usage is sampled from
+  ``/proc`` for the process group (in a worker thread). There is no per-tree
+  pids limit in this mode.
+- ``off``: no limits and no accounting.
+- ``auto`` (default): ``cgroup`` when the cgroup root can be used, else
+  ``rlimit`` on Linux, else ``off``.
+
+In every mode the whole process group is killed when the launch finishes or
+times out, so processes left behind by an agent (dev servers, watchers) do
+not outlive it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import math
+import os
+import shutil
+import signal
+import sys
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from zloth_api.config import settings
+from zloth_api.domain.enums import ExecutorType
+from zloth_api.domain.models import RunResourceUsage
+
+logger = logging.getLogger(__name__)
+
+CGROUP_CONTROLLERS = ("cpu", "memory", "pids", "io")
+# Interval of /proc usage samples in rlimit mode
+PROC_SAMPLE_SECONDS = 2.0
+# Attempts to remove a cgroup whose processes are still exiting
+CGROUP_REMOVE_ATTEMPTS = 20
+# Default cgroup cpu.weight; the nice level of rlimit mode is derived from it
+DEFAULT_CPU_WEIGHT = 100
+
+
+@dataclass
+class ResourceLimits:
+    """Resource limits of one executor process tree (None = unlimited)."""
+
+    cpu_weight: int | None = None
+    memory_max_mb: int | None = None
+    pids_max: int | None = None
+
+
+def limits_for(executor_type: ExecutorType) -> ResourceLimits:
+    """Resolve the configured limits of an executor type.
+
+    ``executor_resource_limits`` overrides the defaults per executor type.
+    Zero means unlimited.
+    """
+    values: dict[str, int] = {
+        "cpu_weight": settings.executor_cpu_weight,
+        "memory_max_mb": settings.executor_memory_max_mb,
+        "pids_max": settings.executor_pids_max,
+    }
+    values.update(settings.executor_resource_limits.get(executor_type.value, {}))
+    return ResourceLimits(
+        cpu_weight=values.get("cpu_weight") or None,
+        memory_max_mb=values.get("memory_max_mb") or None,
+        pids_max=values.get("pids_max") or None,
+    )
+
+
+def merge_usage(
+    first: RunResourceUsage | None, second: RunResourceUsage | None
+) -> RunResourceUsage | None:
+    """Combine the usage of two launches (times and bytes add up, peaks do not)."""
+    if first is None or second is None:
+        return first or second
+
+    def add(a: Any, b: Any) -> Any:
+        return b if a is None else a if b is None else a + b
+
+    peaks = [p for p in (first.peak_memory_bytes, second.peak_memory_bytes) if p is not None]
+    return RunResourceUsage(
+        isolation=second.isolation,
+        peak_memory_bytes=max(peaks) if peaks else None,
+        cpu_user_seconds=add(first.cpu_user_seconds, second.cpu_user_seconds),
+        cpu_system_seconds=add(first.cpu_system_seconds, second.cpu_system_seconds),
+        io_read_bytes=add(first.io_read_bytes, second.io_read_bytes),
+        io_write_bytes=add(first.io_write_bytes, second.io_write_bytes),
+    )
+
+
+def _nice_for_weight(cpu_weight: int) -> int:
+    """Map a cgroup cpu.weight to a nice level (each level is ~1.25x CPU share)."""
+    if cpu_weight >= DEFAULT_CPU_WEIGHT:
+        return 0  # Raising priority needs privileges
+    return min(19, round(math.log(DEFAULT_CPU_WEIGHT / cpu_weight, 1.25)))
+
+
+class IsolatedProcess:
+    """A started executor process with its cgroup or process group."""
+
+    def __init__(
+        self,
+        process: asyncio.subprocess.Process,
+        mode: str,
+        cgroup_path: Path | None = None,
+        sample_interval: float = PROC_SAMPLE_SECONDS,
+    ):
+        self.process = process
+        self.mode = mode
+        self.cgroup_path = cgroup_path
+        self._usage: RunResourceUsage | None = None
+        self._finished = False
+        # rlimit mode: pid -> (cpu user s, cpu system s, read bytes, write bytes)
+        self._proc_totals: dict[int, tuple[float, float, int, int]] = {}
+        self._proc_peak_rss = 0
+        self._sampler: asyncio.Task[None] | None = None
+        if mode == "rlimit" and sys.platform.startswith("linux"):
+            self._sampler = asyncio.create_task(self._sample_loop(sample_interval))
+
+    @property
+    def pid(self) -> int:
+        return self.process.pid
+
+    def signal_tree(self, sig: int) -> None:
+        """Send a signal to every process of the tree."""
+        if sig == signal.SIGKILL and self.cgroup_path is not None:
+            kill_file = self.cgroup_path / "cgroup.kill"
+            if kill_file.exists():
+                with contextlib.suppress(OSError):
+                    kill_file.write_text("1")
+                    return
+        with contextlib.suppress(ProcessLookupError, PermissionError):
+            os.killpg(self.pid, sig)
+
+    async def kill_tree(self) -> None:
+        """Kill the whole process tree and wait for the top-level process."""
+        self.signal_tree(signal.SIGKILL)
+        with contextlib.suppress(ProcessLookupError):
+            self.process.kill()
+        await self.process.wait()
+
+    async def finish(self) -> RunResourceUsage | None:
+        """Kill what is left of the tree, collect usage and release the cgroup.
+
+        Safe to call more than once; later calls return the recorded usage.
+        """
+        if self._finished:
+            return self._usage
+        self._finished = True
+
+        # Stray children (dev servers, watchers) must not outlive the launch
+        self.signal_tree(signal.SIGKILL)
+        await self.process.wait()
+
+        if self._sampler is not None:
+            self._sampler.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._sampler
+            self._record_sample(await asyncio.to_thread(_sample_process_group, self.pid))
+
+        if self.mode == "cgroup" and self.cgroup_path is not None:
+            self._usage = self._read_cgroup_usage(self.cgroup_path)
+            await self._remove_cgroup(self.cgroup_path)
+        elif self.mode == "rlimit" and self._proc_totals:
+            self._usage = RunResourceUsage(
+                isolation="rlimit",
+                peak_memory_bytes=self._proc_peak_rss or None,
+                cpu_user_seconds=round(sum(t[0] for t in self._proc_totals.values()), 3),
+                cpu_system_seconds=round(sum(t[1] for t in self._proc_totals.values()), 3),
+                io_read_bytes=sum(t[2] for t in self._proc_totals.values()),
+                io_write_bytes=sum(t[3] for t in self._proc_totals.values()),
+            )
+        return self._usage
+
+    def _read_cgroup_usage(self, path: Path) -> RunResourceUsage:
+        usage = RunResourceUsage(isolation="cgroup")
+        peak = _read_text(path / "memory.peak")
+        if peak and peak.strip().isdigit():
+            usage.peak_memory_bytes = int(peak)
+
+        cpu_stat = _parse_flat_keyed(_read_text(path / "cpu.stat"))
+        if "user_usec" in cpu_stat:
+            usage.cpu_user_seconds = cpu_stat["user_usec"] / 1_000_000
+        if "system_usec" in cpu_stat:
+            usage.cpu_system_seconds = cpu_stat["system_usec"] / 1_000_000
+
+        io_stat = _read_text(path / "io.stat")
+        if io_stat is not None:
+            read_bytes = write_bytes = 0
+            for line in io_stat.splitlines():
+                # "<major>:<minor> rbytes=... wbytes=... rios=... ..."
+                fields = _parse_flat_keyed(line.partition(" ")[2].replace("=", " "))
+                read_bytes += fields.get("rbytes", 0)
+                write_bytes += fields.get("wbytes", 0)
+            usage.io_read_bytes = read_bytes
+            usage.io_write_bytes = write_bytes
+        return usage
+
+    async def _remove_cgroup(self, path: Path) -> None:
+        for _ in range(CGROUP_REMOVE_ATTEMPTS):
+            try:
+                path.rmdir()
+                return
+            except FileNotFoundError:
+                return
+            except OSError:
+                # Killed processes take a moment to leave the cgroup
+                await asyncio.sleep(0.05)
+        logger.warning(f"Could not remove executor cgroup {path}")
+
+    async def _sample_loop(self, interval: float) -> None:
+        while self.process.returncode is None:
+            # Scanning /proc blocks; keep it off the event loop
+            self._record_sample(await asyncio.to_thread(_sample_process_group, self.pid))
+            await asyncio.sleep(interval)
+
+    def _record_sample(self, sample: ProcSample) -> None:
+        rss_total, totals = sample
+        self._proc_totals.update(totals)
+        self._proc_peak_rss = max(self._proc_peak_rss, rss_total)
+
+
+class ProcessIsolator:
+    """Starts executor processes with resource limits and accounting."""
+
+    def __init__(
+        self,
+        *,
+        mode: str | None = None,
+        cgroup_root: str | Path | None = None,
+        sample_interval: float = PROC_SAMPLE_SECONDS,
+    ):
+        """Initialize the isolator.
+
+        Args:
+            mode: "auto", "cgroup", "rlimit" or "off". Defaults to settings.
+            cgroup_root: Delegated cgroup v2 directory for executor cgroups.
+            sample_interval: Interval of /proc usage samples in rlimit mode.
+        """
+        self.requested_mode = mode or settings.executor_isolation
+        self.cgroup_root = Path(cgroup_root or settings.executor_cgroup_root)
+        self.sample_interval = sample_interval
+        self._mode: str | None = None
+
+    @property
+    def mode(self) -> str:
+        """Isolation mode in effect (resolved on first use)."""
+        if self._mode is None:
+            self._mode = self._resolve_mode()
+        return self._mode
+
+    async def spawn(
+        self,
+        cmd: list[str],
+        executor_type: ExecutorType,
+        **kwargs: Any,
+    ) -> IsolatedProcess:
+        """Start an executor process.
+
+        Args:
+            cmd: Command line; cmd[0] is looked up in PATH.
+            executor_type: Executor type whose limits apply.
+            **kwargs: Passed to ``asyncio.create_subprocess_exec`` (cwd, env,
+                stdin, stdout, stderr, limit).
+
+        Returns:
+            The started process.
+
+        Raises:
+            FileNotFoundError: The executable does not exist.
+        """
+        env = kwargs.get("env")
+        executable = shutil.which(cmd[0], path=(env or os.environ).get("PATH"))
+        if executable is None:
+            raise FileNotFoundError(cmd[0])
+        cmd = [executable, *cmd[1:]]
+        limits = limits_for(executor_type)
+
+        if self.mode == "cgroup":
+            cgroup_path = self._create_cgroup(executor_type, limits)
+            # The wrapper joins the cgroup before exec, so no child can escape it
+            wrapped = [
+                "/bin/sh",
+                "-c",
+                'echo $$ > "$0" && exec "$@"',
+                str(cgroup_path / "cgroup.procs"),
+                *cmd,
+            ]
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    *wrapped, start_new_session=True, **kwargs
+                )
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    cgroup_path.rmdir()
+                raise
+            return IsolatedProcess(process, "cgroup", cgroup_path=cgroup_path)
+
+        if self.mode == "rlimit":
+            # Applied by a wrapper before the CLI execs, so children it starts
+            # right away are covered too (preexec_fn is unsafe in a threaded process)
+            cmd = _rlimit_wrapper(cmd, limits)
+        process = await asyncio.create_subprocess_exec(*cmd, start_new_session=True, **kwargs)
+        return IsolatedProcess(process, self.mode, sample_interval=self.sample_interval)
+
+    def _resolve_mode(self) -> str:
+        requested = self.requested_mode
+        if requested == "off":
+            return "off"
+        if requested in ("auto", "cgroup"):
+            if self._prepare_cgroup_root():
+                return "cgroup"
+            if requested == "cgroup":
+                logger.warning(
+                    f"cgroup v2 root {self.cgroup_root} is not usable; "
+                    "falling back to rlimit isolation"
+                )
+        if sys.platform.startswith("linux"):
+            return "rlimit"
+        return "off"
+
+    def _prepare_cgroup_root(self) -> bool:
+        """Create the executor cgroup root and enable controllers for its children."""
+        if not (self.cgroup_root.parent / "cgroup.controllers").exists():
+            return False
+        try:
+            self.cgroup_root.mkdir(exist_ok=True)
+        except OSError as e:
+            logger.info(f"Cannot create executor cgroup root {self.cgroup_root}: {e}")
+            return False
+
+        subtree = self.cgroup_root / "cgroup.subtree_control"
+        for controller in CGROUP_CONTROLLERS:
+            try:
+                subtree.write_text(f"+{controller}")
+            except OSError as e:
+                # Not delegated / not available: limits of this controller are skipped
+                logger.info(f"cgroup controller '{controller}' unavailable for executors: {e}")
+        return True
+
+    def _create_cgroup(self, executor_type: ExecutorType, limits: ResourceLimits) -> Path:
+        path = self.cgroup_root / f"{executor_type.value}-{uuid.uuid4().hex[:12]}"
+        path.mkdir()
+        values = {
+            "cpu.weight": limits.cpu_weight,
+            "memory.max": limits.memory_max_mb * 1024 * 1024 if limits.memory_max_mb else None,
+            "pids.max": limits.pids_max,
+        }
+        for name, value in values.items():
+            limit_file = path / name
+            if value is None or not limit_file.exists():
+                continue
+            try:
+                limit_file.write_text(str(value))
+            except OSError as e:
+                logger.warning(f"Could not set {name}={value} on {path}: {e}")
+        return path
+
+
+# (RSS of the group, pid -> (cpu user s, cpu system s, read bytes, write bytes))
+ProcSample = tuple[int, dict[int, tuple[float, float, int, int]]]
+
+
+def _sample_process_group(pgid: int) -> ProcSample:
+    """Sample RSS, CPU time and I/O of a process group from /proc."""
+    tick = os.sysconf("SC_CLK_TCK")
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    rss_total = 0
+    totals: dict[int, tuple[float, float, int, int]] = {}
+    for entry in os.scandir("/proc"):
+        if not entry.name.isdigit():
+            continue
+        stat = _read_text(Path(entry.path) / "stat")
+        if stat is None:
+            continue
+        # Fields after the parenthesized command name, starting at field 3
+        fields = stat.rpartition(")")[2].split()
+        if len(fields) < 22 or int(fields[2]) != pgid:  # pgrp
+            continue
+        rss_total += int(fields[21]) * page_size
+        io = _parse_flat_keyed((_read_text(Path(entry.path) / "io") or "").replace(":", " "))
+        totals[int(entry.name)] = (
+            int(fields[11]) / tick,
+            int(fields[12]) / tick,
+            io.get("read_bytes", 0),
+            io.get("write_bytes", 0),
+        )
+    return rss_total, totals
+
+
+def _rlimit_wrapper(cmd: list[str], limits: ResourceLimits) -> list[str]:
+    """Wrap a command so the rlimit mode limits are set before it execs.
+
+    ``sh`` sets the data segment limit with ``ulimit -d`` (in KiB) and ``nice``
+    lowers the priority; both exec, so the CLI keeps the wrapper's PID.
+    """
+    nice = _nice_for_weight(limits.cpu_weight) if limits.cpu_weight else 0
+    nice_path = shutil.which("nice") if nice else None
+    if nice_path:
+        cmd = [nice_path, "-n", str(nice), *cmd]
+    if not limits.memory_max_mb:
+        return cmd
+    # A shell that cannot set the limit still starts the CLI
+    return [
+        "/bin/sh",
+        "-c",
+        'ulimit -d "$0" 2>/dev/null; exec "$@"',
+        str(limits.memory_max_mb * 1024),
+        *cmd,
+    ]
+
+
+def _read_text(path: Path) -> str | None:
+    try:
+        return path.read_text()
+    except OSError:
+        return None
+
+
+def _parse_flat_keyed(text: str | None) -> dict[str, int]:
+    """Parse "key value" pairs (cgroup flat-keyed files, /proc/<pid>/io)."""
+    values: dict[str, int] = {}
+    tokens = (text or "").split()
+    for key, value in zip(tokens[::2], tokens[1::2], strict=False):
+        if value.isdigit():
+            values[key] = int(value)
+    return values
+
+
+_process_isolator: ProcessIsolator | None = None
+
+
+def get_process_isolator() -> ProcessIsolator:
+    """Get the process-wide executor process isolator."""
+    global _process_isolator
+    if _process_isolator is None:
+        _process_isolator = ProcessIsolator()
+    return _process_isolator
@@ -0,0 +1,88 @@
+"""Registry of the CLI processes started on behalf of each job.
+
+A job worker runs each job under ``track_processes(job_id)``; every executor
+process started while the job runs is recorded under the job's ID. Cancelling
+a job cancels its asyncio task, whose cleanup kills the process tree. The
+registry is the backstop: whatever is still alive once the task had time to
+unwind (a process started outside the streaming pipeline, a cleanup that got
+stuck) is killed by ``kill(job_id)``.
+
+The owner is carried in a context variable, so processes started by tasks the
+job spawns are attributed to it as well.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+from collections.abc import Iterator
+from contextvars import ContextVar
+
+from zloth_api.executors.process_isolation import IsolatedProcess
+
+logger = logging.getLogger(__name__)
+
+_owner: ContextVar[str | None] = ContextVar("executor_process_owner", default=None)
+
+
+class ProcessRegistry:
+    """Executor processes by the ID of the job that started them."""
+
+    def __init__(self) -> None:
+        self._processes: dict[str, list[IsolatedProcess]] = {}
+
+    def register(self, isolated: IsolatedProcess) -> None:
+        """Record a started process under the current owner (if any)."""
+        owner = _owner.get()
+        if owner is None:
+            return
+        self._prune()
+        self._processes.setdefault(owner, []).append(isolated)
+
+    def processes(self, owner: str) -> list[IsolatedProcess]:
+        """Processes of an owner that are still running."""
+        self._prune()
+        return list(self._processes.get(owner, []))
+
+    async def kill(self, owner: str) -> int:
+        """Kill the process trees of an owner.
+
+        Returns:
+            Number of process trees that were still running.
+        """
+        processes = self.processes(owner)
+        for isolated in processes:
+            logger.warning(f"Killing executor process {isolated.pid} of job {owner}")
+            await isolated.kill_tree()
+        self._processes.pop(owner, None)
+        return len(processes)
+
+    def _prune(self) -> None:
+        """Forget processes that have exited."""
+        for owner, processes in list(self._processes.items()):
+            running = [p for p in processes if p.process.returncode is None]
+            if running:
+                self._processes[owner] = running
+            else:
+                del self._processes[owner]
+
+
+@contextlib.contextmanager
+def track_processes(owner: str) -> Iterator[None]:
+    """Attribute the executor processes started in this context to an owner."""
+    token = _owner.set(owner)
+    try:
+        yield
+    finally:
+        _owner.reset(token)
+
+
+_registry: ProcessRegistry | None = None
+
+
+def get_process_registry() -> ProcessRegistry:
+    """Get the process-wide process registry."""
+    global _registry
+    if _registry is None:
+        _registry = ProcessRegistry()
+    return _registry
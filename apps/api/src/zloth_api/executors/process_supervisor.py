@@ -0,0 +1,244 @@
+"""Supervision of running CLI executor processes.
+
+Every executor reads the CLI's output through ``ProcessSupervisor``, which
+enforces one timeout policy for all of them:
+
+- total timeout: the launch may run at most ``timeout_seconds``,
+- idle timeout: the CLI is considered hung once it has printed nothing for
+  ``executor_idle_timeout_seconds``,
+- stall warning: after ``executor_stall_warning_seconds`` of silence a
+  ``stalled`` event is reported (and ``resumed`` once output continues), so
+  clients see a hung CLI long before it is terminated.
+
+A timed out process tree is terminated softly first (SIGTERM to the whole
+process group, so the CLI can write its session state), and killed with
+SIGKILL if it is still alive after ``executor_termination_grace_seconds``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import signal
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Literal
+
+from zloth_api.config import settings
+from zloth_api.executors.process_isolation import IsolatedProcess
+
+logger = logging.getLogger(__name__)
+
+# Process events reported through the on_event callback of the executors
+STALLED_EVENT = "stalled"
+RESUMED_EVENT = "resumed"
+
+EventCallback = Callable[[str, str], Awaitable[None]]
+TimeoutKind = Literal["idle", "total"]
+
+# Pipe read size of LineReader
+READ_CHUNK_BYTES = 64 * 1024
+
+
+class LineReader:
+    """Splits a process's output stream into lines using chunked reads.
+
+    Unlike ``StreamReader.readline`` there is no line length limit (a single
+    tool result can be larger than the reader's buffer limit); output is read
+    in chunks of ``READ_CHUNK_BYTES``. ``readline`` is cancellation safe.
+    """
+
+    def __init__(self, stream: asyncio.StreamReader, chunk_size: int = READ_CHUNK_BYTES):
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._buffer = bytearray()
+        self._scanned = 0  # Bytes of the buffer known to contain no newline
+        self._eof = False
+
+    async def readline(self) -> bytes:
+        """Next line including its newline; the rest of the output at EOF, then b""."""
+        while True:
+            newline = self._buffer.find(b"\n", self._scanned)
+            if newline >= 0:
+                line = bytes(self._buffer[: newline + 1])
+                del self._buffer[: newline + 1]
+                self._scanned = 0
+                return line
+            self._scanned = len(self._buffer)
+            if self._eof:
+                line = bytes(self._buffer)
+                self._buffer.clear()
+                self._scanned = 0
+                return line
+            chunk = await self._stream.read(self._chunk_size)
+            if chunk:
+                self._buffer.extend(chunk)
+            else:
+                self._eof = True
+
+
+@dataclass
+class SupervisedExit:
+    """How a supervised process ended."""
+
+    returncode: int | None
+    timeout: TimeoutKind | None = None  # Set if the supervisor terminated the process
+    timeout_seconds: float | None = None  # The limit that was exceeded
+    output_lines: int = 0
+
+    @property
+    def timed_out(self) -> bool:
+        return self.timeout is not None
+
+    @property
+    def error(self) -> str | None:
+        """Error message for a timed out process."""
+        if self.timeout == "idle":
+            return (
+                f"No output for {self.timeout_seconds:g} seconds; the CLI was terminated as stalled"
+            )
+        if self.timeout == "total":
+            return f"Execution timed out after {self.timeout_seconds:g} seconds"
+        return None
+
+
+class ProcessSupervisor:
+    """Reads a process's output under the executor timeout policy."""
+
+    def __init__(
+        self,
+        total_timeout: float | None,
+        *,
+        idle_timeout: float | None = None,
+        stall_warning: float | None = None,
+        grace_seconds: float | None = None,
+    ):
+        """Initialize the supervisor.
+
+        Args:
+            total_timeout: Maximum run time of the process (None or 0 = unlimited).
+            idle_timeout: Maximum time without output. Defaults to settings.
+            stall_warning: Silence after which a stalled event is reported.
+                Defaults to settings.
+            grace_seconds: Time between SIGTERM and SIGKILL. Defaults to settings.
+        """
+
+        def _limit(value: float | None) -> float | None:
+            return value if value else None  # 0 disables a limit
+
+        self.total_timeout = _limit(total_timeout)
+        self.idle_timeout = _limit(
+            idle_timeout if idle_timeout is not None else settings.executor_idle_timeout_seconds
+        )
+        self.stall_warning = _limit(
+            stall_warning if stall_warning is not None else settings.executor_stall_warning_seconds
+        )
+        self.grace_seconds = (
+            grace_seconds
+            if grace_seconds is not None
+            else settings.executor_termination_grace_seconds
+        )
+
+    async def run(
+        self,
+        isolated: IsolatedProcess,
+        on_line: Callable[[bytes], Awaitable[None]],
+        on_event: EventCallback | None = None,
+        until: Callable[[], bool] | None = None,
+        reader: LineReader | None = None,
+    ) -> SupervisedExit:
+        """Feed the process's stdout lines to ``on_line`` until it exits.
+
+        The process is terminated if it exceeds a timeout; it has always
+        exited when this returns, unless ``until`` ended the read first.
+
+        Args:
+            isolated: The started process; its stdout must be a pipe.
+            on_line: Called with every raw output line.
+            on_event: Called with (event, message) for stalled/resumed events.
+            until: Checked after every line; returning True stops reading and
+                leaves the process running (one turn of a long-lived session).
+            reader: Reader of the process's stdout, for processes read over
+                several calls. A new one is used if not given.
+
+        Returns:
+            The exit code (None if stopped by ``until``) and the timeout that
+            ended the process, if any.
+        """
+        process = isolated.process
+        if reader is None and process.stdout is not None:
+            reader = LineReader(process.stdout)
+        started = time.monotonic()
+        total = self.total_timeout
+        deadline = started + total if total is not None else None
+        last_output = started
+        stalled = False
+        lines = 0
+
+        async def _timed_out(kind: TimeoutKind, limit: float) -> SupervisedExit:
+            logger.warning(
+                f"Executor process {process.pid} exceeded its {kind} timeout ({limit:g}s)"
+            )
+            await self.terminate(isolated)
+            return SupervisedExit(process.returncode, kind, limit, lines)
+
+        while reader is not None:
+            now = time.monotonic()
+            waits = []
+            if deadline is not None:
+                waits.append(deadline - now)
+            if self.idle_timeout is not None:
+                waits.append(last_output + self.idle_timeout - now)
+            if self.stall_warning is not None and not stalled:
+                waits.append(last_output + self.stall_warning - now)
+
+            try:
+                # readline() is cancellation safe: a partial line stays buffered
+                line = await asyncio.wait_for(
+                    reader.readline(), timeout=max(0.0, min(waits)) if waits else None
+                )
+            except TimeoutError:
+                now = time.monotonic()
+                silence = now - last_output
+                if total is not None and deadline is not None and now >= deadline:
+                    return await _timed_out("total", total)
+                if self.idle_timeout is not None and silence >= self.idle_timeout:
+                    return await _timed_out("idle", self.idle_timeout)
+                if self.stall_warning is not None and not stalled and silence >= self.stall_warning:
+                    stalled = True
+                    logger.warning(f"Executor process {process.pid} silent for {silence:.0f}s")
+                    if on_event:
+                        await on_event(STALLED_EVENT, f"No output for {silence:.0f} seconds")
+                continue
+
+            if not line:
+                break
+            last_output = time.monotonic()
+            lines += 1
+            if stalled:
+                stalled = False
+                if on_event:
+                    await on_event(RESUMED_EVENT, "Output resumed")
+            await on_line(line)
+            if until is not None and until():
+                return SupervisedExit(None, output_lines=lines)
+
+        # EOF: the CLI closed its output; it still has to exit within the total timeout
+        remaining = deadline - time.monotonic() if deadline is not None else None
+        try:
+            await asyncio.wait_for(process.wait(), timeout=remaining)
+        except TimeoutError:
+            return await _timed_out("total", total or 0)
+        return SupervisedExit(process.returncode, output_lines=lines)
+
+    async def terminate(self, isolated: IsolatedProcess) -> None:
+        """Stop a process tree: SIGTERM, then SIGKILL after the grace period."""
+        process = isolated.process
+        if process.returncode is None and self.grace_seconds > 0:
+            isolated.signal_tree(signal.SIGTERM)
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(process.wait(), timeout=self.grace_seconds)
+        # Also reaps children that ignored SIGTERM or outlived the top-level process
+        await isolated.kill_tree()
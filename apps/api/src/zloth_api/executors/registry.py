@@ -0,0 +1,60 @@
+"""Registry of CLI executors.
+
+Executor classes register themselves with ``@register_executor``; services
+create executors through the registry instead of naming each CLI, so a new
+CLI only needs an executor module (imported in ``zloth_api.executors``).
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from zloth_api.domain.enums import ExecutorType
+from zloth_api.executors.base_executor import BaseExecutor
+
+_EXECUTORS: dict[ExecutorType, type[BaseExecutor]] = {}
+
+
+def register_executor[E: type[BaseExecutor]](cls: E) -> E:
+    """Class decorator registering an executor for its ``executor_type``."""
+    _EXECUTORS[cls.executor_type] = cls
+    return cls
+
+
+def executor_class(executor_type: ExecutorType) -> type[BaseExecutor]:
+    """Executor class registered for a type.
+
+    Raises:
+        ValueError: No executor is registered for the type.
+    """
+    cls = _EXECUTORS.get(executor_type)
+    if cls is None:
+        raise ValueError(f"Executor not available: {executor_type}")
+    return cls
+
+
+def registered_executor_types() -> list[ExecutorType]:
+    """Executor types that have a registered executor."""
+    return list(_EXECUTORS)
+
+
+def create_executor(executor_type: ExecutorType, **options: Any) -> BaseExecutor:
+    """Create an executor configured from settings.
+
+    Args:
+        executor_type: Type of executor.
+        **options: Option overrides (e.g. timeout_seconds).
+
+    Raises:
+        ValueError: No executor is registered for the type.
+    """
+    return executor_class(executor_type).from_settings(**options)
+
+
+def create_executors(**options: Any) -> dict[ExecutorType, BaseExecutor]:
+    """Create one executor per registered type.
+
+    Args:
+        **options: Option overrides applied to every executor.
+    """
+    return {t: cls.from_settings(**options) for t, cls in _EXECUTORS.items()}
@@ -0,0 +1,230 @@
+"""Incremental decoder for Claude Code ``--output-format stream-json`` output.
+
+Every stdout line of ``claude -p --verbose --output-format stream-json`` is
+one JSON event. Most of the volume is in ``user`` events carrying tool
+results (file contents, command output), which are never displayed. The
+decoder therefore:
+
+- sniffs the event type from the start of the raw line and skips ``user``
+  events without parsing them,
+- parses the other events straight from bytes into typed pydantic schemas
+  (Rust JSON parser, no intermediate dicts); fields that are not part of a
+  schema (tool inputs, cached content) are never turned into Python objects,
+- keeps the session ID, model, tool call count and the ``result`` event
+  (cost, usage, turns), which together make up the ``ExecutionStats``.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+
+from pydantic import BaseModel, Field, ValidationError
+
+from zloth_api.domain.models import ExecutionStats
+from zloth_api.executors.output_parser import OutputParser
+
+logger = logging.getLogger(__name__)
+
+# Event type as the first key of the object, as written by the CLI
+_TYPE_PREFIX = re.compile(rb'\{\s*"type"\s*:\s*"([A-Za-z_]+)"')
+_UUID = r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"
+# Session ID hints in plain text (non-JSON) output
+_SESSION_PATTERNS = [
+    # "Session ID: <uuid>" or "session_id: <uuid>"
+    re.compile(r"session[_\s]?id[:\s]+(" + _UUID + r")", re.IGNORECASE),
+    # "--resume <uuid>" or "--session-id <uuid>" hint
+    re.compile(r"--(?:resume|session-id)\s+(" + _UUID + r")", re.IGNORECASE),
+    # "session: <uuid>"
+    re.compile(r"\bsession[:\s]+(" + _UUID + r")", re.IGNORECASE),
+]
+
+
+class _EventHeader(BaseModel):
+    """Fields common to all events (used when the type is not the first key)."""
+
+    type: str | None = None
+
+
+class _ContentBlock(BaseModel):
+    type: str = ""
+    text: str | None = None
+
+
+class _AssistantMessage(BaseModel):
+    model: str | None = None
+    content: list[_ContentBlock] = Field(default_factory=list)
+
+
+class AssistantEvent(BaseModel):
+    """``{"type": "assistant", "message": {"content": [...]}}``"""
+
+    message: _AssistantMessage = Field(default_factory=_AssistantMessage)
+    session_id: str | None = None
+
+
+class SystemEvent(BaseModel):
+    """``{"type": "system", "subtype": "init", "session_id": ..., "model": ...}``"""
+
+    subtype: str | None = None
+    message: str | None = None
+    session_id: str | None = None
+    model: str | None = None
+
+
+class ResultUsage(BaseModel):
+    """Token usage of a whole CLI invocation."""
+
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_creation_input_tokens: int = 0
+    cache_read_input_tokens: int = 0
+
+
+class ResultEvent(BaseModel):
+    """Final ``{"type": "result", ...}`` event of a CLI invocation."""
+
+    subtype: str | None = None
+    is_error: bool = False
+    session_id: str | None = None
+    total_cost_usd: float | None = None
+    cost_usd: float | None = None  # Older CLI versions
+    duration_ms: int | None = None
+    duration_api_ms: int | None = None
+    num_turns: int | None = None
+    usage: ResultUsage | None = None
+
+    @property
+    def cost(self) -> float | None:
+        return self.total_cost_usd if self.total_cost_usd is not None else self.cost_usd
+
+
+_EVENTS: dict[str, type[AssistantEvent] | type[SystemEvent] | type[ResultEvent]] = {
+    "assistant": AssistantEvent,
+    "system": SystemEvent,
+    "result": ResultEvent,
+}
+
+
+def _is_invalid_json(error: ValidationError) -> bool:
+    return any(e["type"] == "json_invalid" for e in error.errors())
+
+
+class StreamJsonDecoder(OutputParser):
+    """Decodes stream-json events line by line and keeps what the run needs."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.model: str | None = None
+        self.result: ResultEvent | None = None
+        self.tool_calls = 0
+        self.events = 0
+        # Events skipped without parsing (tool results)
+        self.skipped_events = 0
+        self.skipped_bytes = 0
+
+    def feed(self, line: bytes) -> str | None:
+        """Decode one output line.
+
+        Args:
+            line: Raw stdout line.
+
+        Returns:
+            Human-readable text for display, or None if not displayable.
+        """
+        line = line.strip()
+        if not line:
+            return None
+        if not line.startswith(b"{"):
+            return self._plain_text(line)
+
+        match = _TYPE_PREFIX.match(line)
+        if match is not None:
+            event_type = match.group(1).decode("ascii")
+        else:
+            try:
+                event_type = _EventHeader.model_validate_json(line).type or ""
+            except ValidationError as e:
+                return self._plain_text(line) if _is_invalid_json(e) else None
+
+        self.events += 1
+        schema = _EVENTS.get(event_type)
+        if schema is None:
+            # "user" (tool results) and unknown events are not displayed
+            self.skipped_events += 1
+            self.skipped_bytes += len(line)
+            return None
+
+        try:
+            event = schema.model_validate_json(line)
+        except ValidationError as e:
+            if _is_invalid_json(e):
+                return self._plain_text(line)
+            logger.debug(f"Unexpected stream-json {event_type} event: {e}")
+            return None
+        return self._handle(event)
+
+    @property
+    def turn_complete(self) -> bool:
+        """A ``result`` event ends every turn."""
+        return self.result is not None
+
+    def _handle(self, event: AssistantEvent | SystemEvent | ResultEvent) -> str | None:
+        if isinstance(event, AssistantEvent):
+            self.model = event.message.model or self.model
+            self.session_id = self.session_id or event.session_id
+            self.tool_calls += sum(1 for b in event.message.content if b.type == "tool_use")
+            texts = [b.text for b in event.message.content if b.type == "text" and b.text]
+            return "".join(texts) or None
+
+        if isinstance(event, SystemEvent):
+            self.model = event.model or self.model
+            self.session_id = event.session_id or self.session_id
+            return f"[system] {event.message}" if event.message else None
+
+        self.result = event
+        if event.session_id:
+            self.session_id = event.session_id
+            logger.info(f"Extracted session_id from result: {event.session_id}")
+        return None
+
+    def stats(self, wall_time_ms: int | None = None) -> ExecutionStats:
+        """Execution stats of the turn decoded so far.
+
+        Args:
+            wall_time_ms: Measured run time of the CLI process.
+        """
+        stats = ExecutionStats(
+            model=self.model,
+            tool_calls=self.tool_calls,
+            wall_time_ms=wall_time_ms,
+        )
+        result = self.result
+        if result is None:
+            return stats
+        stats.cost_usd = result.cost
+        stats.num_turns = result.num_turns
+        stats.api_time_ms = result.duration_api_ms
+        if result.usage is not None:
+            usage = result.usage
+            stats.input_tokens = usage.input_tokens
+            stats.output_tokens = usage.output_tokens
+            stats.cache_read_tokens = usage.cache_read_input_tokens
+            stats.cache_write_tokens = usage.cache_creation_input_tokens
+            stats.total_tokens = (
+                usage.input_tokens
+                + usage.output_tokens
+                + usage.cache_read_input_tokens
+                + usage.cache_creation_input_tokens
+            )
+        return stats
+
+    def _plain_text(self, line: bytes) -> str:
+        text = line.decode("utf-8", errors="replace")
+        if self.session_id is None:
+            for pattern in _SESSION_PATTERNS:
+                match = pattern.search(text)
+                if match:
+                    self.session_id = match.group(1)
+                    break
+        return text
@@ -0,0 +1,195 @@
+"""Long-lived CLI sessions reused across the runs of a task.
+
+Starting a CLI costs seconds before it does any work: Node starts, auth and
+config are read and the workspace is indexed. With ``executor_warm_sessions``
+enabled, an executor that supports streaming input keeps its process alive
+after a run and feeds the next instruction of the same task (follow-ups,
+review fixes) into it instead of starting a new one.
+
+Sessions are keyed by (task, executor type). A session is checked out for the
+duration of one turn, so concurrent runs of the same task never share a
+process; a run that finds the session busy starts a cold process. Sessions
+idle for longer than ``executor_warm_session_ttl_seconds`` are recycled, and
+at most ``executor_warm_sessions_max`` are kept (least recently used first out).
+
+Idle sessions do not hold an admission slot; the memory they use is seen by
+the admission controller's host memory check.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from pathlib import Path
+
+from zloth_api.config import settings
+from zloth_api.domain.enums import ExecutorType
+from zloth_api.executors.process_isolation import IsolatedProcess
+from zloth_api.executors.process_supervisor import LineReader
+
+logger = logging.getLogger(__name__)
+
+SessionKey = tuple[str, ExecutorType]
+
+# Time a closed session gets to exit on its own before its tree is killed
+CLOSE_GRACE_SECONDS = 5.0
+
+
+class WarmSession:
+    """A running CLI process that accepts instructions on stdin."""
+
+    def __init__(
+        self,
+        key: SessionKey,
+        isolated: IsolatedProcess,
+        worktree_path: Path,
+        read_only: bool,
+        session_id: str | None = None,
+    ):
+        self.key = key
+        self.isolated = isolated
+        # One reader across turns, so output read ahead of a turn's end is kept
+        stdout = isolated.process.stdout
+        if stdout is None:
+            raise ValueError("Warm session needs a stdout pipe")
+        self.reader = LineReader(stdout)
+        self.worktree_path = worktree_path
+        self.read_only = read_only
+        self.session_id = session_id  # CLI conversation ID, known after the first turn
+        self.turns = 0
+        self.last_used = time.monotonic()
+
+    @property
+    def alive(self) -> bool:
+        return self.isolated.process.returncode is None
+
+    def matches(self, worktree_path: Path, read_only: bool, resume_session_id: str | None) -> bool:
+        """Whether the session can run the next turn of this conversation."""
+        return (
+            self.alive
+            and self.worktree_path == worktree_path
+            and self.read_only == read_only
+            and self.session_id is not None
+            and self.session_id == resume_session_id
+        )
+
+    async def send(self, message: bytes) -> None:
+        """Write one input message (a complete line) to the CLI's stdin."""
+        stdin = self.isolated.process.stdin
+        if stdin is None:
+            raise RuntimeError("Warm session has no stdin pipe")
+        stdin.write(message)
+        await stdin.drain()
+        self.last_used = time.monotonic()
+
+    async def close(self) -> None:
+        """End the session: close stdin, let the CLI exit, then release the tree."""
+        process = self.isolated.process
+        if process.stdin is not None and not process.stdin.is_closing():
+            process.stdin.close()
+        if process.returncode is None:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(process.wait(), timeout=CLOSE_GRACE_SECONDS)
+        await self.isolated.finish()
+        logger.info(f"Closed warm {self.key[1].value} session for task {self.key[0]}")
+
+
+class WarmSessionPool:
+    """Idle warm sessions, at most one per (task, executor type)."""
+
+    def __init__(self, ttl_seconds: float | None = None, max_sessions: int | None = None):
+        """Initialize the pool.
+
+        Args:
+            ttl_seconds: Idle time after which a session is recycled. Defaults to settings.
+            max_sessions: Maximum idle sessions kept. Defaults to settings.
+        """
+        self.ttl_seconds = (
+            ttl_seconds if ttl_seconds is not None else settings.executor_warm_session_ttl_seconds
+        )
+        self.max_sessions = (
+            max_sessions if max_sessions is not None else settings.executor_warm_sessions_max
+        )
+        self._sessions: dict[SessionKey, WarmSession] = {}
+        self._reaper: asyncio.Task[None] | None = None
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    async def checkout(self, key: SessionKey) -> WarmSession | None:
+        """Take the idle session for a key out of the pool, if there is a live one."""
+        session = self._sessions.pop(key, None)
+        if session is not None and not session.alive:
+            logger.info(f"Warm {key[1].value} session for task {key[0]} has exited")
+            await session.close()
+            return None
+        return session
+
+    async def checkin(self, session: WarmSession) -> None:
+        """Return a session after a successful turn so the next one can reuse it."""
+        session.last_used = time.monotonic()
+        replaced = self._sessions.pop(session.key, None)
+        if replaced is not None and replaced is not session:
+            await replaced.close()
+        if self.max_sessions <= 0:
+            await session.close()
+            return
+        self._sessions[session.key] = session
+        while len(self._sessions) > self.max_sessions:
+            oldest = min(self._sessions.values(), key=lambda s: s.last_used)
+            del self._sessions[oldest.key]
+            await oldest.close()
+        if self._reaper is None or self._reaper.done():
+            self._reaper = asyncio.create_task(self._reap_loop())
+
+    async def reap_idle(self) -> int:
+        """Close sessions idle for longer than the TTL.
+
+        Returns:
+            Number of sessions closed.
+        """
+        now = time.monotonic()
+        expired = [
+            s
+            for s in self._sessions.values()
+            if not s.alive or now - s.last_used >= self.ttl_seconds
+        ]
+        for session in expired:
+            del self._sessions[session.key]
+            await session.close()
+        return len(expired)
+
+    async def close_all(self) -> None:
+        """Close every idle session (shutdown)."""
+        if self._reaper is not None:
+            self._reaper.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._reaper
+            self._reaper = None
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        await asyncio.gather(*(s.close() for s in sessions), return_exceptions=True)
+
+    async def _reap_loop(self) -> None:
+        interval = max(1.0, min(self.ttl_seconds / 2, 60.0))
+        while self._sessions:
+            await asyncio.sleep(interval)
+            try:
+                closed = await self.reap_idle()
+                if closed:
+                    logger.info(f"Recycled {closed} idle warm CLI session(s)")
+            except Exception as e:
+                logger.warning(f"Warm session reaper failed: {e}")
+
+
+_pool: WarmSessionPool | None = None
+
+
+def get_warm_session_pool() -> WarmSessionPool:
+    """Get the process-wide warm session pool."""
+    global _pool
+    if _pool is None:
+        _pool = WarmSessionPool()
+    return _pool
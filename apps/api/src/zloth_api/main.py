@@ -7,8 +7,15 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from zloth_api.config import settings
-from zloth_api.dependencies import get_job_worker, get_pr_status_poller
+from zloth_api.dependencies import (
+    get_github_service,
+    get_job_worker,
+    get_pr_status_poller,
+    get_webhook_service,
+    get_workspace_gc_service,
+)
 from zloth_api.error_handling import install_error_handling
+from zloth_api.executors.warm_sessions import get_warm_session_pool
 from zloth_api.routes import (
     analysis_router,
     backlog_router,
@@ -23,9 +30,12 @@ from zloth_api.routes import (
     reviews_router,
     runs_router,
     tasks_router,
+    webhooks_router,
+    workspaces_router,
 )
 from zloth_api.storage.dao import ReviewDAO, RunDAO
 from zloth_api.storage.db import get_db
+from zloth_api.utils.http_client import close_shared_http_client
 
 
 @asynccontextmanager
@@ -46,6 +56,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
         error="Server restarted while review was running (startup recovery)"
     )
 
+    # Warm GitHub App credentials so the first git push/clone does not wait
+    github_service = await get_github_service()
+    github_service.warm_credentials()
+
     # Start PR status poller
     pr_status_poller = await get_pr_status_poller()
     pr_status_poller.start()
@@ -58,8 +72,28 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
         await job_worker.recover_startup()
         job_worker.start()
 
+    # Replay webhook deliveries that were stored but not processed
+    webhook_service = None
+    if settings.webhooks_enabled:
+        webhook_service = await get_webhook_service()
+        await webhook_service.replay_pending()
+
+    # Start workspace garbage collector (disk quotas, orphan cleanup)
+    workspace_gc = None
+    if settings.workspace_gc_enabled:
+        workspace_gc = await get_workspace_gc_service()
+        workspace_gc.start()
+
     yield
 
+    # Shutdown: stop workspace garbage collector
+    if workspace_gc is not None:
+        await workspace_gc.stop()
+
+    # Shutdown: finish processing in-flight webhook deliveries
+    if webhook_service is not None:
+        await webhook_service.drain()
+
     # Shutdown: stop PR status poller
     await pr_status_poller.stop()
 
@@ -67,6 +101,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
     if job_worker is not None:
         await job_worker.stop()
 
+    # Shutdown: end idle warm CLI sessions
+    await get_warm_session_pool().close_all()
+
+    # Shutdown: close pooled HTTP clients
+    await github_service.aclose()
+    await close_shared_http_client()
+
     # Shutdown: close database
     await db.disconnect()
 
@@ -105,7 +146,10 @@ app.include_router(reviews_router, prefix="/v1")
 app.include_router(tasks_router, prefix="/v1")
 app.include_router(runs_router, prefix="/v1")
 app.include_router(prs_router, prefix="/v1")
-# Note: webhooks_router removed - using CI polling instead (see ci_polling_service.py)
+app.include_router(workspaces_router, prefix="/v1")
+# Webhooks are opt-in; CI and PR status polling remain the fallback
+if settings.webhooks_enabled:
+    app.include_router(webhooks_router, prefix="/v1")
 
 
 @app.get("/health")
@@ -164,6 +164,31 @@ class QueueBackend(Protocol):
         """
         ...
 
+    async def request_cancel(self, job_id: str) -> bool:
+        """Ask the worker running a job to cancel it.
+
+        The worker that holds the job's lock picks the request up, stops the
+        job and marks it CANCELED.
+
+        Args:
+            job_id: ID of the running job.
+
+        Returns:
+            True if the job is running and the request was recorded.
+        """
+        ...
+
+    async def get_cancel_requested(self, *, locked_by: str) -> list[str]:
+        """Get the running jobs of a worker that were asked to cancel.
+
+        Args:
+            locked_by: Identifier of the worker.
+
+        Returns:
+            IDs of the jobs to cancel.
+        """
+        ...
+
     async def get(self, job_id: str) -> Job | None:
         """Get a job by ID.
 
@@ -206,6 +206,31 @@ class SQLiteQueue:
         # Note: reason is not passed to cancel_queued_by_ref in current JobDAO
         return await self._job_dao.cancel_queued_by_ref(kind=kind, ref_id=ref_id)
 
+    async def request_cancel(self, job_id: str) -> bool:
+        """Ask the worker running a job to cancel it.
+
+        Args:
+            job_id: ID of the running job.
+
+        Returns:
+            True if the job is running and the request was recorded.
+        """
+        requested = await self._job_dao.request_cancel(job_id)
+        if requested:
+            logger.debug("Requested cancellation of job %s", job_id)
+        return requested
+
+    async def get_cancel_requested(self, *, locked_by: str) -> list[str]:
+        """Get the running jobs of a worker that were asked to cancel.
+
+        Args:
+            locked_by: Identifier of the worker.
+
+        Returns:
+            IDs of the jobs to cancel.
+        """
+        return await self._job_dao.list_cancel_requested(locked_by=locked_by)
+
     async def get(self, job_id: str) -> Job | None:
         """Get a job by ID.
 
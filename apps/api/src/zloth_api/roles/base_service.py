@@ -17,9 +17,7 @@ from typing import TYPE_CHECKING, Any, Generic, TypeVar
 from zloth_api.config import settings
 from zloth_api.domain.enums import ExecutorType, RoleExecutionStatus
 from zloth_api.domain.models import RoleExecutionResult
-from zloth_api.executors.claude_code_executor import ClaudeCodeExecutor, ClaudeCodeOptions
-from zloth_api.executors.codex_executor import CodexExecutor, CodexOptions
-from zloth_api.executors.gemini_executor import GeminiExecutor, GeminiOptions
+from zloth_api.executors import BaseExecutor, create_executors
 
 if TYPE_CHECKING:
     from zloth_api.services.output_manager import OutputLine, OutputManager
@@ -151,10 +149,6 @@ class RoleQueueAdapter:
         }
 
 
-# Type alias for executor types
-BaseExecutor = ClaudeCodeExecutor | CodexExecutor | GeminiExecutor
-
-
 class BaseRoleService(ABC, Generic[TRecord, TCreate, TResult]):
     """Abstract base class for all AI Role services.
 
@@ -177,44 +171,19 @@ class BaseRoleService(ABC, Generic[TRecord, TCreate, TResult]):
     def __init__(
         self,
         output_manager: OutputManager | None = None,
-        claude_executor: ClaudeCodeExecutor | None = None,
-        codex_executor: CodexExecutor | None = None,
-        gemini_executor: GeminiExecutor | None = None,
+        executors: dict[ExecutorType, BaseExecutor] | None = None,
     ):
         """Initialize the base role service.
 
         Args:
             output_manager: Manager for log streaming.
-            claude_executor: Claude Code CLI executor (created if not provided).
-            codex_executor: Codex CLI executor (created if not provided).
-            gemini_executor: Gemini CLI executor (created if not provided).
+            executors: Executors overriding the registered defaults, by type.
         """
         self.output_manager = output_manager
 
-        # Initialize executors
-        self._executors: dict[ExecutorType, BaseExecutor] = {}
-
-        # Create default executors if not provided
-        if claude_executor:
-            self._executors[ExecutorType.CLAUDE_CODE] = claude_executor
-        else:
-            self._executors[ExecutorType.CLAUDE_CODE] = ClaudeCodeExecutor(
-                ClaudeCodeOptions(claude_cli_path=settings.claude_cli_path)
-            )
-
-        if codex_executor:
-            self._executors[ExecutorType.CODEX_CLI] = codex_executor
-        else:
-            self._executors[ExecutorType.CODEX_CLI] = CodexExecutor(
-                CodexOptions(codex_cli_path=settings.codex_cli_path)
-            )
-
-        if gemini_executor:
-            self._executors[ExecutorType.GEMINI_CLI] = gemini_executor
-        else:
-            self._executors[ExecutorType.GEMINI_CLI] = GeminiExecutor(
-                GeminiOptions(gemini_cli_path=settings.gemini_cli_path)
-            )
+        # One executor per registered CLI, configured from settings
+        self._executors: dict[ExecutorType, BaseExecutor] = create_executors()
+        self._executors.update(executors or {})
 
         # Queue for async execution
         self._queue = RoleQueueAdapter()
@@ -13,8 +13,8 @@ from zloth_api.routes.repos import router as repos_router
 from zloth_api.routes.reviews import router as reviews_router
 from zloth_api.routes.runs import router as runs_router
 from zloth_api.routes.tasks import router as tasks_router
-
-# Note: webhooks router removed - using CI polling instead (see ci_polling_service.py)
+from zloth_api.routes.webhooks import router as webhooks_router
+from zloth_api.routes.workspaces import router as workspaces_router
 
 __all__ = [
     "analysis_router",
@@ -30,4 +30,6 @@ __all__ = [
     "tasks_router",
     "runs_router",
     "prs_router",
+    "webhooks_router",
+    "workspaces_router",
 ]
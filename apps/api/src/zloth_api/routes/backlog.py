@@ -10,6 +10,7 @@ from zloth_api.domain.models import (
     BacklogItemUpdate,
     Task,
 )
+from zloth_api.services.sparse_checkout import normalize_sparse_paths
 from zloth_api.storage.dao import BacklogDAO, TaskDAO
 
 router = APIRouter(prefix="/backlog", tags=["backlog"])
@@ -154,8 +155,9 @@ async def start_work_on_backlog_item(
 
     This endpoint:
     1. Creates a new Task from the backlog item
-    2. Sets the Task kanban_status to 'todo'
-    3. Links the backlog item to the created task
+    2. Seeds the Task's sparse checkout profile from the item's target files
+    3. Sets the Task kanban_status to 'todo'
+    4. Links the backlog item to the created task
 
     Args:
         item_id: Backlog item ID.
@@ -184,6 +186,10 @@ async def start_work_on_backlog_item(
         title=item.title,
     )
 
+    # Only materialize the directories the item is expected to touch
+    if item.target_files:
+        await task_dao.update_sparse_paths(task.id, normalize_sparse_paths(item.target_files))
+
     # Set task kanban_status to 'todo' (Backlog -> ToDo transition)
     await task_dao.update_kanban_status(task.id, TaskBaseKanbanStatus.TODO)
 
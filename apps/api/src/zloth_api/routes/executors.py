@@ -2,10 +2,14 @@
 
 import asyncio
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 from pydantic import BaseModel
 
 from zloth_api.config import settings
+from zloth_api.dependencies import get_executor_result_cache
+from zloth_api.domain.models import ExecutorAdmissionStatus, ExecutorResultCacheStats
+from zloth_api.services.executor_admission import get_executor_admission
+from zloth_api.services.executor_result_cache import ExecutorResultCache
 
 router = APIRouter(prefix="/executors", tags=["executors"])
 
@@ -101,3 +105,17 @@ async def get_executors_status() -> ExecutorsStatusResponse:
         codex_cli=codex_status,
         gemini_cli=gemini_status,
     )
+
+
+@router.get("/admission", response_model=ExecutorAdmissionStatus)
+async def get_admission_status() -> ExecutorAdmissionStatus:
+    """Get running and queued CLI executor launches and the admission limits."""
+    return get_executor_admission().status()
+
+
+@router.get("/result-cache/stats", response_model=ExecutorResultCacheStats)
+async def get_result_cache_stats(
+    result_cache: ExecutorResultCache = Depends(get_executor_result_cache),
+) -> ExecutorResultCacheStats:
+    """Get size and hit/miss statistics of the CLI run result cache."""
+    return await result_cache.stats()
@@ -1,11 +1,13 @@
 """GitHub App routes."""
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 
 from zloth_api.dependencies import get_github_service
 from zloth_api.domain.models import (
     GitHubAppConfig,
     GitHubAppConfigSave,
+    GitHubCacheStats,
+    GitHubRateLimitStatus,
     GitHubRepository,
 )
 from zloth_api.services.github_service import GitHubService
@@ -33,13 +35,32 @@ async def save_config(
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.get("/cache/stats", response_model=GitHubCacheStats)
+async def get_cache_stats(
+    github_service: GitHubService = Depends(get_github_service),
+) -> GitHubCacheStats:
+    """Get hit/miss statistics of the GitHub conditional-request cache."""
+    return github_service.cache_stats()
+
+
+@router.get("/rate-limit", response_model=list[GitHubRateLimitStatus])
+async def get_rate_limit_status(
+    github_service: GitHubService = Depends(get_github_service),
+) -> list[GitHubRateLimitStatus]:
+    """Get the remaining request budget and queue depth per installation."""
+    return github_service.rate_limit_status()
+
+
 @router.get("/repos", response_model=list[GitHubRepository])
 async def list_repos(
+    q: str | None = Query(None, description="Repository name or full name prefix"),
+    limit: int | None = Query(None, ge=1, description="Maximum number of repositories"),
+    refresh: bool = Query(False, description="Reload the cached listing from GitHub"),
     github_service: GitHubService = Depends(get_github_service),
 ) -> list[GitHubRepository]:
     """List repositories accessible to the GitHub App."""
     try:
-        return await github_service.list_repos()
+        return await github_service.list_repos(q, limit, refresh=refresh)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -50,11 +71,14 @@ async def list_repos(
 async def list_branches(
     owner: str,
     repo: str,
+    q: str | None = Query(None, description="Branch name prefix"),
+    limit: int | None = Query(None, ge=1, description="Maximum number of branches"),
+    refresh: bool = Query(False, description="Reload the cached listing from GitHub"),
     github_service: GitHubService = Depends(get_github_service),
 ) -> list[str]:
     """List branches for a repository."""
     try:
-        return await github_service.list_branches(owner, repo)
+        return await github_service.list_branches(owner, repo, q, limit, refresh=refresh)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
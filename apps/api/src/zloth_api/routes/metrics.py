@@ -1,9 +1,13 @@
 """API routes for development metrics."""
 
+from typing import Literal
+
 from fastapi import APIRouter, Depends, Query
 
 from zloth_api.dependencies import get_metrics_service
 from zloth_api.domain.models import (
+    ExecutionCost,
+    ExecutionStatsBucket,
     MetricsDetail,
     MetricsSummary,
     MetricsTrend,
@@ -56,3 +60,27 @@ async def get_metrics_trends(
 ) -> list[MetricsTrend]:
     """Get trend data for specified metrics."""
     return await metrics_service.get_trends(metrics, period, granularity, repo_id)
+
+
+@router.get("/executions", response_model=list[ExecutionStatsBucket])
+async def get_execution_stats(
+    period: str = Query("30d", description="Period: 1d, 7d, 30d, 90d, all"),
+    repo_id: str | None = Query(None, description="Filter by repository ID"),
+    group_by: Literal["executor", "repo", "day", "week", "month"] = Query(
+        "executor", description="Aggregate by executor type, repository or period"
+    ),
+    metrics_service: MetricsService = Depends(get_metrics_service),
+) -> list[ExecutionStatsBucket]:
+    """Get executor token usage, cost and timing of runs and reviews."""
+    return await metrics_service.get_execution_stats(period, repo_id, group_by)
+
+
+@router.get("/executions/costliest", response_model=list[ExecutionCost])
+async def get_costliest_executions(
+    period: str = Query("30d", description="Period: 1d, 7d, 30d, 90d, all"),
+    repo_id: str | None = Query(None, description="Filter by repository ID"),
+    limit: int = Query(20, ge=1, le=200, description="Maximum number of executions"),
+    metrics_service: MetricsService = Depends(get_metrics_service),
+) -> list[ExecutionCost]:
+    """Get the runs and reviews that spent the most tokens/money on their executor."""
+    return await metrics_service.get_costliest_executions(period, repo_id, limit)
@@ -3,7 +3,12 @@
 from fastapi import APIRouter, Depends
 
 from zloth_api.dependencies import get_github_service, get_repo_service
-from zloth_api.domain.models import Repo, RepoCloneRequest, RepoSelectRequest
+from zloth_api.domain.models import (
+    Repo,
+    RepoCloneRequest,
+    RepoSelectRequest,
+    SparseProfileUpdate,
+)
 from zloth_api.errors import NotFoundError
 from zloth_api.services.github_service import GitHubService
 from zloth_api.services.repo_service import RepoService
@@ -40,3 +45,13 @@ async def get_repo(
     if not repo:
         raise NotFoundError("Repository not found", details={"repo_id": repo_id})
     return repo
+
+
+@router.put("/{repo_id}/sparse-profile", response_model=Repo)
+async def update_repo_sparse_profile(
+    repo_id: str,
+    data: SparseProfileUpdate,
+    repo_service: RepoService = Depends(get_repo_service),
+) -> Repo:
+    """Set the default sparse checkout profile for new workspaces of a repository."""
+    return await repo_service.update_sparse_profile(repo_id, data.paths)
@@ -92,6 +92,7 @@ async def get_review_logs(
                     "line_number": ol.line_number,
                     "content": ol.content,
                     "timestamp": ol.timestamp,
+                    "event": ol.event,
                 }
                 for ol in output_logs
             ],
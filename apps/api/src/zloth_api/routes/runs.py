@@ -3,12 +3,13 @@
 import json
 import logging
 from collections.abc import AsyncGenerator
+from typing import Literal
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import StreamingResponse
 
 from zloth_api.dependencies import get_output_manager, get_run_service
-from zloth_api.domain.models import Run, RunCreate, RunsCreated
+from zloth_api.domain.models import Run, RunCreate, RunDiff, RunsCreated
 from zloth_api.services.output_manager import OutputManager
 from zloth_api.services.run_service import RunService
 
@@ -49,6 +50,20 @@ async def get_run(
     return run
 
 
+@router.get("/runs/{run_id}/diff", response_model=RunDiff)
+async def get_run_diff(
+    run_id: str,
+    scope: Literal["run", "cumulative"] = Query("run"),
+    run_service: RunService = Depends(get_run_service),
+) -> RunDiff:
+    """Get a run's diff.
+
+    ``scope=run`` returns the run's own delta; ``scope=cumulative`` returns all
+    changes on the run's branch since it diverged from the base ref.
+    """
+    return await run_service.get_diff(run_id, scope=scope)
+
+
 @router.post("/runs/{run_id}/cancel", status_code=204)
 async def cancel_run(
     run_id: str,
@@ -107,6 +122,7 @@ async def get_run_logs(
                     "line_number": ol.line_number,
                     "content": ol.content,
                     "timestamp": ol.timestamp,
+                    "event": ol.event,
                 }
                 for ol in output_logs
             ],
@@ -143,7 +159,8 @@ async def stream_run_logs(
     - A 'complete' event is sent when the run finishes
 
     Event format:
-    - data events: {"line_number": int, "content": str, "timestamp": float}
+    - data events: {"line_number": int, "content": str, "timestamp": float, "event": null}
+    - stalled/resumed events: same payload, sent when the CLI stops or resumes printing
     - complete event: signals end of stream
     """
     # Verify run exists
@@ -162,9 +179,14 @@ async def stream_run_logs(
                         "line_number": output_line.line_number,
                         "content": output_line.content,
                         "timestamp": output_line.timestamp,
+                        "event": output_line.event,
                     }
                 )
-                yield f"data: {data}\n\n"
+                if output_line.event:
+                    # Process events (e.g. "stalled") are sent as named events
+                    yield f"event: {output_line.event}\ndata: {data}\n\n"
+                else:
+                    yield f"data: {data}\n\n"
                 line_count += 1
                 if line_count % 10 == 0:
                     logger.debug(f"SSE sent {line_count} lines for run {run_id}")
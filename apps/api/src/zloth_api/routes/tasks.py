@@ -23,12 +23,14 @@ from zloth_api.domain.models import (
     PRSummary,
     RejectMergeRequest,
     RunSummary,
+    SparseProfileUpdate,
     Task,
     TaskBulkCreate,
     TaskBulkCreated,
     TaskCreate,
     TaskDetail,
 )
+from zloth_api.services.sparse_checkout import normalize_sparse_paths
 from zloth_api.storage.dao import (
     PRDAO,
     CICheckDAO,
@@ -214,6 +216,27 @@ async def get_task(
     )
 
 
+@router.put("/{task_id}/sparse-profile", response_model=Task)
+async def update_task_sparse_profile(
+    task_id: str,
+    data: SparseProfileUpdate,
+    task_dao: TaskDAO = Depends(get_task_dao),
+) -> Task:
+    """Set the sparse checkout profile for a task.
+
+    The profile is merged with the repository profile when the task's workspace
+    is created. Existing workspaces are hydrated lazily as the agent needs more.
+    """
+    task = await task_dao.get(task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    await task_dao.update_sparse_paths(task_id, normalize_sparse_paths(data.paths))
+    updated = await task_dao.get(task_id)
+    if not updated:
+        raise HTTPException(status_code=404, detail="Task not found")
+    return updated
+
+
 @router.post("/{task_id}/messages", response_model=Message, status_code=201)
 async def add_message(
     task_id: str,
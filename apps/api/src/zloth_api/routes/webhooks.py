@@ -13,7 +13,9 @@ from zloth_api.domain.models import (
     CIResult,
     CIWebhookPayload,
     CIWebhookResponse,
+    WebhookIngestResponse,
 )
+from zloth_api.services.webhook_service import WebhookService
 
 if TYPE_CHECKING:
     from zloth_api.services.agentic_orchestrator import AgenticOrchestrator
@@ -37,14 +39,21 @@ def verify_signature(body: bytes, signature: str | None) -> bool:
         return False
 
     if not settings.webhook_secret:
-        logger.warning("Webhook secret not configured, skipping verification")
-        return True
+        logger.warning("Webhook secret not configured, rejecting webhook")
+        return False
 
     secret = settings.webhook_secret.encode()
     expected = "sha256=" + hmac.new(secret, body, hashlib.sha256).hexdigest()
     return hmac.compare_digest(expected, signature)
 
 
+async def get_webhook_service() -> WebhookService:
+    """Get webhook service dependency."""
+    from zloth_api.dependencies import get_webhook_service as _get_webhook_service
+
+    return await _get_webhook_service()
+
+
 async def get_orchestrator() -> "AgenticOrchestrator":
     """Get agentic orchestrator dependency.
 
@@ -155,34 +164,45 @@ async def handle_ci_webhook(
         )
 
 
-@router.post("/github")
+@router.post("/github", response_model=WebhookIngestResponse, status_code=202)
 async def handle_github_webhook(
     request: Request,
-) -> dict[str, str]:
-    """Receive general GitHub webhook events.
+    webhook_service: WebhookService = Depends(get_webhook_service),
+) -> WebhookIngestResponse:
+    """Receive GitHub App webhook events.
 
-    Currently handles:
-    - check_suite events for CI status
-    - pull_request events for PR status
+    Handles check_suite, check_run, status, pull_request and push events.
+    Deliveries are verified, deduplicated by X-GitHub-Delivery and stored in
+    the inbox before they are acknowledged; processing happens in the
+    background.
 
     Args:
         request: FastAPI request.
+        webhook_service: Webhook ingestion service.
 
     Returns:
-        Acknowledgement response.
+        Ingestion result.
+
+    Raises:
+        HTTPException: If signature verification fails or the payload is invalid.
     """
     body = await request.body()
 
     # Verify signature
     signature = request.headers.get("X-Hub-Signature-256")
     if not verify_signature(body, signature):
+        logger.warning("Invalid webhook signature")
         raise HTTPException(status_code=401, detail="Invalid signature")
 
     event_type = request.headers.get("X-GitHub-Event", "unknown")
-    logger.info(f"Received GitHub webhook: event={event_type}")
+    delivery_id = request.headers.get("X-GitHub-Delivery")
+    if not delivery_id:
+        raise HTTPException(status_code=400, detail="Missing X-GitHub-Delivery header")
 
-    # Parse and handle based on event type
-    # For now, just acknowledge
-    # More specific handling can be added as needed
+    logger.info(f"Received GitHub webhook: event={event_type}, delivery={delivery_id}")
 
-    return {"status": "received", "event": event_type}
+    try:
+        return await webhook_service.ingest(delivery_id, event_type, body)
+    except ValueError as e:
+        logger.error(f"Failed to parse webhook payload: {e}")
+        raise HTTPException(status_code=400, detail=f"Invalid payload: {str(e)}")
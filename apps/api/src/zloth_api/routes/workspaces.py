@@ -0,0 +1,25 @@
+"""Workspace disk usage routes."""
+
+from fastapi import APIRouter, Depends
+
+from zloth_api.dependencies import get_workspace_gc_service
+from zloth_api.domain.models import WorkspaceGCStats, WorkspaceUsageSummary
+from zloth_api.services.workspace_gc_service import WorkspaceGCService
+
+router = APIRouter(prefix="/workspaces", tags=["workspaces"])
+
+
+@router.get("/usage", response_model=WorkspaceUsageSummary)
+async def get_workspace_usage(
+    gc_service: WorkspaceGCService = Depends(get_workspace_gc_service),
+) -> WorkspaceUsageSummary:
+    """Get workspace disk usage (as of the last GC sweep) and eviction statistics."""
+    return await gc_service.get_usage()
+
+
+@router.post("/gc", response_model=WorkspaceGCStats)
+async def run_workspace_gc(
+    gc_service: WorkspaceGCService = Depends(get_workspace_gc_service),
+) -> WorkspaceGCStats:
+    """Run a workspace garbage collection sweep immediately."""
+    return await gc_service.sweep()
@@ -31,8 +31,11 @@ from zloth_api.domain.models import (
     FixInstructionRequest,
     IterationLimits,
     ReviewCreate,
+    Run,
+    RunCreate,
 )
 from zloth_api.services.settings_service import SettingsService
+from zloth_api.services.speculative_runs import SpeculativeRunner
 
 if TYPE_CHECKING:
     from zloth_api.services.ci_polling_service import CIPollingService
@@ -46,6 +49,38 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Total size of CI log excerpts included in a CI-fix instruction
+CI_FIX_MAX_LOG_CHARS = 16000
+# Smallest excerpt worth including; jobs past what fits at this size are omitted
+CI_FIX_MIN_LOG_CHARS = 1000
+
+
+def _split_log_budget(sizes: list[int], total: int) -> list[int]:
+    """Split a size budget evenly between logs of the given sizes.
+
+    Budget a short log leaves unused goes to the others. Only the first
+    ``total // CI_FIX_MIN_LOG_CHARS`` non-empty logs get a budget.
+    """
+    budgets = [0] * len(sizes)
+    included = [i for i, size in enumerate(sizes) if size][: total // CI_FIX_MIN_LOG_CHARS]
+    remaining = total
+    for n, i in enumerate(sorted(included, key=lambda i: sizes[i])):
+        budgets[i] = min(sizes[i], remaining // (len(included) - n))
+        remaining -= budgets[i]
+    return budgets
+
+
+def _cut_middle(text: str, limit: int) -> str:
+    """Cap text at ``limit`` characters by cutting out its middle."""
+    if len(text) <= limit:
+        return text
+    marker = "\n...\n"
+    if limit <= len(marker):
+        return text[:limit]
+    head = (limit - len(marker)) // 2
+    tail = limit - len(marker) - head
+    return text[:head] + marker + text[len(text) - tail :]
+
 
 class AgenticOrchestrator:
     """Orchestrates the full agentic development cycle.
@@ -100,6 +135,9 @@ class AgenticOrchestrator:
         self._locks: dict[str, asyncio.Lock] = {}
         # Background task tracking to prevent orphaned tasks
         self._background_tasks: dict[str, asyncio.Task[None]] = {}
+        # Executor that produced the accepted code; fix iterations continue with it
+        self._coding_executors: dict[str, ExecutorType] = {}
+        self.speculator = SpeculativeRunner(run_service, review_service, task_dao)
 
         # Default limits from settings
         self._default_limits = IterationLimits(
@@ -262,10 +300,24 @@ class AgenticOrchestrator:
         # Persist state
         await self.agentic_dao.create(state)
 
+        # Race several executors on the first iteration if configured
+        speculative_executors = list(settings.agentic_speculative_executors)
+        speculative_review = settings.agentic_speculative_review
+        if config and config.speculative_executors is not None:
+            speculative_executors = config.speculative_executors
+        if config and config.speculative_review is not None:
+            speculative_review = config.speculative_review
+
         # Start coding phase in background with proper tracking and timeout
         self._start_background_task(
             task_id,
-            self._run_coding_phase(task_id, instruction, limits),
+            self._run_coding_phase(
+                task_id,
+                instruction,
+                limits,
+                speculative_executors=speculative_executors,
+                speculative_review=speculative_review,
+            ),
             "Coding phase",
         )
 
@@ -544,14 +596,22 @@ class AgenticOrchestrator:
         instruction: str,
         limits: IterationLimits,
         context: dict[str, Any] | None = None,
+        *,
+        speculative_executors: list[ExecutorType] | None = None,
+        speculative_review: bool = False,
     ) -> None:
-        """Execute Claude Code for coding.
+        """Execute the coding executor (Claude Code unless another one won earlier).
+
+        With several speculative executors, they are raced on a new task and
+        the first acceptable run is kept (see SpeculativeRunner).
 
         Args:
             task_id: Task ID.
             instruction: Coding instruction.
             limits: Iteration limits.
             context: Additional context.
+            speculative_executors: Executors to race (first iteration only).
+            speculative_review: Require a fast review to accept a speculative run.
         """
         state = self._states.get(task_id)
         if not state:
@@ -580,37 +640,54 @@ class AgenticOrchestrator:
             # Enhance instruction with context
             full_instruction = self._enhance_instruction(instruction, context, state)
 
-            # Create run via RunService
-            from zloth_api.domain.models import RunCreate
+            run: Run | None
+            if speculative_executors and await self.speculator.can_speculate(
+                task_id, speculative_executors
+            ):
+                speculation = await self.speculator.run(
+                    task_id,
+                    full_instruction,
+                    speculative_executors,
+                    review=speculative_review,
+                    min_review_score=limits.min_review_score,
+                )
+                run = speculation.winner
+                error = speculation.error
+            else:
+                # Create run via RunService
+                run_data = RunCreate(
+                    instruction=full_instruction,
+                    executor_type=self._coding_executors.get(task_id, ExecutorType.CLAUDE_CODE),
+                )
 
-            run_data = RunCreate(
-                instruction=full_instruction,
-                executor_type=ExecutorType.CLAUDE_CODE,
-            )
+                runs = await self.run_service.create_runs(task_id, run_data)
 
-            runs = await self.run_service.create_runs(task_id, run_data)
+                if not runs:
+                    async with self._locks[task_id]:
+                        state.phase = AgenticPhase.FAILED
+                        state.error = "Failed to create coding run"
+                        await self.agentic_dao.update(state)
+                        await self._notify_failure(state)
+                    return
 
-            if not runs:
-                async with self._locks[task_id]:
-                    state.phase = AgenticPhase.FAILED
-                    state.error = "Failed to create coding run"
-                    await self.agentic_dao.update(state)
-                    await self._notify_failure(state)
-                return
+                # Wait for run completion
+                run_id = runs[0].id
+                await self._wait_for_run(run_id)
 
-            # Wait for run completion
-            run_id = runs[0].id
-            await self._wait_for_run(run_id)
+                # Get run result
+                run = await self.run_service.get(run_id)
+                error = f"Coding run failed: {run.error if run else 'Unknown'}"
+                if run and run.status != "succeeded":
+                    run = None
 
-            # Get run result
-            run = await self.run_service.get(run_id)
-            if not run or run.status != "succeeded":
+            if not run:
                 async with self._locks[task_id]:
                     state.phase = AgenticPhase.FAILED
-                    state.error = f"Coding run failed: {run.error if run else 'Unknown'}"
+                    state.error = error
                     await self.agentic_dao.update(state)
                     await self._notify_failure(state)
                 return
+            self._coding_executors[task_id] = run.executor_type
 
             # Update state with commit SHA
             async with self._locks[task_id]:
@@ -674,12 +751,17 @@ class AgenticOrchestrator:
             if not runs:
                 raise ValueError("No runs found for task")
 
-            # Get the most recent successful run
-            latest_run = None
-            for run in runs:
-                if run.status == "succeeded":
-                    latest_run = run
-                    break
+            # Get the run that produced the current commit (speculative runs of
+            # the same round may also have succeeded), else the most recent success
+            succeeded = [run for run in runs if run.status == "succeeded"]
+            latest_run = next(
+                (
+                    run
+                    for run in succeeded
+                    if state.current_sha and run.commit_sha == state.current_sha
+                ),
+                succeeded[0] if succeeded else None,
+            )
 
             if not latest_run:
                 raise ValueError("No successful run found for review")
@@ -792,6 +874,7 @@ class AgenticOrchestrator:
                 repo_full_name=repo_full_name,
                 method=runtime_settings.merge_method,
                 delete_branch=settings.merge_delete_branch,
+                last_review_score=state.last_review_score,
             )
 
             async with self._locks[task_id]:
@@ -891,6 +974,10 @@ class AgenticOrchestrator:
     def _build_ci_fix_instruction(self, failed_jobs: list[CIJobResult]) -> str:
         """Build instruction for fixing CI failures.
 
+        Log excerpts of the failed jobs are included up to
+        ``CI_FIX_MAX_LOG_CHARS`` in total, split evenly between the jobs
+        (budget a short excerpt leaves unused goes to the others).
+
         Args:
             failed_jobs: List of failed CI jobs.
 
@@ -898,11 +985,18 @@ class AgenticOrchestrator:
             Fix instruction string.
         """
         parts = ["Fix the following CI failures:\n"]
+        budgets = _split_log_budget(
+            [len(job.error_log or "") for job in failed_jobs], CI_FIX_MAX_LOG_CHARS
+        )
 
-        for job in failed_jobs:
+        for job, budget in zip(failed_jobs, budgets):
             parts.append(f"\n## {job.job_name} (FAILED)\n")
-            if job.error_log:
-                parts.append(f"```\n{job.error_log}\n```\n")
+            if job.error_log and budget > 0:
+                # Excerpts start with the first errors and end with the tail of
+                # the log; both ends are the most useful, so cut the middle
+                parts.append(f"```\n{_cut_middle(job.error_log, budget)}\n```\n")
+            elif job.error_log:
+                parts.append("(Log excerpt omitted: size limit reached)\n")
 
             # Add fix strategy hint
             strategy = self.merger.get_fix_strategy(job.job_name)
@@ -14,11 +14,11 @@ import uuid
 from pathlib import Path
 from typing import Any
 
-from zloth_api.config import settings
 from zloth_api.domain.enums import (
     BreakdownStatus,
     BrokenDownTaskType,
     EstimatedSize,
+    ExecutorPriority,
     ExecutorType,
     RoleExecutionStatus,
 )
@@ -32,9 +32,7 @@ from zloth_api.domain.models import (
     TaskBreakdownRequest,
     TaskBreakdownResponse,
 )
-from zloth_api.executors.claude_code_executor import ClaudeCodeExecutor, ClaudeCodeOptions
-from zloth_api.executors.codex_executor import CodexExecutor, CodexOptions
-from zloth_api.executors.gemini_executor import GeminiExecutor, GeminiOptions
+from zloth_api.executors import BaseExecutor, create_executors
 from zloth_api.roles.base_service import BaseRoleService
 from zloth_api.roles.registry import RoleRegistry
 from zloth_api.services.output_manager import OutputManager
@@ -211,37 +209,9 @@ class BreakdownService(
         self._results: dict[str, TaskBreakdownResponse] = {}
 
         # Initialize executors with custom timeout for breakdown
-        self._claude_executor = ClaudeCodeExecutor(
-            ClaudeCodeOptions(
-                timeout_seconds=1800,  # 30 min for breakdown
-                claude_cli_path=settings.claude_cli_path,
-            )
-        )
-        self._codex_executor = CodexExecutor(
-            CodexOptions(
-                timeout_seconds=1800,
-                codex_cli_path=settings.codex_cli_path,
-            )
-        )
-        self._gemini_executor = GeminiExecutor(
-            GeminiOptions(
-                timeout_seconds=1800,
-                gemini_cli_path=settings.gemini_cli_path,
-            )
-        )
+        self._breakdown_executors = create_executors(timeout_seconds=1800)  # 30 min
 
-        # Executor map (overrides base class executors with custom timeouts)
-        self._breakdown_executors: dict[
-            ExecutorType, ClaudeCodeExecutor | CodexExecutor | GeminiExecutor
-        ] = {
-            ExecutorType.CLAUDE_CODE: self._claude_executor,
-            ExecutorType.CODEX_CLI: self._codex_executor,
-            ExecutorType.GEMINI_CLI: self._gemini_executor,
-        }
-
-    def _get_breakdown_executor(
-        self, executor_type: ExecutorType
-    ) -> ClaudeCodeExecutor | CodexExecutor | GeminiExecutor:
+    def _get_breakdown_executor(self, executor_type: ExecutorType) -> BaseExecutor:
         """Get executor for the given type (with breakdown-specific timeout).
 
         Args:
@@ -365,6 +335,12 @@ class BreakdownService(
             if self.output_manager:
                 await self.output_manager.publish_async(breakdown_id, line)
 
+        async def on_event(event: str, message: str) -> None:
+            if self.output_manager:
+                await self.output_manager.publish_async(
+                    breakdown_id, f"[{event}] {message}", event=event
+                )
+
         await on_output("Starting task breakdown analysis (v2)...")
         await on_output(f"Using executor: {request.executor_type.value}")
         await on_output(f"Repository: {repo.repo_url}")
@@ -374,6 +350,9 @@ class BreakdownService(
             worktree_path=workspace_path,
             instruction=instruction,
             on_output=on_output,
+            repo=repo.id,
+            priority=ExecutorPriority.USER,
+            on_event=on_event,
         )
 
         if not result.success:
@@ -4,13 +4,15 @@ This service provides on-demand CI status checking for PRs.
 """
 
 import logging
-from datetime import datetime, timedelta
 from typing import TYPE_CHECKING
 
+from zloth_api.domain.enums import GitHubRequestPriority
 from zloth_api.domain.models import CICheck, CICheckResponse, CIJobResult
+from zloth_api.services.ci_log_service import CILogService
 from zloth_api.storage.dao import PRDAO, CICheckDAO, RepoDAO, TaskDAO
 
 if TYPE_CHECKING:
+    from zloth_api.services.ci_polling_service import CIPollingService
     from zloth_api.services.github_service import GitHubService
 
 logger = logging.getLogger(__name__)
@@ -20,10 +22,12 @@ CI_CHECK_SHA_COOLDOWN_SECONDS = 30
 
 
 class CICheckService:
-    """Service for checking CI status of PRs."""
+    """Service for checking CI status of PRs.
 
-    # Class-level cache for last check times per PR+SHA
-    _last_check_times: dict[str, datetime] = {}
+    The cooldown between checks of the same PR+SHA is tracked by the CI
+    polling service, which also records what its scheduler observes, so a PR
+    that is being polled is not fetched again on demand (and vice versa).
+    """
 
     def __init__(
         self,
@@ -32,6 +36,8 @@ class CICheckService:
         task_dao: TaskDAO,
         repo_dao: RepoDAO,
         github_service: "GitHubService",
+        ci_polling_service: "CIPollingService",
+        ci_log_service: CILogService | None = None,
     ):
         """Initialize CI check service.
 
@@ -41,37 +47,16 @@ class CICheckService:
             task_dao: Task DAO.
             repo_dao: Repo DAO.
             github_service: GitHub service for API calls.
+            ci_polling_service: CI polling service (shared CI observations).
+            ci_log_service: Log excerpt service for failed jobs.
         """
         self.ci_check_dao = ci_check_dao
         self.pr_dao = pr_dao
         self.task_dao = task_dao
         self.repo_dao = repo_dao
         self.github = github_service
-
-    @classmethod
-    def _get_cache_key(cls, pr_id: str, sha: str | None) -> str:
-        """Generate cache key for cooldown tracking."""
-        return f"{pr_id}:{sha or 'unknown'}"
-
-    @classmethod
-    def _can_check(cls, pr_id: str, sha: str | None) -> bool:
-        """Check if enough time has passed since last check for this PR+SHA."""
-        key = cls._get_cache_key(pr_id, sha)
-        last_time = cls._last_check_times.get(key)
-        if last_time is None:
-            return True
-        elapsed = datetime.utcnow() - last_time
-        return elapsed >= timedelta(seconds=CI_CHECK_SHA_COOLDOWN_SECONDS)
-
-    @classmethod
-    def _record_check_time(cls, pr_id: str, sha: str | None) -> None:
-        """Record the current time as the last check time for this PR+SHA."""
-        key = cls._get_cache_key(pr_id, sha)
-        cls._last_check_times[key] = datetime.utcnow()
-
-        # Clean up old entries (older than 5 minutes) to prevent memory growth
-        cutoff = datetime.utcnow() - timedelta(minutes=5)
-        cls._last_check_times = {k: v for k, v in cls._last_check_times.items() if v > cutoff}
+        self.ci_poller = ci_polling_service
+        self.ci_logs = ci_log_service or CILogService(github_service)
 
     async def check_ci(self, task_id: str, pr_id: str, force: bool = False) -> CICheckResponse:
         """Check CI status for a PR.
@@ -107,18 +92,6 @@ class CICheckService:
             logger.warning(f"PR {pr_id} does not belong to task {task_id}")
             raise ValueError(f"PR {pr_id} does not belong to task {task_id}")
 
-        # Check for existing recent CI check (cooldown)
-        # If we recently checked this PR's SHA, return the existing result
-        if not force:
-            existing_check = await self.ci_check_dao.get_latest_by_pr_id(pr_id)
-            if existing_check and existing_check.sha:
-                if not self._can_check(pr_id, existing_check.sha):
-                    logger.debug(
-                        f"CI check skipped due to cooldown: pr={pr_id}, sha={existing_check.sha}"
-                    )
-                    is_complete = existing_check.status in ("success", "failure", "error")
-                    return CICheckResponse(ci_check=existing_check, is_complete=is_complete)
-
         # Get repo info for GitHub API
         repo = await self.repo_dao.get(task.repo_id)
         if not repo:
@@ -131,6 +104,20 @@ class CICheckService:
             logger.warning(f"Cannot parse repo URL: {repo.repo_url}")
             raise ValueError(f"Cannot parse repo URL: {repo.repo_url}")
 
+        # Check for existing recent CI check (cooldown)
+        # If this PR's SHA was recently observed, return the existing result
+        if not force:
+            existing_check = await self.ci_check_dao.get_latest_by_pr_id(pr_id)
+            observation = self.ci_poller.get_observation(
+                repo_full_name, pr.number, CI_CHECK_SHA_COOLDOWN_SECONDS
+            )
+            if existing_check and observation and observation[0] == existing_check.sha:
+                logger.debug(
+                    f"CI check skipped due to cooldown: pr={pr_id}, sha={existing_check.sha}"
+                )
+                is_complete = existing_check.status in ("success", "failure", "error")
+                return CICheckResponse(ci_check=existing_check, is_complete=is_complete)
+
         logger.debug(f"Fetching CI status for {repo_full_name} PR #{pr.number}")
 
         # Build detailed CI result first (jobs data)
@@ -180,8 +167,8 @@ class CICheckService:
                 failed_jobs=ci_data.get("failed_jobs"),
             )
 
-        # Record check time for cooldown tracking
-        self._record_check_time(pr_id, sha)
+        # Record the observation for cooldown tracking
+        self.ci_poller.record_observation(repo_full_name, pr.number, sha, status)
 
         # Determine if CI is complete
         is_complete = status in ("success", "failure", "error")
@@ -275,6 +262,7 @@ class CICheckService:
             pr_data = await self.github._github_request(
                 "GET",
                 f"/repos/{owner}/{repo}/pulls/{pr_number}",
+                priority=GitHubRequestPriority.CI_POLLING,
             )
             result["sha"] = pr_data.get("head", {}).get("sha", "")
         except Exception as e:
@@ -291,29 +279,17 @@ class CICheckService:
             check_runs_data = await self.github._github_request(
                 "GET",
                 f"/repos/{owner}/{repo}/commits/{head_sha}/check-runs",
+                priority=GitHubRequestPriority.CI_POLLING,
             )
 
+            check_runs = check_runs_data.get("check_runs", [])
             jobs: dict[str, str] = {}
-            failed_jobs: list[CIJobResult] = []
-
-            for check_run in check_runs_data.get("check_runs", []):
+            for check_run in check_runs:
                 name = check_run.get("name", "unknown")
-                conclusion = check_run.get("conclusion") or check_run.get("status", "unknown")
-                jobs[name] = conclusion
-
-                if conclusion in ("failure", "cancelled", "timed_out"):
-                    # Get error log from check run output
-                    error_log = check_run.get("output", {}).get("summary", "")
-                    if not error_log:
-                        error_log = check_run.get("output", {}).get("text", "")
-
-                    failed_jobs.append(
-                        CIJobResult(
-                            job_name=name,
-                            result=conclusion,
-                            error_log=error_log[:2000] if error_log else None,
-                        )
-                    )
+                jobs[name] = check_run.get("conclusion") or check_run.get("status", "unknown")
+
+            # Failed jobs carry an excerpt of their log for CI-fix instructions
+            failed_jobs = await self.ci_logs.failed_jobs(repo_full_name, check_runs)
 
             result["jobs"] = jobs
             result["failed_jobs"] = failed_jobs
@@ -328,6 +304,7 @@ class CICheckService:
                     statuses_data = await self.github._github_request(
                         "GET",
                         f"/repos/{owner}/{repo}/commits/{head_sha}/statuses",
+                        priority=GitHubRequestPriority.CI_POLLING,
                     )
                     for status_item in statuses_data:
                         context = status_item.get("context", "unknown")
@@ -0,0 +1,283 @@
+"""Failure excerpts from CI job logs.
+
+Failed GitHub Actions jobs usually only carry a one-line summary in their
+check run output, which leaves the coding agent to rediscover the failure
+itself. This service streams the job log, keeps the lines around error
+patterns plus the tail of the log, and caches the resulting excerpt per
+check run (a completed check run never changes). Check runs of other apps,
+and jobs whose logs cannot be read, fall back to the check run output.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+from collections import OrderedDict, deque
+from collections.abc import AsyncGenerator
+from contextlib import aclosing
+from typing import TYPE_CHECKING, Any
+
+from zloth_api.config import settings
+from zloth_api.domain.enums import GitHubRequestPriority
+from zloth_api.domain.models import CIJobResult
+
+if TYPE_CHECKING:
+    from zloth_api.services.github_service import GitHubService
+
+logger = logging.getLogger(__name__)
+
+# Check run conclusions that are reported as failed jobs
+FAILED_CONCLUSIONS = frozenset({"failure", "cancelled", "timed_out"})
+
+# Lines kept from the end of the log
+TAIL_LINES = 60
+# Lines kept before and after each error-pattern match
+CONTEXT_LINES = 3
+# Error windows kept (the first errors are usually the root cause)
+MAX_ERROR_WINDOWS = 12
+# Longer lines (minified output, base64 blobs) are cut
+MAX_LINE_CHARS = 400
+
+# Completed check runs whose excerpts are kept in memory
+EXCERPT_CACHE_MAX_ENTRIES = 256
+# Logs downloaded concurrently per failed CI result
+LOG_FETCH_CONCURRENCY = 4
+# Share of the excerpt size the check run output gets next to a job log excerpt
+OUTPUT_EXCERPT_SHARE = 0.25
+
+ERROR_PATTERN = re.compile(
+    r"##\[error\]"
+    r"|\b(?:error|errors|failed|failure|fatal|exception|traceback|panic(?:ked)?)\b"
+    r"|^E {2,}\S"  # pytest assertion details
+    r"|npm ERR!"
+    r"|\bFAIL\b"
+    r"|exit (?:code|status) [1-9]",
+    re.IGNORECASE,
+)
+_ANSI_ESCAPE = re.compile(r"\x1b\[[0-9;]*[A-Za-z]")
+# Actions prefixes every line with an ISO timestamp
+_TIMESTAMP_PREFIX = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?Z ")
+
+
+def clean_log_line(line: str) -> str:
+    """Strip the timestamp prefix and ANSI escapes of a log line and cap its length."""
+    line = _TIMESTAMP_PREFIX.sub("", _ANSI_ESCAPE.sub("", line.rstrip("\r")), count=1)
+    if len(line) > MAX_LINE_CHARS:
+        line = line[:MAX_LINE_CHARS] + "…"
+    return line
+
+
+class LogExcerptExtractor:
+    """Incrementally extracts error windows and the tail of a log stream."""
+
+    def __init__(
+        self,
+        tail_lines: int = TAIL_LINES,
+        context_lines: int = CONTEXT_LINES,
+        max_windows: int = MAX_ERROR_WINDOWS,
+    ):
+        self._tail: deque[tuple[int, str]] = deque(maxlen=tail_lines)
+        self._before: deque[tuple[int, str]] = deque(maxlen=context_lines)
+        self._context_lines = context_lines
+        self._max_windows = max_windows
+        self._windows: list[list[tuple[int, str]]] = []
+        self._after_remaining = 0
+        self._line_no = 0
+
+    def feed(self, raw_line: str) -> None:
+        """Add one log line."""
+        line = clean_log_line(raw_line)
+        entry = (self._line_no, line)
+        self._line_no += 1
+        self._tail.append(entry)
+
+        if ERROR_PATTERN.search(line):
+            if self._after_remaining > 0:
+                # Overlapping context: extend the current window
+                self._windows[-1].append(entry)
+                self._after_remaining = self._context_lines
+            elif len(self._windows) < self._max_windows:
+                self._windows.append([*self._before, entry])
+                self._after_remaining = self._context_lines
+            self._before.clear()
+            return
+
+        if self._after_remaining > 0:
+            self._windows[-1].append(entry)
+            self._after_remaining -= 1
+        else:
+            self._before.append(entry)
+
+    def feed_tail(self, raw_line: str) -> None:
+        """Add one log line that only counts toward the tail (not scanned for errors)."""
+        self._tail.append((self._line_no, clean_log_line(raw_line)))
+        self._line_no += 1
+
+    def excerpt(self, max_chars: int) -> str:
+        """Build the excerpt: error windows, then the tail of the log.
+
+        Args:
+            max_chars: Size cap; the tail keeps at least half of it.
+
+        Returns:
+            Excerpt text (empty if no lines were fed).
+        """
+        tail_start = self._tail[0][0] if self._tail else self._line_no
+        windows = []
+        for window in self._windows:
+            lines = [text for line_no, text in window if line_no < tail_start]
+            if lines:
+                windows.append("\n".join(lines))
+
+        tail = "\n".join(text for _, text in self._tail)
+        if self._tail and tail_start > 0:
+            tail = "...\n" + tail
+        errors = "\n...\n".join(windows)
+
+        if len(errors) + len(tail) > max_chars:
+            tail_budget = max(max_chars // 2, max_chars - len(errors))
+            if len(tail) > tail_budget:
+                tail = "..." + tail[len(tail) - tail_budget + 3 :]
+            errors = errors[: max(0, max_chars - len(tail) - 5)]
+        return f"{errors}\n{tail}" if errors else tail
+
+
+class CILogService:
+    """Fetches and caches failure excerpts of CI check runs."""
+
+    def __init__(self, github_service: GitHubService):
+        """Initialize the CI log service.
+
+        Args:
+            github_service: GitHub service for API calls.
+        """
+        self.github = github_service
+        self._cache: OrderedDict[int, str | None] = OrderedDict()
+        self._inflight: dict[int, asyncio.Task[str | None]] = {}
+
+    async def failed_jobs(
+        self,
+        repo_full_name: str,
+        check_runs: list[dict[str, Any]],
+    ) -> list[CIJobResult]:
+        """Build failed job results (with log excerpts) from check runs.
+
+        Args:
+            repo_full_name: Full repository name (owner/repo).
+            check_runs: Check run objects from the GitHub API.
+
+        Returns:
+            One result per failed check run, in check run order.
+        """
+        failed = [
+            run
+            for run in check_runs
+            if (run.get("conclusion") or run.get("status")) in FAILED_CONCLUSIONS
+        ]
+        semaphore = asyncio.Semaphore(LOG_FETCH_CONCURRENCY)
+
+        async def build(run: dict[str, Any]) -> CIJobResult:
+            async with semaphore:
+                error_log = await self.excerpt(repo_full_name, run)
+            return CIJobResult(
+                job_name=run.get("name", "unknown"),
+                result=run.get("conclusion") or run.get("status", "unknown"),
+                error_log=error_log,
+            )
+
+        return list(await asyncio.gather(*(build(run) for run in failed)))
+
+    async def excerpt(self, repo_full_name: str, check_run: dict[str, Any]) -> str | None:
+        """Get the failure excerpt of a completed check run.
+
+        Args:
+            repo_full_name: Full repository name (owner/repo).
+            check_run: Check run object from the GitHub API.
+
+        Returns:
+            Excerpt text, or None if nothing useful is available.
+        """
+        run_id = check_run.get("id")
+        if not isinstance(run_id, int):
+            return self._output_excerpt(check_run)
+
+        if run_id in self._cache:
+            self._cache.move_to_end(run_id)
+            return self._cache[run_id]
+
+        task = self._inflight.get(run_id)
+        if task is None:
+            task = asyncio.create_task(self._load_excerpt(repo_full_name, check_run))
+            self._inflight[run_id] = task
+            task.add_done_callback(lambda _: self._inflight.pop(run_id, None))
+        excerpt = await asyncio.shield(task)
+
+        if check_run.get("status", "completed") == "completed":
+            self._cache[run_id] = excerpt
+            if len(self._cache) > EXCERPT_CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+        return excerpt
+
+    async def _load_excerpt(self, repo_full_name: str, check_run: dict[str, Any]) -> str | None:
+        output_excerpt = self._output_excerpt(check_run)
+        is_actions = (check_run.get("app") or {}).get("slug") == "github-actions"
+        if not settings.ci_log_excerpts_enabled or not is_actions:
+            return output_excerpt
+
+        # The output summary gets a share of the size; the log (which has the
+        # actual failure) the rest
+        max_chars = settings.ci_log_excerpt_max_chars
+        summary = ""
+        if output_excerpt:
+            summary_budget = int(max_chars * OUTPUT_EXCERPT_SHARE)
+            summary = output_excerpt
+            if len(summary) > summary_budget:
+                summary = summary[: max(0, summary_budget - 3)] + "..."
+        log_budget = max_chars - len(summary) - 2 if summary else max_chars
+
+        try:
+            log_excerpt = await self._stream_log_excerpt(
+                repo_full_name, check_run["id"], log_budget
+            )
+        except Exception as e:
+            # 403: missing 'actions: read' permission; 404/410: logs expired
+            logger.warning(
+                f"Could not read log of check run {check_run['id']} ({repo_full_name}): {e}"
+            )
+            return output_excerpt
+
+        if not log_excerpt:
+            return output_excerpt
+        if summary:
+            return f"{summary}\n\n{log_excerpt}"
+        return log_excerpt
+
+    async def _stream_log_excerpt(self, repo_full_name: str, job_id: int, max_chars: int) -> str:
+        """Stream a job log and extract a failure excerpt of at most max_chars."""
+        extractor = LogExcerptExtractor()
+        max_bytes = settings.ci_log_max_download_mb * 1024 * 1024
+        read = 0
+        lines: AsyncGenerator[str] = self.github.iter_job_log_lines(
+            repo_full_name, job_id, priority=GitHubRequestPriority.CI_POLLING
+        )
+        async with aclosing(lines):
+            async for line in lines:
+                if read > max_bytes:
+                    # Keep reading: the job failed at the end of the log
+                    extractor.feed_tail(line)
+                    continue
+                extractor.feed(line)
+                read += len(line) + 1
+                if read > max_bytes:
+                    logger.info(
+                        f"Log of job {job_id} exceeds {max_bytes} bytes; "
+                        "only its tail is kept past that"
+                    )
+        return extractor.excerpt(max_chars)
+
+    def _output_excerpt(self, check_run: dict[str, Any]) -> str | None:
+        """Excerpt from the check run output (summary, else text)."""
+        output = check_run.get("output") or {}
+        text = output.get("summary") or output.get("text") or ""
+        return text[: settings.ci_log_excerpt_max_chars] or None
@@ -2,44 +2,108 @@
 
 This service polls GitHub API to check CI status instead of relying on webhooks.
 This is useful for self-hosted zloth instances that are not exposed to the internet.
+
+A single scheduler watches every pending (PR, head SHA) pair. Due PRs are
+grouped by repository and looked up with one batched GraphQL query per
+repository (see ``GitHubService.get_pull_request_statuses``), so polling
+hundreds of agentic tasks costs a handful of requests per cycle.
+
+Poll intervals adapt per PR: right after a push the PR is checked quickly,
+then the interval grows while CI keeps running. Once a repository has
+completed CI runs, its typical CI duration is learned and the scheduler
+sleeps until the run is expected to finish, then polls quickly again.
 """
 
 import asyncio
 import logging
+import time
+from collections import defaultdict
 from collections.abc import Callable, Coroutine
-from datetime import datetime, timedelta
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 from zloth_api.config import settings
+from zloth_api.domain.enums import GitHubRequestPriority
 from zloth_api.domain.models import CIJobResult, CIResult
+from zloth_api.services.ci_log_service import CILogService
 
 if TYPE_CHECKING:
     from zloth_api.services.github_service import GitHubService
 
 logger = logging.getLogger(__name__)
 
+# Growth factor of the poll interval while CI is pending
+INTERVAL_BACKOFF = 1.5
+
+# Weight of the newest CI duration in the per-repository moving average
+DURATION_EWMA_ALPHA = 0.3
+
+# Observations older than this are dropped
+OBSERVATION_TTL_SECONDS = 300
+
+COMPLETED_STATES = ("success", "failure", "error")
+
+
+@dataclass
+class _CIWatch:
+    """A task waiting for CI on a PR."""
+
+    task_id: str
+    pr_number: int
+    repo_full_name: str
+    on_complete: Callable[[CIResult], Coroutine[Any, Any, None]]
+    on_timeout: Callable[[], Coroutine[Any, Any, None]] | None
+    started_at: float
+    deadline: float
+    next_check_at: float
+    interval: float
+    head_sha: str | None = None
+    sha_seen_at: float = 0.0
+
 
 class CIPollingService:
     """Service for polling GitHub CI status.
 
-    Polls the GitHub API at regular intervals to check if CI has completed.
-    When CI completes (success or failure), triggers a callback with the result.
+    Watches the CI of many PRs from one scheduler task. When CI completes
+    (success or failure), triggers the task's callback with the result.
     """
 
-    def __init__(self, github_service: "GitHubService"):
+    def __init__(
+        self,
+        github_service: "GitHubService",
+        ci_log_service: CILogService | None = None,
+    ):
         """Initialize CI polling service.
 
         Args:
             github_service: GitHub service for API calls.
+            ci_log_service: Log excerpt service for failed jobs.
         """
         self.github = github_service
+        self.ci_logs = ci_log_service or CILogService(github_service)
+
+        # Active watches keyed by task_id
+        self._watches: dict[str, _CIWatch] = {}
+        self._scheduler: asyncio.Task[None] | None = None
+        self._wakeup = asyncio.Event()
+        self._callbacks: set[asyncio.Task[None]] = set()
+
+        # Learned CI duration per repository (seconds, moving average)
+        self._ci_durations: dict[str, float] = {}
 
-        # Active polling tasks keyed by task_id
-        self._polling_tasks: dict[str, asyncio.Task[None]] = {}
+        # Latest observed (head SHA, state, time) per (repo, PR), shared with
+        # CICheckService so on-demand checks and polling do not duplicate calls
+        self._observations: dict[tuple[str, int], tuple[str, str, float]] = {}
 
         # Configuration
+        self._min_interval = settings.ci_watch_min_interval_seconds
         self._poll_interval = settings.ci_polling_interval_seconds
+        self._max_interval = settings.ci_watch_max_interval_seconds
         self._timeout_minutes = settings.ci_polling_timeout_minutes
+        if settings.webhooks_enabled:
+            # Webhook events trigger checks; polling is only a fallback
+            self._min_interval = self._poll_interval
+            self._poll_interval = self._max_interval
 
     async def start_polling(
         self,
@@ -58,24 +122,28 @@ class CIPollingService:
             on_complete: Callback when CI completes (success or failure).
             on_timeout: Optional callback when polling times out.
         """
-        # Cancel any existing polling for this task
+        # Replace any existing watch for this task
         await self.stop_polling(task_id)
 
-        # Create polling task
-        task = asyncio.create_task(
-            self._poll_loop(
-                task_id=task_id,
-                pr_number=pr_number,
-                repo_full_name=repo_full_name,
-                on_complete=on_complete,
-                on_timeout=on_timeout,
-            )
+        now = time.monotonic()
+        self._watches[task_id] = _CIWatch(
+            task_id=task_id,
+            pr_number=pr_number,
+            repo_full_name=repo_full_name,
+            on_complete=on_complete,
+            on_timeout=on_timeout,
+            started_at=now,
+            deadline=now + self._timeout_minutes * 60,
+            next_check_at=now + self._min_interval,
+            interval=self._min_interval,
+            sha_seen_at=now,
         )
-        self._polling_tasks[task_id] = task
+        self._ensure_scheduler()
+        self._wakeup.set()
 
         logger.info(
             f"Started CI polling for task {task_id}, PR #{pr_number} "
-            f"(interval: {self._poll_interval}s, timeout: {self._timeout_minutes}m)"
+            f"(watching {len(self._watches)} PRs, timeout: {self._timeout_minutes}m)"
         )
 
     async def stop_polling(self, task_id: str) -> bool:
@@ -87,16 +155,10 @@ class CIPollingService:
         Returns:
             True if polling was stopped, False if no active polling.
         """
-        task = self._polling_tasks.pop(task_id, None)
-        if task:
-            task.cancel()
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
-            logger.info(f"Stopped CI polling for task {task_id}")
-            return True
-        return False
+        if self._watches.pop(task_id, None) is None:
+            return False
+        logger.info(f"Stopped CI polling for task {task_id}")
+        return True
 
     def is_polling(self, task_id: str) -> bool:
         """Check if polling is active for a task.
@@ -107,79 +169,245 @@ class CIPollingService:
         Returns:
             True if polling is active.
         """
-        task = self._polling_tasks.get(task_id)
-        return task is not None and not task.done()
+        return task_id in self._watches
 
-    async def _poll_loop(
-        self,
-        task_id: str,
-        pr_number: int,
-        repo_full_name: str,
-        on_complete: Callable[[CIResult], Coroutine[Any, Any, None]],
-        on_timeout: Callable[[], Coroutine[Any, Any, None]] | None,
+    def get_observation(
+        self, repo_full_name: str, pr_number: int, max_age_seconds: float
+    ) -> tuple[str, str] | None:
+        """Get the latest CI observation of a PR if it is recent enough.
+
+        Args:
+            repo_full_name: Full repository name (owner/repo).
+            pr_number: PR number.
+            max_age_seconds: Maximum age of the observation.
+
+        Returns:
+            (head SHA, status) or None.
+        """
+        observation = self._observations.get((repo_full_name, pr_number))
+        if observation is None or time.monotonic() - observation[2] > max_age_seconds:
+            return None
+        return observation[0], observation[1]
+
+    def record_observation(
+        self, repo_full_name: str, pr_number: int, head_sha: str | None, status: str
     ) -> None:
-        """Main polling loop.
+        """Record an observed CI status of a PR.
+
+        Called by the scheduler and by on-demand CI checks. A completed
+        status for a watched PR makes the scheduler look at it right away.
 
         Args:
-            task_id: Task ID.
+            repo_full_name: Full repository name (owner/repo).
             pr_number: PR number.
-            repo_full_name: Full repository name.
-            on_complete: Callback for CI completion.
-            on_timeout: Callback for timeout.
+            head_sha: Head commit SHA the status belongs to.
+            status: Combined status ("success", "pending", "failure", "error").
         """
-        start_time = datetime.utcnow()
-        timeout = timedelta(minutes=self._timeout_minutes)
+        if not head_sha:
+            return
+        now = time.monotonic()
+        self._observations[(repo_full_name, pr_number)] = (head_sha, status, now)
+
+        # Clean up old entries to prevent memory growth
+        cutoff = now - OBSERVATION_TTL_SECONDS
+        self._observations = {k: v for k, v in self._observations.items() if v[2] > cutoff}
+
+        if status in COMPLETED_STATES:
+            for watch in self._watches.values():
+                if watch.repo_full_name == repo_full_name and watch.pr_number == pr_number:
+                    watch.next_check_at = now
+                    self._wakeup.set()
+
+    def notify_event(
+        self,
+        repo_full_name: str,
+        *,
+        pr_numbers: list[int] | None = None,
+        head_sha: str | None = None,
+    ) -> int:
+        """Poll watched PRs right away because a webhook reported CI activity.
+
+        Watches match by PR number or by the head SHA last seen for them.
+        The scheduler then reads the combined CI state in one batched lookup
+        and dispatches completion callbacks as usual.
 
-        logger.debug(f"Starting poll loop for task {task_id}")
+        Args:
+            repo_full_name: Full repository name (owner/repo).
+            pr_numbers: PR numbers named by the event.
+            head_sha: Commit SHA named by the event.
+
+        Returns:
+            Number of watches scheduled for an immediate check.
+        """
+        numbers = set(pr_numbers or ())
+        now = time.monotonic()
+        matched = 0
+        for watch in self._watches.values():
+            if watch.repo_full_name != repo_full_name:
+                continue
+            if watch.pr_number in numbers or (head_sha and watch.head_sha == head_sha):
+                watch.next_check_at = now
+                matched += 1
+        if matched:
+            self._wakeup.set()
+        return matched
+
+    def _ensure_scheduler(self) -> None:
+        if self._scheduler is None or self._scheduler.done():
+            self._scheduler = asyncio.create_task(self._run_scheduler())
+
+    async def _run_scheduler(self) -> None:
+        """Poll due PRs in batches until no watches are left."""
+        while self._watches:
+            now = time.monotonic()
+            next_due = min(w.next_check_at for w in self._watches.values())
+            if next_due > now:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=next_due - now)
+                except TimeoutError:
+                    pass
+                continue
+
+            due = [w for w in self._watches.values() if w.next_check_at <= now]
+            by_repo: dict[str, list[_CIWatch]] = defaultdict(list)
+            for watch in due:
+                by_repo[watch.repo_full_name].append(watch)
+            # Defer the due watches until their repo poll reschedules them
+            for watch in due:
+                watch.next_check_at = now + self._max_interval
 
-        while True:
             try:
-                # Check timeout
-                elapsed = datetime.utcnow() - start_time
-                if elapsed > timeout:
-                    logger.warning(f"CI polling timed out for task {task_id}")
-                    self._polling_tasks.pop(task_id, None)
-                    if on_timeout:
-                        await on_timeout()
-                    return
-
-                # Poll CI status
-                status = await self.github.get_pr_check_status(pr_number, repo_full_name)
-                logger.debug(f"CI status for task {task_id}: {status}")
-
-                if status in ("success", "failure", "error"):
-                    # CI completed - build result and trigger callback
-                    ci_result = await self._build_ci_result(
-                        pr_number=pr_number,
-                        repo_full_name=repo_full_name,
-                        status=status,
-                    )
-
-                    logger.info(
-                        f"CI completed for task {task_id}: {status} "
-                        f"(took {elapsed.total_seconds():.1f}s)"
-                    )
-
-                    self._polling_tasks.pop(task_id, None)
-                    await on_complete(ci_result)
-                    return
-
-                # CI still pending - wait and poll again
-                await asyncio.sleep(self._poll_interval)
-
-            except asyncio.CancelledError:
-                logger.debug(f"Polling cancelled for task {task_id}")
-                raise
-            except Exception as e:
-                logger.error(f"Error polling CI status for task {task_id}: {e}")
-                # Continue polling on error (GitHub API might be temporarily unavailable)
-                await asyncio.sleep(self._poll_interval)
+                async with asyncio.TaskGroup() as tg:
+                    for repo_full_name, watches in by_repo.items():
+                        tg.create_task(self._poll_repo(repo_full_name, watches))
+            except Exception:
+                logger.exception("Error in CI polling scheduler")
+
+    async def _poll_repo(self, repo_full_name: str, watches: list[_CIWatch]) -> None:
+        """Look up the CI state of one repository's due PRs in one batch.
+
+        Args:
+            repo_full_name: Full repository name.
+            watches: Due watches of the repository.
+        """
+        owner, repo = repo_full_name.split("/", 1)
+        try:
+            statuses = await self.github.get_pull_request_statuses(
+                owner,
+                repo,
+                [w.pr_number for w in watches],
+                priority=GitHubRequestPriority.CI_POLLING,
+            )
+        except Exception as e:
+            logger.error(f"Error polling CI status for {repo_full_name}: {e}")
+            # Continue polling on error (GitHub API might be temporarily unavailable)
+            statuses = {}
+
+        now = time.monotonic()
+        for watch in watches:
+            if self._watches.get(watch.task_id) is not watch:
+                continue  # Stopped or replaced while the lookup was in flight
+
+            if now > watch.deadline:
+                logger.warning(f"CI polling timed out for task {watch.task_id}")
+                self._watches.pop(watch.task_id, None)
+                if watch.on_timeout:
+                    self._dispatch(watch.on_timeout())
+                continue
+
+            pr_status = statuses.get(watch.pr_number)
+            if pr_status is None:
+                self._schedule(watch, now)
+                continue
+
+            head_sha = pr_status.get("head_sha")
+            status = pr_status.get("ci_state", "pending")
+            if head_sha != watch.head_sha:
+                # New push: CI restarts for the new head commit
+                if watch.head_sha is not None:
+                    watch.sha_seen_at = now
+                    watch.interval = self._min_interval
+                watch.head_sha = head_sha
+            self.record_observation(repo_full_name, watch.pr_number, head_sha, status)
+            logger.debug(f"CI status for task {watch.task_id}: {status}")
+
+            if status not in COMPLETED_STATES:
+                self._schedule(watch, now)
+                continue
+
+            # CI completed - build result and trigger callback
+            duration = now - watch.sha_seen_at
+            self._record_duration(repo_full_name, duration)
+            self._watches.pop(watch.task_id, None)
+            logger.info(
+                f"CI completed for task {watch.task_id}: {status} "
+                f"(took {now - watch.started_at:.1f}s)"
+            )
+            self._dispatch(self._complete(watch, status, head_sha))
+
+    async def _complete(self, watch: _CIWatch, status: str, head_sha: str | None) -> None:
+        ci_result = await self._build_ci_result(
+            pr_number=watch.pr_number,
+            repo_full_name=watch.repo_full_name,
+            status=status,
+            head_sha=head_sha,
+        )
+        await watch.on_complete(ci_result)
+
+    def _dispatch(self, coro: Coroutine[Any, Any, None]) -> None:
+        """Run a callback without blocking the scheduler."""
+        task = asyncio.create_task(coro)
+        self._callbacks.add(task)
+        task.add_done_callback(self._callback_done)
+
+    def _callback_done(self, task: asyncio.Task[None]) -> None:
+        self._callbacks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"CI polling callback failed: {task.exception()}")
+
+    def _schedule(self, watch: _CIWatch, now: float) -> None:
+        """Schedule the next check of a pending PR."""
+        watch.next_check_at = now + self._next_interval(watch, now)
+
+    def _next_interval(self, watch: _CIWatch, now: float) -> float:
+        """Pick the next poll interval for a pending PR.
+
+        Without history the interval grows geometrically from the minimum up
+        to ``ci_polling_interval_seconds``. With a learned CI duration the
+        scheduler waits for roughly half of the remaining expected time,
+        polls at the minimum interval around the expected completion, and
+        backs off again when CI runs longer than usual.
+        """
+        expected = self._ci_durations.get(watch.repo_full_name)
+        elapsed = now - watch.sha_seen_at
+        if expected is not None:
+            if elapsed < 0.8 * expected:
+                interval = (0.8 * expected - elapsed) / 2
+                return min(max(interval, self._min_interval), self._max_interval)
+            if elapsed < 1.5 * expected:
+                watch.interval = self._min_interval
+                return self._min_interval
+
+        interval = watch.interval
+        watch.interval = min(watch.interval * INTERVAL_BACKOFF, self._poll_interval)
+        return interval
+
+    def _record_duration(self, repo_full_name: str, duration: float) -> None:
+        previous = self._ci_durations.get(repo_full_name)
+        if previous is None:
+            self._ci_durations[repo_full_name] = duration
+        else:
+            self._ci_durations[repo_full_name] = (
+                DURATION_EWMA_ALPHA * duration + (1 - DURATION_EWMA_ALPHA) * previous
+            )
 
     async def _build_ci_result(
         self,
         pr_number: int,
         repo_full_name: str,
         status: str,
+        head_sha: str | None = None,
     ) -> CIResult:
         """Build CIResult from GitHub API data.
 
@@ -187,6 +415,7 @@ class CIPollingService:
             pr_number: PR number.
             repo_full_name: Full repository name.
             status: Combined CI status.
+            head_sha: Head commit SHA, if already known.
 
         Returns:
             CIResult object.
@@ -194,14 +423,16 @@ class CIPollingService:
         owner, repo = repo_full_name.split("/", 1)
 
         # Get PR to find head SHA
-        try:
-            pr_data = await self.github._github_request(
-                "GET",
-                f"/repos/{owner}/{repo}/pulls/{pr_number}",
-            )
-            head_sha = pr_data.get("head", {}).get("sha", "")
-        except Exception:
-            head_sha = ""
+        if not head_sha:
+            try:
+                pr_data = await self.github._github_request(
+                    "GET",
+                    f"/repos/{owner}/{repo}/pulls/{pr_number}",
+                    priority=GitHubRequestPriority.CI_POLLING,
+                )
+                head_sha = pr_data.get("head", {}).get("sha", "")
+            except Exception:
+                head_sha = ""
 
         # Get check runs for detailed job info
         jobs: dict[str, str] = {}
@@ -212,40 +443,33 @@ class CIPollingService:
                 check_runs_data = await self.github._github_request(
                     "GET",
                     f"/repos/{owner}/{repo}/commits/{head_sha}/check-runs",
+                    priority=GitHubRequestPriority.CI_POLLING,
                 )
 
-                for check_run in check_runs_data.get("check_runs", []):
+                check_runs = check_runs_data.get("check_runs", [])
+                for check_run in check_runs:
                     name = check_run.get("name", "unknown")
-                    conclusion = check_run.get("conclusion") or check_run.get("status", "unknown")
-                    jobs[name] = conclusion
-
-                    if conclusion in ("failure", "cancelled", "timed_out"):
-                        # Get error log from check run output
-                        error_log = check_run.get("output", {}).get("summary", "")
-                        if not error_log:
-                            error_log = check_run.get("output", {}).get("text", "")
-
-                        failed_jobs.append(
-                            CIJobResult(
-                                job_name=name,
-                                result=conclusion,
-                                error_log=error_log[:2000] if error_log else None,
-                            )
-                        )
+                    jobs[name] = check_run.get("conclusion") or check_run.get("status", "unknown")
+
+                # Failed jobs carry an excerpt of their log for the CI-fix instruction
+                failed_jobs = await self.ci_logs.failed_jobs(repo_full_name, check_runs)
             except Exception as e:
                 logger.warning(f"Failed to get check runs: {e}")
 
         return CIResult(
             success=status == "success",
             workflow_run_id=0,  # Not available from status API
-            sha=head_sha,
+            sha=head_sha or "",
             jobs=jobs,
             failed_jobs=failed_jobs,
         )
 
     async def shutdown(self) -> None:
         """Shutdown polling service and cancel all active polls."""
-        task_ids = list(self._polling_tasks.keys())
-        for task_id in task_ids:
-            await self.stop_polling(task_id)
+        self._watches.clear()
+        tasks = [t for t in (self._scheduler, *self._callbacks) if t is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._scheduler = None
         logger.info("CI polling service shutdown complete")
@@ -0,0 +1,210 @@
+"""Incremental, memory-bounded diff capture.
+
+Instead of materializing a full `git diff` as one string and re-parsing it,
+diffs are captured in two passes:
+
+1. `git diff --numstat -z` yields the changed files and line counts cheaply.
+2. `git diff` output is streamed from the subprocess through
+   :func:`~zloth_api.services.diff_parser.iter_diff_stream`. Each file patch
+   is kept only up to a per-file byte cap, and stored patches are capped in
+   total. The rest is read and discarded without being buffered.
+
+Large generated-file changes therefore keep their stats in `files_changed`
+but do not balloon memory in the API process or in `runs.patch`.
+
+The functions operating on ``git.Repo`` are synchronous and are meant to be
+called from within ``run_in_executor`` blocks in WorkspaceService/GitService.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+import git
+
+from zloth_api.config import settings
+from zloth_api.domain.models import FileDiff
+from zloth_api.services.diff_parser import iter_diff_stream
+
+# Marker appended to patches that were cut off at the size cap
+TRUNCATED_MARKER = "... [diff truncated by zloth: patch too large] ..."
+
+
+@dataclass
+class DiffStat:
+    """Line counts for one changed file from `git diff --numstat -z`."""
+
+    path: str
+    old_path: str | None = None
+    added_lines: int = 0
+    removed_lines: int = 0
+    binary: bool = False
+
+
+@dataclass
+class DiffCapture:
+    """Result of an incremental diff capture."""
+
+    files: list[FileDiff] = field(default_factory=list)
+    patch: str = ""
+    truncated: bool = False
+
+    @property
+    def added_lines(self) -> int:
+        return sum(f.added_lines for f in self.files)
+
+    @property
+    def removed_lines(self) -> int:
+        return sum(f.removed_lines for f in self.files)
+
+
+def parse_numstat_z(output: str) -> list[DiffStat]:
+    """Parse `git diff --numstat -z` output.
+
+    Regular entries are ``<added>\\t<removed>\\t<path>\\0``. Renames and copies
+    are ``<added>\\t<removed>\\t\\0<old>\\0<new>\\0``. Binary files report
+    ``-`` for both counts.
+
+    Args:
+        output: Raw numstat output.
+
+    Returns:
+        List of DiffStat in git's output order.
+    """
+    stats: list[DiffStat] = []
+    tokens = output.split("\0")
+    i = 0
+    while i < len(tokens):
+        entry = tokens[i]
+        i += 1
+        if not entry.strip():
+            continue
+        parts = entry.split("\t", 2)
+        if len(parts) != 3:
+            continue
+        added, removed, path = parts
+        old_path: str | None = None
+        if not path:
+            # Rename/copy: old and new paths follow as separate tokens
+            if i + 1 >= len(tokens):
+                break
+            old_path, path = tokens[i], tokens[i + 1]
+            i += 2
+        binary = added == "-" and removed == "-"
+        stats.append(
+            DiffStat(
+                path=path,
+                old_path=old_path,
+                added_lines=0 if binary else int(added),
+                removed_lines=0 if binary else int(removed),
+                binary=binary,
+            )
+        )
+    return stats
+
+
+def numstat(repo: git.Repo, *diff_args: str) -> list[DiffStat]:
+    """Get per-file line counts for a diff.
+
+    Args:
+        repo: Repository to diff in.
+        *diff_args: Arguments selecting the diff (e.g. ``"HEAD", "--cached"``).
+
+    Returns:
+        List of DiffStat (empty if there are no changes).
+    """
+    output = repo.git.diff(*diff_args, "-M", "--numstat", "-z")
+    return parse_numstat_z(str(output))
+
+
+def capture_diff(
+    repo: git.Repo,
+    *diff_args: str,
+    max_file_bytes: int | None = None,
+    max_total_bytes: int | None = None,
+) -> DiffCapture:
+    """Capture a diff incrementally with bounded memory.
+
+    Args:
+        repo: Repository to diff in.
+        *diff_args: Arguments selecting the diff (e.g. ``"HEAD", "--cached"``).
+        max_file_bytes: Per-file patch cap. Defaults to settings.
+        max_total_bytes: Cap on the combined stored patch. Defaults to settings.
+
+    Returns:
+        DiffCapture with per-file stats, capped patches and the combined patch.
+    """
+    file_cap = max_file_bytes or settings.diff_max_file_patch_kb * 1024
+    total_cap = max_total_bytes or settings.diff_max_run_patch_kb * 1024
+
+    stats = numstat(repo, *diff_args)
+    if not stats:
+        return DiffCapture()
+
+    capture = DiffCapture()
+    parts: list[str] = []
+    total = 0
+    proc = repo.git.diff(*diff_args, "-M", as_process=True)
+    stdout = proc.proc.stdout
+    try:
+        spans = iter_diff_stream(stdout, max_file_bytes=file_cap)
+        for stat in stats:
+            span = next(spans, None)
+            raw = bytes(span.raw) if span else b""
+            file_truncated = span.truncated if span else False
+            if total + len(raw) > total_cap:
+                raw, file_truncated = b"", True
+            total += len(raw)
+            patch = raw.decode("utf-8", errors="replace").rstrip("\n")
+            if file_truncated:
+                capture.truncated = True
+                patch = "\n".join(p for p in (patch, TRUNCATED_MARKER) if p)
+            if patch:
+                parts.append(patch)
+            capture.files.append(
+                FileDiff(
+                    path=stat.path,
+                    old_path=stat.old_path,
+                    added_lines=stat.added_lines,
+                    removed_lines=stat.removed_lines,
+                    patch=patch,
+                )
+            )
+        # Read the rest of the output so git is not blocked on a full pipe
+        for _ in spans:
+            pass
+    finally:
+        stdout.close()
+        proc.wait()
+
+    capture.patch = "\n".join(parts) + ("\n" if parts else "")
+    return capture
+
+
+def merge_file_diffs(deltas: list[list[FileDiff]]) -> list[FileDiff]:
+    """Combine per-run file deltas into a cumulative per-file view.
+
+    Used when the workspace is no longer available to compute the cumulative
+    diff from git. Line counts are summed and patches concatenated in order.
+
+    Args:
+        deltas: Per-run file lists, oldest first.
+
+    Returns:
+        Combined file list in first-seen order.
+    """
+    combined: dict[str, FileDiff] = {}
+    for files in deltas:
+        for f in files:
+            current = combined.get(f.path)
+            if current is None and f.old_path and f.old_path in combined:
+                current = combined.pop(f.old_path)
+                current.path = f.path
+            if current is None:
+                combined[f.path] = f.model_copy()
+                continue
+            current.added_lines += f.added_lines
+            current.removed_lines += f.removed_lines
+            current.patch = "\n".join(p for p in (current.patch, f.patch) if p)
+            combined[f.path] = current
+    return list(combined.values())
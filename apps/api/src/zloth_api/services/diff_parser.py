@@ -1,71 +1,349 @@
-"""Unified diff parsing utilities."""
+"""Unified diff parsing utilities.
+
+The parser walks the diff buffer by offset instead of splitting it into
+lines. Header lines are inspected one at a time; hunk bodies are skipped in
+one step (the next file boundary is located with ``bytes.find``) and their
+added/removed lines are counted with ``bytes.count`` over the hunk range.
+
+Each parsed file is returned as a :class:`DiffFileSpan` referencing a slice
+of the original buffer, so the patch text is only materialized when it is
+actually needed.
+
+Supported input:
+- ``git diff`` output (``diff --git`` headers, renames, copies, binary files,
+  mode-only changes, ``/dev/null`` for added/deleted files).
+- Header-less unified diffs as produced by LLMs (``--- a/x`` / ``+++ b/x``),
+  where hunk line counts in ``@@`` headers are not trusted.
+"""
 
 from __future__ import annotations
 
+import codecs
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
 from zloth_api.domain.models import FileDiff
 
+_GIT_HEADER = b"diff --git "
+_NL_GIT_HEADER = b"\n" + _GIT_HEADER
+_OLD_HEADER = b"--- "
+_NL_OLD_HEADER = b"\n" + _OLD_HEADER
+_NEW_HEADER = b"+++ "
+_HUNK = b"@@"
+_DEV_NULL = b"/dev/null"
+_RENAME_FROM = b"rename from "
+_RENAME_TO = b"rename to "
+_COPY_FROM = b"copy from "
+_COPY_TO = b"copy to "
+_BINARY = b"Binary files "
+_GIT_BINARY = b"GIT binary patch"
+
+
+@dataclass
+class DiffFileSpan:
+    """One file in a unified diff, referencing a slice of the source buffer."""
+
+    buffer: bytes
+    start: int
+    end: int
+    path: str
+    old_path: str | None = None
+    added_lines: int = 0
+    removed_lines: int = 0
+    binary: bool = False
+    truncated: bool = False  # Patch cut at the stream's per-file cap
+
+    @property
+    def raw(self) -> memoryview:
+        """The file's patch bytes without copying the source buffer."""
+        end = self.end
+        if end > self.start and self.buffer[end - 1] == 0x0A:
+            end -= 1
+        return memoryview(self.buffer)[self.start : end]
+
+    @property
+    def patch(self) -> str:
+        """The file's patch text (decoded on access)."""
+        return str(self.raw, "utf-8", "replace")
+
+    def to_file_diff(self) -> FileDiff:
+        """Convert to a FileDiff, materializing the patch text."""
+        return FileDiff(
+            path=self.path,
+            old_path=self.old_path,
+            added_lines=self.added_lines,
+            removed_lines=self.removed_lines,
+            patch=self.patch,
+        )
+
+
+def _decode_path(raw: bytes, prefix: bytes) -> str | None:
+    """Decode a path from a ``---``/``+++``/rename line.
+
+    Handles git's C-style quoting, trailing tab-separated timestamps and the
+    ``a/``/``b/`` prefixes. Returns None for ``/dev/null``.
+    """
+    raw = raw.rstrip(b"\r")
+    if raw.startswith(b'"') and raw.endswith(b'"') and len(raw) >= 2:
+        raw = codecs.escape_decode(raw[1:-1])[0]
+    else:
+        tab = raw.find(b"\t")
+        if tab != -1:
+            raw = raw[:tab]
+    if raw == _DEV_NULL:
+        return None
+    if prefix and raw.startswith(prefix):
+        raw = raw[len(prefix) :]
+    return raw.decode("utf-8", "replace")
+
+
+def _split_git_header(rest: bytes) -> tuple[str | None, str | None]:
+    """Split ``a/<old> b/<new>`` from a ``diff --git`` line."""
+    rest = rest.rstrip(b"\r")
+    if rest.startswith(b'"'):
+        # Quoted old path: "a/..." b/... or "a/..." "b/..."
+        close = rest.find(b'" ', 1)
+        if close == -1:
+            return None, None
+        return _decode_path(rest[: close + 1], b"a/"), _decode_path(rest[close + 2 :], b"b/")
+    # Unquoted: when both sides are equal the split is unambiguous even if
+    # the path contains " b/"
+    half = (len(rest) - 5) // 2
+    if (
+        len(rest) % 2 == 1
+        and rest.startswith(b"a/")
+        and rest[2 + half : 5 + half] == b" b/"
+        and rest[2 : 2 + half] == rest[5 + half :]
+    ):
+        path = _decode_path(rest[2 + half + 3 :], b"")
+        return path, path
+    sep = rest.find(b" b/")
+    if sep == -1:
+        return None, None
+    return _decode_path(rest[:sep], b"a/"), _decode_path(rest[sep + 1 :], b"b/")
+
+
+def _is_headerless_boundary(buf: bytes, pos: int) -> bool:
+    """Check for a ``--- `` / ``+++ `` / ``@@`` triple starting at ``pos``.
+
+    In header-less diffs this is the only reliable file boundary: a removed
+    line may start with ``--`` and an added one with ``++``, but a hunk
+    content line can never start with ``@``.
+    """
+    eol = buf.find(b"\n", pos)
+    if eol == -1 or not buf.startswith(_NEW_HEADER, eol + 1):
+        return False
+    eol2 = buf.find(b"\n", eol + 1)
+    return eol2 != -1 and buf.startswith(_HUNK, eol2 + 1)
+
+
+def _find_next_file(buf: bytes, pos: int, has_git_header: bool) -> int:
+    """Find the offset where the file after the hunk body starting at ``pos`` begins.
+
+    Returns ``len(buf)`` when the hunk body extends to the end of the buffer.
+    """
+    n = len(buf)
+    git_next = buf.find(_NL_GIT_HEADER, pos - 1)
+    git_next = n if git_next == -1 else git_next + 1
+    if has_git_header:
+        return git_next
+    search = pos - 1
+    while True:
+        cand = buf.find(_NL_OLD_HEADER, search, git_next)
+        if cand == -1:
+            return git_next
+        if _is_headerless_boundary(buf, cand + 1):
+            return cand + 1
+        search = cand + 1
+
+
+def iter_unified_diff(diff: bytes) -> Iterator[DiffFileSpan]:
+    """Parse a unified diff buffer, yielding one span per file.
+
+    Args:
+        diff: Diff bytes (``git diff`` output or a header-less unified diff).
 
-def parse_unified_diff(diff: str) -> list[FileDiff]:
+    Yields:
+        DiffFileSpan records in diff order.
+    """
+    buf = bytes(diff)
+    n = len(buf)
+    pos = 0
+
+    current: DiffFileSpan | None = None
+    has_git_header = False
+    seen_new_header = False
+    header_old: str | None = None
+
+    def finish(end: int) -> DiffFileSpan | None:
+        if current is None:
+            return None
+        current.end = end
+        if current.old_path == current.path:
+            current.old_path = None
+        return current if current.path else None
+
+    while pos < n:
+        eol = buf.find(b"\n", pos)
+        if eol == -1:
+            eol = n
+        nxt = eol + 1
+
+        if buf.startswith(_GIT_HEADER, pos):
+            done = finish(pos)
+            if done:
+                yield done
+            old, new = _split_git_header(buf[pos + len(_GIT_HEADER) : eol])
+            current = DiffFileSpan(buf, pos, n, path=new or old or "", old_path=old)
+            has_git_header, seen_new_header, header_old = True, False, old
+        elif buf.startswith(_OLD_HEADER, pos) and (current is None or seen_new_header):
+            # Header-less diff: "--- " starts a new file
+            done = finish(pos)
+            if done:
+                yield done
+            header_old = _decode_path(buf[pos + 4 : eol], b"a/")
+            current = DiffFileSpan(buf, pos, n, path=header_old or "", old_path=header_old)
+            has_git_header, seen_new_header = False, False
+        elif current is None:
+            pass  # Preamble before the first file
+        elif buf.startswith(_OLD_HEADER, pos):
+            header_old = _decode_path(buf[pos + 4 : eol], b"a/")
+            if header_old:
+                current.old_path = header_old
+        elif buf.startswith(_NEW_HEADER, pos):
+            seen_new_header = True
+            new_path = _decode_path(buf[pos + 4 : eol], b"b/")
+            if new_path is None:
+                # Deleted file: keep the old path
+                current.path = header_old or current.path
+                current.old_path = None
+            else:
+                current.path = new_path
+                if header_old is None:
+                    current.old_path = None  # Added file
+        elif buf.startswith(_HUNK, pos):
+            # Skip the hunk bodies up to the next file and count +/- lines
+            body_end = _find_next_file(buf, nxt, has_git_header)
+            lo = min(eol, body_end)
+            current.added_lines += buf.count(b"\n+", lo, body_end)
+            current.removed_lines += buf.count(b"\n-", lo, body_end)
+            nxt = body_end
+            seen_new_header = True
+        elif buf.startswith(_RENAME_FROM, pos) or buf.startswith(_COPY_FROM, pos):
+            start = pos + (len(_RENAME_FROM) if buf[pos] == 0x72 else len(_COPY_FROM))
+            current.old_path = _decode_path(buf[start:eol], b"")
+        elif buf.startswith(_RENAME_TO, pos) or buf.startswith(_COPY_TO, pos):
+            start = pos + (len(_RENAME_TO) if buf[pos] == 0x72 else len(_COPY_TO))
+            current.path = _decode_path(buf[start:eol], b"") or current.path
+        elif buf.startswith(_BINARY, pos) or buf.startswith(_GIT_BINARY, pos):
+            current.binary = True
+
+        pos = nxt
+
+    done = finish(n)
+    if done:
+        yield done
+
+
+def iter_diff_stream(
+    chunks: Iterable[bytes], max_file_bytes: int | None = None
+) -> Iterator[DiffFileSpan]:
+    """Parse a diff incrementally from a byte stream.
+
+    Accepts any iterable of bytes, e.g. the stdout pipe of a ``git diff``
+    subprocess or a generator of chunks. Files are yielded as soon as the
+    next ``diff --git`` header arrives, so only the file currently being
+    read is buffered.
+
+    With ``max_file_bytes``, at most that many bytes of each ``diff --git``
+    section are buffered. The rest of the section is read and discarded and
+    the span is marked ``truncated``; its line counts then only cover the
+    kept part.
+
+    Args:
+        chunks: Iterable of diff bytes.
+        max_file_bytes: Optional per-file cap on buffered patch bytes.
+
+    Yields:
+        DiffFileSpan records in diff order.
+    """
+    if max_file_bytes is not None:
+        yield from _iter_capped_stream(chunks, max_file_bytes)
+        return
+
+    pending = bytearray()
+    for chunk in chunks:
+        if not chunk:
+            continue
+        search_from = max(0, len(pending) - len(_NL_GIT_HEADER))
+        pending += chunk
+        boundary = pending.rfind(_NL_GIT_HEADER, search_from)
+        if boundary == -1:
+            continue
+        segment = bytes(pending[: boundary + 1])
+        del pending[: boundary + 1]
+        yield from iter_unified_diff(segment)
+    if pending:
+        yield from iter_unified_diff(bytes(pending))
+
+
+def _iter_lines(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Re-split a byte stream into lines (keeping the newlines)."""
+    pending = bytearray()
+    for chunk in chunks:
+        start = 0
+        while (eol := chunk.find(b"\n", start)) != -1:
+            if pending:
+                pending += chunk[start : eol + 1]
+                yield bytes(pending)
+                pending.clear()
+            else:
+                yield chunk[start : eol + 1]
+            start = eol + 1
+        pending += chunk[start:]
+    if pending:
+        yield bytes(pending)
+
+
+def _iter_capped_stream(chunks: Iterable[bytes], max_file_bytes: int) -> Iterator[DiffFileSpan]:
+    """Split a stream at ``diff --git`` lines, buffering at most ``max_file_bytes`` per file.
+
+    The header line of a file is always kept so the span still carries its path.
+    """
+    segment = bytearray()
+    truncated = False
+    for line in _iter_lines(chunks):
+        if line.startswith(_GIT_HEADER) and segment:
+            yield from _parse_segment(bytes(segment), truncated)
+            segment.clear()
+            truncated = False
+        elif truncated:
+            continue
+        elif segment and len(segment) + len(line) > max_file_bytes:
+            truncated = True
+            continue
+        segment += line
+    if segment:
+        yield from _parse_segment(bytes(segment), truncated)
+
+
+def _parse_segment(segment: bytes, truncated: bool) -> list[DiffFileSpan]:
+    spans = list(iter_unified_diff(segment))
+    if truncated and spans:
+        spans[-1].truncated = True
+    return spans
+
+
+def parse_unified_diff(diff: str | bytes) -> list[FileDiff]:
     """Parse a unified diff and extract per-file change metadata.
 
     Args:
-        diff: Unified diff string.
+        diff: Unified diff string or bytes.
 
     Returns:
         List of FileDiff objects.
     """
-    files: list[FileDiff] = []
-    current_file: str | None = None
-    current_patch_lines: list[str] = []
-    added_lines = 0
-    removed_lines = 0
-
-    for line in (diff or "").split("\n"):
-        if line.startswith("--- a/"):
-            # Save previous file if exists
-            if current_file:
-                files.append(
-                    FileDiff(
-                        path=current_file,
-                        added_lines=added_lines,
-                        removed_lines=removed_lines,
-                        patch="\n".join(current_patch_lines),
-                    )
-                )
-            # Reset for new file
-            current_patch_lines = [line]
-            current_file = None
-            added_lines = 0
-            removed_lines = 0
-        elif line.startswith("+++ b/"):
-            current_file = line[6:]
-            current_patch_lines.append(line)
-        elif line.startswith("--- /dev/null"):
-            # New file
-            current_patch_lines = [line]
-            current_file = None
-            added_lines = 0
-            removed_lines = 0
-        elif line.startswith("+++ b/") and current_file is None:
-            # New file path
-            current_file = line[6:]
-            current_patch_lines.append(line)
-        elif current_file:
-            current_patch_lines.append(line)
-            if line.startswith("+") and not line.startswith("+++"):
-                added_lines += 1
-            elif line.startswith("-") and not line.startswith("---"):
-                removed_lines += 1
-
-    # Save last file
-    if current_file:
-        files.append(
-            FileDiff(
-                path=current_file,
-                added_lines=added_lines,
-                removed_lines=removed_lines,
-                patch="\n".join(current_patch_lines),
-            )
-        )
-
-    return files
+    if not diff:
+        return []
+    buf = diff.encode("utf-8") if isinstance(diff, str) else diff
+    return [span.to_file_diff() for span in iter_unified_diff(buf)]
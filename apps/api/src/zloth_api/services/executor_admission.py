@@ -0,0 +1,335 @@
+"""Admission control for CLI executor launches.
+
+Concurrency is also capped by the job worker, the role queues and a few
+services, but none of those caps sees how many ``claude`` / ``codex`` /
+``gemini`` processes are actually alive. Every executor launch therefore
+takes a slot from one process-wide controller first. A launch is admitted
+when:
+
+1. fewer than ``executor_max_concurrent`` executors run in total,
+2. its executor type is below ``executor_max_concurrent_per_type``,
+3. its repository is below ``executor_max_concurrent_per_repo``, and
+4. the host has headroom: available memory stays above
+   ``executor_min_available_memory_mb`` (launches of the last few seconds are
+   counted with ``executor_memory_per_launch_mb`` because they are not yet
+   visible in the host's statistics) and the load average per CPU is below
+   ``executor_max_load_per_cpu``.
+
+Queued launches are admitted in priority order. A launch blocked by its own
+type or repository limit does not hold back launches of other types or
+repositories; global and host limits block the whole queue. While only host
+load blocks admission the queue is re-checked periodically. The host checks
+never block the first executor, so a busy host still makes progress.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import os
+import time
+from collections import Counter, deque
+from collections.abc import AsyncIterator, Callable, Mapping
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+
+from zloth_api.config import settings
+from zloth_api.domain.enums import ExecutorPriority, ExecutorType
+from zloth_api.domain.models import ExecutorAdmissionStatus
+
+logger = logging.getLogger(__name__)
+
+# Lower rank is admitted first
+PRIORITY_RANK = {
+    ExecutorPriority.USER: 0,
+    ExecutorPriority.RUN: 1,
+    ExecutorPriority.REVIEW: 2,
+}
+
+# Interval at which the queue is re-checked while host load blocks admission
+HOST_RECHECK_SECONDS = 2.0
+# A launched CLI takes this long to show up in host memory statistics
+LAUNCH_SETTLE_SECONDS = 15.0
+
+
+@dataclass
+class HostLoad:
+    """Host memory and CPU load snapshot (None where unavailable)."""
+
+    available_memory_mb: float | None
+    load_per_cpu: float | None
+
+
+def read_host_load() -> HostLoad:
+    """Read available memory (Linux /proc/meminfo) and the load average per CPU."""
+    available_memory_mb: float | None = None
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    available_memory_mb = int(line.split()[1]) / 1024
+                    break
+    except (OSError, ValueError, IndexError):
+        pass
+
+    load_per_cpu: float | None = None
+    try:
+        load_per_cpu = os.getloadavg()[0] / (os.cpu_count() or 1)
+    except (OSError, AttributeError):
+        pass
+    return HostLoad(available_memory_mb=available_memory_mb, load_per_cpu=load_per_cpu)
+
+
+@dataclass(eq=False)
+class _Waiter:
+    """A queued executor launch."""
+
+    executor_type: ExecutorType
+    repo: str | None
+    priority: ExecutorPriority
+    future: asyncio.Future[None]
+    enqueued_at: float
+
+
+class ExecutorAdmissionController:
+    """Global, per-type and per-repository slots for CLI executor processes."""
+
+    def __init__(
+        self,
+        *,
+        max_concurrent: int | None = None,
+        max_per_type: Mapping[str, int] | None = None,
+        max_per_repo: int | None = None,
+        min_available_memory_mb: float | None = None,
+        memory_per_launch_mb: float | None = None,
+        max_load_per_cpu: float | None = None,
+        host_load: Callable[[], HostLoad] = read_host_load,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_concurrent = max(
+            1, max_concurrent if max_concurrent is not None else settings.executor_max_concurrent
+        )
+        self.max_per_type = dict(
+            max_per_type if max_per_type is not None else settings.executor_max_concurrent_per_type
+        )
+        self.max_per_repo = (
+            max_per_repo if max_per_repo is not None else settings.executor_max_concurrent_per_repo
+        )
+        self.min_available_memory_mb = (
+            min_available_memory_mb
+            if min_available_memory_mb is not None
+            else settings.executor_min_available_memory_mb
+        )
+        self.memory_per_launch_mb = (
+            memory_per_launch_mb
+            if memory_per_launch_mb is not None
+            else settings.executor_memory_per_launch_mb
+        )
+        self.max_load_per_cpu = (
+            max_load_per_cpu if max_load_per_cpu is not None else settings.executor_max_load_per_cpu
+        )
+        self._host_load = host_load
+        self._clock = clock
+
+        self._running = 0
+        self._running_by_type: Counter[ExecutorType] = Counter()
+        self._running_by_repo: Counter[str] = Counter()
+        self._queue: list[tuple[int, int, _Waiter]] = []
+        self._seq = itertools.count()
+        self._recent_launches: deque[float] = deque()
+        self._timer: asyncio.TimerHandle | None = None
+        self._last_host_load: HostLoad | None = None
+
+        self._admitted_total = 0
+        self._host_deferrals = 0
+        self._total_wait_seconds = 0.0
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        executor_type: ExecutorType,
+        *,
+        repo: str | None = None,
+        priority: ExecutorPriority = ExecutorPriority.RUN,
+    ) -> AsyncIterator[None]:
+        """Hold an executor slot for the duration of the block.
+
+        Args:
+            executor_type: Executor that is launched.
+            repo: Repository the executor works on (None: not limited per repo).
+            priority: Admission priority of the launch.
+        """
+        await self.acquire(executor_type, repo=repo, priority=priority)
+        try:
+            yield
+        finally:
+            self.release(executor_type, repo=repo)
+
+    async def acquire(
+        self,
+        executor_type: ExecutorType,
+        *,
+        repo: str | None = None,
+        priority: ExecutorPriority = ExecutorPriority.RUN,
+    ) -> None:
+        """Wait until an executor may be launched.
+
+        Every successful acquire must be paired with :meth:`release`.
+
+        Args:
+            executor_type: Executor that is launched.
+            repo: Repository the executor works on (None: not limited per repo).
+            priority: Admission priority of the launch.
+        """
+        waiter = _Waiter(
+            executor_type=executor_type,
+            repo=repo,
+            priority=priority,
+            future=asyncio.get_running_loop().create_future(),
+            enqueued_at=self._clock(),
+        )
+        heapq.heappush(self._queue, (PRIORITY_RANK[priority], next(self._seq), waiter))
+        self._dispatch()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Admitted just before the cancellation: give the slot back
+                self.release(executor_type, repo=repo)
+            else:
+                self._remove(waiter)
+            raise
+
+        waited = self._clock() - waiter.enqueued_at
+        if waited >= 1.0:
+            logger.info(
+                f"{executor_type.value} launch admitted after {waited:.1f}s "
+                f"({self._running}/{self.max_concurrent} executors running)"
+            )
+
+    def release(self, executor_type: ExecutorType, *, repo: str | None = None) -> None:
+        """Free the slot of an executor that has exited."""
+        self._running = max(0, self._running - 1)
+        self._running_by_type[executor_type] -= 1
+        if self._running_by_type[executor_type] <= 0:
+            del self._running_by_type[executor_type]
+        if repo is not None:
+            self._running_by_repo[repo] -= 1
+            if self._running_by_repo[repo] <= 0:
+                del self._running_by_repo[repo]
+        self._dispatch()
+
+    def status(self) -> ExecutorAdmissionStatus:
+        """Snapshot of running and queued launches."""
+        queued = [waiter for _, _, waiter in self._queue if not waiter.future.done()]
+        host = self._last_host_load or self._host_load()
+        return ExecutorAdmissionStatus(
+            running=self._running,
+            running_by_type=dict(self._running_by_type),
+            running_by_repo=dict(self._running_by_repo),
+            queued=len(queued),
+            queued_by_priority=dict(Counter(waiter.priority for waiter in queued)),
+            max_concurrent=self.max_concurrent,
+            max_concurrent_per_type=self.max_per_type,
+            max_concurrent_per_repo=self.max_per_repo,
+            available_memory_mb=host.available_memory_mb,
+            load_per_cpu=host.load_per_cpu,
+            admitted_total=self._admitted_total,
+            host_deferrals=self._host_deferrals,
+            average_wait_ms=(
+                self._total_wait_seconds * 1000 / self._admitted_total
+                if self._admitted_total
+                else 0.0
+            ),
+        )
+
+    def _remove(self, waiter: _Waiter) -> None:
+        self._queue = [entry for entry in self._queue if entry[2] is not waiter]
+        heapq.heapify(self._queue)
+        # A waiter blocked by its own limits may have held nothing back; others may fit now
+        self._dispatch()
+
+    def _fits_limits(self, waiter: _Waiter) -> bool:
+        """Whether the waiter's executor type and repository have a free slot."""
+        type_limit = self.max_per_type.get(waiter.executor_type.value)
+        if type_limit is not None and self._running_by_type[waiter.executor_type] >= type_limit:
+            return False
+        return not (
+            waiter.repo is not None
+            and self.max_per_repo > 0
+            and self._running_by_repo[waiter.repo] >= self.max_per_repo
+        )
+
+    def _host_allows(self, now: float) -> bool:
+        """Whether host memory and CPU load leave room for another executor."""
+        if self._running == 0:
+            return True
+        while self._recent_launches and now - self._recent_launches[0] > LAUNCH_SETTLE_SECONDS:
+            self._recent_launches.popleft()
+
+        host = self._host_load()
+        self._last_host_load = host
+        if self.min_available_memory_mb > 0 and host.available_memory_mb is not None:
+            unaccounted = len(self._recent_launches) * self.memory_per_launch_mb
+            if host.available_memory_mb - unaccounted < self.min_available_memory_mb:
+                return False
+        return not (
+            self.max_load_per_cpu > 0
+            and host.load_per_cpu is not None
+            and host.load_per_cpu > self.max_load_per_cpu
+        )
+
+    def _dispatch(self) -> None:
+        """Admit queued launches in priority order while limits allow."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        now = self._clock()
+        blocked: list[tuple[int, int, _Waiter]] = []
+        host_blocked = False
+        while self._queue and self._running < self.max_concurrent:
+            entry = heapq.heappop(self._queue)
+            waiter = entry[2]
+            if waiter.future.done():
+                continue
+            if not self._fits_limits(waiter):
+                # Lower priorities of other types/repos may still be admitted
+                blocked.append(entry)
+                continue
+            if not self._host_allows(now):
+                blocked.append(entry)
+                host_blocked = True
+                self._host_deferrals += 1
+                break
+            self._admit(waiter, now)
+
+        for entry in blocked:
+            heapq.heappush(self._queue, entry)
+
+        if host_blocked:
+            loop = asyncio.get_running_loop()
+            self._timer = loop.call_later(HOST_RECHECK_SECONDS, self._dispatch)
+
+    def _admit(self, waiter: _Waiter, now: float) -> None:
+        self._running += 1
+        self._running_by_type[waiter.executor_type] += 1
+        if waiter.repo is not None:
+            self._running_by_repo[waiter.repo] += 1
+        self._recent_launches.append(now)
+        self._admitted_total += 1
+        self._total_wait_seconds += now - waiter.enqueued_at
+        waiter.future.set_result(None)
+
+
+_admission_controller: ExecutorAdmissionController | None = None
+
+
+def get_executor_admission() -> ExecutorAdmissionController:
+    """Get the process-wide executor admission controller."""
+    global _admission_controller
+    if _admission_controller is None:
+        _admission_controller = ExecutorAdmissionController()
+    return _admission_controller
@@ -0,0 +1,172 @@
+"""Content-addressed cache of CLI run results.
+
+Comparison runs and retried instructions often run the same CLI with the same
+instruction on the same base commit. With the cache enabled, the staged patch
+and summary of a successful run are stored under a key derived from the
+repository, the git tree of the (clean) workspace, the normalized instruction,
+the executor type and the model. A later run with the same key applies the
+cached patch instead of launching the CLI.
+
+Entries live in SQLite, expire after a TTL and are evicted least recently
+used first once their combined size exceeds the limit. Lookups match the
+repository and tree explicitly, so a result is never served for another
+repository or for different workspace content.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from zloth_api.config import settings
+from zloth_api.domain.enums import ExecutorType
+from zloth_api.domain.models import ExecutorResultCacheStats
+from zloth_api.storage.dao import ExecutorResultCacheDAO
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_instruction(instruction: str) -> str:
+    """Normalize line endings and surrounding/trailing whitespace."""
+    lines = instruction.replace("\r\n", "\n").strip().split("\n")
+    return "\n".join(line.rstrip() for line in lines)
+
+
+@dataclass(frozen=True)
+class ResultCacheKey:
+    """Everything a cached CLI run result depends on."""
+
+    repo_id: str
+    tree_hash: str
+    instruction: str
+    executor_type: ExecutorType
+    model: str | None = None
+
+    @property
+    def digest(self) -> str:
+        """SHA-256 of the key fields (instruction normalized)."""
+        fields = [
+            self.repo_id,
+            self.tree_hash,
+            self.executor_type.value,
+            self.model,
+            normalize_instruction(self.instruction),
+        ]
+        return hashlib.sha256(json.dumps(fields).encode()).hexdigest()
+
+
+@dataclass
+class CachedRunResult:
+    """Patch and summary of an earlier run."""
+
+    patch: bytes
+    summary: str | None
+
+
+class ExecutorResultCache:
+    """Stores and looks up CLI run results by ResultCacheKey."""
+
+    def __init__(
+        self,
+        dao: ExecutorResultCacheDAO,
+        *,
+        ttl_seconds: int | None = None,
+        max_bytes: int | None = None,
+    ):
+        self.dao = dao
+        self.ttl_seconds = (
+            ttl_seconds if ttl_seconds is not None else settings.executor_result_cache_ttl_seconds
+        )
+        self.max_bytes = (
+            max_bytes
+            if max_bytes is not None
+            else settings.executor_result_cache_max_mb * 1024 * 1024
+        )
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    async def get(self, key: ResultCacheKey) -> CachedRunResult | None:
+        """Look up an unexpired result for the key."""
+        try:
+            row = await self.dao.get(
+                key.digest,
+                repo_id=key.repo_id,
+                tree_hash=key.tree_hash,
+                created_after=self._expiry_cutoff(),
+            )
+            if row is not None:
+                await self.dao.touch(key.digest)
+        except Exception as e:
+            logger.warning(f"Failed to read executor result cache: {e}")
+            row = None
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return CachedRunResult(patch=bytes(row["patch"]), summary=row["summary"])
+
+    async def put(self, key: ResultCacheKey, patch: bytes, summary: str | None) -> bool:
+        """Store the result of a successful run.
+
+        Returns:
+            True if the result was stored (results larger than the cache are not).
+        """
+        if not patch or len(patch) > self.max_bytes:
+            return False
+        try:
+            await self.dao.upsert(
+                key.digest,
+                repo_id=key.repo_id,
+                tree_hash=key.tree_hash,
+                executor_type=key.executor_type,
+                model=key.model,
+                patch=patch,
+                summary=summary,
+            )
+            self.stores += 1
+            self.evictions += await self.dao.prune(
+                created_before=self._expiry_cutoff(), max_bytes=self.max_bytes
+            )
+        except Exception as e:
+            logger.warning(f"Failed to store executor result: {e}")
+            return False
+        return True
+
+    async def invalidate(self, key: ResultCacheKey) -> None:
+        """Drop an entry whose patch could not be applied."""
+        self.invalidations += 1
+        try:
+            await self.dao.delete(key.digest)
+        except Exception as e:
+            logger.warning(f"Failed to delete executor result cache entry: {e}")
+
+    async def clear(self) -> None:
+        """Drop all entries."""
+        await self.dao.clear()
+
+    async def stats(self) -> ExecutorResultCacheStats:
+        """Current cache statistics."""
+        entries, size_bytes = await self.dao.totals()
+        lookups = self.hits + self.misses
+        return ExecutorResultCacheStats(
+            enabled=settings.executor_result_cache_enabled,
+            entries=entries,
+            size_bytes=size_bytes,
+            max_bytes=self.max_bytes,
+            ttl_seconds=self.ttl_seconds,
+            hits=self.hits,
+            misses=self.misses,
+            hit_rate=self.hits / lookups if lookups else 0.0,
+            stores=self.stores,
+            evictions=self.evictions,
+            invalidations=self.invalidations,
+        )
+
+    def _expiry_cutoff(self) -> datetime:
+        return datetime.utcnow() - timedelta(seconds=self.ttl_seconds)
@@ -11,6 +11,7 @@ import asyncio
 import logging
 import re
 import shutil
+import tempfile
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -19,6 +20,14 @@ import git
 
 from zloth_api.config import settings
 from zloth_api.domain.models import Repo
+from zloth_api.services.diff_capture import DiffCapture, capture_diff
+from zloth_api.services.sparse_checkout import (
+    apply_sparse_checkout,
+    get_sparse_dirs,
+    hydrate_sparse_paths,
+    hydrate_untracked_outside_cone,
+    normalize_sparse_paths,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -174,6 +183,7 @@ class GitService:
         run_id: str,
         branch_prefix: str | None = None,
         auth_url: str | None = None,
+        sparse_paths: list[str] | None = None,
     ) -> WorktreeInfo:
         """Create a new git worktree for the run.
 
@@ -184,6 +194,8 @@ class GitService:
             branch_prefix: Optional branch prefix for the new work branch.
             auth_url: Authenticated URL for private repos. When provided, uses
                 authenticated fetch to ensure latest refs are available.
+            sparse_paths: Optional sparse checkout profile. The worktree is
+                created with ``--no-checkout`` and only the profile is populated.
 
         Returns:
             WorktreeInfo with path and branch information.
@@ -193,6 +205,7 @@ class GitService:
         """
         branch_name = self._generate_branch_name(run_id, branch_prefix=branch_prefix)
         worktree_path = self.worktrees_dir / f"run_{run_id}"
+        sparse_dirs = normalize_sparse_paths(sparse_paths or [])
 
         def _create_worktree() -> WorktreeInfo:
             source_repo = git.Repo(repo.workspace_path)
@@ -240,13 +253,26 @@ class GitService:
                 base_ref = base_branch
 
             # Create worktree with new branch
-            source_repo.git.worktree(
-                "add",
-                "-b",
-                branch_name,
-                str(worktree_path),
-                base_ref,
-            )
+            if sparse_dirs:
+                # Sparse worktrees use per-worktree config (extensions.worktreeConfig),
+                # so the source checkout keeps its own profile.
+                source_repo.git.worktree(
+                    "add",
+                    "--no-checkout",
+                    "-b",
+                    branch_name,
+                    str(worktree_path),
+                    base_ref,
+                )
+                apply_sparse_checkout(git.Repo(worktree_path), sparse_dirs, branch_name)
+            else:
+                source_repo.git.worktree(
+                    "add",
+                    "-b",
+                    branch_name,
+                    str(worktree_path),
+                    base_ref,
+                )
 
             return WorktreeInfo(
                 path=worktree_path,
@@ -525,6 +551,48 @@ class GitService:
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(None, _get_status)
 
+    async def get_sparse_paths(self, worktree_path: Path) -> list[str] | None:
+        """Get the sparse checkout profile of a worktree.
+
+        Args:
+            worktree_path: Path to the worktree.
+
+        Returns:
+            Cone directories, or None if the worktree has a full checkout.
+        """
+
+        def _get() -> list[str] | None:
+            return get_sparse_dirs(git.Repo(worktree_path))
+
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, _get)
+
+    async def hydrate_sparse_checkout(
+        self,
+        worktree_path: Path,
+        paths: list[str] | None = None,
+    ) -> list[str]:
+        """Lazily extend a sparse worktree with directories outside its profile.
+
+        Args:
+            worktree_path: Path to the worktree.
+            paths: Optional file/directory paths that must be materialized.
+
+        Returns:
+            Directories added to the sparse profile (empty for full checkouts).
+        """
+
+        def _hydrate() -> list[str]:
+            repo = git.Repo(worktree_path)
+            if get_sparse_dirs(repo) is None:
+                return []
+            added = hydrate_sparse_paths(repo, paths) if paths else []
+            added.extend(hydrate_untracked_outside_cone(repo))
+            return added
+
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, _hydrate)
+
     async def stage_all(self, worktree_path: Path) -> None:
         """Stage all changes.
 
@@ -557,6 +625,132 @@ class GitService:
         loop = asyncio.get_event_loop()
         await loop.run_in_executor(None, _unstage_all)
 
+    async def capture_diff(self, worktree_path: Path, staged: bool = True) -> DiffCapture:
+        """Capture the diff incrementally with bounded memory.
+
+        Uses `git diff --numstat -z` for per-file stats and streams per-file
+        patches, keeping at most the configured size of patch text.
+
+        Args:
+            worktree_path: Path to the worktree.
+            staged: If True, capture the staged diff against HEAD (the delta
+                since the previous commit); otherwise the unstaged diff.
+
+        Returns:
+            DiffCapture with per-file stats and size-capped patches.
+        """
+
+        def _capture() -> DiffCapture:
+            repo = git.Repo(worktree_path)
+            try:
+                if staged:
+                    return capture_diff(repo, "HEAD", "--cached")
+                return capture_diff(repo)
+            except git.GitCommandError:
+                return DiffCapture()
+
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, _capture)
+
+    async def get_tree_hash(self, worktree_path: Path) -> str | None:
+        """Get the hash of the tree committed at HEAD.
+
+        Args:
+            worktree_path: Path to the worktree.
+
+        Returns:
+            Tree hash, or None if there is no HEAD commit yet.
+        """
+
+        def _get_tree_hash() -> str | None:
+            repo = git.Repo(worktree_path)
+            try:
+                return str(repo.git.rev_parse("HEAD^{tree}"))
+            except git.GitCommandError:
+                return None
+
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, _get_tree_hash)
+
+    async def get_staged_patch(self, worktree_path: Path) -> bytes:
+        """Get the complete staged diff against HEAD, including binary files.
+
+        Unlike capture_diff, the patch is not size-capped and can be applied
+        with apply_patch.
+
+        Args:
+            worktree_path: Path to the worktree.
+
+        Returns:
+            Patch bytes (empty if nothing is staged).
+        """
+
+        def _get_patch() -> bytes:
+            repo = git.Repo(worktree_path)
+            patch = repo.git.diff(
+                "HEAD",
+                "--cached",
+                "--binary",
+                "--full-index",
+                stdout_as_string=False,
+                strip_newline_in_stdout=False,
+            )
+            return bytes(patch)
+
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, _get_patch)
+
+    async def apply_patch(self, worktree_path: Path, patch: bytes) -> None:
+        """Apply a patch to the working tree and the index.
+
+        The patch is applied atomically: if any hunk does not apply, nothing
+        is changed.
+
+        Args:
+            worktree_path: Path to the worktree.
+            patch: Patch from get_staged_patch.
+
+        Raises:
+            git.GitCommandError: If the patch does not apply.
+        """
+
+        def _apply() -> None:
+            repo = git.Repo(worktree_path)
+            with tempfile.NamedTemporaryFile(suffix=".patch") as patch_file:
+                patch_file.write(patch)
+                patch_file.flush()
+                repo.git.apply("--index", "--whitespace=nowarn", patch_file.name)
+
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(None, _apply)
+
+    async def capture_diff_range(
+        self, worktree_path: Path, base_ref: str, head_ref: str = "HEAD"
+    ) -> DiffCapture:
+        """Capture the cumulative diff between the merge base of two refs and head.
+
+        Args:
+            worktree_path: Path to the worktree.
+            base_ref: Base branch/commit reference.
+            head_ref: Head commit reference (default: HEAD).
+
+        Returns:
+            DiffCapture with per-file stats and size-capped patches.
+        """
+
+        def _capture() -> DiffCapture:
+            repo = git.Repo(worktree_path)
+            for ref in (base_ref, f"origin/{base_ref}"):
+                try:
+                    merge_base = repo.git.merge_base(ref, head_ref)
+                    return capture_diff(repo, merge_base, head_ref)
+                except git.GitCommandError:
+                    continue
+            return DiffCapture()
+
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, _capture)
+
     async def get_diff(self, worktree_path: Path, staged: bool = True) -> str:
         """Get diff.
 
@@ -0,0 +1,161 @@
+"""Conditional-request cache for GitHub API reads.
+
+GitHub returns ``ETag`` / ``Last-Modified`` validators on most GET
+responses. Re-sending them as ``If-None-Match`` / ``If-Modified-Since``
+yields ``304 Not Modified`` when the resource is unchanged, and 304s do not
+count against the installation's primary rate limit. Pollers that re-read
+the same PR, status and check-run resources every cycle therefore become
+almost free in steady state.
+
+Entries are kept in a bounded in-memory LRU (entry count and body bytes).
+Optionally they are also persisted in SQLite so validators survive restarts.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from zloth_api.config import settings
+from zloth_api.domain.models import GitHubCacheStats
+from zloth_api.storage.dao import GitHubHTTPCacheDAO
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedResponse:
+    """A cached GitHub response body with its validators."""
+
+    etag: str | None
+    last_modified: str | None
+    body: str
+
+    @property
+    def size(self) -> int:
+        return len(self.body)
+
+    def validator_headers(self) -> dict[str, str]:
+        """Headers that make the next request conditional."""
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class GitHubResponseCache:
+    """Bounded LRU of GitHub responses keyed by installation and URL."""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        dao: GitHubHTTPCacheDAO | None = None,
+    ):
+        self.max_entries = (
+            max_entries if max_entries is not None else settings.github_cache_max_entries
+        )
+        self.max_bytes = (
+            max_bytes if max_bytes is not None else settings.github_cache_max_mb * 1024 * 1024
+        )
+        self.dao = dao
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    async def get(self, key: str) -> CachedResponse | None:
+        """Look up an entry, falling back to the persistent store."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            return entry
+        if self.dao is None:
+            return None
+        try:
+            row = await self.dao.get(key)
+        except Exception as e:
+            logger.warning(f"Failed to read GitHub cache entry: {e}")
+            return None
+        if row is None:
+            return None
+        entry = CachedResponse(
+            etag=row["etag"], last_modified=row["last_modified"], body=row["body"]
+        )
+        self._store(key, entry)
+        return entry
+
+    async def put(
+        self,
+        key: str,
+        *,
+        etag: str | None,
+        last_modified: str | None,
+        body: str,
+    ) -> None:
+        """Store a fresh (200) response that carries validators."""
+        self.misses += 1
+        entry = CachedResponse(etag=etag, last_modified=last_modified, body=body)
+        if entry.size > self.max_bytes:
+            self._discard(key)
+            return
+        self._store(key, entry)
+        if self.dao is not None:
+            try:
+                await self.dao.upsert(key, etag=etag, last_modified=last_modified, body=body)
+                # Bound the persistent store too, amortized over writes
+                if self.misses % 100 == 0:
+                    await self.dao.prune(self.max_entries)
+            except Exception as e:
+                logger.warning(f"Failed to persist GitHub cache entry: {e}")
+
+    async def mark_hit(self, key: str) -> None:
+        """Record a 304 revalidation of an entry."""
+        self.hits += 1
+        if self.dao is not None:
+            try:
+                await self.dao.touch(key)
+            except Exception as e:
+                logger.warning(f"Failed to touch GitHub cache entry: {e}")
+
+    async def clear(self) -> None:
+        """Drop all entries (e.g. after the GitHub App configuration changed)."""
+        self._entries.clear()
+        self._size = 0
+        if self.dao is not None:
+            await self.dao.clear()
+
+    def stats(self) -> GitHubCacheStats:
+        """Current cache statistics."""
+        return GitHubCacheStats(
+            enabled=settings.github_cache_enabled,
+            persistent=self.dao is not None,
+            entries=len(self._entries),
+            size_bytes=self._size,
+            max_entries=self.max_entries,
+            max_bytes=self.max_bytes,
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+        )
+
+    def _store(self, key: str, entry: CachedResponse) -> None:
+        self._discard(key)
+        self._entries[key] = entry
+        self._size += entry.size
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._size > self.max_bytes
+        ):
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= evicted.size
+            self.evictions += 1
+
+    def _discard(self, key: str) -> None:
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._size -= old.size
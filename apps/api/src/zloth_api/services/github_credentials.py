@@ -0,0 +1,337 @@
+"""GitHub App credential manager.
+
+Keeps what is needed to authenticate as a GitHub App installation warm:
+
+- App credentials are loaded once per configuration; the private key is
+  parsed into a signing key once and app JWTs are reused until shortly
+  before they expire.
+- The installation list (owner -> installation mapping) is cached with a TTL
+  (``github_installation_cache_ttl_seconds``).
+- Installation tokens are cached until they expire. Tokens that are in use
+  are refreshed in the background ``github_token_refresh_margin_seconds``
+  before expiry, so API requests and git push/clone URLs do not wait on a
+  mint.
+- Concurrent loads of the same item share one request (single flight).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+import httpx
+import jwt
+from cryptography.hazmat.primitives import serialization
+
+from zloth_api.config import settings
+from zloth_api.utils.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# (app_id, private key PEM, configured installation ID)
+AppCredentials = tuple[str, str, str | None]
+
+# GitHub accepts app JWTs valid for at most 10 minutes
+APP_JWT_LIFETIME_SECONDS = 600
+APP_JWT_REUSE_SECONDS = 480
+
+# Tokens with less validity left are not handed out; callers wait for a new one
+MIN_TOKEN_VALIDITY_SECONDS = 60
+
+# Used when the token response does not carry a parseable expires_at
+DEFAULT_TOKEN_LIFETIME_SECONDS = 3600
+
+# Minimum time between installation list refreshes caused by unknown owners
+OWNER_MISS_REFRESH_SECONDS = 60
+
+
+@dataclass
+class _AppSigner:
+    """Parsed app credentials and the current app JWT."""
+
+    app_id: str
+    private_key: Any
+    installation_id: str | None
+    jwt: str | None = None
+    jwt_refresh_at: float = 0.0
+
+
+@dataclass
+class _InstallationToken:
+    """Cached installation access token."""
+
+    token: str
+    expires_at: float
+    minted_at: float
+    last_used: float
+    timer: asyncio.TimerHandle | None = None
+
+
+class GitHubCredentialManager:
+    """Caches app credentials, installations and installation tokens."""
+
+    def __init__(
+        self,
+        load_credentials: Callable[[], Awaitable[AppCredentials | None]],
+        client: Callable[[], httpx.AsyncClient],
+        *,
+        refresh_margin_seconds: float | None = None,
+        installation_ttl_seconds: float | None = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Initialize the credential manager.
+
+        Args:
+            load_credentials: Loads (app_id, private key PEM, installation ID).
+            client: Returns the pooled client for api.github.com.
+            refresh_margin_seconds: Refresh tokens this long before expiry.
+            installation_ttl_seconds: TTL of the cached installation list.
+            clock: Wall clock (epoch seconds).
+        """
+        self._load_credentials = load_credentials
+        self._client = client
+        self.refresh_margin = float(
+            refresh_margin_seconds
+            if refresh_margin_seconds is not None
+            else settings.github_token_refresh_margin_seconds
+        )
+        self.installation_ttl = float(
+            installation_ttl_seconds
+            if installation_ttl_seconds is not None
+            else settings.github_installation_cache_ttl_seconds
+        )
+        self._clock = clock
+        self._signer: _AppSigner | None = None
+        self._installations: list[dict] | None = None
+        self._installations_at = 0.0
+        self._owners: dict[str, str] = {}
+        self._tokens: dict[str, _InstallationToken] = {}
+        self._flights = SingleFlight()
+        self._prefetch_task: asyncio.Task[None] | None = None
+
+    async def token(self, installation_id: str | None = None) -> str | None:
+        """Get an installation access token.
+
+        Args:
+            installation_id: Installation to authenticate as. Defaults to the
+                configured installation or the first available one.
+
+        Returns:
+            Access token, or None if the app is not configured or installed.
+        """
+        signer = await self._get_signer()
+        if signer is None:
+            return None
+
+        target = installation_id or signer.installation_id
+        if not target:
+            installations = await self.installations()
+            if not installations:
+                return None
+            target = str(installations[0]["id"])
+
+        now = self._clock()
+        cached = self._tokens.get(target)
+        if cached is not None and now < cached.expires_at - MIN_TOKEN_VALIDITY_SECONDS:
+            cached.last_used = now
+            if now >= cached.expires_at - self.refresh_margin:
+                self._refresh_in_background(target)
+            return cached.token
+
+        minted = await self._flights.run(f"token:{target}", lambda: self._mint(target))
+        return minted.token
+
+    async def installations(self, *, force: bool = False) -> list[dict]:
+        """List installations of the app (cached with a TTL).
+
+        Args:
+            force: Bypass the cache.
+
+        Returns:
+            Installation dicts with 'id', 'account', etc.
+        """
+        if (
+            not force
+            and self._installations is not None
+            and self._clock() - self._installations_at < self.installation_ttl
+        ):
+            return self._installations
+        return await self._flights.run("installations", self._fetch_installations)
+
+    async def installation_for_owner(self, owner: str) -> str | None:
+        """Find the installation ID for a repository owner.
+
+        Unknown owners refresh the installation list (at most once per
+        ``OWNER_MISS_REFRESH_SECONDS``) to pick up new installations.
+
+        Args:
+            owner: Repository owner (GitHub username or organization name).
+
+        Returns:
+            Installation ID if found, None otherwise.
+        """
+        await self.installations()
+        installation_id = self._owners.get(owner.lower())
+        if (
+            installation_id is None
+            and self._clock() - self._installations_at >= OWNER_MISS_REFRESH_SECONDS
+        ):
+            await self.installations(force=True)
+            installation_id = self._owners.get(owner.lower())
+        return installation_id
+
+    def prefetch(self) -> None:
+        """Load credentials and mint tokens of all installations in the background."""
+        if self._prefetch_task is None or self._prefetch_task.done():
+            self._prefetch_task = asyncio.create_task(self._prefetch())
+
+    def invalidate(self) -> None:
+        """Forget all cached credentials (e.g. after the app config changed)."""
+        for cached in self._tokens.values():
+            if cached.timer is not None:
+                cached.timer.cancel()
+        self._tokens.clear()
+        self._signer = None
+        self._installations = None
+        self._installations_at = 0.0
+        self._owners = {}
+        self._flights.invalidate()
+
+    async def aclose(self) -> None:
+        """Cancel background refreshes."""
+        tasks = self._flights.tasks()
+        if self._prefetch_task is not None:
+            tasks.append(self._prefetch_task)
+            self._prefetch_task = None
+        self.invalidate()
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _prefetch(self) -> None:
+        try:
+            if await self._get_signer() is None:
+                return
+            for installation in await self.installations():
+                await self.token(str(installation["id"]))
+        except Exception as e:
+            logger.warning(f"Failed to prefetch GitHub App credentials: {e}")
+
+    async def _get_signer(self) -> _AppSigner | None:
+        if self._signer is not None:
+            return self._signer
+        generation = self._flights.generation
+        signer = await self._flights.run("signer", self._load_signer)
+        if generation == self._flights.generation:
+            self._signer = signer
+        return signer
+
+    async def _load_signer(self) -> _AppSigner | None:
+        creds = await self._load_credentials()
+        if not creds:
+            return None
+        app_id, private_key, installation_id = creds
+        key = serialization.load_pem_private_key(private_key.encode(), password=None)
+        return _AppSigner(app_id=app_id, private_key=key, installation_id=installation_id)
+
+    def _app_jwt(self, signer: _AppSigner) -> str:
+        """Get an app JWT, reusing the current one until shortly before it expires."""
+        now = self._clock()
+        if signer.jwt is None or now >= signer.jwt_refresh_at:
+            payload = {
+                "iat": int(now) - 60,  # 60 seconds in the past (clock drift)
+                "exp": int(now) + APP_JWT_LIFETIME_SECONDS - 60,
+                "iss": signer.app_id,
+            }
+            signer.jwt = jwt.encode(payload, signer.private_key, algorithm="RS256")
+            signer.jwt_refresh_at = now + APP_JWT_REUSE_SECONDS
+        return signer.jwt
+
+    async def _fetch_installations(self) -> list[dict]:
+        generation = self._flights.generation
+        signer = await self._get_signer()
+        if signer is None:
+            return []
+
+        response = await self._client().get(
+            "/app/installations",
+            headers={"Authorization": f"Bearer {self._app_jwt(signer)}"},
+            params={"per_page": 100},
+        )
+        response.raise_for_status()
+        installations: list[dict] = response.json()
+
+        if generation == self._flights.generation:
+            self._installations = installations
+            self._installations_at = self._clock()
+            self._owners = {
+                inst.get("account", {}).get("login", "").lower(): str(inst["id"])
+                for inst in installations
+            }
+        return installations
+
+    async def _mint(self, installation_id: str) -> _InstallationToken:
+        generation = self._flights.generation
+        signer = await self._get_signer()
+        if signer is None:
+            raise ValueError("GitHub App not configured")
+
+        response = await self._client().post(
+            f"/app/installations/{installation_id}/access_tokens",
+            headers={"Authorization": f"Bearer {self._app_jwt(signer)}"},
+        )
+        response.raise_for_status()
+        data = response.json()
+
+        now = self._clock()
+        minted = _InstallationToken(
+            token=data["token"],
+            expires_at=_parse_expiry(data.get("expires_at"), now),
+            minted_at=now,
+            last_used=now,
+        )
+        if generation != self._flights.generation:
+            return minted
+
+        previous = self._tokens.get(installation_id)
+        if previous is not None and previous.timer is not None:
+            previous.timer.cancel()
+        delay = max(0.0, minted.expires_at - self.refresh_margin - now)
+        minted.timer = asyncio.get_running_loop().call_later(
+            delay, self._on_refresh_due, installation_id
+        )
+        self._tokens[installation_id] = minted
+        logger.debug(f"Minted GitHub installation token for {installation_id}")
+        return minted
+
+    def _on_refresh_due(self, installation_id: str) -> None:
+        """Refresh a token nearing expiry if it was used since it was minted."""
+        cached = self._tokens.get(installation_id)
+        if cached is None:
+            return
+        cached.timer = None
+        if cached.last_used > cached.minted_at:
+            self._refresh_in_background(installation_id)
+
+    def _refresh_in_background(self, installation_id: str) -> None:
+        self._flights.run_in_background(
+            f"token:{installation_id}",
+            lambda: self._mint(installation_id),
+            f"GitHub token for installation {installation_id}",
+        )
+
+
+def _parse_expiry(value: str | None, now: float) -> float:
+    """Parse the ``expires_at`` of a token response (ISO 8601) to epoch seconds."""
+    if value:
+        try:
+            return datetime.fromisoformat(value).timestamp()
+        except ValueError:
+            pass
+    return now + DEFAULT_TOKEN_LIFETIME_SECONDS
@@ -0,0 +1,195 @@
+"""Cached repository and branch listings for the repository picker.
+
+Listing every repository of a large organization (or every branch of a busy
+repository) takes dozens of paginated GitHub requests. The picker needs the
+list instantly, so listings are kept in memory:
+
+- A listing younger than ``github_listing_cache_ttl_seconds`` is served as is.
+- An older listing is still served immediately while it is reloaded in the
+  background (stale-while-revalidate). Reloads are incremental: every page is
+  a conditional request, so unchanged pages come back as free 304s from the
+  response cache.
+- Concurrent loads of the same listing share one request (single flight).
+- A listing that could only be loaded in part (e.g. one installation failed)
+  is kept for ``PARTIAL_LISTING_TTL_SECONDS`` only.
+- Each listing carries a sorted prefix index, so search is a bisect over the
+  cache instead of a scan or another GitHub round trip.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from bisect import bisect_left
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+from zloth_api.config import settings
+from zloth_api.utils.single_flight import SingleFlight
+
+T = TypeVar("T")
+
+# Listings kept in memory (one per repository for branches, plus the repo list)
+LISTING_CACHE_MAX_ENTRIES = 256
+
+# Listings missing a part that failed to load are refreshed after this long
+PARTIAL_LISTING_TTL_SECONDS = 30.0
+
+
+class PrefixIndex(Generic[T]):
+    """Items with a case-insensitive sorted prefix index over their keys."""
+
+    def __init__(
+        self,
+        items: Iterable[T],
+        keys: Callable[[T], Iterable[str]],
+        *,
+        complete: bool = True,
+    ):
+        """Build the index.
+
+        Args:
+            items: Items in their natural (API) order.
+            keys: Returns the searchable keys of an item (e.g. name and full name).
+            complete: False if part of the listing could not be loaded. Such
+                listings are cached for ``PARTIAL_LISTING_TTL_SECONDS`` at most.
+        """
+        self.items: list[T] = list(items)
+        self.complete = complete
+        pairs = sorted(
+            (key.lower(), position)
+            for position, item in enumerate(self.items)
+            for key in keys(item)
+        )
+        self._keys = [key for key, _ in pairs]
+        self._positions = [position for _, position in pairs]
+
+    def search(self, prefix: str | None = None, limit: int | None = None) -> list[T]:
+        """Find items with a key starting with ``prefix``.
+
+        Args:
+            prefix: Case-insensitive prefix. Empty or None matches everything.
+            limit: Maximum number of items to return.
+
+        Returns:
+            Matching items in key order, or all items in their natural order
+            when no prefix is given.
+        """
+        if not prefix:
+            return self.items[:limit] if limit is not None else list(self.items)
+
+        prefix = prefix.lower()
+        matches: list[T] = []
+        seen: set[int] = set()
+        for i in range(bisect_left(self._keys, prefix), len(self._keys)):
+            if not self._keys[i].startswith(prefix):
+                break
+            position = self._positions[i]
+            if position in seen:
+                continue
+            seen.add(position)
+            matches.append(self.items[position])
+            if limit is not None and len(matches) >= limit:
+                break
+        return matches
+
+
+@dataclass
+class _Listing:
+    """A cached listing and when it was loaded."""
+
+    index: PrefixIndex[Any]
+    loaded_at: float
+    ttl: float
+
+
+class ListingCache:
+    """TTL cache of listings that serves stale entries while refreshing them."""
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float | None = None,
+        max_entries: int = LISTING_CACHE_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the listing cache.
+
+        Args:
+            ttl_seconds: Age after which a listing is refreshed in the background.
+            max_entries: Listings kept (least recently used are evicted).
+            clock: Monotonic clock.
+        """
+        self.ttl = float(
+            ttl_seconds if ttl_seconds is not None else settings.github_listing_cache_ttl_seconds
+        )
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[str, _Listing] = OrderedDict()
+        self._flights = SingleFlight()
+
+    async def get(
+        self,
+        key: str,
+        load: Callable[[], Awaitable[PrefixIndex[Any]]],
+        *,
+        refresh: bool = False,
+    ) -> PrefixIndex[Any]:
+        """Get a listing, loading it on a miss.
+
+        Args:
+            key: Cache key of the listing.
+            load: Loads the listing from GitHub.
+            refresh: Wait for a fresh load even if a cached listing exists.
+
+        Returns:
+            The cached or freshly loaded listing.
+        """
+        entry = self._entries.get(key)
+        if entry is not None and not refresh:
+            self._entries.move_to_end(key)
+            if self._clock() - entry.loaded_at >= entry.ttl:
+                self._refresh_in_background(key, load)
+            return entry.index
+        return await self._load(key, load)
+
+    def invalidate(self) -> None:
+        """Forget all listings (e.g. after the app config changed)."""
+        self._entries.clear()
+        self._flights.invalidate()
+
+    async def aclose(self) -> None:
+        """Cancel running loads."""
+        tasks = self._flights.tasks()
+        self.invalidate()
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _load(
+        self, key: str, load: Callable[[], Awaitable[PrefixIndex[Any]]]
+    ) -> PrefixIndex[Any]:
+        return await self._flights.run(key, lambda: self._load_and_store(key, load))
+
+    async def _load_and_store(
+        self, key: str, load: Callable[[], Awaitable[PrefixIndex[Any]]]
+    ) -> PrefixIndex[Any]:
+        generation = self._flights.generation
+        index = await load()
+        if generation == self._flights.generation:
+            ttl = self.ttl if index.complete else min(self.ttl, PARTIAL_LISTING_TTL_SECONDS)
+            self._entries[key] = _Listing(index=index, loaded_at=self._clock(), ttl=ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return index
+
+    def _refresh_in_background(
+        self, key: str, load: Callable[[], Awaitable[PrefixIndex[Any]]]
+    ) -> None:
+        self._flights.run_in_background(
+            key, lambda: self._load_and_store(key, load), f"GitHub listing {key}"
+        )
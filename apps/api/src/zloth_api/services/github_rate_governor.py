@@ -0,0 +1,303 @@
+"""Central rate-limit governor for GitHub API requests.
+
+Every authenticated GitHub request acquires a slot from the governor before
+it is sent. Slots are granted per installation and rate-limit resource
+(``core`` for REST, ``graphql``) in priority order:
+
+1. A token bucket (``github_rate_burst`` / ``github_rate_per_second``) smooths
+   bursts that would otherwise trip GitHub's secondary rate limits.
+2. The primary budget is tracked from ``X-RateLimit-*`` response headers.
+   Lower priorities stop before the budget is exhausted (a reserve is kept
+   for higher priorities) and polling requests are paced so the remaining
+   budget lasts until the window resets.
+3. 403/429 rate-limit responses put the bucket into backoff, honouring
+   ``Retry-After`` / ``X-RateLimit-Reset`` and doubling otherwise.
+
+Interactive requests are therefore never queued behind background polling,
+and polling slows down automatically as the budget shrinks.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+from zloth_api.config import settings
+from zloth_api.domain.enums import GitHubRequestPriority
+from zloth_api.domain.models import GitHubRateLimitStatus
+
+logger = logging.getLogger(__name__)
+
+# Lower rank is served first
+PRIORITY_RANK = {
+    GitHubRequestPriority.USER: 0,
+    GitHubRequestPriority.MERGE_GATE: 1,
+    GitHubRequestPriority.CI_POLLING: 2,
+    GitHubRequestPriority.BACKGROUND: 3,
+}
+
+# Fraction of the primary budget a priority leaves for higher priorities
+BUDGET_RESERVE = {
+    GitHubRequestPriority.USER: 0.0,
+    GitHubRequestPriority.MERGE_GATE: 0.02,
+    GitHubRequestPriority.CI_POLLING: 0.10,
+    GitHubRequestPriority.BACKGROUND: 0.20,
+}
+
+# Priorities paced across the reset window once half the budget is used
+PACED_PRIORITIES = frozenset({GitHubRequestPriority.CI_POLLING, GitHubRequestPriority.BACKGROUND})
+
+MIN_BACKOFF_SECONDS = 1.0
+
+# Secondary rate limit 403s often carry neither Retry-After nor a zero
+# X-RateLimit-Remaining; GitHub asks to wait at least a minute before retrying
+SECONDARY_RATE_LIMIT_MARKER = "secondary rate limit"
+SECONDARY_MIN_BACKOFF_SECONDS = 60.0
+
+
+@dataclass
+class _Bucket:
+    """Budget and wait queue of one installation / resource."""
+
+    installation: str
+    resource: str
+    tokens: float
+    refilled_at: float
+    limit: int | None = None
+    remaining: int | None = None
+    reset_at: float | None = None  # Epoch seconds
+    backoff: float = 0.0
+    backoff_until: float = 0.0  # Monotonic seconds
+    last_grant: dict[GitHubRequestPriority, float] = field(default_factory=dict)
+    queue: list[tuple[int, int, GitHubRequestPriority, asyncio.Future[None]]] = field(
+        default_factory=list
+    )
+    timer: asyncio.TimerHandle | None = None
+
+
+class GitHubRateGovernor:
+    """Per-installation token bucket with a priority queue and adaptive backoff."""
+
+    def __init__(
+        self,
+        *,
+        burst: int | None = None,
+        rate_per_second: float | None = None,
+        max_backoff_seconds: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time,
+    ):
+        self.burst = float(burst if burst is not None else settings.github_rate_burst)
+        self.rate = (
+            rate_per_second if rate_per_second is not None else settings.github_rate_per_second
+        )
+        self.max_backoff = float(
+            max_backoff_seconds
+            if max_backoff_seconds is not None
+            else settings.github_rate_max_backoff_seconds
+        )
+        self._clock = clock
+        self._wall_clock = wall_clock
+        self._buckets: dict[tuple[str, str], _Bucket] = {}
+        self._seq = itertools.count()
+
+    async def acquire(
+        self,
+        installation: str,
+        resource: str = "core",
+        priority: GitHubRequestPriority = GitHubRequestPriority.USER,
+    ) -> None:
+        """Wait until a request may be sent.
+
+        Args:
+            installation: Installation the request is authenticated as.
+            resource: Rate-limit resource ("core" or "graphql").
+            priority: Scheduling priority of the request.
+        """
+        bucket = self._bucket(installation, resource)
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(bucket.queue, (PRIORITY_RANK[priority], next(self._seq), priority, waiter))
+        self._dispatch(bucket)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            # Cancelled waiters are skipped by _dispatch; if the slot was
+            # already granted the token is simply lost
+            self._dispatch(bucket)
+            raise
+
+    def record_response(
+        self,
+        installation: str,
+        resource: str,
+        status_code: int,
+        headers: Mapping[str, str],
+        body: str | None = None,
+    ) -> bool:
+        """Update the budget from a response and back off when rate limited.
+
+        Args:
+            installation: Installation the request was authenticated as.
+            resource: Rate-limit resource the request was counted against.
+            status_code: HTTP status code of the response.
+            headers: Response headers.
+            body: Response body of a 403 (to detect secondary rate limits).
+
+        Returns:
+            True if the response signals rate limiting (the request may be
+            retried after acquiring a new slot).
+        """
+        bucket = self._bucket(installation, resource)
+        limit = _int_header(headers, "X-RateLimit-Limit")
+        remaining = _int_header(headers, "X-RateLimit-Remaining")
+        reset = _int_header(headers, "X-RateLimit-Reset")
+        if limit is not None:
+            bucket.limit = limit
+        if remaining is not None:
+            bucket.remaining = remaining
+        if reset is not None:
+            bucket.reset_at = float(reset)
+
+        retry_after = _int_header(headers, "Retry-After")
+        secondary = (
+            status_code == 403 and body is not None and SECONDARY_RATE_LIMIT_MARKER in body.lower()
+        )
+        rate_limited = (
+            status_code == 429
+            or secondary
+            or (status_code == 403 and (retry_after is not None or remaining == 0))
+        )
+        if rate_limited:
+            if retry_after is not None:
+                wait = float(retry_after)
+            elif remaining == 0 and bucket.reset_at is not None:
+                wait = bucket.reset_at - self._wall_clock()
+            else:
+                wait = bucket.backoff * 2
+            if secondary:
+                wait = max(wait, SECONDARY_MIN_BACKOFF_SECONDS)
+            bucket.backoff = min(
+                max(wait, bucket.backoff * 2, MIN_BACKOFF_SECONDS), self.max_backoff
+            )
+            bucket.backoff_until = self._clock() + bucket.backoff
+            logger.warning(
+                f"GitHub rate limit hit for installation {installation} ({resource}); "
+                f"backing off {bucket.backoff:.0f}s"
+            )
+        elif status_code < 400:
+            bucket.backoff = 0.0
+
+        self._dispatch(bucket)
+        return rate_limited
+
+    def status(self) -> list[GitHubRateLimitStatus]:
+        """Current budget and queue depth of every tracked bucket."""
+        now = self._clock()
+        result = []
+        for bucket in self._buckets.values():
+            self._refill(bucket, now)
+            queued: dict[GitHubRequestPriority, int] = {}
+            for _, _, priority, waiter in bucket.queue:
+                if not waiter.done():
+                    queued[priority] = queued.get(priority, 0) + 1
+            result.append(
+                GitHubRateLimitStatus(
+                    installation=bucket.installation,
+                    resource=bucket.resource,
+                    limit=bucket.limit,
+                    remaining=bucket.remaining,
+                    reset_at=(
+                        datetime.fromtimestamp(bucket.reset_at, UTC)
+                        if bucket.reset_at is not None
+                        else None
+                    ),
+                    tokens=round(bucket.tokens, 2),
+                    backoff_seconds=round(max(0.0, bucket.backoff_until - now), 2),
+                    queue_depth=sum(queued.values()),
+                    queued=queued,
+                )
+            )
+        return result
+
+    def _bucket(self, installation: str, resource: str) -> _Bucket:
+        key = (installation, resource)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = _Bucket(
+                installation=installation,
+                resource=resource,
+                tokens=self.burst,
+                refilled_at=self._clock(),
+            )
+            self._buckets[key] = bucket
+        return bucket
+
+    def _refill(self, bucket: _Bucket, now: float) -> None:
+        elapsed = now - bucket.refilled_at
+        if elapsed > 0:
+            bucket.tokens = min(self.burst, bucket.tokens + elapsed * self.rate)
+            bucket.refilled_at = now
+
+    def _delay(self, bucket: _Bucket, priority: GitHubRequestPriority, now: float) -> float:
+        """Seconds until a request of the given priority may be sent."""
+        delay = bucket.backoff_until - now
+
+        if bucket.limit and bucket.remaining is not None and bucket.reset_at is not None:
+            until_reset = bucket.reset_at - self._wall_clock()
+            if until_reset > 0:
+                reserve = BUDGET_RESERVE[priority] * bucket.limit
+                if bucket.remaining <= reserve:
+                    delay = max(delay, until_reset)
+                elif priority in PACED_PRIORITIES and bucket.remaining < bucket.limit / 2:
+                    # Spread the spendable budget over the rest of the window
+                    spacing = until_reset / (bucket.remaining - reserve)
+                    last = bucket.last_grant.get(priority)
+                    if last is not None:
+                        delay = max(delay, last + spacing - now)
+
+        if bucket.tokens < 1:
+            delay = max(delay, (1 - bucket.tokens) / self.rate)
+        return delay
+
+    def _dispatch(self, bucket: _Bucket) -> None:
+        """Grant slots to queued requests in priority order."""
+        if bucket.timer is not None:
+            bucket.timer.cancel()
+            bucket.timer = None
+
+        now = self._clock()
+        self._refill(bucket, now)
+        while bucket.queue:
+            _, _, priority, waiter = bucket.queue[0]
+            if waiter.done():
+                heapq.heappop(bucket.queue)
+                continue
+            delay = self._delay(bucket, priority, now)
+            if delay > 0:
+                # Head-of-line blocking is intended: everything behind the
+                # head has the same or a lower priority
+                loop = asyncio.get_running_loop()
+                bucket.timer = loop.call_later(delay, self._dispatch, bucket)
+                return
+            heapq.heappop(bucket.queue)
+            bucket.tokens -= 1
+            if bucket.remaining is not None:
+                bucket.remaining = max(0, bucket.remaining - 1)
+            bucket.last_grant[priority] = now
+            waiter.set_result(None)
+
+
+def _int_header(headers: Mapping[str, str], name: str) -> int | None:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return int(float(value))
+    except ValueError:
+        return None
@@ -1,28 +1,113 @@
 """GitHub App service for zloth API."""
 
+import asyncio
 import base64
-import time
+import json
+from collections.abc import AsyncGenerator
 from typing import Any
 
 import httpx
-import jwt
 
 from zloth_api.config import settings
+from zloth_api.domain.enums import GitHubRequestPriority
 from zloth_api.domain.models import (
     GitHubAppConfig,
     GitHubAppConfigSave,
+    GitHubCacheStats,
+    GitHubRateLimitStatus,
     GitHubRepository,
 )
+from zloth_api.services.github_cache import GitHubResponseCache
+from zloth_api.services.github_credentials import GitHubCredentialManager
+from zloth_api.services.github_listing import ListingCache, PrefixIndex
+from zloth_api.services.github_rate_governor import GitHubRateGovernor
+from zloth_api.storage.dao import GitHubHTTPCacheDAO
 from zloth_api.storage.db import Database
+from zloth_api.utils.http_client import build_http_client
+
+GITHUB_API_URL = "https://api.github.com"
+# GitHub GraphQL limits a query to 100 nodes per connection; we apply the same
+# bound to the number of aliased pullRequest lookups per query
+GRAPHQL_MAX_BATCH_SIZE = 100
+
+# Retries of a request that GitHub rejected with a rate-limit 403/429
+GITHUB_RATE_LIMIT_RETRIES = 2
+
+# Page size of repository and branch listings (the GitHub maximum)
+LISTING_PAGE_SIZE = 100
+# Branch pages fetched concurrently (the endpoint reports no total count)
+BRANCH_PAGE_WINDOW = 4
+
+_GRAPHQL_PR_FIELDS = (
+    "number state merged mergedAt mergeable headRefOid "
+    "commits(last: 1) { nodes { commit { statusCheckRollup { state } } } }"
+)
+
+# GraphQL StatusState (checks and commit statuses combined) -> combined status
+_ROLLUP_STATES = {
+    "SUCCESS": "success",
+    "FAILURE": "failure",
+    "ERROR": "error",
+    "PENDING": "pending",
+    "EXPECTED": "pending",
+}
+
+GITHUB_API_HEADERS = {
+    "Accept": "application/vnd.github+json",
+    "X-GitHub-Api-Version": "2022-11-28",
+}
 
 
 class GitHubService:
-    """Service for GitHub App operations."""
+    """Service for GitHub App operations.
+
+    All GitHub API calls go through one long-lived, pooled HTTP client
+    (HTTP/2 when available) so connections are reused across requests.
+    Call :meth:`aclose` on shutdown.
+
+    GET requests are revalidated with ``If-None-Match`` / ``If-Modified-Since``
+    against a response cache; 304s are served from the cache and do not
+    count against the installation's primary rate limit.
+
+    Requests are scheduled by a per-installation rate governor, so callers
+    pass a :class:`GitHubRequestPriority` (interactive requests by default).
+
+    App credentials, installations and installation tokens are cached by a
+    :class:`GitHubCredentialManager`; tokens in use are refreshed before
+    they expire.
+
+    Repository and branch listings are cached by a :class:`ListingCache`
+    and served stale while they are refreshed.
+    """
 
     def __init__(self, db: Database):
         self.db = db
-        self._token_cache: dict[str, tuple[str, float]] = {}
-        self._installations_cache: list[dict] | None = None
+        self._http_client: httpx.AsyncClient | None = None
+        self.credentials = GitHubCredentialManager(
+            self._get_app_credentials, lambda: self.http_client
+        )
+        self.rate_governor = GitHubRateGovernor()
+        self.response_cache = GitHubResponseCache(
+            dao=GitHubHTTPCacheDAO(db) if settings.github_cache_persist else None
+        )
+        self.listings = ListingCache()
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """Pooled client for api.github.com (created on first use)."""
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = build_http_client(
+                base_url=GITHUB_API_URL, headers=GITHUB_API_HEADERS
+            )
+        return self._http_client
+
+    async def aclose(self) -> None:
+        """Stop credential refreshes and close the pooled HTTP client."""
+        await self.credentials.aclose()
+        await self.listings.aclose()
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
 
     def _mask_value(self, value: str, visible_chars: int = 4) -> str:
         """Mask a value, showing only the last few characters."""
@@ -121,10 +206,11 @@ class GitHubService:
                 (data.app_id, encoded_key, data.installation_id),
             )
 
-        # Clear token cache
-        self._token_cache.clear()
-        # Clear installations cache
-        self._installations_cache = None
+        # Clear cached credentials, installations and tokens
+        self.credentials.invalidate()
+        self.listings.invalidate()
+        # Cached responses may belong to another App / installation
+        await self.response_cache.clear()
 
         return GitHubAppConfig(
             app_id=data.app_id,
@@ -185,15 +271,9 @@ class GitHubService:
 
         return (app_id, private_key, installation_id)
 
-    def _generate_jwt(self, app_id: str, private_key: str) -> str:
-        """Generate JWT for GitHub App authentication."""
-        now = int(time.time())
-        payload = {
-            "iat": now - 60,  # 60 seconds in the past
-            "exp": now + (10 * 60),  # 10 minutes from now
-            "iss": app_id,
-        }
-        return jwt.encode(payload, private_key, algorithm="RS256")
+    def warm_credentials(self) -> None:
+        """Load credentials and mint installation tokens in the background."""
+        self.credentials.prefetch()
 
     async def _list_installations(self) -> list[dict]:
         """List all installations of this GitHub App.
@@ -201,30 +281,7 @@ class GitHubService:
         Returns:
             List of installation dicts with 'id', 'account', etc.
         """
-        if self._installations_cache is not None:
-            return self._installations_cache
-
-        creds = await self._get_app_credentials()
-        if not creds:
-            return []
-
-        app_id, private_key, _ = creds
-        jwt_token = self._generate_jwt(app_id, private_key)
-
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                "https://api.github.com/app/installations",
-                headers={
-                    "Authorization": f"Bearer {jwt_token}",
-                    "Accept": "application/vnd.github+json",
-                    "X-GitHub-Api-Version": "2022-11-28",
-                },
-            )
-            response.raise_for_status()
-            installations = response.json()
-
-        self._installations_cache = installations
-        return installations
+        return await self.credentials.installations()
 
     async def _get_installation_for_owner(self, owner: str) -> str | None:
         """Find the installation ID for a specific repository owner.
@@ -239,15 +296,10 @@ class GitHubService:
         Returns:
             Installation ID if found, None otherwise.
         """
-        installations = await self._list_installations()
-        for installation in installations:
-            account = installation.get("account", {})
-            if account.get("login", "").lower() == owner.lower():
-                return str(installation["id"])
-        return None
+        return await self.credentials.installation_for_owner(owner)
 
     async def _get_installation_token(self, installation_id: str | None = None) -> str | None:
-        """Get or refresh installation access token.
+        """Get a cached (or newly minted) installation access token.
 
         Args:
             installation_id: Optional installation ID. If not provided,
@@ -256,50 +308,7 @@ class GitHubService:
         Returns:
             Installation access token or None if not available.
         """
-        creds = await self._get_app_credentials()
-        if not creds:
-            return None
-
-        app_id, private_key, configured_installation_id = creds
-
-        # Determine which installation_id to use
-        target_installation_id = installation_id or configured_installation_id
-
-        if not target_installation_id:
-            # Auto-discover: get first available installation
-            installations = await self._list_installations()
-            if not installations:
-                return None
-            target_installation_id = str(installations[0]["id"])
-
-        cache_key = f"{app_id}:{target_installation_id}"
-
-        # Check cache
-        if cache_key in self._token_cache:
-            token, expires_at = self._token_cache[cache_key]
-            if time.time() < expires_at - 60:  # 1 minute buffer
-                return token
-
-        # Generate new token
-        jwt_token = self._generate_jwt(app_id, private_key)
-
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"https://api.github.com/app/installations/{target_installation_id}/access_tokens",
-                headers={
-                    "Authorization": f"Bearer {jwt_token}",
-                    "Accept": "application/vnd.github+json",
-                    "X-GitHub-Api-Version": "2022-11-28",
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-
-        token = data["token"]
-        # GitHub tokens expire in 1 hour, cache for slightly less
-        self._token_cache[cache_key] = (token, time.time() + 3500)
-
-        return token
+        return await self.credentials.token(installation_id)
 
     async def _github_request(
         self,
@@ -307,115 +316,231 @@ class GitHubService:
         endpoint: str,
         *,
         installation_id: str | None = None,
+        priority: GitHubRequestPriority = GitHubRequestPriority.USER,
         **kwargs: Any,
     ) -> Any:
         """Make authenticated request to GitHub API.
 
+        The request waits for a slot from the rate governor and is retried
+        (after backing off) when GitHub answers with a rate-limit 403/429.
+
         Args:
             method: HTTP method.
             endpoint: API endpoint path.
             installation_id: Optional installation ID for the token.
+            priority: Scheduling priority for the rate governor.
             **kwargs: Additional arguments for the request.
         """
         token = await self._get_installation_token(installation_id)
         if not token:
             raise ValueError("GitHub App not configured")
 
-        async with httpx.AsyncClient() as client:
-            response = await client.request(
+        headers = {"Authorization": f"Bearer {token}"}
+        cache_key: str | None = None
+        cached = None
+        if method.upper() == "GET" and settings.github_cache_enabled:
+            url = httpx.URL(endpoint, params=kwargs.get("params"))
+            cache_key = f"{installation_id or '-'} {url}"
+            cached = await self.response_cache.get(cache_key)
+            if cached is not None:
+                headers.update(cached.validator_headers())
+
+        installation = installation_id or "default"
+        resource = "graphql" if endpoint == "/graphql" else "core"
+        for attempt in range(GITHUB_RATE_LIMIT_RETRIES + 1):
+            await self.rate_governor.acquire(installation, resource, priority)
+            response = await self.http_client.request(
                 method,
-                f"https://api.github.com{endpoint}",
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "Accept": "application/vnd.github+json",
-                    "X-GitHub-Api-Version": "2022-11-28",
-                },
+                endpoint,
+                headers=headers,
                 **kwargs,
             )
+            rate_limited = self.rate_governor.record_response(
+                installation,
+                resource,
+                response.status_code,
+                response.headers,
+                body=response.text if response.status_code == 403 else None,
+            )
+            if not rate_limited:
+                break
+
+        if cache_key is not None:
+            if response.status_code == 304 and cached is not None:
+                await self.response_cache.mark_hit(cache_key)
+                return json.loads(cached.body)
             response.raise_for_status()
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if etag or last_modified:
+                await self.response_cache.put(
+                    cache_key, etag=etag, last_modified=last_modified, body=response.text
+                )
             return response.json()
 
-    async def list_repos(self) -> list[GitHubRepository]:
+        response.raise_for_status()
+        return response.json()
+
+    def cache_stats(self) -> GitHubCacheStats:
+        """Get statistics of the conditional-request response cache."""
+        return self.response_cache.stats()
+
+    def rate_limit_status(self) -> list[GitHubRateLimitStatus]:
+        """Get the request budget and queue depth per installation."""
+        return self.rate_governor.status()
+
+    async def list_repos(
+        self,
+        query: str | None = None,
+        limit: int | None = None,
+        *,
+        refresh: bool = False,
+    ) -> list[GitHubRepository]:
         """List repositories accessible to the GitHub App.
 
         If installation_id is configured, returns repos from that installation.
-        Otherwise, returns repos from all installations.
+        Otherwise, returns repos from all installations. The listing is cached
+        (see ``github_listing``); stale listings are returned immediately and
+        refreshed in the background.
+
+        Args:
+            query: Case-insensitive prefix of the repository name or full name.
+            limit: Maximum number of repositories to return.
+            refresh: Reload the listing from GitHub before answering.
         """
+        index = await self.listings.get("repos", self._load_repos, refresh=refresh)
+        repos: list[GitHubRepository] = index.search(query, limit)
+        return repos
+
+    async def _load_repos(self) -> PrefixIndex[GitHubRepository]:
+        """Load the repositories of all installations concurrently."""
         creds = await self._get_app_credentials()
         if not creds:
             raise ValueError("GitHub App not configured")
 
         _, _, configured_installation_id = creds
 
-        repos: list[GitHubRepository] = []
-        seen_ids: set[int] = set()
-
         if configured_installation_id:
             # Single installation mode
             installation_ids = [configured_installation_id]
         else:
             # Multi-installation mode: get all installations
             installations = await self._list_installations()
-            if not installations:
-                return []
             installation_ids = [str(inst["id"]) for inst in installations]
 
-        for inst_id in installation_ids:
-            try:
-                data = await self._github_request(
-                    "GET",
-                    "/installation/repositories",
-                    installation_id=inst_id,
-                    params={"per_page": 100},
-                )
+        results = await asyncio.gather(
+            *(self._list_installation_repos(inst_id) for inst_id in installation_ids),
+            return_exceptions=True,
+        )
 
-                for repo in data.get("repositories", []):
-                    if repo["id"] not in seen_ids:
-                        seen_ids.add(repo["id"])
-                        repos.append(
-                            GitHubRepository(
-                                id=repo["id"],
-                                name=repo["name"],
-                                full_name=repo["full_name"],
-                                owner=repo["owner"]["login"],
-                                default_branch=repo["default_branch"],
-                                private=repo["private"],
-                            )
-                        )
-            except Exception:
-                # Skip failed installations
+        failures = [r for r in results if isinstance(r, BaseException)]
+        if failures and len(failures) == len(results):
+            raise failures[0]
+
+        repos: list[GitHubRepository] = []
+        seen_ids: set[int] = set()
+        for result in results:
+            if isinstance(result, BaseException):
+                # Skip failed installations; the partial listing expires early
                 continue
+            for repo in result:
+                if repo.id not in seen_ids:
+                    seen_ids.add(repo.id)
+                    repos.append(repo)
 
-        return repos
+        return PrefixIndex(repos, lambda r: (r.name, r.full_name), complete=not failures)
 
-    async def list_branches(self, owner: str, repo: str) -> list[str]:
-        """List all branches for a repository with pagination support."""
-        # Get the correct installation for this owner
-        installation_id = await self._get_installation_for_owner(owner)
+    async def _list_installation_repos(self, installation_id: str) -> list[GitHubRepository]:
+        """List all repositories of one installation.
 
-        all_branches: list[str] = []
-        page = 1
+        The first page reports ``total_count``, so the remaining pages are
+        fetched concurrently.
+        """
 
-        while True:
-            data = await self._github_request(
+        async def fetch_page(page: int) -> dict:
+            data: dict = await self._github_request(
                 "GET",
-                f"/repos/{owner}/{repo}/branches",
+                "/installation/repositories",
                 installation_id=installation_id,
-                params={"per_page": 100, "page": page},
+                params={"per_page": LISTING_PAGE_SIZE, "page": page},
             )
+            return data
+
+        first = await fetch_page(1)
+        pages = [first]
+        page_count = -(-int(first.get("total_count", 0)) // LISTING_PAGE_SIZE)
+        if page_count > 1:
+            pages.extend(await asyncio.gather(*(fetch_page(p) for p in range(2, page_count + 1))))
+
+        return [
+            GitHubRepository(
+                id=repo["id"],
+                name=repo["name"],
+                full_name=repo["full_name"],
+                owner=repo["owner"]["login"],
+                default_branch=repo["default_branch"],
+                private=repo["private"],
+            )
+            for data in pages
+            for repo in data.get("repositories", [])
+        ]
 
-            if not data:
-                break
+    async def list_branches(
+        self,
+        owner: str,
+        repo: str,
+        query: str | None = None,
+        limit: int | None = None,
+        *,
+        refresh: bool = False,
+    ) -> list[str]:
+        """List branches of a repository (cached like ``list_repos``).
 
-            all_branches.extend(branch["name"] for branch in data)
+        Args:
+            owner: Repository owner.
+            repo: Repository name.
+            query: Case-insensitive branch name prefix.
+            limit: Maximum number of branches to return.
+            refresh: Reload the listing from GitHub before answering.
+        """
+        index = await self.listings.get(
+            f"branches:{owner.lower()}/{repo.lower()}",
+            lambda: self._load_branches(owner, repo),
+            refresh=refresh,
+        )
+        branches: list[str] = index.search(query, limit)
+        return branches
 
-            # If we got less than 100, we've reached the last page
-            if len(data) < 100:
-                break
+    async def _load_branches(self, owner: str, repo: str) -> PrefixIndex[str]:
+        """Load all branches of a repository.
+
+        The branches endpoint does not report a total, so after a full first
+        page the following pages are fetched in concurrent windows until a
+        short page marks the end.
+        """
+        # Get the correct installation for this owner
+        installation_id = await self._get_installation_for_owner(owner)
+
+        async def fetch_page(page: int) -> list[dict]:
+            data: list[dict] = await self._github_request(
+                "GET",
+                f"/repos/{owner}/{repo}/branches",
+                installation_id=installation_id,
+                params={"per_page": LISTING_PAGE_SIZE, "page": page},
+            )
+            return data or []
 
-            page += 1
+        pages = [await fetch_page(1)]
+        next_page = 2
+        while len(pages[-1]) == LISTING_PAGE_SIZE:
+            window = range(next_page, next_page + BRANCH_PAGE_WINDOW)
+            for data in await asyncio.gather(*(fetch_page(p) for p in window)):
+                pages.append(data)
+                if len(data) < LISTING_PAGE_SIZE:
+                    break
+            next_page += BRANCH_PAGE_WINDOW
 
-        return all_branches
+        return PrefixIndex((branch["name"] for data in pages for branch in data), lambda b: (b,))
 
     async def clone_url(self, owner: str, repo: str) -> str:
         """Get authenticated clone URL for a repository.
@@ -454,6 +579,9 @@ class GitHubService:
     async def get_auth_url(self, owner: str, repo: str) -> str:
         """Get authenticated URL for git push operations.
 
+        The installation token is normally served from the credential cache
+        (tokens in use are refreshed in the background before expiry).
+
         Args:
             owner: Repository owner.
             repo: Repository name.
@@ -674,95 +802,260 @@ class GitHubService:
             "merged_at": pr_data.get("merged_at"),
         }
 
+    async def get_pull_request_statuses(
+        self,
+        owner: str,
+        repo: str,
+        pr_numbers: list[int],
+        priority: GitHubRequestPriority = GitHubRequestPriority.USER,
+    ) -> dict[int, dict]:
+        """Get the status of many PRs of one repository via GraphQL.
+
+        PRs are fetched in batches of up to ``GRAPHQL_MAX_BATCH_SIZE`` aliased
+        ``pullRequest`` lookups per query, so polling N open PRs costs
+        ``ceil(N / 100)`` requests instead of N.
+
+        Args:
+            owner: Repository owner.
+            repo: Repository name.
+            pr_numbers: PR numbers to fetch.
+            priority: Scheduling priority for the rate governor.
+
+        Returns:
+            Dict keyed by PR number. Each value has the keys of
+            :meth:`get_pull_request_status` plus:
+                - mergeable: bool | None (None while GitHub is computing it)
+                - head_sha: str | None
+                - ci_state: combined check/status state of the head commit,
+                  "success" | "pending" | "failure" | "error"
+            PRs that do not exist (or are not visible) are omitted.
+        """
+        installation_id = await self._get_installation_for_owner(owner)
+        numbers = list(dict.fromkeys(pr_numbers))
+        statuses: dict[int, dict] = {}
+
+        for i in range(0, len(numbers), GRAPHQL_MAX_BATCH_SIZE):
+            batch = numbers[i : i + GRAPHQL_MAX_BATCH_SIZE]
+            fields = " ".join(
+                f"pr{n}: pullRequest(number: {n}) {{ {_GRAPHQL_PR_FIELDS} }}" for n in batch
+            )
+            query = (
+                "query($owner: String!, $name: String!) "
+                f"{{ repository(owner: $owner, name: $name) {{ {fields} }} }}"
+            )
+            result = await self._github_request(
+                "POST",
+                "/graphql",
+                installation_id=installation_id,
+                json={"query": query, "variables": {"owner": owner, "name": repo}},
+                priority=priority,
+            )
+            repository = (result.get("data") or {}).get("repository")
+            if repository is None:
+                # Missing PRs only produce per-alias NOT_FOUND errors; a
+                # missing repository means the whole query failed
+                errors = result.get("errors") or []
+                message = errors[0].get("message") if errors else "no data"
+                raise ValueError(f"GraphQL query for {owner}/{repo} failed: {message}")
+
+            for node in repository.values():
+                if not node:
+                    continue
+                mergeable = node.get("mergeable")
+                commits = (node.get("commits") or {}).get("nodes") or [{}]
+                rollup = ((commits[-1] or {}).get("commit") or {}).get("statusCheckRollup")
+                statuses[node["number"]] = {
+                    "state": "open" if node.get("state") == "OPEN" else "closed",
+                    "merged": bool(node.get("merged")),
+                    "merged_at": node.get("mergedAt"),
+                    "mergeable": None if mergeable == "UNKNOWN" else mergeable == "MERGEABLE",
+                    "head_sha": node.get("headRefOid"),
+                    "ci_state": _ROLLUP_STATES.get((rollup or {}).get("state") or "", "pending"),
+                }
+
+        return statuses
+
     # =========================================
     # Agentic Mode Methods
     # =========================================
 
-    async def get_pr_check_status(self, pr_number: int, repo_full_name: str) -> str:
-        """Get combined CI check status for a PR.
+    async def get_pull_request(
+        self,
+        pr_number: int,
+        repo_full_name: str,
+        priority: GitHubRequestPriority = GitHubRequestPriority.USER,
+    ) -> dict:
+        """Get the raw PR object from the REST API.
 
         Args:
             pr_number: PR number.
             repo_full_name: Full repository name (owner/repo).
+            priority: Scheduling priority for the rate governor.
 
         Returns:
-            Combined status: "success", "pending", "failure", or "error".
+            PR dict as returned by ``GET /repos/{owner}/{repo}/pulls/{number}``.
         """
         owner, repo = repo_full_name.split("/", 1)
 
         # Get the correct installation for this owner
         installation_id = await self._get_installation_for_owner(owner)
 
-        # Get PR to find the head SHA
-        pr_data = await self._github_request(
+        return await self._github_request(
             "GET",
             f"/repos/{owner}/{repo}/pulls/{pr_number}",
             installation_id=installation_id,
+            priority=priority,
         )
 
-        head_sha = pr_data.get("head", {}).get("sha")
-        if not head_sha:
-            return "error"
+    async def get_commit_status(
+        self,
+        repo_full_name: str,
+        sha: str,
+        priority: GitHubRequestPriority = GitHubRequestPriority.USER,
+    ) -> str:
+        """Get the combined commit status of a SHA.
+
+        Args:
+            repo_full_name: Full repository name (owner/repo).
+            sha: Commit SHA.
+            priority: Scheduling priority for the rate governor.
+
+        Returns:
+            Combined status: "success", "pending", "failure", or "error".
+        """
+        owner, repo = repo_full_name.split("/", 1)
+
+        # Get the correct installation for this owner
+        installation_id = await self._get_installation_for_owner(owner)
 
-        # Get combined status
         status_data = await self._github_request(
             "GET",
-            f"/repos/{owner}/{repo}/commits/{head_sha}/status",
+            f"/repos/{owner}/{repo}/commits/{sha}/status",
             installation_id=installation_id,
+            priority=priority,
         )
 
         return status_data.get("state", "pending")
 
-    async def check_pr_conflicts(self, pr_number: int, repo_full_name: str) -> bool:
-        """Check if PR has merge conflicts.
+    async def get_pr_check_status(
+        self,
+        pr_number: int,
+        repo_full_name: str,
+        priority: GitHubRequestPriority = GitHubRequestPriority.USER,
+    ) -> str:
+        """Get combined CI check status for a PR.
 
         Args:
             pr_number: PR number.
             repo_full_name: Full repository name (owner/repo).
+            priority: Scheduling priority for the rate governor.
 
         Returns:
-            True if PR has conflicts, False otherwise.
+            Combined status: "success", "pending", "failure", or "error".
         """
-        owner, repo = repo_full_name.split("/", 1)
+        # Get PR to find the head SHA
+        pr_data = await self.get_pull_request(pr_number, repo_full_name, priority=priority)
 
-        # Get the correct installation for this owner
-        installation_id = await self._get_installation_for_owner(owner)
+        head_sha = pr_data.get("head", {}).get("sha")
+        if not head_sha:
+            return "error"
 
-        pr_data = await self._github_request(
-            "GET",
-            f"/repos/{owner}/{repo}/pulls/{pr_number}",
-            installation_id=installation_id,
-        )
+        return await self.get_commit_status(repo_full_name, head_sha, priority=priority)
+
+    async def check_pr_conflicts(
+        self,
+        pr_number: int,
+        repo_full_name: str,
+        priority: GitHubRequestPriority = GitHubRequestPriority.USER,
+    ) -> bool:
+        """Check if PR has merge conflicts.
+
+        Args:
+            pr_number: PR number.
+            repo_full_name: Full repository name (owner/repo).
+            priority: Scheduling priority for the rate governor.
+
+        Returns:
+            True if PR has conflicts, False otherwise.
+        """
+        pr_data = await self.get_pull_request(pr_number, repo_full_name, priority=priority)
 
         # GitHub uses "dirty" for conflict state
         mergeable_state = pr_data.get("mergeable_state", "unknown")
         return mergeable_state == "dirty"
 
-    async def is_pr_mergeable(self, pr_number: int, repo_full_name: str) -> bool:
+    async def is_pr_mergeable(
+        self,
+        pr_number: int,
+        repo_full_name: str,
+        priority: GitHubRequestPriority = GitHubRequestPriority.USER,
+    ) -> bool:
         """Check if PR is mergeable.
 
         Args:
             pr_number: PR number.
             repo_full_name: Full repository name (owner/repo).
+            priority: Scheduling priority for the rate governor.
 
         Returns:
             True if PR is mergeable, False otherwise.
         """
-        owner, repo = repo_full_name.split("/", 1)
-
-        # Get the correct installation for this owner
-        installation_id = await self._get_installation_for_owner(owner)
-
-        pr_data = await self._github_request(
-            "GET",
-            f"/repos/{owner}/{repo}/pulls/{pr_number}",
-            installation_id=installation_id,
-        )
+        pr_data = await self.get_pull_request(pr_number, repo_full_name, priority=priority)
 
         # mergeable can be null while GitHub is computing
         mergeable = pr_data.get("mergeable")
         return mergeable is True
 
+    async def iter_job_log_lines(
+        self,
+        repo_full_name: str,
+        job_id: int,
+        priority: GitHubRequestPriority = GitHubRequestPriority.CI_POLLING,
+    ) -> AsyncGenerator[str]:
+        """Stream the log of a GitHub Actions job line by line.
+
+        The API answers with a redirect to the log blob, which is streamed
+        without being buffered in memory.
+
+        Args:
+            repo_full_name: Full repository name (owner/repo).
+            job_id: Actions job ID (the check run ID of Actions check runs).
+            priority: Scheduling priority for the rate governor.
+
+        Yields:
+            Log lines without line endings.
+
+        Raises:
+            httpx.HTTPStatusError: If the log is not available (e.g. missing
+                'actions: read' permission or expired logs).
+        """
+        owner, repo = repo_full_name.split("/", 1)
+        installation_id = await self._get_installation_for_owner(owner)
+        token = await self._get_installation_token(installation_id)
+        if not token:
+            raise ValueError("GitHub App not configured")
+
+        installation = installation_id or "default"
+        await self.rate_governor.acquire(installation, "core", priority)
+        # The Authorization header is dropped when following the redirect to
+        # the (differently hosted) log blob
+        async with self.http_client.stream(
+            "GET",
+            f"/repos/{owner}/{repo}/actions/jobs/{job_id}/logs",
+            headers={"Authorization": f"Bearer {token}"},
+            follow_redirects=True,
+        ) as response:
+            api_response = response.history[0] if response.history else response
+            body = None
+            if api_response.status_code == 403:
+                body = (await api_response.aread()).decode("utf-8", errors="replace")
+            self.rate_governor.record_response(
+                installation, "core", api_response.status_code, api_response.headers, body=body
+            )
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                yield line
+
     async def merge_pr(
         self,
         pr_number: int,
@@ -823,13 +1116,8 @@ class GitHubService:
         if not token:
             return False
 
-        async with httpx.AsyncClient() as client:
-            response = await client.delete(
-                f"https://api.github.com/repos/{owner}/{repo}/git/refs/heads/{branch_name}",
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "Accept": "application/vnd.github+json",
-                    "X-GitHub-Api-Version": "2022-11-28",
-                },
-            )
-            return response.status_code == 204
+        response = await self.http_client.delete(
+            f"/repos/{owner}/{repo}/git/refs/heads/{branch_name}",
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        return response.status_code == 204
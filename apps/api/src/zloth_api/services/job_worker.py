@@ -6,7 +6,9 @@ QueueBackend implementation (SQLite, Redis, Azure Service Bus).
 Design goals:
 - Survive process restarts (queued jobs are not lost)
 - Concurrency control via semaphore
-- Best-effort cancellation for running jobs
+- Cancellation of running jobs across processes: a cancel request is recorded
+  on the job, the worker holding its lock cancels it and kills its executor
+  processes, and the requester waits for the job to become CANCELED
 - Backend-agnostic (works with any QueueBackend)
 
 Architecture v2 Reference: docs/architecture-v2.md
@@ -16,6 +18,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 import uuid
 from collections.abc import Awaitable, Callable, Mapping
 from typing import TYPE_CHECKING
@@ -23,6 +26,7 @@ from typing import TYPE_CHECKING
 from zloth_api.config import settings
 from zloth_api.domain.enums import JobKind, JobStatus
 from zloth_api.domain.models import Job
+from zloth_api.executors.process_registry import get_process_registry, track_processes
 
 if TYPE_CHECKING:
     from zloth_api.queue.sqlite import SQLiteQueue
@@ -31,6 +35,61 @@ logger = logging.getLogger(__name__)
 
 JobHandler = Callable[[Job], Awaitable[None]]
 
+# Interval at which a cancel request is checked for the owning worker's confirmation
+CANCEL_CONFIRM_POLL_SECONDS = 0.25
+
+# Time a cancelled job's task gets to unwind before its processes are killed
+CANCEL_GRACE_SECONDS = 5.0
+
+
+async def request_job_cancel(
+    queue: SQLiteQueue,
+    *,
+    kind: JobKind,
+    ref_id: str,
+    timeout_seconds: float | None = None,
+) -> bool:
+    """Ask the worker running a job to cancel it and wait for the confirmation.
+
+    Works for jobs running in any process that shares the queue (e.g. a
+    standalone worker while the API runs with ``worker_enabled=false``).
+
+    Args:
+        queue: Queue backend holding the job.
+        kind: Type of job to cancel.
+        ref_id: Reference ID to match.
+        timeout_seconds: Time to wait for the job to become CANCELED.
+            Defaults to settings.worker_cancel_confirm_timeout_seconds.
+
+    Returns:
+        True if the owning worker cancelled the job in time.
+    """
+    job = await queue.get_by_ref(kind=kind, ref_id=ref_id)
+    if not job or job.status != JobStatus.RUNNING:
+        return False
+    if not await queue.request_cancel(job.id):
+        return False
+
+    timeout = (
+        timeout_seconds
+        if timeout_seconds is not None
+        else settings.worker_cancel_confirm_timeout_seconds
+    )
+    deadline = time.monotonic() + timeout
+    while True:
+        current = await queue.get(job.id)
+        if current is None or current.status != JobStatus.RUNNING:
+            return current is not None and current.status == JobStatus.CANCELED
+        if time.monotonic() >= deadline:
+            logger.warning(
+                "Job %s was not cancelled by worker %s within %.0fs",
+                job.id,
+                job.locked_by,
+                timeout,
+            )
+            return False
+        await asyncio.sleep(CANCEL_CONFIRM_POLL_SECONDS)
+
 
 class JobWorker:
     """Background worker that polls a queue backend and executes handlers.
@@ -95,6 +154,7 @@ class JobWorker:
 
         self._semaphore = asyncio.Semaphore(self._max_concurrent)
         self._loop_task: asyncio.Task[None] | None = None
+        self._cancel_watch_task: asyncio.Task[None] | None = None
         self._stop_event = asyncio.Event()
 
         # Job ID -> running task
@@ -129,6 +189,7 @@ class JobWorker:
             return
         self._stop_event.clear()
         self._loop_task = asyncio.create_task(self._run_loop())
+        self._cancel_watch_task = asyncio.create_task(self._watch_cancel_requests())
         logger.info(
             "JobWorker started (id=%s, concurrency=%d, poll_interval=%.1fs)",
             self._worker_id,
@@ -144,12 +205,13 @@ class JobWorker:
         """
         self._stop_event.set()
 
-        if self._loop_task and not self._loop_task.done():
-            self._loop_task.cancel()
-            try:
-                await self._loop_task
-            except asyncio.CancelledError:
-                pass
+        for loop_task in (self._loop_task, self._cancel_watch_task):
+            if loop_task and not loop_task.done():
+                loop_task.cancel()
+                try:
+                    await loop_task
+                except asyncio.CancelledError:
+                    pass
 
         # Wait for running jobs to complete (with timeout)
         if self._running:
@@ -170,7 +232,11 @@ class JobWorker:
         logger.info("JobWorker stopped (%s)", self._worker_id)
 
     async def cancel_ref(self, *, kind: JobKind, ref_id: str) -> bool:
-        """Cancel a queued job and attempt to cancel a running job.
+        """Cancel a queued or running job.
+
+        A job running in this worker is cancelled directly; a job running in
+        another worker process is asked to cancel through the queue, and this
+        waits for that worker's confirmation.
 
         Args:
             kind: Type of job to cancel.
@@ -180,22 +246,15 @@ class JobWorker:
             True if a job was canceled (queued or running).
         """
         # Cancel queued job
-        cancelled = await self._queue.cancel_by_ref(kind=kind, ref_id=ref_id)
+        if await self._queue.cancel_by_ref(kind=kind, ref_id=ref_id):
+            return True
 
-        # Try to cancel running job if owned by this worker
         running_job = await self._queue.get_by_ref(kind=kind, ref_id=ref_id)
-        if (
-            running_job
-            and running_job.status == JobStatus.RUNNING
-            and running_job.locked_by == self._worker_id
-        ):
-            task = self._running.get(running_job.id)
-            if task and not task.done():
-                await self._queue.cancel(running_job.id, reason="Canceled by user")
-                task.cancel()
-                return True
-
-        return cancelled
+        if not running_job or running_job.status != JobStatus.RUNNING:
+            return False
+        if running_job.locked_by == self._worker_id:
+            return await self._cancel_running(running_job.id, reason="Canceled by user")
+        return await request_job_cancel(self._queue, kind=kind, ref_id=ref_id)
 
     async def recover_startup(self) -> None:
         """Recover from previous process crashes.
@@ -256,8 +315,47 @@ class JobWorker:
                 )
                 await asyncio.sleep(self._poll_interval_seconds)
 
+    async def _watch_cancel_requests(self) -> None:
+        """Cancel this worker's jobs that another process asked to cancel."""
+        while not self._stop_event.is_set():
+            try:
+                job_ids = await self._queue.get_cancel_requested(locked_by=self._worker_id)
+                for job_id in job_ids:
+                    logger.info("Cancel requested for job %s", job_id)
+                    await self._cancel_running(job_id, reason="Canceled by user")
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("JobWorker cancel watch error (worker_id=%s)", self._worker_id)
+            await asyncio.sleep(settings.worker_cancel_poll_interval_seconds)
+
+    async def _cancel_running(self, job_id: str, *, reason: str) -> bool:
+        """Cancel a job running in this worker and kill its executor processes.
+
+        Returns:
+            True if the job was running here.
+        """
+        task = self._running.get(job_id)
+        running_here = task is not None and not task.done()
+        if task is not None and running_here:
+            task.cancel()
+            # The task's cleanup kills the CLI process tree; kill what survives it
+            await asyncio.wait([task], timeout=CANCEL_GRACE_SECONDS)
+            killed = await get_process_registry().kill(job_id)
+            if killed:
+                logger.warning("Killed %d executor process(es) left by job %s", killed, job_id)
+        # Confirms the cancellation to the requester (and clears a stale request
+        # for a job this worker no longer runs)
+        await self._queue.cancel(job_id, reason=reason)
+        return running_here
+
     async def _execute_job(self, job: Job) -> None:
         """Execute a single job with concurrency control."""
+        with track_processes(job.id):
+            await self._run_job(job)
+
+    async def _run_job(self, job: Job) -> None:
+        """Run a job's handler and record its outcome."""
         async with self._semaphore:
             handler = self._handlers.get(job.kind)
             if not handler:
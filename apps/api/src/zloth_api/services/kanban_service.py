@@ -2,7 +2,7 @@
 
 import logging
 
-from zloth_api.domain.enums import ExecutorType, RunStatus, TaskBaseKanbanStatus, TaskKanbanStatus
+from zloth_api.domain.enums import RunStatus, TaskBaseKanbanStatus, TaskKanbanStatus
 from zloth_api.domain.models import (
     PR,
     ExecutorRunStatus,
@@ -13,6 +13,7 @@ from zloth_api.domain.models import (
     Task,
     TaskWithKanbanStatus,
 )
+from zloth_api.executors import registered_executor_types
 from zloth_api.services.github_service import GitHubService
 from zloth_api.storage.dao import (
     PRDAO,
@@ -122,11 +123,7 @@ class KanbanService:
         reviewed_run_ids = await self.review_dao.get_reviewed_run_ids(all_run_ids)
 
         # CLI executor types to display (excluding patch_agent)
-        cli_executor_types = [
-            ExecutorType.CLAUDE_CODE,
-            ExecutorType.CODEX_CLI,
-            ExecutorType.GEMINI_CLI,
-        ]
+        cli_executor_types = registered_executor_types()
 
         # Note: We do NOT automatically refresh CI status here because it would
         # cause unrelated tasks to unexpectedly transition to Gating status.
@@ -1,8 +1,19 @@
-"""Merge gate service for checking merge conditions."""
+"""Merge gate service for checking merge conditions.
 
+The PR is fetched from GitHub once per gate check; conflicts and
+mergeability are read from that single response while the review score is
+checked concurrently. The combined CI status is only requested for head SHAs
+whose CI has not finished yet: terminal results are cached per head SHA, so
+re-checking an unchanged PR costs one conditional PR request (answered with
+304 by the GitHub response cache).
+"""
+
+import asyncio
 import logging
-from typing import TYPE_CHECKING
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
 
+from zloth_api.domain.enums import GitHubRequestPriority
 from zloth_api.domain.models import (
     MergeCondition,
     MergeConditionsResult,
@@ -17,6 +28,22 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+CI_CONDITION = "CI Green"
+REVIEW_CONDITION = "Review Score"
+CONFLICTS_CONDITION = "No Conflicts"
+MERGEABLE_CONDITION = "PR Mergeable"
+
+# Order of conditions in MergeConditionsResult
+CONDITION_ORDER = (CI_CONDITION, REVIEW_CONDITION, CONFLICTS_CONDITION, MERGEABLE_CONDITION)
+
+# Combined statuses that no longer change for a head SHA. Failures are not
+# final: failed jobs can be re-run and pass on the same SHA.
+CACHED_CI_STATES = frozenset({"success"})
+
+# Maximum number of (repo, head SHA) CI results kept in memory
+CI_CACHE_MAX_ENTRIES = 512
+
+
 # Fix strategies for different CI failures
 FIX_STRATEGIES: dict[str, str] = {
     "backend_lint": "Run 'ruff check --fix' and 'ruff format'",
@@ -49,102 +76,181 @@ class MergeGateService:
         self.github = github_service
         self.review_dao = review_dao
         self.settings_service = settings_service or SettingsService()
+        self._ci_cache: OrderedDict[tuple[str, str], MergeCondition] = OrderedDict()
 
     async def check_all_conditions(
         self,
         pr_number: int,
         repo_full_name: str,
         last_review_score: float | None = None,
+        *,
+        fail_fast: bool = False,
     ) -> MergeConditionsResult:
         """Check all merge conditions for a PR.
 
+        The review score and the GitHub conditions are evaluated concurrently.
+
         Args:
             pr_number: PR number to check.
             repo_full_name: Full repository name (owner/repo).
             last_review_score: Last review score if available.
+            fail_fast: Stop at the first failed condition. Conditions that
+                were not evaluated are omitted from the result.
 
         Returns:
             Result containing all condition checks.
         """
         conditions: list[MergeCondition] = []
-        failed: list[str] = []
-
-        # 1. Check CI status
-        ci_condition = await self._check_ci_status(pr_number, repo_full_name)
-        conditions.append(ci_condition)
-        if not ci_condition.passed:
-            failed.append(ci_condition.name)
-
-        # 2. Check review score
-        review_condition = await self._check_review_score(last_review_score)
-        conditions.append(review_condition)
-        if not review_condition.passed:
-            failed.append(review_condition.name)
-
-        # 3. Check for merge conflicts
-        conflict_condition = await self._check_no_conflicts(pr_number, repo_full_name)
-        conditions.append(conflict_condition)
-        if not conflict_condition.passed:
-            failed.append(conflict_condition.name)
-
-        # 4. Check if PR is mergeable (GitHub's built-in check)
-        mergeable_condition = await self._check_pr_mergeable(pr_number, repo_full_name)
-        conditions.append(mergeable_condition)
-        if not mergeable_condition.passed:
-            failed.append(mergeable_condition.name)
-
-        can_merge = len(failed) == 0
+        pending: set[asyncio.Task[list[MergeCondition]]] = {
+            asyncio.create_task(self._check_review_conditions(last_review_score)),
+            asyncio.create_task(
+                self._check_github_conditions(pr_number, repo_full_name, fail_fast)
+            ),
+        }
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    conditions.extend(task.result())
+                if fail_fast and any(not c.passed for c in conditions):
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        conditions.sort(key=lambda c: CONDITION_ORDER.index(c.name))
+        failed = [c.name for c in conditions if not c.passed]
 
         return MergeConditionsResult(
-            can_merge=can_merge,
+            can_merge=len(failed) == 0 and len(conditions) == len(CONDITION_ORDER),
             conditions=conditions,
             failed=failed,
         )
 
-    async def _check_ci_status(
+    async def _check_review_conditions(
+        self,
+        last_review_score: float | None,
+    ) -> list[MergeCondition]:
+        """Check the review score (wrapped for concurrent evaluation)."""
+        return [await self._check_review_score(last_review_score)]
+
+    async def _check_github_conditions(
         self,
         pr_number: int,
         repo_full_name: str,
+        fail_fast: bool,
+    ) -> list[MergeCondition]:
+        """Check CI, conflicts and mergeability from a single PR fetch.
+
+        Args:
+            pr_number: PR number.
+            repo_full_name: Full repository name.
+            fail_fast: Skip the CI status lookup if the PR cannot be merged.
+
+        Returns:
+            Condition check results.
+        """
+        try:
+            pr_data = await self.github.get_pull_request(
+                pr_number, repo_full_name, priority=GitHubRequestPriority.MERGE_GATE
+            )
+        except Exception as e:
+            logger.error(f"Error fetching PR #{pr_number} of {repo_full_name}: {e}")
+            return [
+                MergeCondition(
+                    name=CI_CONDITION,
+                    passed=False,
+                    message=f"Failed to check CI status: {str(e)}",
+                ),
+                MergeCondition(
+                    name=CONFLICTS_CONDITION,
+                    passed=False,
+                    message=f"Failed to check conflicts: {str(e)}",
+                ),
+                MergeCondition(
+                    name=MERGEABLE_CONDITION,
+                    passed=False,
+                    message=f"Failed to check mergeable status: {str(e)}",
+                ),
+            ]
+
+        conditions = [self._check_no_conflicts(pr_data), self._check_pr_mergeable(pr_data)]
+        if fail_fast and any(not c.passed for c in conditions):
+            return conditions
+
+        head_sha = (pr_data.get("head") or {}).get("sha")
+        conditions.append(await self._check_ci_status(repo_full_name, head_sha))
+        return conditions
+
+    async def _check_ci_status(
+        self,
+        repo_full_name: str,
+        head_sha: str | None,
     ) -> MergeCondition:
         """Check if all CI checks have passed.
 
+        Passing CI results are cached per head SHA.
+
         Args:
-            pr_number: PR number.
             repo_full_name: Full repository name.
+            head_sha: Head commit SHA of the PR.
 
         Returns:
             Condition check result.
         """
+        if not head_sha:
+            return MergeCondition(
+                name=CI_CONDITION,
+                passed=False,
+                message="CI checks failed (status: error)",
+            )
+
+        key = (repo_full_name, head_sha)
+        cached = self._ci_cache.get(key)
+        if cached is not None:
+            self._ci_cache.move_to_end(key)
+            return cached
+
         try:
             # Get combined status from GitHub
-            status = await self.github.get_pr_check_status(pr_number, repo_full_name)
-
-            if status == "success":
-                return MergeCondition(
-                    name="CI Green",
-                    passed=True,
-                    message="All CI checks passed",
-                )
-            elif status == "pending":
-                return MergeCondition(
-                    name="CI Green",
-                    passed=False,
-                    message="CI checks still running",
-                )
-            else:
-                return MergeCondition(
-                    name="CI Green",
-                    passed=False,
-                    message=f"CI checks failed (status: {status})",
-                )
+            status = await self.github.get_commit_status(
+                repo_full_name, head_sha, priority=GitHubRequestPriority.MERGE_GATE
+            )
         except Exception as e:
             logger.error(f"Error checking CI status: {e}")
             return MergeCondition(
-                name="CI Green",
+                name=CI_CONDITION,
                 passed=False,
                 message=f"Failed to check CI status: {str(e)}",
             )
 
+        if status == "success":
+            condition = MergeCondition(
+                name=CI_CONDITION,
+                passed=True,
+                message="All CI checks passed",
+            )
+        elif status == "pending":
+            condition = MergeCondition(
+                name=CI_CONDITION,
+                passed=False,
+                message="CI checks still running",
+            )
+        else:
+            condition = MergeCondition(
+                name=CI_CONDITION,
+                passed=False,
+                message=f"CI checks failed (status: {status})",
+            )
+
+        if status in CACHED_CI_STATES:
+            self._ci_cache[key] = condition
+            if len(self._ci_cache) > CI_CACHE_MAX_ENTRIES:
+                self._ci_cache.popitem(last=False)
+        return condition
+
     async def _check_review_score(
         self,
         last_review_score: float | None,
@@ -162,96 +268,68 @@ class MergeGateService:
 
         if last_review_score is None:
             return MergeCondition(
-                name="Review Score",
+                name=REVIEW_CONDITION,
                 passed=False,
                 message="No review score available",
             )
 
         if last_review_score >= min_score:
             return MergeCondition(
-                name="Review Score",
+                name=REVIEW_CONDITION,
                 passed=True,
                 message=f"Review score {last_review_score:.2f} >= {min_score}",
             )
         else:
             return MergeCondition(
-                name="Review Score",
+                name=REVIEW_CONDITION,
                 passed=False,
                 message=f"Review score {last_review_score:.2f} < {min_score}",
             )
 
-    async def _check_no_conflicts(
-        self,
-        pr_number: int,
-        repo_full_name: str,
-    ) -> MergeCondition:
+    def _check_no_conflicts(self, pr_data: dict[str, Any]) -> MergeCondition:
         """Check if PR has no merge conflicts.
 
         Args:
-            pr_number: PR number.
-            repo_full_name: Full repository name.
+            pr_data: PR object from the GitHub REST API.
 
         Returns:
             Condition check result.
         """
-        try:
-            has_conflicts = await self.github.check_pr_conflicts(pr_number, repo_full_name)
-
-            if not has_conflicts:
-                return MergeCondition(
-                    name="No Conflicts",
-                    passed=True,
-                    message="No merge conflicts",
-                )
-            else:
-                return MergeCondition(
-                    name="No Conflicts",
-                    passed=False,
-                    message="PR has merge conflicts that need resolution",
-                )
-        except Exception as e:
-            logger.error(f"Error checking conflicts: {e}")
+        # GitHub uses "dirty" for conflict state
+        if pr_data.get("mergeable_state", "unknown") != "dirty":
             return MergeCondition(
-                name="No Conflicts",
+                name=CONFLICTS_CONDITION,
+                passed=True,
+                message="No merge conflicts",
+            )
+        else:
+            return MergeCondition(
+                name=CONFLICTS_CONDITION,
                 passed=False,
-                message=f"Failed to check conflicts: {str(e)}",
+                message="PR has merge conflicts that need resolution",
             )
 
-    async def _check_pr_mergeable(
-        self,
-        pr_number: int,
-        repo_full_name: str,
-    ) -> MergeCondition:
+    def _check_pr_mergeable(self, pr_data: dict[str, Any]) -> MergeCondition:
         """Check if PR is mergeable according to GitHub.
 
         Args:
-            pr_number: PR number.
-            repo_full_name: Full repository name.
+            pr_data: PR object from the GitHub REST API.
 
         Returns:
             Condition check result.
         """
-        try:
-            is_mergeable = await self.github.is_pr_mergeable(pr_number, repo_full_name)
-
-            if is_mergeable:
-                return MergeCondition(
-                    name="PR Mergeable",
-                    passed=True,
-                    message="PR is mergeable",
-                )
-            else:
-                return MergeCondition(
-                    name="PR Mergeable",
-                    passed=False,
-                    message="PR is not mergeable (check GitHub for details)",
-                )
-        except Exception as e:
-            logger.error(f"Error checking PR mergeable status: {e}")
+        # mergeable can be null while GitHub is computing
+        if pr_data.get("mergeable") is True:
             return MergeCondition(
-                name="PR Mergeable",
+                name=MERGEABLE_CONDITION,
+                passed=True,
+                message="PR is mergeable",
+            )
+        else:
+            return MergeCondition(
+                name=MERGEABLE_CONDITION,
                 passed=False,
-                message=f"Failed to check mergeable status: {str(e)}",
+                message="PR is not mergeable (check GitHub for details)",
             )
 
     async def merge(
@@ -260,6 +338,7 @@ class MergeGateService:
         repo_full_name: str,
         method: str = "squash",
         delete_branch: bool = True,
+        last_review_score: float | None = None,
     ) -> MergeResult:
         """Execute merge for a PR.
 
@@ -268,13 +347,16 @@ class MergeGateService:
             repo_full_name: Full repository name.
             method: Merge method (merge, squash, rebase).
             delete_branch: Whether to delete the branch after merge.
+            last_review_score: Last review score of the PR.
 
         Returns:
             Merge result.
         """
         try:
             # First check all conditions
-            conditions = await self.check_all_conditions(pr_number, repo_full_name)
+            conditions = await self.check_all_conditions(
+                pr_number, repo_full_name, last_review_score, fail_fast=True
+            )
 
             if not conditions.can_merge:
                 return MergeResult(
@@ -7,6 +7,8 @@ from zloth_api.domain.models import (
     AgenticMetrics,
     CIMetrics,
     ConversationMetrics,
+    ExecutionCost,
+    ExecutionStatsBucket,
     ExecutorDistribution,
     MetricsDataPoint,
     MetricsDetail,
@@ -228,6 +230,50 @@ class MetricsService:
 
         return trends
 
+    async def get_execution_stats(
+        self,
+        period: str = "30d",
+        repo_id: str | None = None,
+        group_by: str = "executor",
+    ) -> list[ExecutionStatsBucket]:
+        """Get executor token usage, cost and timing aggregated by one key.
+
+        Args:
+            period: Period string
+            repo_id: Optional repository filter
+            group_by: "executor", "repo", "day", "week" or "month"
+
+        Returns:
+            Aggregates per group, most expensive first
+        """
+        period_start, period_end = _parse_period(period)
+        rows = await self.metrics_dao.get_execution_stats(
+            period_start, period_end, repo_id, group_by
+        )
+        return [ExecutionStatsBucket(**row) for row in rows]
+
+    async def get_costliest_executions(
+        self,
+        period: str = "30d",
+        repo_id: str | None = None,
+        limit: int = 20,
+    ) -> list[ExecutionCost]:
+        """Get the runs and reviews that spent the most on their executor.
+
+        Args:
+            period: Period string
+            repo_id: Optional repository filter
+            limit: Maximum number of executions
+
+        Returns:
+            Executions, most expensive first
+        """
+        period_start, period_end = _parse_period(period)
+        rows = await self.metrics_dao.get_costliest_executions(
+            period_start, period_end, repo_id, limit
+        )
+        return [ExecutionCost(**row) for row in rows]
+
     def _build_pr_metrics(self, data: dict) -> PRMetrics:
         """Build PR metrics from raw data."""
         total = data["total_prs"]
@@ -3,11 +3,10 @@
 import logging
 from abc import ABC, abstractmethod
 
-import httpx
-
 from zloth_api.domain.enums import NotificationType
 from zloth_api.domain.models import NotificationEvent
 from zloth_api.services.settings_service import SettingsService
+from zloth_api.utils.http_client import get_shared_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -107,12 +106,12 @@ class SlackNotifier(NotificationChannel):
             ]
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(self.webhook_url, json=payload, timeout=10.0)
-                success = response.status_code == 200
-                if not success:
-                    logger.warning(f"Slack notification failed: {response.status_code}")
-                return success
+            client = get_shared_http_client()
+            response = await client.post(self.webhook_url, json=payload, timeout=10.0)
+            success = response.status_code == 200
+            if not success:
+                logger.warning(f"Slack notification failed: {response.status_code}")
+            return success
         except Exception as e:
             logger.error(f"Slack notification error: {e}")
             return False
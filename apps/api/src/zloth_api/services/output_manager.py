@@ -22,6 +22,8 @@ class OutputLine:
     line_number: int
     content: str
     timestamp: float = field(default_factory=time.time)
+    # Set for process events (e.g. "stalled") rather than CLI output
+    event: str | None = None
 
 
 class OutputManager:
@@ -116,7 +118,7 @@ class OutputManager:
             # No running event loop - log and skip
             logger.warning(f"No event loop for publishing to run {run_id}")
 
-    async def publish_async(self, run_id: str, line: str) -> None:
+    async def publish_async(self, run_id: str, line: str, event: str | None = None) -> None:
         """Publish an output line for a run (async version).
 
         This method awaits the publication, ensuring immediate delivery
@@ -125,15 +127,17 @@ class OutputManager:
         Args:
             run_id: The run ID.
             line: The output line content.
+            event: Event name if the line reports a process event (e.g. "stalled").
         """
-        await self._publish_async(run_id, line)
+        await self._publish_async(run_id, line, event)
 
-    async def _publish_async(self, run_id: str, line: str) -> None:
+    async def _publish_async(self, run_id: str, line: str, event: str | None = None) -> None:
         """Async implementation of publish.
 
         Args:
             run_id: The run ID.
             line: The output line content.
+            event: Event name if the line reports a process event.
         """
         run_lock = await self._get_run_lock(run_id)
         async with run_lock:
@@ -145,6 +149,7 @@ class OutputManager:
             output_line = OutputLine(
                 line_number=line_number,
                 content=line,
+                event=event,
             )
 
             # Add to history (with limit)
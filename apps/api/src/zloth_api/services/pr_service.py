@@ -16,8 +16,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 from urllib.parse import urlencode
 
-from zloth_api.config import settings
-from zloth_api.domain.enums import ExecutorType, PRUpdateMode
+from zloth_api.domain.enums import ExecutorPriority, ExecutorType, PRUpdateMode
 from zloth_api.domain.models import (
     PR,
     PRCreate,
@@ -38,9 +37,7 @@ from zloth_api.errors import (
     NotFoundError,
     ValidationError,
 )
-from zloth_api.executors.claude_code_executor import ClaudeCodeExecutor, ClaudeCodeOptions
-from zloth_api.executors.codex_executor import CodexExecutor, CodexOptions
-from zloth_api.executors.gemini_executor import GeminiExecutor, GeminiOptions
+from zloth_api.executors import create_executors
 from zloth_api.services.commit_message import ensure_english_commit_message
 from zloth_api.services.git_service import GitService
 from zloth_api.services.repo_service import RepoService
@@ -151,13 +148,7 @@ class PRService:
         # Job queue for async PR link generation
         self.link_job_queue = PRLinkJobQueue()
         # Initialize executors for PR description generation
-        self.claude_executor = ClaudeCodeExecutor(
-            ClaudeCodeOptions(claude_cli_path=settings.claude_cli_path)
-        )
-        self.codex_executor = CodexExecutor(CodexOptions(codex_cli_path=settings.codex_cli_path))
-        self.gemini_executor = GeminiExecutor(
-            GeminiOptions(gemini_cli_path=settings.gemini_cli_path)
-        )
+        self.executors = create_executors()
 
     def _parse_github_url(self, repo_url: str) -> tuple[str, str]:
         """Backward-compatible wrapper (use parse_github_owner_repo)."""
@@ -939,15 +930,13 @@ IMPORTANT INSTRUCTIONS:
 3. The file should contain ONLY the PR description content"""
 
         try:
-            if executor_type == ExecutorType.CLAUDE_CODE:
-                result = await self.claude_executor.execute(worktree_path, wrapped_prompt)
-            elif executor_type == ExecutorType.CODEX_CLI:
-                result = await self.codex_executor.execute(worktree_path, wrapped_prompt)
-            elif executor_type == ExecutorType.GEMINI_CLI:
-                result = await self.gemini_executor.execute(worktree_path, wrapped_prompt)
-            else:
+            executor = self.executors.get(executor_type)
+            if executor is None:
                 logger.warning(f"Unsupported executor type for description: {executor_type}")
                 return None
+            result = await executor.execute(
+                worktree_path, wrapped_prompt, priority=ExecutorPriority.USER
+            )
 
             if not result.success:
                 logger.warning(f"Executor failed: {result.error}")
@@ -1129,6 +1118,13 @@ IMPORTANT INSTRUCTIONS:
                 "Run has no patch to apply",
                 details={"run_id": data.selected_run_id},
             )
+        if run.patch_truncated:
+            # The stored patch was cut at the size cap; applying it would
+            # commit a partial change
+            raise ValidationError(
+                "Run patch was truncated and cannot be applied",
+                details={"run_id": data.selected_run_id},
+            )
 
         # Parse GitHub info
         owner, repo_name = self._parse_github_url(repo_obj.repo_url)
@@ -2,7 +2,12 @@
 
 import asyncio
 import logging
+import time
+from collections import defaultdict
+from functools import lru_cache
 
+from zloth_api.domain.enums import GitHubRequestPriority
+from zloth_api.domain.models import PR
 from zloth_api.services.github_service import GitHubService
 from zloth_api.storage.dao import PRDAO
 
@@ -11,12 +16,32 @@ logger = logging.getLogger(__name__)
 # Default polling interval in seconds
 DEFAULT_POLL_INTERVAL = 60
 
+# Polling interval when webhooks deliver PR events (polling is a fallback)
+WEBHOOK_FALLBACK_POLL_INTERVAL = 300
+
+# Maximum number of repositories polled concurrently
+DEFAULT_MAX_CONCURRENCY = 4
+
+
+@lru_cache(maxsize=4096)
+def parse_pr_repo(pr_url: str) -> tuple[str, str] | None:
+    """Parse (owner, repo) from a PR URL.
+
+    URL format: https://github.com/{owner}/{repo}/pull/{number}
+    """
+    url_parts = pr_url.rstrip("/").split("/")
+    if len(url_parts) < 5:
+        return None
+    return url_parts[-4], url_parts[-3]
+
 
 class PRStatusPoller:
     """Background service that polls GitHub for PR status updates.
 
     Periodically checks all open PRs and updates their status in the database
-    when they are merged or closed on GitHub.
+    when they are merged or closed on GitHub. Open PRs are grouped by
+    repository and fetched with batched GraphQL queries (up to 100 PRs per
+    request); repositories are polled concurrently.
     """
 
     def __init__(
@@ -24,6 +49,7 @@ class PRStatusPoller:
         pr_dao: PRDAO,
         github_service: GitHubService,
         poll_interval: int = DEFAULT_POLL_INTERVAL,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
     ):
         """Initialize the PR status poller.
 
@@ -31,10 +57,12 @@ class PRStatusPoller:
             pr_dao: PR data access object.
             github_service: GitHub service for API calls.
             poll_interval: Polling interval in seconds (default: 60).
+            max_concurrency: Maximum repositories polled at once (default: 4).
         """
         self.pr_dao = pr_dao
         self.github_service = github_service
         self.poll_interval = poll_interval
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency))
         self._task: asyncio.Task[None] | None = None
         self._running = False
 
@@ -79,39 +107,88 @@ class PRStatusPoller:
         if not open_prs:
             return
 
-        logger.debug("Polling %d open PRs for status updates", len(open_prs))
-
+        by_repo: dict[tuple[str, str], list[PR]] = defaultdict(list)
         for pr in open_prs:
+            repo_key = parse_pr_repo(pr.url)
+            if repo_key is None:
+                logger.warning("Invalid PR URL format: %s", pr.url)
+                continue
+            by_repo[repo_key].append(pr)
+
+        started = time.monotonic()
+        # A TaskGroup cancels every in-flight repository poll when the poller
+        # is stopped, so no request outlives stop()
+        async with asyncio.TaskGroup() as tg:
+            for (owner, repo), prs in by_repo.items():
+                tg.create_task(self._poll_repo(owner, repo, prs))
+
+        logger.debug(
+            "Polled %d open PRs in %d repositories in %.2fs",
+            len(open_prs),
+            len(by_repo),
+            time.monotonic() - started,
+        )
+
+    async def _poll_repo(self, owner: str, repo: str, prs: list[PR]) -> None:
+        """Fetch the status of one repository's open PRs and apply changes.
+
+        Errors are logged and swallowed so one failing repository does not
+        abort the other repositories' polls.
+
+        Args:
+            owner: Repository owner.
+            repo: Repository name.
+            prs: Open PRs of the repository.
+        """
+        async with self._semaphore:
+            try:
+                statuses = await self.github_service.get_pull_request_statuses(
+                    owner,
+                    repo,
+                    [pr.number for pr in prs],
+                    priority=GitHubRequestPriority.BACKGROUND,
+                )
+            except Exception:
+                logger.debug("Failed to get PR statuses from GitHub for %s/%s", owner, repo)
+                return
+
+        for pr in prs:
+            pr_data = statuses.get(pr.number)
+            if pr_data is None:
+                continue
             try:
-                await self._check_and_update_pr(pr.id, pr.url, pr.number)
+                await self._apply_status(pr, owner, repo, pr_data)
             except Exception:
-                logger.exception("Error checking PR %s (url=%s)", pr.id, pr.url)
+                logger.exception("Error updating PR %s (url=%s)", pr.id, pr.url)
 
-    async def _check_and_update_pr(self, pr_id: str, pr_url: str, pr_number: int) -> None:
-        """Check a single PR's status and update if changed.
+    async def apply_event(self, pr_url: str, state: str, merged: bool) -> bool:
+        """Apply a PR state reported by a ``pull_request`` webhook.
 
         Args:
-            pr_id: Local PR ID.
-            pr_url: GitHub PR URL.
-            pr_number: GitHub PR number.
-        """
-        # Parse owner/repo from PR URL
-        # URL format: https://github.com/{owner}/{repo}/pull/{number}
-        url_parts = pr_url.split("/")
-        if len(url_parts) < 5:
-            logger.warning("Invalid PR URL format: %s", pr_url)
-            return
+            pr_url: GitHub PR URL (``html_url``).
+            state: "open" | "closed".
+            merged: Whether the PR was merged.
 
-        owner = url_parts[-4]
-        repo = url_parts[-3]
+        Returns:
+            True if a tracked open PR was updated.
+        """
+        pr = await self.pr_dao.get_by_url(pr_url)
+        repo_key = parse_pr_repo(pr_url)
+        if pr is None or pr.status != "open" or repo_key is None:
+            return False
+        owner, repo = repo_key
+        await self._apply_status(pr, owner, repo, {"state": state, "merged": merged})
+        return True
 
-        # Get PR status from GitHub
-        try:
-            pr_data = await self.github_service.get_pull_request_status(owner, repo, pr_number)
-        except Exception:
-            logger.debug("Failed to get PR status from GitHub for %s/%s#%d", owner, repo, pr_number)
-            return
+    async def _apply_status(self, pr: PR, owner: str, repo: str, pr_data: dict) -> None:
+        """Update a local PR from its GitHub status if it was merged or closed.
 
+        Args:
+            pr: Local PR.
+            owner: Repository owner.
+            repo: Repository name.
+            pr_data: Status as returned by GitHubService.get_pull_request_statuses.
+        """
         # Determine new status
         if pr_data.get("merged"):
             new_status = "merged"
@@ -122,12 +199,12 @@ class PRStatusPoller:
             return
 
         # Update local PR status
-        await self.pr_dao.update_status(pr_id, new_status)
+        await self.pr_dao.update_status(pr.id, new_status)
         logger.info(
             "Updated PR %s status to '%s' (GitHub %s/%s#%d)",
-            pr_id,
+            pr.id,
             new_status,
             owner,
             repo,
-            pr_number,
+            pr.number,
         )
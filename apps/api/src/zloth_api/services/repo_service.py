@@ -12,7 +12,8 @@ import git
 
 from zloth_api.config import settings
 from zloth_api.domain.models import Repo, RepoCloneRequest, RepoSelectRequest
-from zloth_api.errors import ForbiddenError
+from zloth_api.errors import ForbiddenError, NotFoundError
+from zloth_api.services.sparse_checkout import normalize_sparse_paths
 from zloth_api.storage.dao import RepoDAO
 
 if TYPE_CHECKING:
@@ -100,6 +101,26 @@ class RepoService:
         """
         return await self.dao.get(repo_id)
 
+    async def update_sparse_profile(self, repo_id: str, paths: list[str]) -> Repo:
+        """Set the default sparse checkout profile for new workspaces of a repo.
+
+        Args:
+            repo_id: Repository ID.
+            paths: Directories or files to materialize. Empty means full checkout.
+
+        Returns:
+            Updated Repo object.
+
+        Raises:
+            NotFoundError: If the repository does not exist.
+        """
+        repo = await self.dao.get(repo_id)
+        if not repo:
+            raise NotFoundError("Repository not found", details={"repo_id": repo_id})
+        sparse_paths = normalize_sparse_paths(paths)
+        await self.dao.update_sparse_paths(repo_id, sparse_paths)
+        return repo.model_copy(update={"sparse_paths": sparse_paths})
+
     async def find_by_url(self, repo_url: str) -> Repo | None:
         """Find a repository by URL.
 
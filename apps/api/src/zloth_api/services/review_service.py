@@ -14,9 +14,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from zloth_api.config import settings
 from zloth_api.domain.enums import (
-    ExecutorType,
+    ExecutorPriority,
     JobKind,
     MessageRole,
     ReviewCategory,
@@ -37,12 +36,10 @@ from zloth_api.domain.models import (
     ReviewFeedbackItem,
     ReviewSummary,
 )
-from zloth_api.executors.claude_code_executor import ClaudeCodeExecutor, ClaudeCodeOptions
-from zloth_api.executors.codex_executor import CodexExecutor, CodexOptions
-from zloth_api.executors.gemini_executor import GeminiExecutor, GeminiOptions
+from zloth_api.queue.sqlite import SQLiteQueue
 from zloth_api.roles.base_service import BaseRoleService
 from zloth_api.roles.registry import RoleRegistry
-from zloth_api.services.job_worker import JobWorker
+from zloth_api.services.job_worker import JobWorker, request_job_cancel
 from zloth_api.storage.dao import JobDAO, MessageDAO, ReviewDAO, RunDAO, TaskDAO, generate_id
 
 if TYPE_CHECKING:
@@ -177,14 +174,7 @@ class ReviewService(BaseRoleService[Review, ReviewCreate, ReviewExecutionResult]
         self.job_dao = job_dao
         # Note: self.output_manager is set by base class
         self.job_worker: JobWorker | None = None
-        # Note: Executors are also available via self._executors from base class
-        self.claude_executor = ClaudeCodeExecutor(
-            ClaudeCodeOptions(claude_cli_path=settings.claude_cli_path)
-        )
-        self.codex_executor = CodexExecutor(CodexOptions(codex_cli_path=settings.codex_cli_path))
-        self.gemini_executor = GeminiExecutor(
-            GeminiOptions(gemini_cli_path=settings.gemini_cli_path)
-        )
+        # Note: Executors are available via self.get_executor() from base class
 
     def set_job_worker(self, worker: JobWorker) -> None:
         """Attach the shared JobWorker instance (for best-effort cancellation)."""
@@ -235,6 +225,31 @@ class ReviewService(BaseRoleService[Review, ReviewCreate, ReviewExecutionResult]
 
         return review
 
+    async def cancel_review(self, review_id: str) -> bool:
+        """Cancel a queued or running review.
+
+        Args:
+            review_id: Review ID.
+
+        Returns:
+            True if cancelled, False if not found or already finished.
+        """
+        if self.job_worker:
+            cancelled = await self.job_worker.cancel_ref(
+                kind=JobKind.REVIEW_EXECUTE, ref_id=review_id
+            )
+        else:
+            cancelled = await self.job_dao.cancel_queued_by_ref(
+                kind=JobKind.REVIEW_EXECUTE, ref_id=review_id
+            ) or await request_job_cancel(
+                SQLiteQueue(self.job_dao.db, self.job_dao),
+                kind=JobKind.REVIEW_EXECUTE,
+                ref_id=review_id,
+            )
+        if cancelled:
+            await self.review_dao.update_status(review_id, ReviewStatus.CANCELED)
+        return cancelled
+
     async def get_review(self, review_id: str) -> Review | None:
         """Get a review by ID."""
         return await self.review_dao.get(review_id)
@@ -367,11 +382,7 @@ class ReviewService(BaseRoleService[Review, ReviewCreate, ReviewExecutionResult]
                     worktree_path = None
 
             # Execute review based on executor type
-            if review.executor_type in (
-                ExecutorType.CLAUDE_CODE,
-                ExecutorType.CODEX_CLI,
-                ExecutorType.GEMINI_CLI,
-            ):
+            if review.executor_type in self._executors:
                 result = await self._execute_cli_review(review, combined_patch, logs, worktree_path)
             else:
                 # For patch_agent, use a simpler approach
@@ -409,16 +420,10 @@ class ReviewService(BaseRoleService[Review, ReviewCreate, ReviewExecutionResult]
         import tempfile as tmpfile
 
         # Select executor
-        executor_map: dict[
-            ExecutorType, tuple[ClaudeCodeExecutor | CodexExecutor | GeminiExecutor, str]
-        ] = {
-            ExecutorType.CLAUDE_CODE: (self.claude_executor, "Claude Code"),
-            ExecutorType.CODEX_CLI: (self.codex_executor, "Codex"),
-            ExecutorType.GEMINI_CLI: (self.gemini_executor, "Gemini"),
-        }
-
-        executor, executor_name = executor_map[review.executor_type]
+        executor = self.get_executor(review.executor_type)
+        executor_name = executor.display_name
         logs.append(f"Using {executor_name} for review")
+        task = await self.task_dao.get(review.task_id)
         logs.append(f"Patch size: {len(patch)} characters")
 
         # Determine working directory
@@ -461,8 +466,13 @@ class ReviewService(BaseRoleService[Review, ReviewCreate, ReviewExecutionResult]
                 worktree_path=work_dir,
                 instruction=review_prompt,
                 on_output=lambda line: self._log_output(review.id, line, logs),
+                on_event=lambda event, message: self._log_event(review.id, event, message),
                 read_only=True,  # Review should never modify files
+                repo=task.repo_id if task else None,
+                priority=ExecutorPriority.REVIEW,
             )
+            if result.stats is not None:
+                await self.review_dao.update_execution_stats(review.id, result.stats)
 
             if not result.success:
                 raise RuntimeError(f"CLI execution failed: {result.error}")
@@ -788,6 +798,15 @@ class ReviewService(BaseRoleService[Review, ReviewCreate, ReviewExecutionResult]
         if self.output_manager:
             await self.output_manager.publish_async(f"review-{review_id}", line)
 
+    async def _log_event(self, review_id: str, event: str, message: str) -> None:
+        """Publish a CLI process event (e.g. "stalled")."""
+        logger.warning(f"[review-{review_id[:8]}] CLI {event}: {message}")
+
+        if self.output_manager:
+            await self.output_manager.publish_async(
+                f"review-{review_id}", f"[{event}] {message}", event=event
+            )
+
     # ==========================================
     # BaseRoleService Abstract Method Implementations
     # ==========================================
@@ -13,7 +13,7 @@ import logging
 from collections.abc import Callable, Coroutine
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal
 
 from zloth_api.config import settings
 from zloth_api.domain.enums import ExecutorType, JobKind, RoleExecutionStatus, RunStatus
@@ -25,20 +25,23 @@ from zloth_api.domain.models import (
     Job,
     Run,
     RunCreate,
+    RunDiff,
     Task,
 )
 from zloth_api.errors import NotFoundError
-from zloth_api.executors.claude_code_executor import ClaudeCodeExecutor, ClaudeCodeOptions
-from zloth_api.executors.codex_executor import CodexExecutor, CodexOptions
-from zloth_api.executors.gemini_executor import GeminiExecutor, GeminiOptions
+from zloth_api.executors import BaseExecutor, ExecutorResult
+from zloth_api.executors.process_isolation import merge_usage
+from zloth_api.queue.sqlite import SQLiteQueue
 from zloth_api.roles.base_service import BaseRoleService
 from zloth_api.roles.registry import RoleRegistry
 from zloth_api.services.commit_message import ensure_english_commit_message
-from zloth_api.services.diff_parser import parse_unified_diff
+from zloth_api.services.diff_capture import TRUNCATED_MARKER, merge_file_diffs
+from zloth_api.services.executor_result_cache import ExecutorResultCache, ResultCacheKey
 from zloth_api.services.git_service import GitService
-from zloth_api.services.job_worker import JobWorker
+from zloth_api.services.job_worker import JobWorker, request_job_cancel
 from zloth_api.services.repo_service import RepoService
 from zloth_api.services.run_workspace_manager import RunWorkspaceManager
+from zloth_api.services.sparse_checkout import normalize_sparse_paths
 from zloth_api.services.workspace_adapters import (
     CloneWorkspaceAdapter,
     ExecutionWorkspaceInfo,
@@ -201,6 +204,7 @@ class RunService(BaseRoleService[Run, RunCreate, ImplementationResult]):
         user_preferences_dao: UserPreferencesDAO | None = None,
         github_service: GitHubService | None = None,
         output_manager: OutputManager | None = None,
+        result_cache: ExecutorResultCache | None = None,
     ):
         # Initialize base class with output manager and executors
         super().__init__(output_manager=output_manager)
@@ -213,16 +217,11 @@ class RunService(BaseRoleService[Run, RunCreate, ImplementationResult]):
         self.workspace_service = workspace_service or WorkspaceService()
         self.user_preferences_dao = user_preferences_dao
         self.github_service = github_service
+        # Used only with settings.executor_result_cache_enabled
+        self.result_cache = result_cache
         # Note: self.output_manager is set by base class
         self.job_worker: JobWorker | None = None
-        # Note: Executors are also available via self._executors from base class
-        self.claude_executor = ClaudeCodeExecutor(
-            ClaudeCodeOptions(claude_cli_path=settings.claude_cli_path)
-        )
-        self.codex_executor = CodexExecutor(CodexOptions(codex_cli_path=settings.codex_cli_path))
-        self.gemini_executor = GeminiExecutor(
-            GeminiOptions(gemini_cli_path=settings.gemini_cli_path)
-        )
+        # Note: Executors are available via self.get_executor() from base class
         # Workspace isolation mode:
         # Worktree-based isolation is deprecated. We always use clone-based workspaces.
         if not settings.use_clone_isolation:
@@ -301,12 +300,67 @@ class RunService(BaseRoleService[Run, RunCreate, ImplementationResult]):
         # Note: Each executor type maintains its own worktree and session
         # so we allow multiple different CLI types in the same task
 
-        # Filter to only CLI executors (PATCH_AGENT is no longer supported)
-        cli_executor_types = [
-            et
-            for et in executor_types
-            if et in {ExecutorType.CLAUDE_CODE, ExecutorType.CODEX_CLI, ExecutorType.GEMINI_CLI}
-        ]
+        # Filter to executors with a registered CLI (PATCH_AGENT is no longer supported)
+        cli_executor_types = [et for et in executor_types if et in self._executors]
+
+        # A new task fanned out to several executors gets one workspace per
+        # executor. Prepare them concurrently: the base branch is fetched once
+        # into a shared seed and each run is enqueued as soon as its own
+        # workspace is ready, so CLI launches overlap the remaining setup.
+        parallel = (
+            len(cli_executor_types) > 1
+            and not settings.share_workspace_across_executors
+            and not (task.workspace_path and task.working_branch)
+        )
+        if parallel:
+            results = await asyncio.gather(
+                *(
+                    self._create_cli_run(
+                        task_id=task_id,
+                        task=task,
+                        repo=repo,
+                        instruction=data.instruction,
+                        base_ref=effective_base_ref,
+                        executor_type=executor_type,
+                        message_id=data.message_id,
+                        update_task_workspace=False,
+                        fail_run_on_error=True,
+                    )
+                    for executor_type in cli_executor_types
+                ),
+                return_exceptions=True,
+            )
+            for executor_type, result in zip(cli_executor_types, results):
+                if isinstance(result, Run):
+                    runs.append(result)
+                elif isinstance(result, Exception):
+                    # Failed before its run row existed; record it so the caller
+                    # still gets one run per executor.
+                    logger.error(f"Failed to create {executor_type.value} run: {result}")
+                    runs.append(
+                        await self._record_failed_run(
+                            task_id=task_id,
+                            instruction=data.instruction,
+                            base_ref=effective_base_ref,
+                            executor_type=executor_type,
+                            message_id=data.message_id,
+                            error=str(result),
+                        )
+                    )
+                else:
+                    raise result
+            prepared = [
+                (r.worktree_path, r.working_branch)
+                for r in runs
+                if r.status != RunStatus.FAILED and r.worktree_path and r.working_branch
+            ]
+            if prepared:
+                # Same outcome as sequential creation: the last workspace is fixed
+                workspace_path, working_branch = prepared[-1]
+                await self.task_dao.update_workspace(
+                    task.id, workspace_path=workspace_path, working_branch=working_branch
+                )
+            return runs
 
         # Create runs for each CLI executor type
         for executor_type in cli_executor_types:
@@ -332,6 +386,8 @@ class RunService(BaseRoleService[Run, RunCreate, ImplementationResult]):
         base_ref: str,
         executor_type: ExecutorType,
         message_id: str | None = None,
+        update_task_workspace: bool = True,
+        fail_run_on_error: bool = False,
     ) -> Run:
         """Create and start a CLI-based run (Claude Code, Codex, or Gemini).
 
@@ -346,6 +402,10 @@ class RunService(BaseRoleService[Run, RunCreate, ImplementationResult]):
             base_ref: Base branch to work from.
             executor_type: Type of CLI executor to use.
             message_id: ID of the triggering message.
+            update_task_workspace: Fix the new workspace on the task. Disabled when
+                several runs are created concurrently; the caller fixes it instead.
+            fail_run_on_error: Return the run marked as failed when preparing its
+                workspace fails, instead of raising.
 
         Returns:
             Created Run object.
@@ -380,10 +440,45 @@ class RunService(BaseRoleService[Run, RunCreate, ImplementationResult]):
             executor_type=executor_type,
             message_id=message_id,
             base_ref=base_ref,
+            model_name=self.get_executor(executor_type).options.model,
         )
 
+        try:
+            return await self._prepare_cli_run(
+                run=run,
+                task=task,
+                repo=repo,
+                base_ref=base_ref,
+                existing_run=existing_run,
+                previous_session_id=previous_session_id,
+                update_task_workspace=update_task_workspace,
+            )
+        except Exception as e:
+            logger.error(f"Failed to prepare run {run.id}: {e}")
+            await self.run_dao.update_status(
+                run.id, RunStatus.FAILED, error=f"Workspace setup failed: {e}"
+            )
+            if not fail_run_on_error:
+                raise
+            failed_run = await self.run_dao.get(run.id)
+            if not failed_run:
+                raise ValueError(f"Run not found after update: {run.id}") from e
+            return failed_run
+
+    async def _prepare_cli_run(
+        self,
+        run: Run,
+        task: Task,
+        repo: Any,
+        base_ref: str,
+        existing_run: Run | None,
+        previous_session_id: str | None,
+        update_task_workspace: bool,
+    ) -> Run:
+        """Set up the workspace of a new CLI run and enqueue its execution job."""
         workspace_path = task.workspace_path
         working_branch = task.working_branch
+        prepared_at: datetime | None = None
 
         if not workspace_path or not working_branch:
             if existing_run and existing_run.worktree_path and existing_run.working_branch:
@@ -407,10 +502,17 @@ class RunService(BaseRoleService[Run, RunCreate, ImplementationResult]):
                     base_ref=task.base_ref or base_ref,
                     run_id=run.id,
                     workspace_path=workspace_dir,
+                    sparse_paths=self._resolve_sparse_paths(repo, task),
                 )
         else:
             # No fixed workspace yet (new task) -> create and fix it
-            workspace_info = await self.workspace_manager.create_workspace(run.id, repo, base_ref)
+            workspace_info = await self.workspace_manager.create_workspace(
+                run.id,
+                repo,
+                base_ref,
+                sparse_paths=self._resolve_sparse_paths(repo, task),
+            )
+            prepared_at = datetime.utcnow()
 
         # Update run with workspace info
         await self.workspace_manager.update_run_workspace(run.id, workspace_info)
@@ -425,7 +527,7 @@ class RunService(BaseRoleService[Run, RunCreate, ImplementationResult]):
                     f"{task.workspace_path=} {task.working_branch=} "
                     f"{workspace_info.path=} {workspace_info.branch_name=}"
                 )
-        else:
+        elif update_task_workspace:
             await self.task_dao.update_workspace(
                 task.id,
                 workspace_path=str(workspace_info.path),
@@ -439,14 +541,43 @@ class RunService(BaseRoleService[Run, RunCreate, ImplementationResult]):
 
         # Enqueue for execution (persistent job).
         # We store resume_session_id in payload because it is derived at enqueue-time.
+        # prepared_at marks a workspace just cut from a freshly fetched base branch.
+        payload: dict[str, Any] = {}
+        if previous_session_id:
+            payload["resume_session_id"] = previous_session_id
+        if prepared_at:
+            payload["prepared_at"] = prepared_at.isoformat()
         await self.job_dao.create(
             kind=JobKind.RUN_EXECUTE,
             ref_id=updated_run.id,
-            payload={"resume_session_id": previous_session_id} if previous_session_id else {},
+            payload=payload,
         )
 
         return updated_run
 
+    async def _record_failed_run(
+        self,
+        task_id: str,
+        instruction: str,
+        base_ref: str,
+        executor_type: ExecutorType,
+        message_id: str | None,
+        error: str,
+    ) -> Run:
+        """Create a run that failed before it could be prepared."""
+        run = await self.run_dao.create(
+            task_id=task_id,
+            instruction=instruction,
+            executor_type=executor_type,
+            message_id=message_id,
+            base_ref=base_ref,
+        )
+        await self.run_dao.update_status(run.id, RunStatus.FAILED, error=error)
+        failed_run = await self.run_dao.get(run.id)
+        if not failed_run:
+            raise ValueError(f"Run not found after update: {run.id}")
+        return failed_run
+
     async def get(self, run_id: str) -> Run | None:
         """Get a run by ID.
 
@@ -469,6 +600,73 @@ class RunService(BaseRoleService[Run, RunCreate, ImplementationResult]):
         """
         return await self.run_dao.list(task_id)
 
+    async def get_diff(self, run_id: str, scope: Literal["run", "cumulative"] = "run") -> RunDiff:
+        """Get the diff for a run.
+
+        Runs store only their own delta (changes since the previous commit).
+        The cumulative view is computed on demand: from git when the workspace
+        still exists, otherwise by merging the stored deltas of earlier runs
+        on the same branch.
+
+        Args:
+            run_id: Run ID.
+            scope: "run" for the run's own delta, "cumulative" for all changes
+                on the branch since it diverged from the base ref.
+
+        Returns:
+            RunDiff for the requested scope.
+
+        Raises:
+            NotFoundError: If the run does not exist.
+        """
+        run = await self.run_dao.get(run_id)
+        if not run:
+            raise NotFoundError("Run not found", details={"run_id": run_id})
+
+        if scope != "cumulative":
+            files, patch = run.files_changed, run.patch or ""
+            truncated = run.patch_truncated or any(TRUNCATED_MARKER in f.patch for f in files)
+            return self._build_run_diff(run.id, "run", files, patch, truncated)
+
+        if run.worktree_path and run.base_ref and Path(run.worktree_path).exists():
+            capture = await self.workspace_service.capture_diff_range(
+                Path(run.worktree_path), run.base_ref, run.commit_sha or "HEAD"
+            )
+            if capture.files:
+                return self._build_run_diff(
+                    run.id, "cumulative", capture.files, capture.patch, capture.truncated
+                )
+
+        # Workspace is gone: merge stored per-run deltas up to this run
+        deltas: builtins.list[builtins.list[FileDiff]] = []
+        for r in sorted(await self.run_dao.list(run.task_id), key=lambda r: r.created_at):
+            if r.created_at > run.created_at:
+                break
+            if r.working_branch == run.working_branch and r.status == RunStatus.SUCCEEDED:
+                deltas.append(r.files_changed)
+        files = merge_file_diffs(deltas)
+        patch = "\n".join(f.patch for f in files if f.patch)
+        truncated = any(TRUNCATED_MARKER in f.patch for f in files)
+        return self._build_run_diff(run.id, "cumulative", files, patch, truncated)
+
+    @staticmethod
+    def _build_run_diff(
+        run_id: str,
+        scope: Literal["run", "cumulative"],
+        files: builtins.list[FileDiff],
+        patch: str,
+        truncated: bool,
+    ) -> RunDiff:
+        return RunDiff(
+            run_id=run_id,
+            scope=scope,
+            files_changed=files,
+            patch=patch,
+            added_lines=sum(f.added_lines for f in files),
+            removed_lines=sum(f.removed_lines for f in files),
+            truncated=truncated,
+        )
+
     async def execute_job(self, job: Job) -> None:
         """Execute a durable queue job for a run.
 
@@ -501,8 +699,13 @@ class RunService(BaseRoleService[Run, RunCreate, ImplementationResult]):
         )
 
         resume_session_id = None
+        fresh_workspace = False
         if job.payload:
             resume_session_id = job.payload.get("resume_session_id")
+            prepared_at = job.payload.get("prepared_at")
+            if prepared_at:
+                age = datetime.utcnow() - datetime.fromisoformat(prepared_at)
+                fresh_workspace = age.total_seconds() < settings.workspace_seed_ttl_seconds
 
         await self._execute_cli_run(
             run=run,
@@ -510,6 +713,7 @@ class RunService(BaseRoleService[Run, RunCreate, ImplementationResult]):
             executor_type=run.executor_type,
             resume_session_id=resume_session_id,
             repo=repo,
+            fresh_workspace=fresh_workspace,
         )
 
         # Determine success based on persisted run status
@@ -527,24 +731,24 @@ class RunService(BaseRoleService[Run, RunCreate, ImplementationResult]):
             True if cancelled.
         """
         run = await self.run_dao.get(run_id)
-        # Cancel queued job (durable queue) and best-effort cancel running job in this process.
+        # Cancel the queued job, or have the worker running it (in this or another
+        # process) stop it and kill its CLI processes before the workspace goes away.
         if self.job_worker:
             cancelled = await self.job_worker.cancel_ref(kind=JobKind.RUN_EXECUTE, ref_id=run_id)
         else:
             cancelled = await self.job_dao.cancel_queued_by_ref(
                 kind=JobKind.RUN_EXECUTE, ref_id=run_id
+            ) or await request_job_cancel(
+                SQLiteQueue(self.job_dao.db, self.job_dao),
+                kind=JobKind.RUN_EXECUTE,
+                ref_id=run_id,
             )
 
         if cancelled:
             await self.run_dao.update_status(run_id, RunStatus.CANCELED)
 
             # Cleanup workspace if it's a CLI executor run
-            cli_executors = {
-                ExecutorType.CLAUDE_CODE,
-                ExecutorType.CODEX_CLI,
-                ExecutorType.GEMINI_CLI,
-            }
-            if run and run.executor_type in cli_executors:
+            if run and run.executor_type in self._executors:
                 await self.workspace_manager.cleanup_workspace(run, delete_branch=True)
 
         return cancelled
@@ -573,6 +777,17 @@ class RunService(BaseRoleService[Run, RunCreate, ImplementationResult]):
         """
         return await self.cleanup_workspace(run_id)
 
+    def _resolve_sparse_paths(self, repo: Any, task: Task) -> builtins.list[str]:
+        """Merge the repo-level and task-level sparse checkout profiles.
+
+        Returns an empty list (full checkout) when sparse checkout is disabled
+        or neither the repo nor the task defines a profile.
+        """
+        if not settings.workspace_sparse_checkout:
+            return []
+        repo_paths: builtins.list[str] = getattr(repo, "sparse_paths", None) or []
+        return normalize_sparse_paths([*repo_paths, *task.sparse_paths])
+
     async def _execute_cli_run(
         self,
         run: Run,
@@ -580,6 +795,7 @@ class RunService(BaseRoleService[Run, RunCreate, ImplementationResult]):
         executor_type: ExecutorType,
         resume_session_id: str | None = None,
         repo: Any = None,
+        fresh_workspace: bool = False,
     ) -> None:
         """Execute a CLI-based run with automatic commit/push.
 
@@ -597,20 +813,17 @@ class RunService(BaseRoleService[Run, RunCreate, ImplementationResult]):
             executor_type: Type of CLI executor to use.
             resume_session_id: Optional session ID to resume a previous conversation.
             repo: Repository object for push operations.
+            fresh_workspace: The workspace was just created from a freshly fetched
+                base branch, so remote sync and base-branch merge are skipped.
         """
         logs: list[str] = []
         commit_sha: str | None = None
+        auth_url: str | None = None
 
-        # Map executor types to their executors and names
-        executor_map: dict[
-            ExecutorType, tuple[ClaudeCodeExecutor | CodexExecutor | GeminiExecutor, str]
-        ] = {
-            ExecutorType.CLAUDE_CODE: (self.claude_executor, "Claude Code"),
-            ExecutorType.CODEX_CLI: (self.codex_executor, "Codex"),
-            ExecutorType.GEMINI_CLI: (self.gemini_executor, "Gemini"),
-        }
-
-        executor, executor_name = executor_map[executor_type]
+        executor = self.get_executor(executor_type)
+        executor_name = executor.display_name
+        # Repository key for the per-repository executor limit
+        repo_id: str | None = repo.id if repo else None
 
         # Track if we need to add conflict resolution instructions
         conflict_instruction: str | None = None
@@ -627,7 +840,14 @@ class RunService(BaseRoleService[Run, RunCreate, ImplementationResult]):
             # 0. Sync with remote (pull latest changes from remote branch)
             # This handles the case where the PR branch was updated on GitHub
             # (e.g., via "Update branch" button) and we need to incorporate those changes.
-            if self.github_service and repo:
+            if self.github_service and repo and fresh_workspace:
+                try:
+                    owner, repo_name = self._parse_github_url(repo.repo_url)
+                    auth_url = await self.github_service.get_auth_url(owner, repo_name)
+                except Exception as auth_error:
+                    logger.warning(f"[{run.id[:8]}] Could not get auth URL: {auth_error}")
+                logs.append("Workspace prepared from the latest base branch, skipping remote sync")
+            elif self.github_service and repo:
                 try:
                     await self._log_output(run.id, "Checking for remote updates...")
                     owner, repo_name = self._parse_github_url(repo.repo_url)
@@ -716,6 +936,7 @@ class RunService(BaseRoleService[Run, RunCreate, ImplementationResult]):
                     executor=executor,
                     executor_name=executor_name,
                     logs=logs,
+                    repo_id=repo_id,
                 )
                 conflict_instruction = None
 
@@ -725,11 +946,10 @@ class RunService(BaseRoleService[Run, RunCreate, ImplementationResult]):
 
             logs.append(f"Starting {executor_name} execution in {worktree_info.path}")
             logs.append(f"Working branch: {worktree_info.branch_name}")
-            # We proactively attempt to resume conversations via session_id when available.
-            # If the CLI rejects the session (e.g., "already in use"), we retry once without it.
 
             # 2. Build instruction with constraints
-            constraints = AgentConstraints()
+            sparse_paths = await self.workspace_adapter.get_sparse_paths(worktree_info.path)
+            constraints = AgentConstraints(sparse_paths=sparse_paths or [])
 
             # Include conflict resolution instruction if conflicts were detected
             if conflict_instruction:
@@ -746,44 +966,30 @@ class RunService(BaseRoleService[Run, RunCreate, ImplementationResult]):
                 f"[{run.id[:8]}] Instruction length: {len(instruction_with_constraints)} chars"
             )
 
-            # 3. Execute the CLI (file editing only)
-            logger.info(f"[{run.id[:8]}] Executing CLI...")
-            await self._log_output(run.id, f"Launching {executor_name} CLI...")
-            attempt_session_id = resume_session_id
-            result = await executor.execute(
-                worktree_path=worktree_info.path,
-                instruction=instruction_with_constraints,
-                on_output=lambda line: self._log_output(run.id, line),
-                resume_session_id=attempt_session_id,
+            # 3. Reuse the result of an identical earlier run, or execute the CLI
+            # (file editing only)
+            cache_key = await self._result_cache_key(
+                executor,
+                worktree_info.path,
+                instruction_with_constraints,
+                repo_id=repo_id,
+                resume_session_id=resume_session_id,
+                workspace_clean=not pre_status.has_changes,
             )
-            # Session error patterns that should trigger a retry without session continuation
-            session_error_patterns = [
-                "already in use",
-                "in use",
-                "no conversation found",
-                "not found",
-                "invalid session",
-                "session expired",
-            ]
-            error_lower = result.error.lower() if result.error else ""
-            if (
-                not result.success
-                and attempt_session_id
-                and result.error
-                and ("session" in error_lower)
-                and any(pattern in error_lower for pattern in session_error_patterns)
-            ):
-                # Retry once without session continuation if the CLI rejects the session.
-                logs.append(
-                    f"Session continuation failed ({result.error}). Retrying without session_id."
-                )
-                result = await executor.execute(
-                    worktree_path=worktree_info.path,
-                    instruction=instruction_with_constraints,
-                    on_output=lambda line: self._log_output(run.id, line),
-                    resume_session_id=None,
+            result = None
+            if cache_key is not None:
+                result = await self._apply_cached_result(run, cache_key, worktree_info.path, logs)
+            from_cache = result is not None
+            if result is None:
+                result = await self._execute_with_session_fallback(
+                    run,
+                    executor,
+                    worktree_info.path,
+                    instruction_with_constraints,
+                    resume_session_id,
+                    repo_id,
+                    logs,
                 )
-            logger.info(f"[{run.id[:8]}] CLI execution completed: success={result.success}")
 
             if not result.success:
                 await self.run_dao.update_status(
@@ -792,6 +998,8 @@ class RunService(BaseRoleService[Run, RunCreate, ImplementationResult]):
                     error=result.error,
                     logs=logs + result.logs,
                     session_id=result.session_id or resume_session_id,
+                    resource_usage=result.resource_usage,
+                    execution_stats=result.stats,
                 )
                 return
 
@@ -799,13 +1007,22 @@ class RunService(BaseRoleService[Run, RunCreate, ImplementationResult]):
             summary_from_file = await self._read_and_remove_summary_file(worktree_info.path, logs)
 
             # 5. Stage all changes
+            # In sparse workspaces, new files outside the profile are skipped by
+            # `git add -A` unless their directories are hydrated first.
+            if sparse_paths:
+                hydrated = await self.workspace_adapter.hydrate_sparse(
+                    worktree_info.path, auth_url=auth_url
+                )
+                if hydrated:
+                    logs.append(f"Hydrated sparse checkout: {', '.join(hydrated)}")
             await self.workspace_adapter.stage_all(worktree_info.path)
 
-            # 6. Get patch
-            patch = await self.workspace_adapter.get_diff(worktree_info.path, staged=True)
+            # 6. Capture the per-run delta (staged changes against the previous commit)
+            capture = await self.workspace_adapter.capture_diff(worktree_info.path, staged=True)
+            patch = capture.patch
 
             # Skip commit/push if no changes
-            if not patch.strip():
+            if not capture.files:
                 logs.append("No changes detected, skipping commit/push")
                 await self.run_dao.update_status(
                     run.id,
@@ -815,18 +1032,24 @@ class RunService(BaseRoleService[Run, RunCreate, ImplementationResult]):
                     files_changed=[],
                     logs=logs + result.logs,
                     session_id=result.session_id or resume_session_id,
+                    resource_usage=result.resource_usage,
+                    execution_stats=result.stats,
                 )
                 return
 
-            # Parse diff to get file changes
-            files_changed = parse_unified_diff(patch)
+            files_changed = capture.files
             logs.append(f"Detected {len(files_changed)} changed file(s)")
+            if capture.truncated:
+                logs.append("Diff too large: stored patch truncated (file stats are complete)")
 
             # Determine final summary (priority: file > CLI output > generated)
             final_summary = (
                 summary_from_file or result.summary or self._generate_summary(files_changed)
             )
 
+            if cache_key is not None and not from_cache and not capture.truncated:
+                await self._store_cached_result(cache_key, worktree_info.path, final_summary, logs)
+
             # 7. Commit (automatic, use appropriate service)
             commit_message = self._generate_commit_message(run.instruction, final_summary)
             commit_message = await ensure_english_commit_message(
@@ -867,11 +1090,14 @@ class RunService(BaseRoleService[Run, RunCreate, ImplementationResult]):
                 RunStatus.SUCCEEDED,
                 summary=final_summary,
                 patch=patch,
+                patch_truncated=capture.truncated,
                 files_changed=files_changed,
                 logs=logs + result.logs,
                 warnings=result.warnings,
                 session_id=result.session_id or resume_session_id,
                 commit_sha=commit_sha,
+                resource_usage=result.resource_usage,
+                execution_stats=result.stats,
             )
 
         except asyncio.CancelledError:
@@ -901,6 +1127,170 @@ class RunService(BaseRoleService[Run, RunCreate, ImplementationResult]):
             if self.output_manager:
                 await self.output_manager.mark_complete(run.id)
 
+    async def _execute_with_session_fallback(
+        self,
+        run: Run,
+        executor: BaseExecutor,
+        worktree_path: Path,
+        instruction: str,
+        resume_session_id: str | None,
+        repo_id: str | None,
+        logs: builtins.list[str],
+    ) -> ExecutorResult:
+        """Execute the CLI, retrying once without the session if it is rejected.
+
+        Args:
+            run: Run object.
+            executor: CLI executor instance.
+            worktree_path: Path to the workspace.
+            instruction: Instruction including the agent constraints.
+            resume_session_id: Session ID to continue, if any.
+            repo_id: Repository ID, for the per-repository executor limit.
+            logs: Log list to append to.
+
+        Returns:
+            Result of the last attempt.
+        """
+        logger.info(f"[{run.id[:8]}] Executing CLI...")
+        await self._log_output(run.id, f"Launching {executor.display_name} CLI...")
+        # We proactively attempt to resume conversations via session_id when available.
+        # If the CLI rejects the session (e.g., "already in use"), we retry once without it.
+        result = await executor.execute(
+            worktree_path=worktree_path,
+            instruction=instruction,
+            on_output=lambda line: self._log_output(run.id, line),
+            on_event=lambda event, message: self._log_event(run.id, event, message),
+            resume_session_id=resume_session_id,
+            repo=repo_id,
+            session_key=run.task_id,
+        )
+        # Session error patterns that should trigger a retry without session continuation
+        session_error_patterns = [
+            "already in use",
+            "in use",
+            "no conversation found",
+            "not found",
+            "invalid session",
+            "session expired",
+        ]
+        error_lower = result.error.lower() if result.error else ""
+        if (
+            not result.success
+            and resume_session_id
+            and result.error
+            and ("session" in error_lower)
+            and any(pattern in error_lower for pattern in session_error_patterns)
+        ):
+            # Retry once without session continuation if the CLI rejects the session.
+            logs.append(
+                f"Session continuation failed ({result.error}). Retrying without session_id."
+            )
+            rejected_usage = result.resource_usage
+            result = await executor.execute(
+                worktree_path=worktree_path,
+                instruction=instruction,
+                on_output=lambda line: self._log_output(run.id, line),
+                on_event=lambda event, message: self._log_event(run.id, event, message),
+                resume_session_id=None,
+                repo=repo_id,
+                session_key=run.task_id,
+            )
+            result.resource_usage = merge_usage(rejected_usage, result.resource_usage)
+        logger.info(f"[{run.id[:8]}] CLI execution completed: success={result.success}")
+        return result
+
+    async def _result_cache_key(
+        self,
+        executor: BaseExecutor,
+        worktree_path: Path,
+        instruction: str,
+        *,
+        repo_id: str | None,
+        resume_session_id: str | None,
+        workspace_clean: bool,
+    ) -> ResultCacheKey | None:
+        """Key of the run in the executor result cache, if the run is cacheable.
+
+        A run is cacheable when the cache is enabled, the workspace has no
+        uncommitted changes (so its content is exactly the tree at HEAD) and
+        the run starts a new CLI conversation: a resumed conversation depends
+        on earlier turns that are not part of the key. The model is the one
+        the CLI runs with (configured, or the default of the CLI version).
+        """
+        if (
+            self.result_cache is None
+            or not settings.executor_result_cache_enabled
+            or repo_id is None
+            or resume_session_id
+            or not workspace_clean
+        ):
+            return None
+        tree_hash = await self.git_service.get_tree_hash(worktree_path)
+        model = await executor.model_identity()
+        if tree_hash is None or model is None:
+            return None
+        return ResultCacheKey(
+            repo_id=repo_id,
+            tree_hash=tree_hash,
+            instruction=instruction,
+            executor_type=executor.executor_type,
+            model=model,
+        )
+
+    async def _apply_cached_result(
+        self,
+        run: Run,
+        key: ResultCacheKey,
+        worktree_path: Path,
+        logs: builtins.list[str],
+    ) -> ExecutorResult | None:
+        """Apply the cached patch of an identical earlier run.
+
+        Returns:
+            A successful ExecutorResult, or None on a cache miss or if the
+            cached patch does not apply.
+        """
+        assert self.result_cache is not None
+        cached = await self.result_cache.get(key)
+        if cached is None:
+            return None
+        try:
+            await self.git_service.apply_patch(worktree_path, cached.patch)
+        except Exception as e:
+            logger.warning(f"[{run.id[:8]}] Cached result did not apply: {e}")
+            logs.append("Cached result did not apply, running the CLI")
+            await self.result_cache.invalidate(key)
+            return None
+
+        message = f"Reused the result of an identical earlier run (tree {key.tree_hash[:12]})"
+        logger.info(f"[{run.id[:8]}] {message}")
+        logs.append(message)
+        await self._log_output(run.id, message)
+        return ExecutorResult(
+            success=True,
+            summary=cached.summary or "",
+            patch="",
+            files_changed=[],
+            logs=[],
+        )
+
+    async def _store_cached_result(
+        self,
+        key: ResultCacheKey,
+        worktree_path: Path,
+        summary: str | None,
+        logs: builtins.list[str],
+    ) -> None:
+        """Store the staged changes of a successful run in the result cache."""
+        assert self.result_cache is not None
+        try:
+            patch = await self.git_service.get_staged_patch(worktree_path)
+        except Exception as e:
+            logger.warning(f"Failed to read staged patch for the result cache: {e}")
+            return
+        if await self.result_cache.put(key, patch, summary):
+            logs.append("Stored result in the executor result cache")
+
     async def _read_and_remove_summary_file(
         self,
         worktree_path: Path,
@@ -959,6 +1349,18 @@ class RunService(BaseRoleService[Run, RunCreate, ImplementationResult]):
         else:
             logger.warning(f"[{run_id[:8]}] OutputManager not available, cannot publish")
 
+    async def _log_event(self, run_id: str, event: str, message: str) -> None:
+        """Publish a CLI process event (e.g. "stalled") to OutputManager.
+
+        Args:
+            run_id: Run ID.
+            event: Event name.
+            message: Human-readable description.
+        """
+        logger.warning(f"[{run_id[:8]}] CLI {event}: {message}")
+        if self.output_manager:
+            await self.output_manager.publish_async(run_id, f"[{event}] {message}", event=event)
+
     def _generate_commit_message(self, instruction: str, summary: str | None) -> str:
         """Generate a commit message from instruction and summary.
 
@@ -1018,9 +1420,10 @@ After resolving ALL conflicts, proceed with the original task below.
         run: Run,
         worktree_path: Path,
         conflict_files: builtins.list[str],
-        executor: ClaudeCodeExecutor | CodexExecutor | GeminiExecutor,
+        executor: BaseExecutor,
         executor_name: str,
         logs: builtins.list[str],
+        repo_id: str | None = None,
     ) -> None:
         """Resolve merge conflicts before proceeding with the main task.
 
@@ -1031,6 +1434,7 @@ After resolving ALL conflicts, proceed with the original task below.
             executor: CLI executor instance.
             executor_name: Human-readable executor name for logs.
             logs: Log list to append to.
+            repo_id: Repository ID, for the per-repository executor limit.
         """
         conflict_instruction = self._build_conflict_resolution_instruction(conflict_files)
         constraints = AgentConstraints()
@@ -1048,7 +1452,9 @@ After resolving ALL conflicts, proceed with the original task below.
             worktree_path=worktree_path,
             instruction=instruction,
             on_output=lambda line: self._log_output(run.id, line),
+            on_event=lambda event, message: self._log_event(run.id, event, message),
             resume_session_id=None,
+            repo=repo_id,
         )
 
         logs.extend(result.logs)
@@ -3,16 +3,20 @@
 This module handles workspace lifecycle for run execution, including:
 - Reusing existing workspaces when valid
 - Restoring workspaces from remote branches when local workspace is invalid
-- Creating new workspaces when needed
+- Creating new workspaces when needed, forked from a shared seed clone per
+  (repo, base branch) so that concurrent runs fetch the remote only once
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from zloth_api.config import settings
 from zloth_api.services.workspace_adapters import ExecutionWorkspaceInfo, WorkspaceAdapter
 from zloth_api.storage.dao import RunDAO, UserPreferencesDAO
 from zloth_api.utils.github_url import parse_github_owner_repo
@@ -36,6 +40,9 @@ class RunWorkspaceManager:
         self.git_service = git_service
         self.user_preferences_dao = user_preferences_dao
         self.github_service = github_service
+        # Seed clones per (repo_id, base_ref): path and monotonic time of last fetch
+        self._seeds: dict[tuple[str, str], tuple[Path, float]] = {}
+        self._seed_locks: dict[tuple[str, str], asyncio.Lock] = {}
 
     async def get_reusable_workspace(
         self,
@@ -78,6 +85,7 @@ class RunWorkspaceManager:
         repo: Any,
         base_ref: str,
         run_id: str,
+        sparse_paths: list[str] | None = None,
     ) -> ExecutionWorkspaceInfo:
         """Get existing workspace, restore from branch, or create new.
 
@@ -91,6 +99,7 @@ class RunWorkspaceManager:
             repo: Repository object.
             base_ref: Base branch for the run.
             run_id: ID of the new run.
+            sparse_paths: Optional sparse checkout profile for new workspaces.
 
         Returns:
             ExecutionWorkspaceInfo for the workspace.
@@ -121,6 +130,7 @@ class RunWorkspaceManager:
                     base_branch=base_ref,
                     run_id=run_id,
                     auth_url=auth_url,
+                    sparse_paths=sparse_paths,
                 )
                 logger.info(
                     f"Successfully restored workspace from branch '{existing_run.working_branch}'"
@@ -134,7 +144,7 @@ class RunWorkspaceManager:
                 )
 
         # 3. Create new workspace
-        return await self.create_workspace(run_id, repo, base_ref)
+        return await self.create_workspace(run_id, repo, base_ref, sparse_paths=sparse_paths)
 
     async def restore_workspace(
         self,
@@ -144,6 +154,7 @@ class RunWorkspaceManager:
         base_ref: str,
         run_id: str,
         workspace_path: Path,
+        sparse_paths: list[str] | None = None,
     ) -> ExecutionWorkspaceInfo:
         """Restore workspace from an existing branch at a fixed path."""
         auth_url: str | None = None
@@ -161,15 +172,62 @@ class RunWorkspaceManager:
             run_id=run_id,
             auth_url=auth_url,
             workspace_path=workspace_path,
+            sparse_paths=sparse_paths,
         )
 
+    async def prepare_base(
+        self,
+        repo: Any,
+        base_ref: str,
+        auth_url: str | None = None,
+    ) -> Path | None:
+        """Fetch the base branch once into a seed clone shared by concurrent runs.
+
+        Concurrent callers for the same (repo, base_ref) wait on a single
+        fetch; a seed fetched within ``workspace_seed_ttl_seconds`` is reused
+        as is.
+
+        Returns:
+            Path to the seed clone, or None when seeds are disabled or the
+            seed could not be prepared (callers then clone from the remote).
+        """
+        if not settings.workspace_seed_clones or not getattr(repo, "id", None):
+            return None
+
+        key = (repo.id, base_ref)
+        lock = self._seed_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            cached = self._seeds.get(key)
+            if (
+                cached
+                and time.monotonic() - cached[1] < settings.workspace_seed_ttl_seconds
+                and cached[0].exists()
+            ):
+                return cached[0]
+            try:
+                seed_path = await self.workspace_adapter.prepare_seed(
+                    repo=repo, base_branch=base_ref, auth_url=auth_url
+                )
+            except Exception as e:
+                logger.warning(f"Could not prepare seed for {base_ref}, cloning directly: {e}")
+                self._seeds.pop(key, None)
+                return None
+            if seed_path:
+                self._seeds[key] = (seed_path, time.monotonic())
+            return seed_path
+
     async def create_workspace(
         self,
         run_id: str,
         repo: Any,
         base_ref: str,
+        sparse_paths: list[str] | None = None,
     ) -> ExecutionWorkspaceInfo:
-        """Create a new workspace for a run."""
+        """Create a new workspace for a run.
+
+        Non-sparse, full-clone workspaces are forked from the shared seed of
+        (repo, base_ref) when available, falling back to a remote clone.
+        """
         branch_prefix: str | None = None
         if self.user_preferences_dao:
             prefs = await self.user_preferences_dao.get()
@@ -183,6 +241,22 @@ class RunWorkspaceManager:
             except Exception as e:
                 logger.warning(f"Could not get auth_url for workspace creation: {e}")
 
+        if not sparse_paths and not settings.workspace_partial_clone:
+            seed_path = await self.prepare_base(repo, base_ref, auth_url)
+            if seed_path:
+                logger.info(f"Creating execution workspace for run {run_id[:8]} from seed")
+                try:
+                    return await self.workspace_adapter.create(
+                        repo=repo,
+                        base_branch=base_ref,
+                        run_id=run_id,
+                        branch_prefix=branch_prefix,
+                        auth_url=auth_url,
+                        seed_path=seed_path,
+                    )
+                except Exception as e:
+                    logger.warning(f"Forking from seed failed, cloning from remote: {e}")
+
         logger.info(f"Creating execution workspace for run {run_id[:8]}")
         return await self.workspace_adapter.create(
             repo=repo,
@@ -190,6 +264,7 @@ class RunWorkspaceManager:
             run_id=run_id,
             branch_prefix=branch_prefix,
             auth_url=auth_url,
+            sparse_paths=sparse_paths,
         )
 
     async def update_run_workspace(
@@ -0,0 +1,190 @@
+"""Sparse checkout helpers shared by clone and worktree isolation.
+
+Large monorepos only need a few directories materialized for a typical run.
+These helpers implement cone-mode sparse checkout profiles:
+
+- Normalizing a mix of file and directory paths into cone directories
+- Applying a profile to a freshly created (``--no-checkout``) repository
+- Lazily hydrating directories the agent touched outside the sparse set
+
+The functions operating on ``git.Repo`` are synchronous and are meant to be
+called from within ``run_in_executor`` blocks in WorkspaceService/GitService.
+"""
+
+from __future__ import annotations
+
+import logging
+import posixpath
+from collections.abc import Iterable
+
+import git
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_sparse_paths(paths: Iterable[str]) -> list[str]:
+    """Normalize paths into a minimal, sorted list of cone directories.
+
+    Cone mode only accepts directories. File paths (anything whose last
+    component has an extension, e.g. ``services/api/main.py``) are converted
+    to their parent directory; dot-directories such as ``.github`` are kept.
+    Top-level files are dropped because cone mode always includes files at
+    the repository root. Directories nested under another listed directory
+    are removed as redundant.
+
+    Args:
+        paths: File or directory paths relative to the repository root.
+
+    Returns:
+        Sorted list of directories (without leading/trailing slashes).
+    """
+    dirs: set[str] = set()
+    for raw in paths:
+        path = raw.strip().replace("\\", "/").strip("/")
+        if not path or path.startswith("..") or "*" in path:
+            continue
+        path = posixpath.normpath(path)
+        if path in (".", ""):
+            continue
+        if "." in posixpath.basename(path).lstrip("."):
+            path = posixpath.dirname(path)
+        if path:
+            dirs.add(path)
+
+    result: list[str] = []
+    for directory in sorted(dirs):
+        if any(directory.startswith(f"{parent}/") for parent in result):
+            continue
+        result.append(directory)
+    return result
+
+
+def is_in_sparse_cone(path: str, cone_dirs: list[str]) -> bool:
+    """Check whether a file path is materialized by a cone-mode profile.
+
+    Cone mode includes every file at the repository root, every file below a
+    listed directory, and the immediate files of each listed directory's
+    ancestors.
+
+    Args:
+        path: File path relative to the repository root.
+        cone_dirs: Directories of the sparse profile.
+
+    Returns:
+        True if the file is inside the sparse cone.
+    """
+    parent = posixpath.dirname(path.strip("/"))
+    if not parent:
+        return True
+    for directory in cone_dirs:
+        if parent == directory or parent.startswith(f"{directory}/"):
+            return True
+        if directory.startswith(f"{parent}/"):
+            return True
+    return False
+
+
+def get_sparse_dirs(repo: git.Repo) -> list[str] | None:
+    """Return the cone directories of a repository, or None if not sparse."""
+    try:
+        enabled = repo.git.config("--get", "core.sparseCheckout").strip()
+    except git.GitCommandError:
+        return None
+    if enabled != "true":
+        return None
+    try:
+        output = repo.git.sparse_checkout("list")
+    except git.GitCommandError:
+        return None
+    return [line.strip() for line in output.splitlines() if line.strip()]
+
+
+def apply_sparse_checkout(repo: git.Repo, cone_dirs: list[str], ref: str) -> None:
+    """Apply a cone-mode profile to a repository cloned with ``--no-checkout``.
+
+    Args:
+        repo: Repository (clone or worktree) without a populated working tree.
+        cone_dirs: Normalized directories to materialize.
+        ref: Branch or commit to check out after the profile is set.
+    """
+    repo.git.sparse_checkout("set", "--cone", *cone_dirs)
+    repo.git.checkout(ref)
+    logger.info(f"Applied sparse checkout ({len(cone_dirs)} dirs) at {repo.working_dir}")
+
+
+def hydrate_sparse_paths(repo: git.Repo, paths: Iterable[str]) -> list[str]:
+    """Add directories to an existing sparse checkout.
+
+    Blobs for newly included directories are fetched on demand from the
+    promisor remote when the workspace is a partial clone, so callers should
+    temporarily point ``origin`` at an authenticated URL for private repos.
+
+    Args:
+        repo: Sparse repository.
+        paths: File or directory paths that must be materialized.
+
+    Returns:
+        Directories that were added to the profile (empty if none).
+    """
+    cone_dirs = get_sparse_dirs(repo)
+    if cone_dirs is None:
+        return []
+
+    missing = [
+        d
+        for d in normalize_sparse_paths(paths)
+        if not any(d == c or d.startswith(f"{c}/") for c in cone_dirs)
+    ]
+    if not missing:
+        return []
+
+    repo.git.sparse_checkout("add", *missing)
+    logger.info(f"Hydrated sparse checkout with: {', '.join(missing)}")
+    return missing
+
+
+def find_paths_outside_cone(repo: git.Repo) -> list[str]:
+    """List untracked files that ``git add -A`` would skip in a sparse checkout.
+
+    Git silently ignores new files outside the sparse-checkout definition when
+    staging, so an agent creating e.g. ``services/other/new.py`` would lose its
+    change unless the directory is hydrated first.
+
+    Args:
+        repo: Repository to inspect.
+
+    Returns:
+        Untracked file paths outside the sparse cone (empty if not sparse).
+    """
+    cone_dirs = get_sparse_dirs(repo)
+    if cone_dirs is None:
+        return []
+
+    output = repo.git.ls_files("--others", "--exclude-standard", "-z")
+    untracked = [p for p in output.split("\0") if p]
+    return [p for p in untracked if not is_in_sparse_cone(p, cone_dirs)]
+
+
+def hydrate_untracked_outside_cone(repo: git.Repo) -> list[str]:
+    """Hydrate the parent directories of untracked files outside the cone.
+
+    Args:
+        repo: Repository to inspect.
+
+    Returns:
+        Directories that were added to the profile (empty if none).
+    """
+    outside = find_paths_outside_cone(repo)
+    if not outside:
+        return []
+    parents = {posixpath.dirname(p) for p in outside}
+    dirs = [p for p in parents if p]
+    if not dirs:
+        return []
+
+    cone_dirs = get_sparse_dirs(repo) or []
+    missing = sorted(d for d in dirs if not any(d == c or d.startswith(f"{c}/") for c in cone_dirs))
+    if missing:
+        repo.git.sparse_checkout("add", *missing)
+        logger.info(f"Hydrated sparse checkout for new files in: {', '.join(missing)}")
+    return missing
@@ -0,0 +1,314 @@
+"""Speculative coding runs: several executors race, the first acceptable result wins.
+
+A coding instruction is started on several executors at once (or on the same
+executor several times), each in its own workspace. Every run is evaluated as
+soon as it finishes:
+
+1. the run succeeded and changed at least one file,
+2. the configured check command (e.g. tests and lint) passes in its workspace,
+3. optionally, a fast review scores at least the minimum review score.
+
+The first run that meets all criteria wins: it becomes the task's workspace
+and the remaining runs are cancelled. Extra compute is traded for lower tail
+latency when one agent gets stuck.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import signal
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from zloth_api.config import settings
+from zloth_api.domain.enums import ExecutorType, ReviewStatus, RunStatus
+from zloth_api.domain.models import ReviewCreate, Run, RunCreate
+
+if TYPE_CHECKING:
+    from zloth_api.services.review_service import ReviewService
+    from zloth_api.services.run_service import RunService
+    from zloth_api.storage.dao import TaskDAO
+
+logger = logging.getLogger(__name__)
+
+# Characters of check command output kept in a rejection reason
+CHECK_OUTPUT_TAIL_CHARS = 2000
+
+# Runs and reviews share the role execution status lifecycle
+TERMINAL_STATUSES = frozenset({RunStatus.SUCCEEDED, RunStatus.FAILED, RunStatus.CANCELED})
+
+
+@dataclass
+class CandidateResult:
+    """Evaluation of one speculative run."""
+
+    run: Run
+    accepted: bool
+    reason: str = ""
+
+
+@dataclass
+class SpeculationResult:
+    """Outcome of a speculative coding round."""
+
+    winner: Run | None = None
+    candidates: list[CandidateResult] = field(default_factory=list)
+    cancelled_run_ids: list[str] = field(default_factory=list)
+
+    @property
+    def error(self) -> str:
+        """Why no run was accepted."""
+        reasons = [
+            f"{c.run.executor_type.value} ({c.run.id[:8]}): {c.reason}"
+            for c in self.candidates
+            if not c.accepted
+        ]
+        return "No speculative run was acceptable: " + "; ".join(reasons or ["no runs"])
+
+
+async def run_check_command(command: str, cwd: Path, timeout_seconds: int) -> tuple[bool, str]:
+    """Run an acceptance check (e.g. ``make test lint``) in a workspace.
+
+    Args:
+        command: Shell command; exit code 0 means the check passed.
+        cwd: Workspace to run it in.
+        timeout_seconds: Time after which the check is killed and fails.
+
+    Returns:
+        Tuple of (passed, combined stdout/stderr).
+    """
+    process = await asyncio.create_subprocess_shell(
+        command,
+        cwd=str(cwd),
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+        start_new_session=True,  # Own process group, so the whole check can be killed
+    )
+    try:
+        stdout, _ = await asyncio.wait_for(process.communicate(), timeout=timeout_seconds)
+    except (TimeoutError, asyncio.CancelledError) as e:
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        await process.wait()
+        if isinstance(e, asyncio.CancelledError):
+            raise
+        return False, f"Check timed out after {timeout_seconds} seconds"
+    output = stdout.decode("utf-8", errors="replace")
+    return process.returncode == 0, output
+
+
+class SpeculativeRunner:
+    """Races coding runs on several executors and keeps the first acceptable one."""
+
+    def __init__(
+        self,
+        run_service: RunService,
+        review_service: ReviewService,
+        task_dao: TaskDAO,
+        *,
+        check_command: str | None = None,
+        check_timeout_seconds: int | None = None,
+        poll_interval: float = 5.0,
+        run_timeout: float = 1800.0,
+        review_timeout: float = 600.0,
+    ):
+        """Initialize the runner.
+
+        Args:
+            run_service: Service that creates, executes and cancels runs.
+            review_service: Service for the optional fast review.
+            task_dao: Task DAO (to fix the winner's workspace on the task).
+            check_command: Acceptance check command. Defaults to settings.
+            check_timeout_seconds: Timeout of the check command. Defaults to settings.
+            poll_interval: Seconds between run/review status polls.
+            run_timeout: Seconds to wait for a run to finish.
+            review_timeout: Seconds to wait for a review to finish.
+        """
+        self.run_service = run_service
+        self.review_service = review_service
+        self.task_dao = task_dao
+        self.check_command = (
+            check_command
+            if check_command is not None
+            else settings.agentic_speculative_check_command
+        )
+        self.check_timeout_seconds = (
+            check_timeout_seconds
+            if check_timeout_seconds is not None
+            else settings.agentic_speculative_check_timeout_seconds
+        )
+        self.poll_interval = poll_interval
+        self.run_timeout = run_timeout
+        self.review_timeout = review_timeout
+
+    async def can_speculate(self, task_id: str, executor_types: list[ExecutorType]) -> bool:
+        """Whether the runs can get a workspace each.
+
+        A task whose workspace is already fixed (e.g. by an earlier run), or
+        shared workspaces, would make the runs edit the same files.
+        """
+        if len(executor_types) < 2 or settings.share_workspace_across_executors:
+            return False
+        task = await self.task_dao.get(task_id)
+        return task is not None and not (task.workspace_path and task.working_branch)
+
+    async def run(
+        self,
+        task_id: str,
+        instruction: str,
+        executor_types: list[ExecutorType],
+        *,
+        review: bool = False,
+        min_review_score: float = 0.0,
+    ) -> SpeculationResult:
+        """Start one run per executor type and keep the first acceptable one.
+
+        Args:
+            task_id: Task ID (must not have a fixed workspace yet).
+            instruction: Coding instruction.
+            executor_types: Executors to race; a type may be repeated.
+            review: Also require a fast review with at least min_review_score.
+            min_review_score: Minimum review score (0.0-1.0).
+
+        Returns:
+            SpeculationResult with the winner (None if no run was acceptable).
+        """
+        runs = await self.run_service.create_runs(
+            task_id, RunCreate(instruction=instruction, executor_types=executor_types)
+        )
+        logger.info(
+            f"Speculative coding for task {task_id[:8]}: "
+            f"{', '.join(r.executor_type.value for r in runs)}"
+        )
+        result = SpeculationResult()
+        # Fast reviews by run ID; losing ones keep running unless cancelled
+        reviews: dict[str, str] = {}
+        evaluations = {
+            asyncio.create_task(self._evaluate(run, review, min_review_score, reviews)): run
+            for run in runs
+        }
+        try:
+            while evaluations and result.winner is None:
+                done, _ = await asyncio.wait(evaluations, return_when=asyncio.FIRST_COMPLETED)
+                for evaluation in done:
+                    del evaluations[evaluation]
+                    candidate = evaluation.result()
+                    result.candidates.append(candidate)
+                    if candidate.accepted and result.winner is None:
+                        result.winner = candidate.run
+                    elif not candidate.accepted:
+                        logger.info(
+                            f"Speculative run {candidate.run.id[:8]} rejected: {candidate.reason}"
+                        )
+        finally:
+            for evaluation in evaluations:
+                evaluation.cancel()
+            await asyncio.gather(*evaluations, return_exceptions=True)
+            winner_id = result.winner.id if result.winner else None
+            await self._cancel_reviews(
+                [review_id for run_id, review_id in reviews.items() if run_id != winner_id]
+            )
+
+        if result.winner is not None:
+            await self._settle(task_id, result, runs)
+        return result
+
+    async def _evaluate(
+        self, run: Run, review: bool, min_review_score: float, reviews: dict[str, str]
+    ) -> CandidateResult:
+        """Wait for a run and check it against the acceptance criteria.
+
+        The ID of a fast review is recorded in ``reviews`` under the run's ID.
+        """
+        try:
+            run = await self._wait_for_run(run.id)
+            if run.status != RunStatus.SUCCEEDED:
+                return CandidateResult(run, False, f"run {run.status.value}: {run.error or ''}")
+            if not run.files_changed:
+                return CandidateResult(run, False, "no changes")
+            if self.check_command and run.worktree_path:
+                passed, output = await run_check_command(
+                    self.check_command, Path(run.worktree_path), self.check_timeout_seconds
+                )
+                if not passed:
+                    tail = output[-CHECK_OUTPUT_TAIL_CHARS:]
+                    return CandidateResult(run, False, f"check failed:\n{tail}")
+            if review:
+                score = await self._review_score(run, reviews)
+                if score < min_review_score:
+                    return CandidateResult(
+                        run, False, f"review score {score:.2f} < {min_review_score:.2f}"
+                    )
+            return CandidateResult(run, True)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            return CandidateResult(run, False, str(e))
+
+    async def _review_score(self, run: Run, reviews: dict[str, str]) -> float:
+        """Review a run and return its overall score (0.0 if the review failed)."""
+        created = await self.review_service.create_review(
+            run.task_id,
+            ReviewCreate(target_run_ids=[run.id], executor_type=ExecutorType.CODEX_CLI),
+        )
+        reviews[run.id] = created.id
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.review_timeout
+        while True:
+            review = await self.review_service.get(created.id)
+            if review and review.status in TERMINAL_STATUSES:
+                if review.status != ReviewStatus.SUCCEEDED:
+                    return 0.0
+                return review.overall_score or 0.0
+            if loop.time() > deadline:
+                raise TimeoutError(f"Review {created.id} timed out after {self.review_timeout}s")
+            await asyncio.sleep(self.poll_interval)
+
+    async def _cancel_reviews(self, review_ids: list[str]) -> None:
+        """Cancel fast reviews that are no longer needed (finished ones are left as is)."""
+        for review_id in review_ids:
+            try:
+                await self.review_service.cancel_review(review_id)
+            except Exception as e:
+                logger.warning(f"Failed to cancel speculative review {review_id[:8]}: {e}")
+
+    async def _wait_for_run(self, run_id: str) -> Run:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.run_timeout
+        while True:
+            run = await self.run_service.get(run_id)
+            if run and run.status in TERMINAL_STATUSES:
+                return run
+            if loop.time() > deadline:
+                raise TimeoutError(f"Run {run_id} timed out after {self.run_timeout}s")
+            await asyncio.sleep(self.poll_interval)
+
+    async def _settle(self, task_id: str, result: SpeculationResult, runs: list[Run]) -> None:
+        """Fix the winner's workspace on the task and cancel or clean up the others."""
+        winner = result.winner
+        assert winner is not None
+        if winner.worktree_path and winner.working_branch:
+            await self.task_dao.update_workspace(
+                task_id, workspace_path=winner.worktree_path, working_branch=winner.working_branch
+            )
+        for run in runs:
+            if run.id == winner.id:
+                continue
+            try:
+                if await self.run_service.cancel(run.id):
+                    result.cancelled_run_ids.append(run.id)
+                else:
+                    # Already finished; its workspace is not the task's
+                    await self.run_service.cleanup_workspace(run.id)
+            except Exception as e:
+                logger.warning(f"Failed to stop speculative run {run.id[:8]}: {e}")
+        logger.info(
+            f"Speculative run {winner.id[:8]} ({winner.executor_type.value}) accepted for task "
+            f"{task_id[:8]}; cancelled {len(result.cancelled_run_ids)} other run(s)"
+        )
@@ -0,0 +1,191 @@
+"""GitHub webhook ingestion.
+
+Verified deliveries are written to the ``webhook_deliveries`` inbox before
+they are acknowledged, deduplicated by ``X-GitHub-Delivery`` (GitHub
+redelivers on timeouts and manual retries). Processing happens in the
+background and fans each event out to the services that would otherwise
+learn about it by polling:
+
+- ``check_suite`` / ``check_run`` / ``status``: the CI watcher checks the
+  affected PRs right away, which dispatches completion to the agentic
+  orchestrator; pending CI check records of those PRs are refreshed.
+- ``pull_request``: merged/closed PRs are applied by the PR status poller;
+  new pushes (``synchronize``) restart CI watching.
+- ``push``: open PRs of the pushed branch restart CI watching.
+
+Deliveries that were stored but not processed (e.g. the server stopped)
+are replayed on startup.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from datetime import datetime, timedelta
+from typing import Any
+
+from zloth_api.config import settings
+from zloth_api.domain.models import WebhookIngestResponse
+from zloth_api.services.ci_check_service import CICheckService
+from zloth_api.services.ci_polling_service import CIPollingService
+from zloth_api.services.pr_status_poller import PRStatusPoller
+from zloth_api.storage.dao import PRDAO, CICheckDAO, WebhookDeliveryDAO
+
+logger = logging.getLogger(__name__)
+
+# Events that are stored and processed; others are acknowledged and dropped
+SUPPORTED_EVENTS = frozenset({"check_suite", "check_run", "status", "pull_request", "push"})
+
+
+class WebhookService:
+    """Stores GitHub webhook deliveries and fans them out to CI/PR services."""
+
+    def __init__(
+        self,
+        delivery_dao: WebhookDeliveryDAO,
+        pr_dao: PRDAO,
+        ci_check_dao: CICheckDAO,
+        ci_polling_service: CIPollingService,
+        pr_status_poller: PRStatusPoller,
+        ci_check_service: CICheckService,
+    ):
+        """Initialize the webhook service.
+
+        Args:
+            delivery_dao: Webhook delivery inbox DAO.
+            pr_dao: PR DAO.
+            ci_check_dao: CICheck DAO.
+            ci_polling_service: CI watcher (agentic CI completion).
+            pr_status_poller: PR status poller (merged/closed PRs).
+            ci_check_service: CI check service (CI check records).
+        """
+        self.delivery_dao = delivery_dao
+        self.pr_dao = pr_dao
+        self.ci_check_dao = ci_check_dao
+        self.ci_poller = ci_polling_service
+        self.pr_status_poller = pr_status_poller
+        self.ci_check_service = ci_check_service
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def ingest(self, delivery_id: str, event: str, body: bytes) -> WebhookIngestResponse:
+        """Store a verified delivery and schedule its processing.
+
+        Args:
+            delivery_id: X-GitHub-Delivery header.
+            event: X-GitHub-Event header.
+            body: Raw (signature-verified) request body.
+
+        Returns:
+            Whether the delivery was accepted, a duplicate or ignored.
+
+        Raises:
+            ValueError: If the body is not a JSON object.
+        """
+        if event not in SUPPORTED_EVENTS:
+            return WebhookIngestResponse(status="ignored", event=event, delivery_id=delivery_id)
+
+        payload = json.loads(body)
+        if not isinstance(payload, dict):
+            raise ValueError("Webhook payload must be a JSON object")
+
+        is_new = await self.delivery_dao.create_if_absent(
+            delivery_id, event, payload.get("action"), body.decode("utf-8")
+        )
+        if not is_new:
+            logger.info(f"Ignoring duplicate webhook delivery {delivery_id} ({event})")
+            return WebhookIngestResponse(status="duplicate", event=event, delivery_id=delivery_id)
+
+        task = asyncio.create_task(self.process(delivery_id))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return WebhookIngestResponse(status="accepted", event=event, delivery_id=delivery_id)
+
+    async def process(self, delivery_id: str) -> None:
+        """Process a stored delivery and record the outcome."""
+        delivery = await self.delivery_dao.get(delivery_id)
+        if delivery is None or delivery.status != "received":
+            return
+        try:
+            await self.dispatch(delivery.event, json.loads(delivery.payload))
+        except Exception as e:
+            logger.exception(f"Failed to process webhook delivery {delivery_id}")
+            await self.delivery_dao.mark(delivery_id, "failed", str(e))
+            return
+        await self.delivery_dao.mark(delivery_id, "processed")
+
+    async def replay_pending(self) -> int:
+        """Process deliveries left unprocessed and prune old ones (startup).
+
+        Returns:
+            Number of replayed deliveries.
+        """
+        cutoff = datetime.utcnow() - timedelta(days=settings.webhook_retention_days)
+        await self.delivery_dao.delete_before(cutoff)
+        pending = await self.delivery_dao.list_unprocessed()
+        for delivery in pending:
+            await self.process(delivery.delivery_id)
+        if pending:
+            logger.info(f"Replayed {len(pending)} unprocessed webhook deliveries")
+        return len(pending)
+
+    async def drain(self) -> None:
+        """Wait for in-flight deliveries to be processed."""
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def dispatch(self, event: str, payload: dict[str, Any]) -> None:
+        """Fan an event out to the interested services.
+
+        Args:
+            event: GitHub event name.
+            payload: Parsed event payload.
+        """
+        repository = payload.get("repository") or {}
+        repo_full_name = repository.get("full_name")
+        repo_html_url = repository.get("html_url")
+        if not repo_full_name or not repo_html_url:
+            return
+        action = payload.get("action")
+
+        if event in ("check_suite", "check_run"):
+            item = payload.get(event) or {}
+            pr_numbers = [pr["number"] for pr in item.get("pull_requests") or []]
+            self.ci_poller.notify_event(
+                repo_full_name, pr_numbers=pr_numbers, head_sha=item.get("head_sha")
+            )
+            if action == "completed":
+                await self._refresh_ci_checks(repo_html_url, pr_numbers)
+
+        elif event == "status":
+            # Commit statuses only carry the SHA; the watcher maps it to PRs
+            if payload.get("state") != "pending":
+                self.ci_poller.notify_event(repo_full_name, head_sha=payload.get("sha"))
+
+        elif event == "pull_request":
+            pr = payload.get("pull_request") or {}
+            if action == "closed":
+                await self.pr_status_poller.apply_event(
+                    pr.get("html_url", ""), "closed", bool(pr.get("merged"))
+                )
+            elif action == "synchronize":
+                self.ci_poller.notify_event(repo_full_name, pr_numbers=[int(pr.get("number", 0))])
+
+        elif event == "push":
+            ref = payload.get("ref", "")
+            if not ref.startswith("refs/heads/") or payload.get("deleted"):
+                return
+            branch = ref.removeprefix("refs/heads/")
+            prs = await self.pr_dao.list_open_by_branch(repo_html_url, branch)
+            if prs:
+                self.ci_poller.notify_event(repo_full_name, pr_numbers=[pr.number for pr in prs])
+
+    async def _refresh_ci_checks(self, repo_html_url: str, pr_numbers: list[int]) -> None:
+        """Refresh pending CI check records of PRs whose CI finished."""
+        for number in pr_numbers:
+            pr = await self.pr_dao.get_by_url(f"{repo_html_url.rstrip('/')}/pull/{number}")
+            if pr is None:
+                continue
+            if await self.ci_check_dao.get_latest_pending_by_pr_id(pr.id) is None:
+                continue
+            await self.ci_check_service.check_ci(pr.task_id, pr.id, force=True)
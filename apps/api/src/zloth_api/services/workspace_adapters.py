@@ -7,12 +7,14 @@ do not need to branch on `settings.use_clone_isolation`.
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Protocol
 
 from zloth_api.domain.models import Repo
+from zloth_api.services.diff_capture import DiffCapture
 from zloth_api.services.git_service import GitService
 from zloth_api.services.workspace_service import MergeResult, WorkspaceService
 
@@ -59,8 +61,14 @@ class WorkspaceAdapter(Protocol):
         run_id: str,
         branch_prefix: str | None = None,
         auth_url: str | None = None,
+        sparse_paths: list[str] | None = None,
+        seed_path: Path | None = None,
     ) -> ExecutionWorkspaceInfo: ...
 
+    async def prepare_seed(
+        self, *, repo: Repo, base_branch: str, auth_url: str | None = None
+    ) -> Path | None: ...
+
     async def restore_from_branch(
         self,
         *,
@@ -70,14 +78,27 @@ class WorkspaceAdapter(Protocol):
         run_id: str,
         auth_url: str | None = None,
         workspace_path: Path | None = None,
+        sparse_paths: list[str] | None = None,
     ) -> ExecutionWorkspaceInfo: ...
 
     async def cleanup(self, *, path: Path, delete_branch: bool) -> None: ...
 
+    async def get_sparse_paths(self, path: Path) -> list[str] | None: ...
+
+    async def hydrate_sparse(
+        self,
+        path: Path,
+        *,
+        paths: list[str] | None = None,
+        auth_url: str | None = None,
+    ) -> list[str]: ...
+
     async def stage_all(self, path: Path) -> None: ...
 
     async def get_diff(self, path: Path, *, staged: bool = True) -> str: ...
 
+    async def capture_diff(self, path: Path, *, staged: bool = True) -> DiffCapture: ...
+
     async def commit(self, path: Path, *, message: str) -> str: ...
 
     async def is_behind_remote(
@@ -123,6 +144,8 @@ class CloneWorkspaceAdapter:
         run_id: str,
         branch_prefix: str | None = None,
         auth_url: str | None = None,
+        sparse_paths: list[str] | None = None,
+        seed_path: Path | None = None,
     ) -> ExecutionWorkspaceInfo:
         if not repo.repo_url:
             raise ValueError("repo.repo_url is required for clone-based workspace creation")
@@ -132,6 +155,8 @@ class CloneWorkspaceAdapter:
             run_id=run_id,
             branch_prefix=branch_prefix,
             auth_url=auth_url,
+            sparse_paths=sparse_paths,
+            seed_path=seed_path,
         )
         return ExecutionWorkspaceInfo(
             path=info.path,
@@ -140,6 +165,19 @@ class CloneWorkspaceAdapter:
             created_at=info.created_at,
         )
 
+    async def prepare_seed(
+        self, *, repo: Repo, base_branch: str, auth_url: str | None = None
+    ) -> Path | None:
+        if not repo.repo_url:
+            return None
+        seed_key = re.sub(r"[^A-Za-z0-9._-]", "_", f"{repo.id}-{base_branch}")
+        return await self._ws.prepare_seed(
+            repo_url=repo.repo_url,
+            base_branch=base_branch,
+            seed_key=seed_key,
+            auth_url=auth_url,
+        )
+
     async def restore_from_branch(
         self,
         *,
@@ -149,6 +187,7 @@ class CloneWorkspaceAdapter:
         run_id: str,
         auth_url: str | None = None,
         workspace_path: Path | None = None,
+        sparse_paths: list[str] | None = None,
     ) -> ExecutionWorkspaceInfo:
         """Restore workspace from an existing remote branch.
 
@@ -163,6 +202,7 @@ class CloneWorkspaceAdapter:
             run_id=run_id,
             auth_url=auth_url,
             workspace_path=workspace_path,
+            sparse_paths=sparse_paths,
         )
         return ExecutionWorkspaceInfo(
             path=info.path,
@@ -175,12 +215,27 @@ class CloneWorkspaceAdapter:
         # delete_branch is not applicable in clone mode
         await self._ws.cleanup_workspace(path)
 
+    async def get_sparse_paths(self, path: Path) -> list[str] | None:
+        return await self._ws.get_sparse_paths(path)
+
+    async def hydrate_sparse(
+        self,
+        path: Path,
+        *,
+        paths: list[str] | None = None,
+        auth_url: str | None = None,
+    ) -> list[str]:
+        return await self._ws.hydrate_sparse_checkout(path, paths=paths, auth_url=auth_url)
+
     async def stage_all(self, path: Path) -> None:
         await self._ws.stage_all(path)
 
     async def get_diff(self, path: Path, *, staged: bool = True) -> str:
         return await self._ws.get_diff(path, staged=staged)
 
+    async def capture_diff(self, path: Path, *, staged: bool = True) -> DiffCapture:
+        return await self._ws.capture_diff(path, staged=staged)
+
     async def commit(self, path: Path, *, message: str) -> str:
         return await self._ws.commit(path, message=message)
 
@@ -251,13 +306,17 @@ class WorktreeWorkspaceAdapter:
         run_id: str,
         branch_prefix: str | None = None,
         auth_url: str | None = None,
+        sparse_paths: list[str] | None = None,
+        seed_path: Path | None = None,
     ) -> ExecutionWorkspaceInfo:
+        # Worktrees already share the repository's object store; seeds do not apply
         info = await self._git.create_worktree(
             repo=repo,
             base_branch=base_branch,
             run_id=run_id,
             branch_prefix=branch_prefix,
             auth_url=auth_url,
+            sparse_paths=sparse_paths,
         )
         return ExecutionWorkspaceInfo(
             path=info.path,
@@ -266,6 +325,11 @@ class WorktreeWorkspaceAdapter:
             created_at=info.created_at,
         )
 
+    async def prepare_seed(
+        self, *, repo: Repo, base_branch: str, auth_url: str | None = None
+    ) -> Path | None:
+        return None
+
     async def restore_from_branch(
         self,
         *,
@@ -275,6 +339,7 @@ class WorktreeWorkspaceAdapter:
         run_id: str,
         auth_url: str | None = None,
         workspace_path: Path | None = None,
+        sparse_paths: list[str] | None = None,
     ) -> ExecutionWorkspaceInfo:
         """Restore workspace from an existing branch.
 
@@ -288,17 +353,34 @@ class WorktreeWorkspaceAdapter:
             run_id=run_id,
             branch_prefix=None,
             auth_url=auth_url,
+            sparse_paths=sparse_paths,
         )
 
     async def cleanup(self, *, path: Path, delete_branch: bool) -> None:
         await self._git.cleanup_worktree(path, delete_branch=delete_branch)
 
+    async def get_sparse_paths(self, path: Path) -> list[str] | None:
+        return await self._git.get_sparse_paths(path)
+
+    async def hydrate_sparse(
+        self,
+        path: Path,
+        *,
+        paths: list[str] | None = None,
+        auth_url: str | None = None,
+    ) -> list[str]:
+        # Worktrees fetch missing blobs through the source repo's remote config
+        return await self._git.hydrate_sparse_checkout(path, paths=paths)
+
     async def stage_all(self, path: Path) -> None:
         await self._git.stage_all(path)
 
     async def get_diff(self, path: Path, *, staged: bool = True) -> str:
         return await self._git.get_diff(path, staged=staged)
 
+    async def capture_diff(self, path: Path, *, staged: bool = True) -> DiffCapture:
+        return await self._git.capture_diff(path, staged=staged)
+
     async def commit(self, path: Path, *, message: str) -> str:
         return await self._git.commit(path, message=message)
 
@@ -0,0 +1,406 @@
+"""Background garbage collector for workspace disk usage.
+
+Workspaces (`run_*` clones and legacy worktrees) are only removed when a caller
+explicitly cleans them up, so archived tasks and failed runs would otherwise
+accumulate full clones until the disk fills. This service periodically:
+
+- Measures the size and last use of every workspace referenced in the DB
+- Reclaims orphaned `run_*` directories that have no DB row
+- Removes shared seed clones that have not been fetched for a while
+- Enforces per-repository and global quotas by evicting the least recently
+  used workspaces of archived, done or idle tasks
+- Runs `git gc --auto` on long-lived workspaces and source clones
+
+Workspaces of tasks with queued/running work are never evicted, and evicted
+workspaces are always restorable from their pushed remote branch.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from zloth_api.config import settings
+from zloth_api.domain.enums import TaskBaseKanbanStatus
+from zloth_api.domain.models import (
+    RepoWorkspaceUsage,
+    WorkspaceGCStats,
+    WorkspaceUsageSummary,
+)
+from zloth_api.services.git_service import GitService
+from zloth_api.services.workspace_service import WorkspaceService
+from zloth_api.storage.dao import WorkspaceUsageDAO
+
+logger = logging.getLogger(__name__)
+
+_BYTES_PER_GB = 1024**3
+
+
+@dataclass
+class _TrackedWorkspace:
+    """Workspace referenced by a task, as seen during a sweep."""
+
+    path: Path
+    task_id: str
+    repo_id: str
+    branch: str | None
+    kanban_status: str
+    pr_merged: bool
+    last_used_at: datetime | None
+    size_bytes: int = 0
+
+
+def _quota_bytes(quota_gb: float) -> int | None:
+    """Convert a GB quota setting into bytes (None for unlimited)."""
+    if quota_gb <= 0:
+        return None
+    return int(quota_gb * _BYTES_PER_GB)
+
+
+def _parse_time(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+class WorkspaceGCService:
+    """Background service enforcing workspace disk quotas."""
+
+    def __init__(
+        self,
+        usage_dao: WorkspaceUsageDAO,
+        workspace_service: WorkspaceService,
+        git_service: GitService,
+        interval_seconds: int | None = None,
+    ):
+        """Initialize the workspace garbage collector.
+
+        Args:
+            usage_dao: Workspace usage data access object.
+            workspace_service: Workspace service (clone workspaces).
+            git_service: Git service (legacy worktrees).
+            interval_seconds: Sweep interval. Defaults to settings.
+        """
+        self.usage_dao = usage_dao
+        self.workspace_service = workspace_service
+        self.git_service = git_service
+        self.interval_seconds = interval_seconds or settings.workspace_gc_interval_seconds
+        self.stats = WorkspaceGCStats()
+        self._task: asyncio.Task[None] | None = None
+        self._running = False
+        self._sweep_lock = asyncio.Lock()
+
+    def start(self) -> None:
+        """Start the background GC task."""
+        if self._task is not None:
+            logger.warning("Workspace GC is already running")
+            return
+
+        self._running = True
+        self._task = asyncio.create_task(self._gc_loop())
+        logger.info("Workspace GC started (interval: %ds)", self.interval_seconds)
+
+    async def stop(self) -> None:
+        """Stop the background GC task."""
+        if self._task is None:
+            return
+
+        self._running = False
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info("Workspace GC stopped")
+
+    async def _gc_loop(self) -> None:
+        """Main GC loop."""
+        while self._running:
+            try:
+                await self.sweep()
+            except Exception as e:
+                self.stats.last_error = str(e)
+                logger.exception("Error during workspace GC sweep")
+
+            await asyncio.sleep(self.interval_seconds)
+
+    async def sweep(self) -> WorkspaceGCStats:
+        """Run a single GC sweep.
+
+        Returns:
+            Cumulative GC statistics after the sweep.
+        """
+        async with self._sweep_lock:
+            started = time.monotonic()
+
+            busy = await self.usage_dao.list_busy_paths()
+            workspaces = await self._collect_workspaces()
+            await self._reclaim_orphans(workspaces, busy)
+            await self._expire_seeds()
+            await self._measure(workspaces)
+            await self._enforce_quotas(workspaces, busy)
+            await self._git_gc(busy)
+
+            self.stats.sweeps += 1
+            self.stats.last_sweep_at = datetime.utcnow()
+            self.stats.last_sweep_duration_ms = int((time.monotonic() - started) * 1000)
+            self.stats.last_error = None
+            return self.stats.model_copy()
+
+    async def get_usage(self) -> WorkspaceUsageSummary:
+        """Get current workspace disk usage (as of the last sweep) and GC stats."""
+        usages = await self.usage_dao.list()
+        repo_quota = _quota_bytes(settings.workspace_repo_quota_gb)
+
+        per_repo: dict[str, RepoWorkspaceUsage] = {}
+        for usage in usages:
+            if not usage.repo_id:
+                continue
+            repo_usage = per_repo.setdefault(
+                usage.repo_id,
+                RepoWorkspaceUsage(repo_id=usage.repo_id, quota_bytes=repo_quota),
+            )
+            repo_usage.workspace_count += 1
+            repo_usage.size_bytes += usage.size_bytes
+
+        return WorkspaceUsageSummary(
+            total_bytes=sum(u.size_bytes for u in usages),
+            quota_bytes=_quota_bytes(settings.workspace_quota_gb),
+            workspace_count=len(usages),
+            repos=sorted(per_repo.values(), key=lambda r: r.size_bytes, reverse=True),
+            workspaces=usages,
+            gc=self.stats.model_copy(),
+        )
+
+    async def _collect_workspaces(self) -> dict[str, _TrackedWorkspace]:
+        """Collect task workspaces from the DB, keyed by path."""
+        workspaces: dict[str, _TrackedWorkspace] = {}
+        for row in await self.usage_dao.list_task_workspaces():
+            last_used = _parse_time(row["last_used_at"])
+            existing = workspaces.get(row["path"])
+            if existing and (
+                last_used is None
+                or (existing.last_used_at is not None and existing.last_used_at >= last_used)
+            ):
+                continue
+            workspaces[row["path"]] = _TrackedWorkspace(
+                path=Path(row["path"]),
+                task_id=row["task_id"],
+                repo_id=row["repo_id"],
+                branch=row["branch"],
+                kanban_status=row["kanban_status"],
+                pr_merged=bool(row["pr_merged"]),
+                last_used_at=last_used,
+            )
+        return workspaces
+
+    def _gc_roots(self) -> list[Path]:
+        roots = [self.workspace_service.workspaces_dir]
+        if self.git_service.worktrees_dir not in roots:
+            roots.append(self.git_service.worktrees_dir)
+        return roots
+
+    async def _reclaim_orphans(
+        self, workspaces: dict[str, _TrackedWorkspace], busy: set[str]
+    ) -> None:
+        """Remove `run_*` directories that are not referenced by any DB row."""
+        repo_paths = {row["path"] for row in await self.usage_dao.list_repo_clones()}
+        grace = timedelta(minutes=settings.workspace_orphan_grace_minutes)
+        now = datetime.now()
+
+        for root in self._gc_roots():
+            if not root.exists():
+                continue
+            for path in root.iterdir():
+                if not path.is_dir() or not path.name.startswith("run_"):
+                    continue
+                key = str(path)
+                if key in workspaces or key in busy or key in repo_paths:
+                    continue
+                # The run row is created before its workspace is cloned
+                if await self.usage_dao.run_exists(path.name.removeprefix("run_")):
+                    continue
+                try:
+                    modified = datetime.fromtimestamp(path.stat().st_mtime)
+                except OSError:
+                    continue
+                if now - modified < grace:
+                    continue
+
+                size = await self.workspace_service.get_disk_usage(path)
+                await self._remove(path)
+                await self.usage_dao.delete(key)
+                self.stats.orphans_removed += 1
+                self.stats.orphan_bytes += size
+                logger.info(f"Reclaimed orphaned workspace {path} ({size} bytes)")
+
+    async def _expire_seeds(self) -> None:
+        """Remove seed clones that have not been fetched within the expiry window.
+
+        A seed is recreated by the next run that needs it, so removing one is
+        always safe; runs fork from it right after fetching it.
+        """
+        seeds_dir = self.workspace_service.workspaces_dir / ".seeds"
+        if not seeds_dir.exists():
+            return
+        expiry = timedelta(hours=settings.workspace_seed_expiry_hours)
+        now = datetime.now()
+
+        for path in seeds_dir.iterdir():
+            if not path.is_dir():
+                continue
+            try:
+                fetched = datetime.fromtimestamp(path.stat().st_mtime)
+            except OSError:
+                continue
+            if now - fetched < expiry:
+                continue
+
+            size = await self.workspace_service.get_disk_usage(path)
+            await self.workspace_service.cleanup_workspace(path)
+            self.stats.seeds_removed += 1
+            self.stats.seed_bytes += size
+            logger.info(f"Removed expired seed clone {path} ({size} bytes)")
+
+    async def _measure(self, workspaces: dict[str, _TrackedWorkspace]) -> None:
+        """Refresh size and last use of tracked workspaces and source clones."""
+        now = datetime.utcnow().isoformat()
+        tracked = {u.path for u in await self.usage_dao.list()}
+        seen: set[str] = set()
+
+        for key, ws in list(workspaces.items()):
+            if not ws.path.exists():
+                workspaces.pop(key)
+                continue
+            ws.size_bytes = await self.workspace_service.get_disk_usage(ws.path)
+            await self.usage_dao.upsert(
+                path=key,
+                kind="task",
+                size_bytes=ws.size_bytes,
+                repo_id=ws.repo_id,
+                task_id=ws.task_id,
+                last_used_at=ws.last_used_at.isoformat() if ws.last_used_at else None,
+                measured_at=now,
+            )
+            seen.add(key)
+
+        for row in await self.usage_dao.list_repo_clones():
+            path = Path(row["path"])
+            if not path.exists():
+                continue
+            size = await self.workspace_service.get_disk_usage(path)
+            await self.usage_dao.upsert(
+                path=row["path"],
+                kind="repo",
+                size_bytes=size,
+                repo_id=row["repo_id"],
+                measured_at=now,
+            )
+            seen.add(row["path"])
+
+        for stale in tracked - seen:
+            await self.usage_dao.delete(stale)
+
+    def _is_evictable(self, ws: _TrackedWorkspace) -> bool:
+        """Only workspaces of archived, done (merged) or idle tasks may be evicted."""
+        if ws.kanban_status == TaskBaseKanbanStatus.ARCHIVED.value or ws.pr_merged:
+            return True
+        if ws.last_used_at is None:
+            return False
+        idle = timedelta(hours=settings.workspace_idle_hours)
+        return datetime.utcnow() - ws.last_used_at >= idle
+
+    async def _enforce_quotas(
+        self, workspaces: dict[str, _TrackedWorkspace], busy: set[str]
+    ) -> None:
+        """Evict LRU workspaces until the per-repo and global quotas are met."""
+        global_quota = _quota_bytes(settings.workspace_quota_gb)
+        repo_quota = _quota_bytes(settings.workspace_repo_quota_gb)
+        if global_quota is None and repo_quota is None:
+            return
+
+        usages = await self.usage_dao.list()
+        total = sum(u.size_bytes for u in usages)
+        per_repo: dict[str, int] = defaultdict(int)
+        for usage in usages:
+            if usage.repo_id:
+                per_repo[usage.repo_id] += usage.size_bytes
+
+        candidates = sorted(
+            (ws for key, ws in workspaces.items() if key not in busy and self._is_evictable(ws)),
+            key=lambda ws: ws.last_used_at or datetime.min,
+        )
+
+        def over_quota(ws: _TrackedWorkspace) -> bool:
+            if global_quota is not None and total > global_quota:
+                return True
+            return repo_quota is not None and per_repo[ws.repo_id] > repo_quota
+
+        for ws in candidates:
+            if not over_quota(ws):
+                continue
+            if await self._evict(ws):
+                total -= ws.size_bytes
+                per_repo[ws.repo_id] -= ws.size_bytes
+                workspaces.pop(str(ws.path), None)
+
+        if global_quota is not None and total > global_quota:
+            logger.warning(
+                f"Workspace usage ({total} bytes) exceeds quota ({global_quota} bytes) "
+                "but no more workspaces are evictable"
+            )
+
+    async def _evict(self, ws: _TrackedWorkspace) -> bool:
+        """Evict a single workspace. Returns True if it was removed."""
+        key = str(ws.path)
+        # Re-check right before deleting: a run may have been queued mid-sweep
+        if await self.usage_dao.is_busy(key):
+            self.stats.skipped_busy += 1
+            return False
+        if not await self.workspace_service.is_safe_to_evict(ws.path, ws.branch):
+            self.stats.skipped_unpushed += 1
+            logger.info(f"Keeping workspace {ws.path}: has unpushed changes")
+            return False
+
+        await self._remove(ws.path)
+        await self.usage_dao.delete(key)
+        self.stats.evicted_workspaces += 1
+        self.stats.evicted_bytes += ws.size_bytes
+        logger.info(f"Evicted workspace {ws.path} (task={ws.task_id[:8]}, {ws.size_bytes} bytes)")
+        return True
+
+    async def _remove(self, path: Path) -> None:
+        if path.is_relative_to(self.git_service.worktrees_dir):
+            await self.git_service.cleanup_worktree(path, delete_branch=False)
+        else:
+            await self.workspace_service.cleanup_workspace(path)
+
+    async def _git_gc(self, busy: set[str]) -> None:
+        """Run `git gc --auto` on idle long-lived workspaces and source clones."""
+        interval = timedelta(hours=settings.workspace_git_gc_interval_hours)
+        now = datetime.utcnow()
+
+        for usage in await self.usage_dao.list():
+            if usage.path in busy:
+                continue
+            if usage.last_git_gc_at is not None and now - usage.last_git_gc_at < interval:
+                continue
+            if usage.last_git_gc_at is None and usage.kind == "task":
+                # Fresh clones are already packed; start counting from first sight
+                await self.usage_dao.mark_git_gc(usage.path)
+                continue
+            try:
+                await self.workspace_service.gc_auto(Path(usage.path))
+                await self.usage_dao.mark_git_gc(usage.path)
+                self.stats.git_gc_runs += 1
+            except Exception as e:
+                logger.warning(f"git gc --auto failed for {usage.path}: {e}")
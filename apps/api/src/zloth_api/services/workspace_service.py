@@ -5,6 +5,7 @@ This service implements the Clone method for workspace isolation, which provides
 - Better support for remote sync (pull/push)
 - Easier conflict resolution with standard git merge
 - Independent from parent repository's worktree state
+- Optional sparse checkout / blob-less partial clone for large monorepos
 
 For legacy worktree-based isolation, see git_service.py.
 """
@@ -13,14 +14,24 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
 import shutil
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
 import git
 
 from zloth_api.config import settings
+from zloth_api.services.diff_capture import DiffCapture, capture_diff
+from zloth_api.services.sparse_checkout import (
+    apply_sparse_checkout,
+    get_sparse_dirs,
+    hydrate_sparse_paths,
+    hydrate_untracked_outside_cone,
+    normalize_sparse_paths,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -111,6 +122,19 @@ class WorkspaceService:
         short_id = run_id[:8]
         return f"{prefix}/{short_id}"
 
+    def _clone_options(self, sparse_dirs: list[str]) -> dict[str, Any]:
+        """Build extra `git clone` options for partial clone / sparse checkout.
+
+        Sparse workspaces are always cloned blob-less with ``--no-checkout`` so
+        that only the blobs of the sparse set are downloaded on checkout.
+        """
+        options: dict[str, Any] = {}
+        if sparse_dirs or settings.workspace_partial_clone:
+            options["filter"] = "blob:none"
+        if sparse_dirs:
+            options["no_checkout"] = True
+        return options
+
     async def create_workspace(
         self,
         repo_url: str,
@@ -118,12 +142,18 @@ class WorkspaceService:
         run_id: str,
         branch_prefix: str | None = None,
         auth_url: str | None = None,
+        sparse_paths: list[str] | None = None,
+        seed_path: Path | None = None,
     ) -> WorkspaceInfo:
         """Create a new workspace using shallow clone.
 
         This creates an isolated workspace by:
-        1. Shallow cloning the repository (depth=1)
-        2. Creating a new branch from the base branch
+        1. Shallow cloning the repository (depth=1), blob-less when partial
+           clones are enabled or a sparse profile is given. When a seed clone
+           is given (see prepare_seed), the workspace is cloned locally from
+           it instead of from the remote.
+        2. Applying the cone-mode sparse checkout profile (if any)
+        3. Creating a new branch from the base branch
 
         Args:
             repo_url: Repository URL to clone.
@@ -131,6 +161,9 @@ class WorkspaceService:
             run_id: Run ID for naming the workspace and branch.
             branch_prefix: Optional branch prefix for the new work branch.
             auth_url: Authenticated URL for private repos.
+            sparse_paths: Optional sparse checkout profile (directories or files).
+            seed_path: Optional local seed clone of base_branch to fork from.
+                Ignored for sparse workspaces.
 
         Returns:
             WorkspaceInfo with path and branch information.
@@ -140,25 +173,46 @@ class WorkspaceService:
         """
         branch_name = self._generate_branch_name(run_id, branch_prefix=branch_prefix)
         workspace_path = self.workspaces_dir / f"run_{run_id}"
+        sparse_dirs = normalize_sparse_paths(sparse_paths or [])
 
         # Use auth_url for clone if provided (required for private repos)
         clone_url = auth_url or repo_url
+        if seed_path and sparse_dirs:
+            seed_path = None
 
         def _create_workspace() -> WorkspaceInfo:
             # Remove existing workspace if it exists
             if workspace_path.exists():
                 shutil.rmtree(workspace_path)
 
-            # Shallow clone with single branch
-            # git clone --depth 1 --single-branch -b <base_branch> <url> <path>
-            logger.info(f"Cloning repository to {workspace_path}")
-            repo = git.Repo.clone_from(
-                clone_url,
-                workspace_path,
-                depth=1,
-                single_branch=True,
-                branch=base_branch,
-            )
+            if seed_path:
+                # Local clone from the shared seed: no network round-trip.
+                # The seed's shallow boundary is carried over.
+                logger.info(f"Forking workspace {workspace_path} from seed {seed_path}")
+                repo = git.Repo.clone_from(
+                    str(seed_path),
+                    workspace_path,
+                    single_branch=True,
+                    branch=base_branch,
+                )
+                repo.remotes.origin.set_url(repo_url)
+            else:
+                # Shallow clone with single branch
+                # git clone --depth 1 --single-branch -b <base_branch> <url> <path>
+                logger.info(f"Cloning repository to {workspace_path}")
+                repo = git.Repo.clone_from(
+                    clone_url,
+                    workspace_path,
+                    depth=1,
+                    single_branch=True,
+                    branch=base_branch,
+                    **self._clone_options(sparse_dirs),
+                )
+
+            # Check out the sparse set while origin still points at the clone URL:
+            # blobs of a partial clone are fetched lazily from origin.
+            if sparse_dirs:
+                apply_sparse_checkout(repo, sparse_dirs, base_branch)
 
             # If we used auth_url for clone, set origin to the non-auth URL
             # to avoid storing credentials in git config
@@ -179,6 +233,74 @@ class WorkspaceService:
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(None, _create_workspace)
 
+    async def prepare_seed(
+        self,
+        repo_url: str,
+        base_branch: str,
+        seed_key: str,
+        auth_url: str | None = None,
+    ) -> Path:
+        """Create or refresh the shared seed clone of a base branch.
+
+        The seed is a shallow bare clone under ``<workspaces_dir>/.seeds``.
+        Seeds not fetched for ``workspace_seed_expiry_hours`` are removed by
+        the workspace GC.
+        Run workspaces for the same (repo, base branch) are forked from it with
+        a local clone, so the remote is fetched once for all of them.
+
+        Args:
+            repo_url: Repository URL.
+            base_branch: Base branch to fetch.
+            seed_key: Filesystem-safe key identifying the (repo, base branch) pair.
+            auth_url: Authenticated URL for private repos.
+
+        Returns:
+            Path to the seed clone.
+
+        Raises:
+            git.GitCommandError: If clone or fetch fails.
+        """
+        seed_path = self.workspaces_dir / ".seeds" / seed_key
+        clone_url = auth_url or repo_url
+
+        def _prepare() -> Path:
+            if (seed_path / "HEAD").exists():
+                try:
+                    seed = git.Repo(seed_path)
+                    seed.remotes.origin.set_url(clone_url)
+                    try:
+                        seed.git.fetch(
+                            "--depth",
+                            "1",
+                            "origin",
+                            f"+refs/heads/{base_branch}:refs/heads/{base_branch}",
+                        )
+                    finally:
+                        seed.remotes.origin.set_url(repo_url)
+                    # The mtime marks the last fetch; the workspace GC expires on it
+                    os.utime(seed_path)
+                    return seed_path
+                except (git.InvalidGitRepositoryError, git.GitCommandError) as e:
+                    logger.warning(f"Seed {seed_path} could not be refreshed, recloning: {e}")
+                shutil.rmtree(seed_path, ignore_errors=True)
+
+            seed_path.parent.mkdir(parents=True, exist_ok=True)
+            logger.info(f"Cloning seed for {base_branch} to {seed_path}")
+            seed = git.Repo.clone_from(
+                clone_url,
+                seed_path,
+                bare=True,
+                depth=1,
+                single_branch=True,
+                branch=base_branch,
+            )
+            if auth_url and repo_url != auth_url:
+                seed.remotes.origin.set_url(repo_url)
+            return seed_path
+
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, _prepare)
+
     async def get_workspace(self, run_id: str) -> WorkspaceInfo | None:
         """Get workspace info for a run.
 
@@ -442,32 +564,34 @@ class WorkspaceService:
                 except Exception:
                     pass
 
+            # Keep the authenticated URL for the merge too: partial clones
+            # fetch missing blobs from origin while merging.
             try:
                 repo.remotes.origin.fetch()
+
+                # Merge origin/<base_branch>
+                remote_ref = f"origin/{base_branch}"
+                try:
+                    repo.git.merge(remote_ref)
+                    return MergeResult(success=True)
+                except git.GitCommandError as e:
+                    error_str = str(e)
+
+                    # Check for merge conflicts
+                    if "CONFLICT" in error_str or "Automatic merge failed" in error_str:
+                        conflict_files = self._get_conflict_files_sync(repo)
+                        return MergeResult(
+                            success=False,
+                            has_conflicts=True,
+                            conflict_files=conflict_files,
+                            error="Merge conflicts detected",
+                        )
+
+                    return MergeResult(success=False, error=str(e))
             finally:
                 if original_url:
                     repo.remotes.origin.set_url(original_url)
 
-            # Merge origin/<base_branch>
-            remote_ref = f"origin/{base_branch}"
-            try:
-                repo.git.merge(remote_ref)
-                return MergeResult(success=True)
-            except git.GitCommandError as e:
-                error_str = str(e)
-
-                # Check for merge conflicts
-                if "CONFLICT" in error_str or "Automatic merge failed" in error_str:
-                    conflict_files = self._get_conflict_files_sync(repo)
-                    return MergeResult(
-                        success=False,
-                        has_conflicts=True,
-                        conflict_files=conflict_files,
-                        error="Merge conflicts detected",
-                    )
-
-                return MergeResult(success=False, error=str(e))
-
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(None, _merge)
 
@@ -598,6 +722,67 @@ class WorkspaceService:
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(None, _check)
 
+    async def get_sparse_paths(self, workspace_path: Path) -> list[str] | None:
+        """Get the sparse checkout profile of a workspace.
+
+        Args:
+            workspace_path: Path to the workspace.
+
+        Returns:
+            Cone directories, or None if the workspace has a full checkout.
+        """
+
+        def _get() -> list[str] | None:
+            return get_sparse_dirs(git.Repo(workspace_path))
+
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, _get)
+
+    async def hydrate_sparse_checkout(
+        self,
+        workspace_path: Path,
+        paths: list[str] | None = None,
+        auth_url: str | None = None,
+    ) -> list[str]:
+        """Lazily extend a sparse workspace with directories outside its profile.
+
+        Adds the directories of ``paths`` (when given) and of any untracked files
+        the agent created outside the sparse set, which ``git add -A`` would
+        otherwise silently skip. No-op for full checkouts.
+
+        Args:
+            workspace_path: Path to the workspace.
+            paths: Optional file/directory paths that must be materialized.
+            auth_url: Authenticated URL for private repos (blob fetches).
+
+        Returns:
+            Directories added to the sparse profile.
+        """
+
+        def _hydrate() -> list[str]:
+            repo = git.Repo(workspace_path)
+            if get_sparse_dirs(repo) is None:
+                return []
+
+            original_url: str | None = None
+            if auth_url:
+                try:
+                    original_url = repo.remotes.origin.url
+                    repo.remotes.origin.set_url(auth_url)
+                except Exception:
+                    pass
+
+            try:
+                added = hydrate_sparse_paths(repo, paths) if paths else []
+                added.extend(hydrate_untracked_outside_cone(repo))
+                return added
+            finally:
+                if original_url:
+                    repo.remotes.origin.set_url(original_url)
+
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, _hydrate)
+
     async def stage_all(self, workspace_path: Path) -> None:
         """Stage all changes.
 
@@ -612,6 +797,60 @@ class WorkspaceService:
         loop = asyncio.get_event_loop()
         await loop.run_in_executor(None, _stage)
 
+    async def capture_diff(self, workspace_path: Path, staged: bool = True) -> DiffCapture:
+        """Capture the diff incrementally with bounded memory.
+
+        Uses `git diff --numstat -z` for per-file stats and streams per-file
+        patches, keeping at most the configured size of patch text.
+
+        Args:
+            workspace_path: Path to the workspace.
+            staged: If True, capture the staged diff against HEAD (the delta
+                since the previous commit); otherwise the unstaged diff.
+
+        Returns:
+            DiffCapture with per-file stats and size-capped patches.
+        """
+
+        def _capture() -> DiffCapture:
+            repo = git.Repo(workspace_path)
+            try:
+                if staged:
+                    return capture_diff(repo, "HEAD", "--cached")
+                return capture_diff(repo)
+            except git.GitCommandError:
+                return DiffCapture()
+
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, _capture)
+
+    async def capture_diff_range(
+        self, workspace_path: Path, base_ref: str, head_ref: str = "HEAD"
+    ) -> DiffCapture:
+        """Capture the cumulative diff between the merge base of two refs and head.
+
+        Args:
+            workspace_path: Path to the workspace.
+            base_ref: Base branch/commit reference.
+            head_ref: Head commit reference (default: HEAD).
+
+        Returns:
+            DiffCapture with per-file stats and size-capped patches.
+        """
+
+        def _capture() -> DiffCapture:
+            repo = git.Repo(workspace_path)
+            for ref in (base_ref, f"origin/{base_ref}"):
+                try:
+                    merge_base = repo.git.merge_base(ref, head_ref)
+                    return capture_diff(repo, merge_base, head_ref)
+                except git.GitCommandError:
+                    continue
+            return DiffCapture()
+
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, _capture)
+
     async def get_diff(self, workspace_path: Path, staged: bool = True) -> str:
         """Get diff.
 
@@ -716,6 +955,87 @@ class WorkspaceService:
         loop = asyncio.get_event_loop()
         await loop.run_in_executor(None, _cleanup)
 
+    async def get_disk_usage(self, workspace_path: Path) -> int:
+        """Get the disk usage of a workspace in bytes (allocated blocks).
+
+        Symlinks are not followed. Files that disappear during the walk are ignored.
+
+        Args:
+            workspace_path: Path to the workspace.
+
+        Returns:
+            Disk usage in bytes (0 if the path does not exist).
+        """
+
+        def _du() -> int:
+            total = 0
+            stack = [workspace_path]
+            while stack:
+                current = stack.pop()
+                try:
+                    entries = list(os.scandir(current))
+                except OSError:
+                    continue
+                for entry in entries:
+                    try:
+                        st = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    blocks = getattr(st, "st_blocks", None)
+                    total += blocks * 512 if blocks is not None else st.st_size
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(Path(entry.path))
+            return total
+
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, _du)
+
+    async def is_safe_to_evict(self, workspace_path: Path, branch: str | None = None) -> bool:
+        """Check whether a workspace can be deleted without losing work.
+
+        A workspace is safe to evict when its working tree is clean and HEAD is
+        contained in the remote-tracking branch, so it can be restored later via
+        `restore_workspace`.
+
+        Args:
+            workspace_path: Path to the workspace.
+            branch: Working branch (defaults to the current branch).
+
+        Returns:
+            True if nothing would be lost by deleting the workspace.
+        """
+
+        def _check() -> bool:
+            try:
+                repo = git.Repo(workspace_path)
+                if repo.git.status("--porcelain").strip():
+                    return False
+                target = branch or repo.active_branch.name
+                repo.git.merge_base("--is-ancestor", "HEAD", f"refs/remotes/origin/{target}")
+                return True
+            except (git.InvalidGitRepositoryError, git.NoSuchPathError):
+                # Broken workspaces cannot be restored from anyway
+                return True
+            except (git.GitCommandError, TypeError, ValueError):
+                return False
+
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, _check)
+
+    async def gc_auto(self, workspace_path: Path) -> None:
+        """Run `git gc --auto` to pack loose objects of a long-lived workspace.
+
+        Args:
+            workspace_path: Path to the workspace.
+        """
+
+        def _gc() -> None:
+            repo = git.Repo(workspace_path)
+            repo.git.gc("--auto", "--quiet")
+
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(None, _gc)
+
     async def get_current_branch(self, workspace_path: Path) -> str:
         """Get the current branch name.
 
@@ -793,6 +1113,7 @@ class WorkspaceService:
         run_id: str,
         auth_url: str | None = None,
         workspace_path: Path | None = None,
+        sparse_paths: list[str] | None = None,
     ) -> WorkspaceInfo:
         """Restore workspace from an existing remote branch.
 
@@ -806,6 +1127,8 @@ class WorkspaceService:
             base_branch: Base branch for reference.
             run_id: Run ID for naming the workspace.
             auth_url: Authenticated URL for private repos.
+            workspace_path: Optional fixed path to restore into.
+            sparse_paths: Optional sparse checkout profile (directories or files).
 
         Returns:
             WorkspaceInfo with path and branch information.
@@ -815,6 +1138,7 @@ class WorkspaceService:
             ValueError: If the branch does not exist on remote.
         """
         target_path = workspace_path or (self.workspaces_dir / f"run_{run_id}")
+        sparse_dirs = normalize_sparse_paths(sparse_paths or [])
 
         # Use auth_url for clone if provided (required for private repos)
         clone_url = auth_url or repo_url
@@ -832,6 +1156,7 @@ class WorkspaceService:
                 depth=1,
                 single_branch=False,  # Need to fetch the working branch
                 branch=base_branch,
+                **self._clone_options(sparse_dirs),
             )
 
             # If we used auth_url for clone, set origin to the non-auth URL
@@ -855,7 +1180,11 @@ class WorkspaceService:
 
                 # Checkout the existing remote branch
                 logger.info(f"Checking out branch {branch_name}")
-                repo.git.checkout("-b", branch_name, f"origin/{branch_name}")
+                if sparse_dirs:
+                    repo.git.branch(branch_name, f"origin/{branch_name}")
+                    apply_sparse_checkout(repo, sparse_dirs, branch_name)
+                else:
+                    repo.git.checkout("-b", branch_name, f"origin/{branch_name}")
 
             finally:
                 # Restore original URL
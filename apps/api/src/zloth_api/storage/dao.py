@@ -30,6 +30,7 @@ from zloth_api.domain.models import (
     BacklogItem,
     CICheck,
     CIJobResult,
+    ExecutionStats,
     FileDiff,
     Job,
     Message,
@@ -38,9 +39,12 @@ from zloth_api.domain.models import (
     ReviewFeedbackItem,
     ReviewSummary,
     Run,
+    RunResourceUsage,
     SubTask,
     Task,
     UserPreferences,
+    WebhookDelivery,
+    WorkspaceUsage,
 )
 from zloth_api.storage.db import Database
 from zloth_api.storage.row_mapping import row_to_model
@@ -130,6 +134,14 @@ class RepoDAO:
         )
         await self.db.connection.commit()
 
+    async def update_sparse_paths(self, id: str, sparse_paths: builtins.list[str]) -> None:
+        """Update the sparse checkout profile for a repo."""
+        await self.db.connection.execute(
+            "UPDATE repos SET sparse_paths = ? WHERE id = ?",
+            (json.dumps(sparse_paths), id),
+        )
+        await self.db.connection.commit()
+
     async def list(self) -> builtins.list[Repo]:
         """List all repos."""
         cursor = await self.db.connection.execute("SELECT * FROM repos ORDER BY created_at DESC")
@@ -137,7 +149,12 @@ class RepoDAO:
         return [self._row_to_model(row) for row in rows]
 
     def _row_to_model(self, row: Any) -> Repo:
-        return row_to_model(Repo, row)
+        return row_to_model(
+            Repo,
+            row,
+            json_fields={"sparse_paths"},
+            defaults={"sparse_paths": []},
+        )
 
 
 class TaskDAO:
@@ -247,6 +264,14 @@ class TaskDAO:
         )
         await self.db.connection.commit()
 
+    async def update_sparse_paths(self, id: str, sparse_paths: builtins.list[str]) -> None:
+        """Update the task's sparse checkout profile."""
+        await self.db.connection.execute(
+            "UPDATE tasks SET sparse_paths = ?, updated_at = ? WHERE id = ?",
+            (json.dumps(sparse_paths), now_iso(), id),
+        )
+        await self.db.connection.commit()
+
     async def list_with_aggregates(
         self, repo_id: str | None = None
     ) -> builtins.list[dict[str, Any]]:
@@ -368,12 +393,14 @@ class TaskDAO:
         return row_to_model(
             Task,
             row,
+            json_fields={"sparse_paths"},
             defaults={
                 "kanban_status": "backlog",
                 "coding_mode": CodingMode.INTERACTIVE.value,
                 "base_ref": None,
                 "workspace_path": None,
                 "working_branch": None,
+                "sparse_paths": [],
             },
         )
 
@@ -537,6 +564,9 @@ class RunDAO:
         error: str | None = None,
         commit_sha: str | None = None,
         session_id: str | None = None,
+        resource_usage: RunResourceUsage | None = None,
+        execution_stats: ExecutionStats | None = None,
+        patch_truncated: bool | None = None,
     ) -> None:
         """Update run status and results."""
         updates = ["status = ?"]
@@ -555,6 +585,9 @@ class RunDAO:
         if patch is not None:
             updates.append("patch = ?")
             params.append(patch)
+        if patch_truncated is not None:
+            updates.append("patch_truncated = ?")
+            params.append(int(patch_truncated))
         if files_changed is not None:
             updates.append("files_changed = ?")
             params.append(json.dumps([f.model_dump() for f in files_changed]))
@@ -573,6 +606,12 @@ class RunDAO:
         if session_id is not None:
             updates.append("session_id = ?")
             params.append(session_id)
+        if resource_usage is not None:
+            updates.append("resource_usage = ?")
+            params.append(resource_usage.model_dump_json())
+        if execution_stats is not None:
+            updates.append("execution_stats = ?")
+            params.append(execution_stats.model_dump_json())
 
         params.append(id)
 
@@ -711,7 +750,7 @@ class RunDAO:
         return row_to_model(
             Run,
             row,
-            json_fields={"files_changed", "logs", "warnings"},
+            json_fields={"files_changed", "logs", "warnings", "resource_usage", "execution_stats"},
             defaults={
                 "executor_type": ExecutorType.PATCH_AGENT.value,
                 "files_changed": [],
@@ -999,6 +1038,38 @@ class JobDAO:
         await self.db.connection.commit()
         return cursor.rowcount > 0
 
+    async def request_cancel(self, job_id: str) -> bool:
+        """Ask the worker running a job to cancel it.
+
+        Returns:
+            True if the job is running and the request was recorded.
+        """
+        now = now_iso()
+        cursor = await self.db.connection.execute(
+            """
+            UPDATE jobs
+            SET cancel_requested_at = COALESCE(cancel_requested_at, ?), updated_at = ?
+            WHERE id = ? AND status = ?
+            """,
+            (now, now, job_id, JobStatus.RUNNING.value),
+        )
+        await self.db.connection.commit()
+        return cursor.rowcount > 0
+
+    async def list_cancel_requested(self, *, locked_by: str) -> list[str]:
+        """IDs of a worker's running jobs that were asked to cancel."""
+        cursor = await self.db.connection.execute(
+            """
+            SELECT id FROM jobs
+            WHERE locked_by = ?
+              AND status = ?
+              AND cancel_requested_at IS NOT NULL
+            """,
+            (locked_by, JobStatus.RUNNING.value),
+        )
+        rows = await cursor.fetchall()
+        return [row["id"] for row in rows]
+
     async def fail_all_running(self, *, error: str) -> int:
         """Fail all running jobs (used during startup recovery)."""
         now = now_iso()
@@ -1042,6 +1113,7 @@ class JobDAO:
             locked_at=_parse_dt(row["locked_at"]),
             locked_by=row["locked_by"],
             last_error=row["last_error"],
+            cancel_requested_at=_parse_dt(row["cancel_requested_at"]),
             created_at=datetime.fromisoformat(row["created_at"]),
             updated_at=datetime.fromisoformat(row["updated_at"]),
         )
@@ -1172,6 +1244,30 @@ class PRDAO:
         )
         await self.db.connection.commit()
 
+    async def get_by_url(self, url: str) -> PR | None:
+        """Get a PR by its GitHub URL."""
+        cursor = await self.db.connection.execute(
+            "SELECT * FROM prs WHERE url = ? ORDER BY created_at DESC LIMIT 1",
+            (url,),
+        )
+        row = await cursor.fetchone()
+        if not row:
+            return None
+        return self._row_to_model(row)
+
+    async def list_open_by_branch(self, repo_url: str, branch: str) -> builtins.list[PR]:
+        """List open PRs of a repository (by GitHub URL) with the given head branch."""
+        cursor = await self.db.connection.execute(
+            """
+            SELECT * FROM prs
+            WHERE status = 'open' AND branch = ? AND url LIKE ?
+            ORDER BY created_at DESC
+            """,
+            (branch, f"{repo_url.rstrip('/')}/pull/%"),
+        )
+        rows = await cursor.fetchall()
+        return [self._row_to_model(row) for row in rows]
+
     async def list_open(self) -> builtins.list[PR]:
         """List all PRs with status='open'.
 
@@ -1713,6 +1809,14 @@ class ReviewDAO:
 
         await self.db.connection.commit()
 
+    async def update_execution_stats(self, review_id: str, stats: ExecutionStats) -> None:
+        """Record the token usage, cost and timing of the review's executor."""
+        await self.db.connection.execute(
+            "UPDATE reviews SET execution_stats = ? WHERE id = ?",
+            (stats.model_dump_json(), review_id),
+        )
+        await self.db.connection.commit()
+
     async def fail_all_running(self, *, error: str) -> int:
         """Mark all RUNNING reviews as FAILED (used during startup recovery)."""
         now = now_iso()
@@ -1755,7 +1859,7 @@ class ReviewDAO:
         return row_to_model(
             Review,
             row,
-            json_fields={"target_run_ids", "logs"},
+            json_fields={"target_run_ids", "logs", "execution_stats"},
             defaults={"target_run_ids": [], "logs": []},
             overrides={"feedbacks": feedbacks},
         )
@@ -2109,6 +2213,29 @@ class CICheckDAO:
         )
 
 
+# Runs and reviews with executor stats, with the repository of their task
+_EXECUTIONS_QUERY = """
+    SELECT 'run' AS kind, r.id, r.task_id, t.repo_id, r.executor_type, r.status,
+        r.created_at, r.execution_stats
+    FROM runs r JOIN tasks t ON t.id = r.task_id
+    WHERE r.execution_stats IS NOT NULL
+    UNION ALL
+    SELECT 'review' AS kind, v.id, v.task_id, t.repo_id, v.executor_type, v.status,
+        v.created_at, v.execution_stats
+    FROM reviews v JOIN tasks t ON t.id = v.task_id
+    WHERE v.execution_stats IS NOT NULL
+"""
+
+# Grouping expressions of get_execution_stats
+_EXECUTION_GROUPS = {
+    "executor": "executor_type",
+    "repo": "repo_id",
+    "day": "substr(created_at, 1, 10)",
+    "week": "date(created_at, 'weekday 0', '-6 days')",
+    "month": "substr(created_at, 1, 7)",
+}
+
+
 class MetricsDAO:
     """DAO for aggregating metrics data from various tables."""
 
@@ -2272,6 +2399,119 @@ class MetricsDAO:
         rows = await cursor.fetchall()
         return [{"executor_type": row["executor_type"], "count": row["count"]} for row in rows]
 
+    async def get_execution_stats(
+        self,
+        period_start: datetime,
+        period_end: datetime,
+        repo_id: str | None = None,
+        group_by: str = "executor",
+    ) -> builtins.list[dict[str, Any]]:
+        """Aggregate token usage, cost and timing of runs and reviews.
+
+        Args:
+            period_start: Start of the period (inclusive).
+            period_end: End of the period (exclusive).
+            repo_id: Optional repository filter.
+            group_by: "executor", "repo", "day", "week" or "month".
+
+        Returns:
+            One dict per group, most expensive first.
+        """
+        group_expr = _EXECUTION_GROUPS.get(group_by)
+        if group_expr is None:
+            raise ValueError(f"Unsupported grouping: {group_by}")
+        params: builtins.list[Any] = [period_start.isoformat(), period_end.isoformat()]
+        repo_filter = ""
+        if repo_id:
+            repo_filter = " AND repo_id = ?"
+            params.append(repo_id)
+
+        def stat(field: str) -> str:
+            return f"json_extract(execution_stats, '$.{field}')"
+
+        query = f"""
+            SELECT
+                {group_expr} AS key,
+                COUNT(*) AS executions,
+                SUM(CASE WHEN kind = 'run' THEN 1 ELSE 0 END) AS runs,
+                SUM(CASE WHEN kind = 'review' THEN 1 ELSE 0 END) AS reviews,
+                SUM({stat("cost_usd")}) AS cost_usd,
+                AVG({stat("cost_usd")}) AS avg_cost_usd,
+                SUM({stat("input_tokens")}) AS input_tokens,
+                SUM({stat("output_tokens")}) AS output_tokens,
+                SUM({stat("cache_read_tokens")}) AS cache_read_tokens,
+                SUM({stat("cache_write_tokens")}) AS cache_write_tokens,
+                SUM({stat("total_tokens")}) AS total_tokens,
+                SUM({stat("tool_calls")}) AS tool_calls,
+                AVG({stat("num_turns")}) AS avg_turns,
+                AVG({stat("wall_time_ms")}) / 1000.0 AS avg_wall_time_seconds,
+                AVG({stat("api_time_ms")}) / 1000.0 AS avg_api_time_seconds
+            FROM ({_EXECUTIONS_QUERY})
+            WHERE created_at >= ? AND created_at < ?{repo_filter}
+            GROUP BY key
+            ORDER BY cost_usd DESC, executions DESC
+        """
+        cursor = await self.db.connection.execute(query, params)
+        rows = await cursor.fetchall()
+        totals = (
+            "executions",
+            "runs",
+            "reviews",
+            "cost_usd",
+            "input_tokens",
+            "output_tokens",
+            "cache_read_tokens",
+            "cache_write_tokens",
+            "total_tokens",
+            "tool_calls",
+        )
+        return [
+            {key: (row[key] or 0) if key in totals else row[key] for key in row.keys()}
+            for row in rows
+        ]
+
+    async def get_costliest_executions(
+        self,
+        period_start: datetime,
+        period_end: datetime,
+        repo_id: str | None = None,
+        limit: int = 20,
+    ) -> builtins.list[dict[str, Any]]:
+        """Get the runs and reviews with the highest executor cost (or tokens).
+
+        Args:
+            period_start: Start of the period (inclusive).
+            period_end: End of the period (exclusive).
+            repo_id: Optional repository filter.
+            limit: Maximum number of executions.
+
+        Returns:
+            Executions with their decoded stats, most expensive first.
+        """
+        params: builtins.list[Any] = [period_start.isoformat(), period_end.isoformat()]
+        repo_filter = ""
+        if repo_id:
+            repo_filter = " AND repo_id = ?"
+            params.append(repo_id)
+        params.append(limit)
+
+        query = f"""
+            SELECT * FROM ({_EXECUTIONS_QUERY})
+            WHERE created_at >= ? AND created_at < ?{repo_filter}
+            ORDER BY
+                COALESCE(json_extract(execution_stats, '$.cost_usd'), 0) DESC,
+                COALESCE(json_extract(execution_stats, '$.total_tokens'), 0) DESC
+            LIMIT ?
+        """
+        cursor = await self.db.connection.execute(query, params)
+        rows = await cursor.fetchall()
+        executions = []
+        for row in rows:
+            execution = dict(row)
+            execution["stats"] = json.loads(execution.pop("execution_stats"))
+            executions.append(execution)
+        return executions
+
     async def get_ci_metrics(
         self,
         period_start: datetime,
@@ -2941,3 +3181,448 @@ class AnalysisDAO:
             return 0.0
 
         return (row["succeeded"] / row["total"]) * 100 if row["total"] > 0 else 0.0
+
+
+class WorkspaceUsageDAO:
+    """DAO for workspace disk usage tracking (workspace garbage collection)."""
+
+    def __init__(self, db: Database):
+        self.db = db
+
+    async def list_task_workspaces(self) -> builtins.list[dict[str, Any]]:
+        """List workspace paths referenced by tasks and runs.
+
+        Returns one row per (path, task) with the task's repo, base kanban status,
+        working branch, whether it has a merged PR, and its latest activity.
+        """
+        cursor = await self.db.connection.execute(
+            """
+            WITH refs AS (
+                SELECT id AS task_id, workspace_path AS path, working_branch AS branch
+                FROM tasks
+                WHERE workspace_path IS NOT NULL
+                UNION
+                SELECT task_id, worktree_path AS path, working_branch AS branch
+                FROM runs
+                WHERE worktree_path IS NOT NULL
+            )
+            SELECT
+                refs.path,
+                refs.branch,
+                t.id AS task_id,
+                t.repo_id,
+                t.kanban_status,
+                EXISTS (
+                    SELECT 1 FROM prs p WHERE p.task_id = t.id AND p.status = 'merged'
+                ) AS pr_merged,
+                MAX(
+                    t.updated_at,
+                    COALESCE(
+                        (
+                            SELECT MAX(COALESCE(r.completed_at, r.started_at, r.created_at))
+                            FROM runs r
+                            WHERE r.task_id = t.id
+                        ),
+                        t.updated_at
+                    )
+                ) AS last_used_at
+            FROM refs
+            JOIN tasks t ON t.id = refs.task_id
+            """
+        )
+        rows = await cursor.fetchall()
+        return [dict(row) for row in rows]
+
+    async def list_busy_paths(self) -> set[str]:
+        """List workspace paths of tasks with queued/running work.
+
+        A task is busy while it has a queued or running run, review, job or a
+        non-terminal agentic run. All workspace paths of busy tasks are returned.
+        """
+        cursor = await self.db.connection.execute(
+            """
+            WITH busy_tasks AS (
+                SELECT task_id FROM runs WHERE status IN ('queued', 'running')
+                UNION
+                SELECT task_id FROM reviews WHERE status IN ('queued', 'running')
+                UNION
+                SELECT task_id FROM agentic_runs WHERE phase NOT IN ('completed', 'failed')
+                UNION
+                SELECT r.task_id
+                FROM jobs j
+                JOIN runs r ON r.id = j.ref_id
+                WHERE j.status IN ('queued', 'running')
+            )
+            SELECT workspace_path AS path
+            FROM tasks
+            WHERE id IN busy_tasks AND workspace_path IS NOT NULL
+            UNION
+            SELECT worktree_path AS path
+            FROM runs
+            WHERE task_id IN busy_tasks AND worktree_path IS NOT NULL
+            """
+        )
+        rows = await cursor.fetchall()
+        return {row["path"] for row in rows}
+
+    async def is_busy(self, path: str) -> bool:
+        """Check whether a workspace path belongs to a task with queued/running work."""
+        return path in await self.list_busy_paths()
+
+    async def list_repo_clones(self) -> builtins.list[dict[str, Any]]:
+        """List source clones of registered repositories."""
+        cursor = await self.db.connection.execute("SELECT id, workspace_path FROM repos")
+        rows = await cursor.fetchall()
+        return [{"repo_id": row["id"], "path": row["workspace_path"]} for row in rows]
+
+    async def run_exists(self, run_id: str) -> bool:
+        """Check whether a run row exists (workspace dirs are named run_<id>)."""
+        cursor = await self.db.connection.execute(
+            "SELECT 1 FROM runs WHERE id = ? LIMIT 1", (run_id,)
+        )
+        return await cursor.fetchone() is not None
+
+    async def upsert(
+        self,
+        path: str,
+        kind: str,
+        size_bytes: int,
+        repo_id: str | None = None,
+        task_id: str | None = None,
+        last_used_at: str | None = None,
+        measured_at: str | None = None,
+    ) -> None:
+        """Insert or update the tracked usage of a workspace."""
+        now = now_iso()
+        await self.db.connection.execute(
+            """
+            INSERT INTO workspace_usage (
+                path, kind, repo_id, task_id, size_bytes, last_used_at, measured_at, updated_at
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(path) DO UPDATE SET
+                kind = excluded.kind,
+                repo_id = excluded.repo_id,
+                task_id = excluded.task_id,
+                size_bytes = excluded.size_bytes,
+                last_used_at = excluded.last_used_at,
+                measured_at = COALESCE(excluded.measured_at, workspace_usage.measured_at),
+                updated_at = excluded.updated_at
+            """,
+            (path, kind, repo_id, task_id, size_bytes, last_used_at, measured_at, now),
+        )
+        await self.db.connection.commit()
+
+    async def mark_git_gc(self, path: str) -> None:
+        """Record that `git gc --auto` ran for a workspace."""
+        await self.db.connection.execute(
+            "UPDATE workspace_usage SET last_git_gc_at = ? WHERE path = ?",
+            (now_iso(), path),
+        )
+        await self.db.connection.commit()
+
+    async def delete(self, path: str) -> None:
+        """Stop tracking a workspace."""
+        await self.db.connection.execute("DELETE FROM workspace_usage WHERE path = ?", (path,))
+        await self.db.connection.commit()
+
+    async def get(self, path: str) -> WorkspaceUsage | None:
+        """Get the tracked usage of a workspace."""
+        cursor = await self.db.connection.execute(
+            "SELECT * FROM workspace_usage WHERE path = ?", (path,)
+        )
+        row = await cursor.fetchone()
+        if not row:
+            return None
+        return self._row_to_model(row)
+
+    async def list(self) -> builtins.list[WorkspaceUsage]:
+        """List all tracked workspaces, least recently used first."""
+        cursor = await self.db.connection.execute(
+            "SELECT * FROM workspace_usage ORDER BY last_used_at ASC"
+        )
+        rows = await cursor.fetchall()
+        return [self._row_to_model(row) for row in rows]
+
+    def _row_to_model(self, row: Any) -> WorkspaceUsage:
+        return row_to_model(WorkspaceUsage, row)
+
+
+class GitHubHTTPCacheDAO:
+    """DAO for persisted GitHub conditional-request cache entries."""
+
+    def __init__(self, db: Database):
+        self.db = db
+
+    async def get(self, cache_key: str) -> dict[str, Any] | None:
+        """Get a cached response by key."""
+        cursor = await self.db.connection.execute(
+            "SELECT etag, last_modified, body FROM github_http_cache WHERE cache_key = ?",
+            (cache_key,),
+        )
+        row = await cursor.fetchone()
+        return dict(row) if row else None
+
+    async def upsert(
+        self,
+        cache_key: str,
+        *,
+        etag: str | None,
+        last_modified: str | None,
+        body: str,
+    ) -> None:
+        """Insert or replace a cached response."""
+        await self.db.connection.execute(
+            """
+            INSERT INTO github_http_cache (cache_key, etag, last_modified, body, updated_at)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(cache_key) DO UPDATE SET
+                etag = excluded.etag,
+                last_modified = excluded.last_modified,
+                body = excluded.body,
+                updated_at = excluded.updated_at
+            """,
+            (cache_key, etag, last_modified, body, now_iso()),
+        )
+        await self.db.connection.commit()
+
+    async def touch(self, cache_key: str) -> None:
+        """Mark an entry as recently used (revalidated with a 304)."""
+        await self.db.connection.execute(
+            "UPDATE github_http_cache SET updated_at = ? WHERE cache_key = ?",
+            (now_iso(), cache_key),
+        )
+        await self.db.connection.commit()
+
+    async def prune(self, max_entries: int) -> int:
+        """Delete the least recently updated entries beyond max_entries."""
+        cursor = await self.db.connection.execute(
+            """
+            DELETE FROM github_http_cache
+            WHERE cache_key IN (
+                SELECT cache_key FROM github_http_cache
+                ORDER BY updated_at DESC
+                LIMIT -1 OFFSET ?
+            )
+            """,
+            (max_entries,),
+        )
+        await self.db.connection.commit()
+        return cursor.rowcount
+
+    async def clear(self) -> None:
+        """Delete all cached responses."""
+        await self.db.connection.execute("DELETE FROM github_http_cache")
+        await self.db.connection.commit()
+
+
+class ExecutorResultCacheDAO:
+    """DAO for cached CLI run results."""
+
+    def __init__(self, db: Database):
+        self.db = db
+
+    async def get(
+        self, cache_key: str, *, repo_id: str, tree_hash: str, created_after: datetime
+    ) -> dict[str, Any] | None:
+        """Get a cached result that is younger than created_after.
+
+        The repository and tree are matched as well as the key, so an entry is
+        never served for another repository or workspace content.
+        """
+        cursor = await self.db.connection.execute(
+            """
+            SELECT patch, summary, size_bytes FROM executor_result_cache
+            WHERE cache_key = ? AND repo_id = ? AND tree_hash = ? AND created_at >= ?
+            """,
+            (cache_key, repo_id, tree_hash, created_after.isoformat()),
+        )
+        row = await cursor.fetchone()
+        return dict(row) if row else None
+
+    async def upsert(
+        self,
+        cache_key: str,
+        *,
+        repo_id: str,
+        tree_hash: str,
+        executor_type: ExecutorType,
+        model: str | None,
+        patch: bytes,
+        summary: str | None,
+    ) -> None:
+        """Insert or replace a cached result."""
+        now = now_iso()
+        await self.db.connection.execute(
+            """
+            INSERT INTO executor_result_cache (
+                cache_key, repo_id, tree_hash, executor_type, model, patch, summary,
+                size_bytes, hits, created_at, last_used_at
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0, ?, ?)
+            ON CONFLICT(cache_key) DO UPDATE SET
+                patch = excluded.patch,
+                summary = excluded.summary,
+                size_bytes = excluded.size_bytes,
+                hits = 0,
+                created_at = excluded.created_at,
+                last_used_at = excluded.last_used_at
+            """,
+            (
+                cache_key,
+                repo_id,
+                tree_hash,
+                executor_type.value,
+                model,
+                patch,
+                summary,
+                len(patch),
+                now,
+                now,
+            ),
+        )
+        await self.db.connection.commit()
+
+    async def touch(self, cache_key: str) -> None:
+        """Record a hit on an entry."""
+        await self.db.connection.execute(
+            """
+            UPDATE executor_result_cache SET hits = hits + 1, last_used_at = ?
+            WHERE cache_key = ?
+            """,
+            (now_iso(), cache_key),
+        )
+        await self.db.connection.commit()
+
+    async def delete(self, cache_key: str) -> None:
+        """Delete an entry (e.g. one whose patch no longer applies)."""
+        await self.db.connection.execute(
+            "DELETE FROM executor_result_cache WHERE cache_key = ?", (cache_key,)
+        )
+        await self.db.connection.commit()
+
+    async def prune(self, *, created_before: datetime, max_bytes: int) -> int:
+        """Delete expired entries, then least recently used ones beyond max_bytes.
+
+        Returns:
+            Number of deleted entries.
+        """
+        cursor = await self.db.connection.execute(
+            "DELETE FROM executor_result_cache WHERE created_at < ?",
+            (created_before.isoformat(),),
+        )
+        deleted = cursor.rowcount
+        cursor = await self.db.connection.execute(
+            """
+            DELETE FROM executor_result_cache
+            WHERE cache_key IN (
+                SELECT cache_key FROM (
+                    SELECT
+                        cache_key,
+                        SUM(size_bytes) OVER (
+                            ORDER BY last_used_at DESC, cache_key
+                        ) AS running_bytes
+                    FROM executor_result_cache
+                )
+                WHERE running_bytes > ?
+            )
+            """,
+            (max_bytes,),
+        )
+        deleted += cursor.rowcount
+        await self.db.connection.commit()
+        return deleted
+
+    async def totals(self) -> tuple[int, int]:
+        """Number of entries and their combined patch size in bytes."""
+        cursor = await self.db.connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM executor_result_cache"
+        )
+        row = await cursor.fetchone()
+        return (int(row[0]), int(row[1])) if row else (0, 0)
+
+    async def clear(self) -> None:
+        """Delete all cached results."""
+        await self.db.connection.execute("DELETE FROM executor_result_cache")
+        await self.db.connection.commit()
+
+
+class WebhookDeliveryDAO:
+    """DAO for the GitHub webhook delivery inbox."""
+
+    def __init__(self, db: Database):
+        self.db = db
+
+    async def create_if_absent(
+        self,
+        delivery_id: str,
+        event: str,
+        action: str | None,
+        payload: str,
+    ) -> bool:
+        """Store a delivery unless its ID was already received.
+
+        Returns:
+            True if the delivery is new, False if it is a duplicate.
+        """
+        cursor = await self.db.connection.execute(
+            """
+            INSERT OR IGNORE INTO webhook_deliveries
+                (delivery_id, event, action, payload, status, received_at)
+            VALUES (?, ?, ?, ?, 'received', ?)
+            """,
+            (delivery_id, event, action, payload, now_iso()),
+        )
+        await self.db.connection.commit()
+        return cursor.rowcount > 0
+
+    async def get(self, delivery_id: str) -> WebhookDelivery | None:
+        """Get a delivery by ID."""
+        cursor = await self.db.connection.execute(
+            "SELECT * FROM webhook_deliveries WHERE delivery_id = ?", (delivery_id,)
+        )
+        row = await cursor.fetchone()
+        if not row:
+            return None
+        return self._row_to_model(row)
+
+    async def mark(self, delivery_id: str, status: str, error: str | None = None) -> None:
+        """Record the outcome of processing a delivery."""
+        await self.db.connection.execute(
+            """
+            UPDATE webhook_deliveries
+            SET status = ?, error = ?, attempts = attempts + 1, processed_at = ?
+            WHERE delivery_id = ?
+            """,
+            (status, error, now_iso(), delivery_id),
+        )
+        await self.db.connection.commit()
+
+    async def list_unprocessed(self, limit: int = 100) -> builtins.list[WebhookDelivery]:
+        """List deliveries that were received but not processed yet, oldest first."""
+        cursor = await self.db.connection.execute(
+            """
+            SELECT * FROM webhook_deliveries
+            WHERE status = 'received'
+            ORDER BY received_at ASC
+            LIMIT ?
+            """,
+            (limit,),
+        )
+        rows = await cursor.fetchall()
+        return [self._row_to_model(row) for row in rows]
+
+    async def delete_before(self, cutoff: datetime) -> int:
+        """Delete processed or failed deliveries received before the cutoff."""
+        cursor = await self.db.connection.execute(
+            """
+            DELETE FROM webhook_deliveries
+            WHERE status != 'received' AND received_at < ?
+            """,
+            (cutoff.isoformat(),),
+        )
+        await self.db.connection.commit()
+        return cursor.rowcount
+
+    def _row_to_model(self, row: Any) -> WebhookDelivery:
+        return row_to_model(WebhookDelivery, row)
@@ -73,6 +73,29 @@ class Database:
             )
             await conn.commit()
 
+        # Migration: Add resource_usage column to runs table if it doesn't exist
+        if "resource_usage" not in column_names:
+            await conn.execute("ALTER TABLE runs ADD COLUMN resource_usage TEXT")
+            await conn.commit()
+
+        # Migration: Add execution_stats column to runs and reviews tables
+        if "execution_stats" not in column_names:
+            await conn.execute("ALTER TABLE runs ADD COLUMN execution_stats TEXT")
+            await conn.commit()
+
+        # Migration: Add patch_truncated column to runs table if it doesn't exist
+        if "patch_truncated" not in column_names:
+            await conn.execute(
+                "ALTER TABLE runs ADD COLUMN patch_truncated INTEGER NOT NULL DEFAULT 0"
+            )
+            await conn.commit()
+
+        cursor = await conn.execute("PRAGMA table_info(reviews)")
+        review_columns = await cursor.fetchall()
+        if "execution_stats" not in [col["name"] for col in review_columns]:
+            await conn.execute("ALTER TABLE reviews ADD COLUMN execution_stats TEXT")
+            await conn.commit()
+
         # Migration: Add default_branch_prefix column to user_preferences table if it doesn't exist
         cursor = await conn.execute("PRAGMA table_info(user_preferences)")
         pref_columns = await cursor.fetchall()
@@ -182,6 +205,26 @@ class Database:
             await conn.execute("ALTER TABLE tasks ADD COLUMN working_branch TEXT")
             await conn.commit()
 
+        # Migration: Add sparse checkout profiles to repos and tasks
+        if "sparse_paths" not in task_column_names:
+            await conn.execute("ALTER TABLE tasks ADD COLUMN sparse_paths TEXT")
+            await conn.commit()
+
+        cursor = await conn.execute("PRAGMA table_info(repos)")
+        repo_columns = await cursor.fetchall()
+        repo_column_names = [col["name"] for col in repo_columns]
+
+        if "sparse_paths" not in repo_column_names:
+            await conn.execute("ALTER TABLE repos ADD COLUMN sparse_paths TEXT")
+            await conn.commit()
+
+        # Migration: Add cross-process cancel requests to jobs
+        cursor = await conn.execute("PRAGMA table_info(jobs)")
+        job_columns = await cursor.fetchall()
+        if "cancel_requested_at" not in [col["name"] for col in job_columns]:
+            await conn.execute("ALTER TABLE jobs ADD COLUMN cancel_requested_at TEXT")
+            await conn.commit()
+
     @property
     def connection(self) -> aiosqlite.Connection:
         """Get the database connection."""
@@ -8,6 +8,7 @@ CREATE TABLE IF NOT EXISTS repos (
     selected_branch TEXT,            -- user-selected branch for worktree base
     latest_commit TEXT NOT NULL,
     workspace_path TEXT NOT NULL,
+    sparse_paths TEXT,               -- JSON array: cone-mode sparse checkout profile
     created_at TEXT NOT NULL DEFAULT (datetime('now'))
 );
 
@@ -23,6 +24,7 @@ CREATE TABLE IF NOT EXISTS tasks (
     base_ref TEXT,  -- locked base branch for this task (set on first run)
     workspace_path TEXT,  -- fixed workspace path for this task
     working_branch TEXT,  -- fixed working branch for this task
+    sparse_paths TEXT,  -- JSON array: task-specific sparse checkout profile
     created_at TEXT NOT NULL DEFAULT (datetime('now')),
     updated_at TEXT NOT NULL DEFAULT (datetime('now'))
 );
@@ -58,10 +60,13 @@ CREATE TABLE IF NOT EXISTS runs (
     status TEXT NOT NULL DEFAULT 'queued',  -- queued, running, succeeded, failed, canceled
     summary TEXT,
     patch TEXT,
+    patch_truncated INTEGER NOT NULL DEFAULT 0,  -- 1 = patch cut at the size cap, not applicable
     files_changed TEXT,              -- JSON array of FileDiff
     logs TEXT,                       -- JSON array of log strings
     warnings TEXT,                   -- JSON array of warning strings
     error TEXT,
+    resource_usage TEXT,             -- JSON RunResourceUsage of the executor process tree
+    execution_stats TEXT,            -- JSON ExecutionStats (tokens, cost, timing) of the CLI
     created_at TEXT NOT NULL DEFAULT (datetime('now')),
     started_at TEXT,
     completed_at TEXT
@@ -85,6 +90,7 @@ CREATE TABLE IF NOT EXISTS jobs (
     locked_at TEXT,
     locked_by TEXT,
     last_error TEXT,
+    cancel_requested_at TEXT,              -- set to ask the owning worker to cancel a running job
     created_at TEXT NOT NULL DEFAULT (datetime('now')),
     updated_at TEXT NOT NULL DEFAULT (datetime('now'))
 );
@@ -177,6 +183,7 @@ CREATE TABLE IF NOT EXISTS reviews (
     overall_score REAL,
     logs TEXT,  -- JSON array
     error TEXT,
+    execution_stats TEXT,  -- JSON ExecutionStats (tokens, cost, timing) of the CLI
     created_at TEXT NOT NULL DEFAULT (datetime('now')),
     started_at TEXT,
     completed_at TEXT,
@@ -271,3 +278,62 @@ CREATE TABLE IF NOT EXISTS ci_checks (
 
 CREATE INDEX IF NOT EXISTS idx_ci_checks_task_id ON ci_checks(task_id);
 CREATE INDEX IF NOT EXISTS idx_ci_checks_pr_id ON ci_checks(pr_id);
+
+-- Workspace disk usage (maintained by the workspace garbage collector)
+CREATE TABLE IF NOT EXISTS workspace_usage (
+    path TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,                -- task (run workspace), repo (source clone)
+    repo_id TEXT,
+    task_id TEXT,
+    size_bytes INTEGER NOT NULL DEFAULT 0,
+    last_used_at TEXT,                 -- latest task/run activity
+    measured_at TEXT,
+    last_git_gc_at TEXT,
+    updated_at TEXT NOT NULL DEFAULT (datetime('now'))
+);
+
+CREATE INDEX IF NOT EXISTS idx_workspace_usage_repo ON workspace_usage(repo_id);
+
+-- Conditional-request cache for GitHub API reads (ETag / Last-Modified)
+CREATE TABLE IF NOT EXISTS github_http_cache (
+    cache_key TEXT PRIMARY KEY,        -- installation + URL
+    etag TEXT,
+    last_modified TEXT,
+    body TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_github_http_cache_updated ON github_http_cache(updated_at);
+
+-- Content-addressed cache of CLI run results (opt-in). Entries are keyed by
+-- repository, workspace tree, normalized instruction, executor and model.
+CREATE TABLE IF NOT EXISTS executor_result_cache (
+    cache_key TEXT PRIMARY KEY,        -- SHA-256 of the key fields
+    repo_id TEXT NOT NULL,
+    tree_hash TEXT NOT NULL,           -- git tree of the clean workspace
+    executor_type TEXT NOT NULL,
+    model TEXT,
+    patch BLOB NOT NULL,               -- staged diff (git diff --binary)
+    summary TEXT,
+    size_bytes INTEGER NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0,
+    created_at TEXT NOT NULL,
+    last_used_at TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_executor_result_cache_used ON executor_result_cache(last_used_at);
+
+-- Inbox of received GitHub webhook deliveries (deduplicated by delivery ID)
+CREATE TABLE IF NOT EXISTS webhook_deliveries (
+    delivery_id TEXT PRIMARY KEY,      -- X-GitHub-Delivery
+    event TEXT NOT NULL,               -- X-GitHub-Event
+    action TEXT,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'received', -- received, processed, failed
+    error TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    received_at TEXT NOT NULL,
+    processed_at TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_webhook_deliveries_status ON webhook_deliveries(status, received_at);
@@ -0,0 +1,80 @@
+"""Pooled HTTP clients for outbound API calls.
+
+Creating an ``httpx.AsyncClient`` per request pays a TCP + TLS handshake
+every time. Clients built here are long-lived, keep connections alive and
+negotiate HTTP/2 when the optional ``h2`` package is installed.
+
+- GitHubService owns its own client for api.github.com (see
+  ``GitHubService.http_client``).
+- Other outbound calls (Slack webhooks, Gemini API) share the client returned
+  by :func:`get_shared_http_client`.
+
+Both are closed in the FastAPI lifespan.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import logging
+
+import httpx
+
+from zloth_api.config import settings
+
+logger = logging.getLogger(__name__)
+
+_shared_client: httpx.AsyncClient | None = None
+
+
+def http2_available() -> bool:
+    """Return True if the optional ``h2`` package needed for HTTP/2 is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def build_http_client(
+    *,
+    base_url: str = "",
+    headers: dict[str, str] | None = None,
+) -> httpx.AsyncClient:
+    """Build a pooled AsyncClient using the configured limits and timeouts.
+
+    Args:
+        base_url: Optional base URL for relative request paths.
+        headers: Default headers sent with every request.
+
+    Returns:
+        A new AsyncClient. The caller owns it and must close it.
+    """
+    http2 = settings.http_client_http2 and http2_available()
+    if settings.http_client_http2 and not http2:
+        logger.debug("HTTP/2 requested but 'h2' is not installed; using HTTP/1.1")
+    return httpx.AsyncClient(
+        base_url=base_url,
+        headers=headers,
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=settings.http_client_max_connections,
+            max_keepalive_connections=settings.http_client_max_keepalive_connections,
+            keepalive_expiry=settings.http_client_keepalive_expiry_seconds,
+        ),
+        timeout=httpx.Timeout(
+            settings.http_client_timeout_seconds,
+            connect=settings.http_client_connect_timeout_seconds,
+        ),
+    )
+
+
+def get_shared_http_client() -> httpx.AsyncClient:
+    """Get the process-wide pooled client for non-GitHub outbound calls."""
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = build_http_client()
+    return _shared_client
+
+
+async def close_shared_http_client() -> None:
+    """Close the shared client (called on application shutdown)."""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
@@ -0,0 +1,83 @@
+"""Single-flight loads for in-memory caches of GitHub data.
+
+The credential manager and the listing cache both reload data that many
+requests ask for at once. ``SingleFlight`` holds what they share:
+
+- Concurrent loads of the same key run once; every caller awaits that task.
+- A cancelled caller does not cancel the load other callers wait for.
+- ``invalidate()`` bumps ``generation``. Loads started before it still finish
+  for their callers, but must compare the generation before storing results.
+- Background refreshes log their failures instead of raising.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """In-flight loads by key."""
+
+    def __init__(self) -> None:
+        self._inflight: dict[str, asyncio.Future[Any]] = {}
+        # Bumped by invalidate() so loads started before it are not stored
+        self.generation = 0
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._inflight
+
+    def start[T](self, key: str, factory: Callable[[], Awaitable[T]]) -> asyncio.Future[T]:
+        """Start a load, or join the load of the same key already running."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+
+            def _done(t: asyncio.Future[Any]) -> None:
+                if self._inflight.get(key) is t:
+                    del self._inflight[key]
+                if not t.cancelled():
+                    t.exception()  # Retrieved by the callers; avoid "never retrieved"
+
+            task.add_done_callback(_done)
+        return task
+
+    async def run[T](self, key: str, factory: Callable[[], Awaitable[T]]) -> T:
+        """Run ``factory`` once for concurrent callers with the same key."""
+        # A cancelled caller must not cancel the load other callers wait for
+        result: T = await asyncio.shield(self.start(key, factory))
+        return result
+
+    def run_in_background(
+        self, key: str, factory: Callable[[], Awaitable[Any]], description: str
+    ) -> None:
+        """Start a load nobody waits for, unless one is already running.
+
+        Args:
+            key: Load key.
+            factory: Starts the load.
+            description: What is refreshed, for the failure log message.
+        """
+        if key in self._inflight:
+            return
+
+        def _log_failure(t: asyncio.Future[Any]) -> None:
+            if not t.cancelled() and t.exception() is not None:
+                logger.warning(f"Background refresh of {description} failed: {t.exception()}")
+
+        self.start(key, factory).add_done_callback(_log_failure)
+
+    def tasks(self) -> list[asyncio.Future[Any]]:
+        """Loads currently running."""
+        return list(self._inflight.values())
+
+    def invalidate(self) -> None:
+        """Stop reusing running loads and keep them from storing their results."""
+        self.generation += 1
+        # Running loads finish for their current callers but are not reused
+        self._inflight.clear()
@@ -0,0 +1,198 @@
+"""Tests for CI log excerpts."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from zloth_api.domain.models import CIJobResult
+from zloth_api.services.agentic_orchestrator import CI_FIX_MAX_LOG_CHARS, AgenticOrchestrator
+from zloth_api.services.ci_log_service import CILogService, LogExcerptExtractor
+from zloth_api.services.github_service import GITHUB_API_HEADERS, GITHUB_API_URL, GitHubService
+from zloth_api.storage.db import Database
+
+
+def _log() -> list[str]:
+    lines = [f"2024-05-01T12:00:{i % 60:02d}.1234567Z step output {i}" for i in range(500)]
+    lines[100] = "2024-05-01T12:01:40.0000000Z \x1b[31mE   AssertionError: expected 2, got 3\x1b[0m"
+    lines[-1] = "2024-05-01T12:05:00.0000000Z ##[error]Process completed with exit code 1."
+    return lines
+
+
+def test_extractor_keeps_error_windows_and_tail() -> None:
+    extractor = LogExcerptExtractor(tail_lines=5, context_lines=2)
+    for line in _log():
+        extractor.feed(line)
+
+    excerpt = extractor.excerpt(max_chars=2000)
+    lines = excerpt.splitlines()
+
+    assert lines[:5] == [
+        "step output 98",
+        "step output 99",
+        "E   AssertionError: expected 2, got 3",
+        "step output 101",
+        "step output 102",
+    ]
+    assert lines[-1] == "##[error]Process completed with exit code 1."
+    assert "step output 495" in lines and "step output 300" not in lines
+
+    # The tail keeps at least half of a small budget
+    small = extractor.excerpt(max_chars=120)
+    assert len(small) <= 120
+    assert small.endswith("exit code 1.")
+
+
+class FakeGitHub:
+    def __init__(self, log_error: Exception | None = None):
+        self.streamed: list[int] = []
+        self.log_error = log_error
+
+    async def iter_job_log_lines(
+        self, repo_full_name: str, job_id: int, **kwargs: object
+    ) -> AsyncIterator[str]:
+        self.streamed.append(job_id)
+        if self.log_error:
+            raise self.log_error
+        for line in _log():
+            yield line
+
+
+CHECK_RUNS = [
+    {"id": 1, "name": "lint", "status": "completed", "conclusion": "success"},
+    {
+        "id": 2,
+        "name": "test",
+        "status": "completed",
+        "conclusion": "failure",
+        "app": {"slug": "github-actions"},
+        "output": {"summary": None, "text": None},
+    },
+    {
+        "id": 3,
+        "name": "external-ci",
+        "status": "completed",
+        "conclusion": "failure",
+        "app": {"slug": "circleci-checks"},
+        "output": {"summary": "3 tests failed"},
+    },
+]
+
+
+@pytest.mark.asyncio
+async def test_failed_jobs_carry_cached_log_excerpts() -> None:
+    github = FakeGitHub()
+    service = CILogService(github)  # type: ignore[arg-type]
+
+    jobs = await service.failed_jobs("o/r", CHECK_RUNS)
+    assert [(job.job_name, job.result) for job in jobs] == [
+        ("test", "failure"),
+        ("external-ci", "failure"),
+    ]
+    assert jobs[0].error_log is not None and "AssertionError" in jobs[0].error_log
+    assert jobs[1].error_log == "3 tests failed"
+
+    # Completed check runs are cached by ID
+    await service.failed_jobs("o/r", CHECK_RUNS)
+    assert github.streamed == [2]
+
+
+@pytest.mark.asyncio
+async def test_long_output_summary_leaves_room_for_the_log(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("zloth_api.services.ci_log_service.settings.ci_log_excerpt_max_chars", 2000)
+    service = CILogService(FakeGitHub())  # type: ignore[arg-type]
+    run = {**CHECK_RUNS[1], "output": {"summary": "Summary line. " * 500}}
+
+    excerpt = await service.excerpt("o/r", run)
+
+    assert excerpt is not None and len(excerpt) <= 2000
+    summary, _, log = excerpt.partition("\n\n")
+    assert summary.startswith("Summary line.") and len(summary) <= 500
+    # The end of the log (the actual failure) is kept
+    assert log.endswith("Process completed with exit code 1.")
+
+
+@pytest.mark.asyncio
+async def test_log_past_the_scan_limit_keeps_its_real_tail(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("zloth_api.services.ci_log_service.settings.ci_log_max_download_mb", 0)
+    service = CILogService(FakeGitHub())  # type: ignore[arg-type]
+
+    excerpt = await service.excerpt("o/r", CHECK_RUNS[1])
+
+    assert excerpt is not None
+    # Only the first line was scanned for errors, but the tail is the end of the log
+    assert "AssertionError" not in excerpt
+    assert excerpt.endswith("Process completed with exit code 1.")
+
+
+@pytest.mark.asyncio
+async def test_unreadable_logs_fall_back_to_output() -> None:
+    request = httpx.Request("GET", "https://api.github.com/")
+    github = FakeGitHub(
+        log_error=httpx.HTTPStatusError(
+            "forbidden", request=request, response=httpx.Response(403, request=request)
+        )
+    )
+    service = CILogService(github)  # type: ignore[arg-type]
+    run = {**CHECK_RUNS[1], "output": {"summary": "Tests failed"}}
+
+    assert await service.excerpt("o/r", run) == "Tests failed"
+
+
+@pytest.mark.asyncio
+async def test_job_log_is_streamed_from_redirect(test_db: Database) -> None:
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        if request.url.host == "api.github.com":
+            return httpx.Response(
+                302, headers={"Location": "https://logs.example.net/job/7?sig=abc"}
+            )
+        return httpx.Response(200, content=b"line 1\nline 2\n")
+
+    service = GitHubService(test_db)
+    service._http_client = httpx.AsyncClient(
+        base_url=GITHUB_API_URL, headers=GITHUB_API_HEADERS, transport=httpx.MockTransport(handler)
+    )
+    service._get_installation_token = AsyncMock(return_value="tok")  # type: ignore[method-assign]
+    service._get_installation_for_owner = AsyncMock(return_value="1")  # type: ignore[method-assign]
+
+    lines = [line async for line in service.iter_job_log_lines("o/r", 7)]
+
+    assert lines == ["line 1", "line 2"]
+    assert seen[0].url.path == "/repos/o/r/actions/jobs/7/logs"
+    assert seen[0].headers["Authorization"] == "Bearer tok"
+    assert "Authorization" not in seen[1].headers
+    await service.aclose()
+
+
+def test_fix_instruction_caps_log_size() -> None:
+    orchestrator = MagicMock()
+    orchestrator.merger.get_fix_strategy.return_value = "Fix it"
+    logs = ["head" + "~" * 6000 + "tail", "short", *("head" + "~" * 6000 + "tail",) * 2]
+    jobs = [
+        CIJobResult(job_name=f"job{i}", result="failure", error_log=log)
+        for i, log in enumerate(logs)
+    ]
+
+    instruction = AgenticOrchestrator._build_ci_fix_instruction(orchestrator, jobs)
+
+    assert instruction.count("~") <= CI_FIX_MAX_LOG_CHARS
+    # Every job gets a share, and each excerpt keeps both ends of its log
+    assert "short" in instruction
+    assert instruction.count("head") == 3 and instruction.count("tail") == 3
+    assert "Log excerpt omitted" not in instruction
+
+    many = [
+        CIJobResult(job_name=f"job{i}", result="failure", error_log="~" * 6000) for i in range(20)
+    ]
+    instruction = AgenticOrchestrator._build_ci_fix_instruction(orchestrator, many)
+    assert instruction.count("~") <= CI_FIX_MAX_LOG_CHARS
+    assert "## job19 (FAILED)" in instruction
+    assert "Log excerpt omitted" in instruction
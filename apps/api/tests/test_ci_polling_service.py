@@ -0,0 +1,121 @@
+"""Tests for the batched, adaptive CI polling scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from unittest.mock import AsyncMock
+
+import pytest
+
+from zloth_api.domain.enums import GitHubRequestPriority
+from zloth_api.domain.models import CIResult
+from zloth_api.services.ci_polling_service import CIPollingService
+
+
+def _poller(github: AsyncMock) -> CIPollingService:
+    poller = CIPollingService(github)
+    poller._min_interval = 0.01
+    poller._poll_interval = 0.05
+    poller._max_interval = 0.1
+    return poller
+
+
+@pytest.mark.asyncio
+async def test_prs_are_polled_in_one_batch_per_repository() -> None:
+    polls = {"o/a": 0}
+
+    async def statuses(owner: str, repo: str, numbers: list[int], **kwargs: object) -> dict:
+        assert kwargs["priority"] == GitHubRequestPriority.CI_POLLING
+        polls[f"{owner}/{repo}"] = polls.get(f"{owner}/{repo}", 0) + 1
+        done = polls[f"{owner}/{repo}"] >= 3
+        return {
+            n: {"head_sha": f"sha{n}", "ci_state": ("failure" if n == 2 else "success")}
+            if done
+            else {"head_sha": f"sha{n}", "ci_state": "pending"}
+            for n in numbers
+        }
+
+    github = AsyncMock()
+    github.get_pull_request_statuses.side_effect = statuses
+    github._github_request.return_value = {
+        "check_runs": [
+            {"name": "lint", "conclusion": "success"},
+            {"name": "test", "conclusion": "failure", "output": {"summary": "boom"}},
+        ]
+    }
+    poller = _poller(github)
+
+    results: dict[str, CIResult] = {}
+    finished = asyncio.Event()
+
+    def on_complete(task_id: str) -> Callable[[CIResult], Awaitable[None]]:
+        async def callback(result: CIResult) -> None:
+            results[task_id] = result
+            if len(results) == 3:
+                finished.set()
+
+        return callback
+
+    for task_id, repo, number in (("t1", "o/a", 1), ("t2", "o/a", 2), ("t3", "o/b", 3)):
+        await poller.start_polling(task_id, number, repo, on_complete(task_id))
+    assert poller.is_polling("t1")
+
+    await asyncio.wait_for(finished.wait(), 2)
+
+    # All PRs of a repository share one lookup per cycle
+    assert polls == {"o/a": 3, "o/b": 3}
+    assert results["t1"].success and results["t1"].sha == "sha1"
+    assert not results["t2"].success
+    assert [job.job_name for job in results["t2"].failed_jobs] == ["test"]
+    assert not poller.is_polling("t1")
+    assert poller.get_observation("o/a", 2, 60) == ("sha2", "failure")
+    await poller.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_timeout_and_stop() -> None:
+    github = AsyncMock()
+    github.get_pull_request_statuses.return_value = {}
+    poller = _poller(github)
+    poller._timeout_minutes = 0
+
+    timed_out = asyncio.Event()
+
+    async def on_timeout() -> None:
+        timed_out.set()
+
+    await poller.start_polling("t1", 1, "o/a", AsyncMock(), on_timeout)
+    await asyncio.wait_for(timed_out.wait(), 1)
+    assert not poller.is_polling("t1")
+
+    poller._timeout_minutes = 10
+    await poller.start_polling("t2", 2, "o/a", AsyncMock())
+    assert await poller.stop_polling("t2")
+    assert not await poller.stop_polling("t2")
+    await poller.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_interval_adapts_to_learned_ci_duration() -> None:
+    poller = CIPollingService(AsyncMock())
+    poller._min_interval, poller._poll_interval, poller._max_interval = 10, 30, 120
+
+    await poller.start_polling("t1", 1, "o/a", AsyncMock())
+    watch = poller._watches["t1"]
+    start = watch.sha_seen_at
+
+    # Without history: grow from the minimum towards the regular interval
+    assert [poller._next_interval(watch, start + 1) for _ in range(4)] == [10, 15, 22.5, 30]
+
+    # With a learned 10 minute CI: wait long early, poll fast near completion
+    poller._record_duration("o/a", 600)
+    assert poller._next_interval(watch, start + 60) == 120
+    assert poller._next_interval(watch, start + 400) == pytest.approx(40)
+    assert poller._next_interval(watch, start + 550) == 10
+    assert poller._next_interval(watch, start + 1000) == 10
+    assert poller._next_interval(watch, start + 1000) == 15
+
+    poller._record_duration("o/a", 300)
+    assert poller._ci_durations["o/a"] == pytest.approx(510)
+    await poller.shutdown()
@@ -0,0 +1,153 @@
+"""Tests for Claude Code stream-json decoding and bounded output storage."""
+
+from __future__ import annotations
+
+import json
+import stat
+from pathlib import Path
+
+import pytest
+
+from zloth_api.executors.claude_code_executor import ClaudeCodeExecutor, ClaudeCodeOptions
+from zloth_api.executors.output_spool import LINE_SPILL_BYTES, OutputSpool
+from zloth_api.executors.process_isolation import ProcessIsolator
+from zloth_api.executors.stream_json import StreamJsonDecoder
+from zloth_api.services.executor_admission import ExecutorAdmissionController
+
+SESSION = "0b7c6c8e-3f7a-4a51-9d1e-2f4e0c1d9a10"
+EVENTS = [
+    {"type": "system", "subtype": "init", "session_id": SESSION, "model": "claude-x"},
+    {
+        "type": "assistant",
+        "message": {
+            "model": "claude-x",
+            "content": [
+                {"type": "text", "text": "Reading the file"},
+                {"type": "tool_use", "id": "t1", "name": "Read", "input": {"path": "a.py"}},
+            ],
+        },
+    },
+    {
+        "type": "user",
+        "message": {"content": [{"type": "tool_result", "content": "x" * 200_000}]},
+    },
+    {
+        "type": "result",
+        "subtype": "success",
+        "is_error": False,
+        "session_id": SESSION,
+        "total_cost_usd": 0.0421,
+        "num_turns": 3,
+        "usage": {"input_tokens": 1200, "output_tokens": 340, "cache_read_input_tokens": 5000},
+    },
+]
+
+
+def test_decoder_displays_text_and_keeps_result() -> None:
+    decoder = StreamJsonDecoder()
+    displayed = [decoder.feed(json.dumps(event).encode()) for event in EVENTS]
+
+    assert displayed == [None, "Reading the file", None, None]
+    assert decoder.session_id == SESSION
+    assert decoder.model == "claude-x"
+    assert decoder.skipped_events == 1 and decoder.skipped_bytes > 200_000
+    assert decoder.tool_calls == 1
+    assert decoder.result is not None
+    assert decoder.result.cost == 0.0421
+    assert decoder.result.usage is not None and decoder.result.usage.cache_read_input_tokens == 5000
+
+    # Plain text and non-leading "type" keys still work
+    assert decoder.feed(b"Error: something broke\n") == "Error: something broke"
+    assert decoder.feed(b'{"message": "hi", "type": "system"}') == "[system] hi"
+    assert decoder.feed(b'{"type": "assistant", broken') == '{"type": "assistant", broken'
+
+
+def test_output_spool_keeps_one_bounded_copy(tmp_path: Path) -> None:
+    logs = ["Executing: claude"]
+    spool = OutputSpool(logs, memory_limit_bytes=100, spill_dir=tmp_path)
+
+    spool.append(b"first line\n")
+    spool.append(b"y" * (LINE_SPILL_BYTES + 1) + b"\n")
+    spool.append(b"second line\n")
+    for i in range(20):
+        spool.append(f"line {i:02d} {'z' * 10}\n".encode())
+    spool.close()
+
+    assert logs[:2] == ["Executing: claude", "first line"]
+    assert logs[2].startswith(f"[{LINE_SPILL_BYTES + 1} byte line spilled to {spool.spill_path}")
+    assert logs[3] == "second line"
+    assert logs[-1].startswith("[output beyond ")
+    assert len(logs) < 12
+    assert spool.spill_path is not None
+    spilled = spool.spill_path.read_bytes().splitlines()
+    assert spilled[0] == b"y" * (LINE_SPILL_BYTES + 1)
+    assert spilled[-1] == b"line 19 " + b"z" * 10
+    assert spool.tail(2) == ["line 18 zzzzzzzzzz", "line 19 zzzzzzzzzz"]
+    assert spool.line_count == 23
+
+
+@pytest.mark.asyncio
+async def test_executor_streams_display_text_and_reports_cost(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("zloth_api.executors.output_spool.settings.data_dir", tmp_path)
+    output = tmp_path / "events.jsonl"
+    output.write_text("".join(json.dumps(event) + "\n" for event in EVENTS))
+    cli = tmp_path / "claude"
+    cli.write_text(f'#!/bin/sh\ncat "{output}"\n')
+    cli.chmod(cli.stat().st_mode | stat.S_IEXEC)
+
+    executor = ClaudeCodeExecutor(
+        ClaudeCodeOptions(claude_cli_path=str(cli)),
+        admission=ExecutorAdmissionController(max_concurrent=1),
+        isolator=ProcessIsolator(mode="off"),
+    )
+    displayed: list[str] = []
+
+    async def on_output(text: str) -> None:
+        displayed.append(text)
+
+    result = await executor.execute(tmp_path, "do it", on_output=on_output)
+
+    assert result.success
+    assert displayed == ["Reading the file"]
+    assert result.session_id == SESSION
+    stats = result.stats
+    assert stats is not None
+    assert (stats.model, stats.cost_usd, stats.num_turns, stats.tool_calls) == (
+        "claude-x",
+        0.0421,
+        3,
+        1,
+    )
+    assert (stats.input_tokens, stats.output_tokens, stats.cache_read_tokens) == (1200, 340, 5000)
+    assert stats.total_tokens == 6540
+    assert stats.wall_time_ms is not None
+    # The tool result is not kept in the logs, only in the spill file
+    assert all(len(line) < LINE_SPILL_BYTES for line in result.logs)
+    assert len(list((tmp_path / "executor_output").glob("claude_code-*.log"))) == 1
+
+
+def test_codex_stats_are_parsed_from_text_output() -> None:
+    from zloth_api.executors.codex_executor import CodexOutputParser
+
+    output = [
+        "OpenAI Codex v0.77.0 (research preview)",
+        "model: gpt-5-codex",
+        "exec",
+        "bash -lc ls in /repo",
+        "[2025-08-01T10:00:00] exec bash -lc 'pytest' in /repo",
+        "tokens used",
+        "12,345",
+        "To continue this session, run codex resume 0199a213-81c0-7800-8aa1-bbab2a035a53",
+    ]
+    parser = CodexOutputParser()
+    for line in output:
+        parser.feed(line.encode())
+    stats = parser.stats()
+    assert (stats.model, stats.tool_calls, stats.total_tokens) == ("gpt-5-codex", 2, 12345)
+    assert parser.session_id == "0199a213-81c0-7800-8aa1-bbab2a035a53"
+
+    parser = CodexOutputParser()
+    parser.feed(b"[ts] tokens used: 99")
+    assert parser.stats().total_tokens == 99
@@ -301,6 +301,12 @@ class TestRunDAO:
         assert completed.status == RunStatus.SUCCEEDED
         assert completed.summary == "Fixed the issue"
         assert completed.completed_at is not None
+        assert not completed.patch_truncated
+
+        await dao.update_status(run.id, RunStatus.SUCCEEDED, patch_truncated=True)
+        truncated = await dao.get(run.id)
+        assert truncated is not None
+        assert truncated.patch_truncated
 
     @pytest.mark.asyncio
     async def test_update_status_with_error(
@@ -573,3 +579,89 @@ class TestAgenticRunDAO:
         assert retrieved is not None
         assert retrieved.last_ci_result is not None
         assert retrieved.last_ci_result.workflow_run_id == 123
+
+
+class TestMetricsDAOExecutionStats:
+    """Test suite for executor usage and cost aggregation."""
+
+    @pytest.mark.asyncio
+    async def test_aggregates_runs_and_reviews(self, test_db: Database) -> None:
+        from datetime import datetime, timedelta
+
+        from zloth_api.domain.enums import ReviewStatus
+        from zloth_api.domain.models import ExecutionStats, Review
+        from zloth_api.storage.dao import MetricsDAO, generate_id
+
+        repo_dao, task_dao = RepoDAO(test_db), TaskDAO(test_db)
+        run_dao, review_dao = RunDAO(test_db), ReviewDAO(test_db)
+        tasks = []
+        for name in ("a", "b"):
+            repo = await repo_dao.create(
+                repo_url=f"https://github.com/test/stats-{name}",
+                default_branch="main",
+                latest_commit="abc",
+                workspace_path=f"/workspaces/stats-{name}",
+            )
+            tasks.append(await task_dao.create(repo_id=repo.id, title=f"Task {name}"))
+
+        runs = [
+            (tasks[0], ExecutorType.CLAUDE_CODE, ExecutionStats(cost_usd=0.5, total_tokens=1000)),
+            (tasks[0], ExecutorType.CLAUDE_CODE, ExecutionStats(cost_usd=1.5, num_turns=4)),
+            (tasks[1], ExecutorType.CODEX_CLI, ExecutionStats(total_tokens=5000, tool_calls=3)),
+            (tasks[1], ExecutorType.GEMINI_CLI, None),
+        ]
+        run_ids = []
+        for task, executor_type, stats in runs:
+            run = await run_dao.create(
+                task_id=task.id, instruction="x", executor_type=executor_type
+            )
+            await run_dao.update_status(run.id, RunStatus.SUCCEEDED, execution_stats=stats)
+            run_ids.append(run.id)
+
+        review = Review(
+            id=generate_id(),
+            task_id=tasks[1].id,
+            target_run_ids=[run_ids[2]],
+            executor_type=ExecutorType.CLAUDE_CODE,
+            model_id=None,
+            model_name=None,
+            status=ReviewStatus.SUCCEEDED,
+            created_at=datetime.utcnow(),
+        )
+        await review_dao.create(review)
+        await review_dao.update_execution_stats(
+            review.id, ExecutionStats(cost_usd=0.25, wall_time_ms=2000)
+        )
+
+        stored = await run_dao.get(run_ids[1])
+        assert stored is not None and stored.execution_stats is not None
+        assert stored.execution_stats.num_turns == 4
+        stored_review = await review_dao.get(review.id)
+        assert stored_review is not None and stored_review.execution_stats is not None
+
+        metrics = MetricsDAO(test_db)
+        start, end = datetime.utcnow() - timedelta(days=1), datetime.utcnow() + timedelta(days=1)
+
+        by_executor = await metrics.get_execution_stats(start, end)
+        assert [b["key"] for b in by_executor] == ["claude_code", "codex_cli"]
+        claude = by_executor[0]
+        assert (claude["executions"], claude["runs"], claude["reviews"]) == (3, 2, 1)
+        assert claude["cost_usd"] == pytest.approx(2.25)
+        assert claude["avg_turns"] == 4
+        assert claude["avg_wall_time_seconds"] == 2
+        assert by_executor[1]["total_tokens"] == 5000 and by_executor[1]["cost_usd"] == 0
+
+        by_repo = await metrics.get_execution_stats(start, end, group_by="repo")
+        assert {b["key"]: b["executions"] for b in by_repo} == {
+            tasks[0].repo_id: 2,
+            tasks[1].repo_id: 2,
+        }
+        by_day = await metrics.get_execution_stats(start, end, tasks[1].repo_id, "day")
+        assert [b["executions"] for b in by_day] == [2]
+
+        costliest = await metrics.get_costliest_executions(start, end, limit=2)
+        assert [(e["kind"], e["id"]) for e in costliest] == [
+            ("run", run_ids[1]),
+            ("run", run_ids[0]),
+        ]
+        assert costliest[0]["stats"]["cost_usd"] == 1.5
@@ -0,0 +1,140 @@
+"""Tests for incremental diff capture."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import git
+import pytest
+
+from zloth_api.domain.models import FileDiff
+from zloth_api.services.diff_capture import (
+    TRUNCATED_MARKER,
+    capture_diff,
+    merge_file_diffs,
+    parse_numstat_z,
+)
+from zloth_api.services.workspace_service import WorkspaceService
+
+
+def _init_repo(path: Path) -> git.Repo:
+    repo = git.Repo.init(path)
+    with repo.config_writer() as cw:
+        cw.set_value("user", "name", "Test User")
+        cw.set_value("user", "email", "test@example.com")
+    repo.git.checkout("-b", "main")
+    (path / "keep.txt").write_text("keep\n")
+    (path / "old_name.py").write_text("".join(f"line {i}\n" for i in range(20)))
+    repo.index.add(["keep.txt", "old_name.py"])
+    repo.index.commit("Initial commit")
+    return repo
+
+
+class TestParseNumstatZ:
+    def test_regular_rename_and_binary(self) -> None:
+        output = "\0".join(
+            ["3\t1\tsrc/a.py", "0\t0\t", "old/b.py", "new/b.py", "-\t-\tlogo.png", ""]
+        )
+        stats = parse_numstat_z(output)
+
+        assert [s.path for s in stats] == ["src/a.py", "new/b.py", "logo.png"]
+        assert (stats[0].added_lines, stats[0].removed_lines) == (3, 1)
+        assert stats[1].old_path == "old/b.py"
+        assert stats[2].binary and stats[2].added_lines == 0
+
+    def test_empty_output(self) -> None:
+        assert parse_numstat_z("") == []
+
+
+class TestCaptureDiff:
+    def test_stats_and_patches_line_up(self, tmp_path: Path) -> None:
+        repo = _init_repo(tmp_path)
+        repo.git.mv("old_name.py", "new_name.py")
+        (tmp_path / "keep.txt").write_text("keep\nmore\n")
+        (tmp_path / "image.bin").write_bytes(bytes(range(256)))
+        repo.git.add("-A")
+
+        capture = capture_diff(repo, "HEAD", "--cached")
+
+        by_path = {f.path: f for f in capture.files}
+        assert set(by_path) == {"image.bin", "keep.txt", "new_name.py"}
+        assert by_path["new_name.py"].old_path == "old_name.py"
+        assert by_path["keep.txt"].added_lines == 1
+        assert "+more" in by_path["keep.txt"].patch
+        assert "Binary files" in by_path["image.bin"].patch
+        for f in capture.files:
+            assert f.patch.startswith(f"diff --git a/{f.old_path or f.path}")
+        assert not capture.truncated
+        patch_file = tmp_path.parent / "run.patch"
+        patch_file.write_text(capture.patch)
+        repo.git.apply("--check", "-R", "--cached", "--exclude=image.bin", str(patch_file))
+
+    def test_large_file_keeps_stats_but_truncates_patch(self, tmp_path: Path) -> None:
+        repo = _init_repo(tmp_path)
+        (tmp_path / "generated.json").write_text("".join(f'"{i}",\n' for i in range(5000)))
+        (tmp_path / "keep.txt").write_text("changed\n")
+        repo.git.add("-A")
+
+        capture = capture_diff(repo, "HEAD", "--cached", max_file_bytes=1024)
+
+        by_path = {f.path: f for f in capture.files}
+        assert by_path["generated.json"].added_lines == 5000
+        assert by_path["generated.json"].patch.endswith(TRUNCATED_MARKER)
+        assert len(by_path["generated.json"].patch) < 2048
+        assert TRUNCATED_MARKER not in by_path["keep.txt"].patch
+        assert capture.truncated
+
+    def test_total_cap_drops_remaining_patches(self, tmp_path: Path) -> None:
+        repo = _init_repo(tmp_path)
+        for name in ("a.txt", "b.txt", "c.txt"):
+            (tmp_path / name).write_text("x" * 600 + "\n")
+        repo.git.add("-A")
+
+        capture = capture_diff(repo, "HEAD", "--cached", max_total_bytes=1000)
+
+        assert [f.path for f in capture.files] == ["a.txt", "b.txt", "c.txt"]
+        assert TRUNCATED_MARKER not in capture.files[0].patch
+        assert capture.files[2].patch == TRUNCATED_MARKER
+        assert all(f.added_lines == 1 for f in capture.files)
+
+    def test_no_changes(self, tmp_path: Path) -> None:
+        repo = _init_repo(tmp_path)
+        capture = capture_diff(repo, "HEAD", "--cached")
+        assert capture.files == []
+        assert capture.patch == ""
+
+
+@pytest.mark.asyncio
+async def test_cumulative_diff_spans_run_commits(tmp_path: Path) -> None:
+    repo = _init_repo(tmp_path)
+    repo.git.checkout("-b", "zloth/feature")
+    service = WorkspaceService(workspaces_dir=tmp_path.parent)
+
+    (tmp_path / "first.txt").write_text("one\n")
+    repo.git.add("-A")
+    first = await service.capture_diff(tmp_path, staged=True)
+    repo.index.commit("Run 1")
+
+    (tmp_path / "second.txt").write_text("two\n")
+    repo.git.add("-A")
+    second = await service.capture_diff(tmp_path, staged=True)
+    repo.index.commit("Run 2")
+
+    assert [f.path for f in first.files] == ["first.txt"]
+    assert [f.path for f in second.files] == ["second.txt"]
+
+    cumulative = await service.capture_diff_range(tmp_path, "main")
+    assert sorted(f.path for f in cumulative.files) == ["first.txt", "second.txt"]
+
+
+def test_merge_file_diffs_follows_renames() -> None:
+    merged = merge_file_diffs(
+        [
+            [FileDiff(path="a.py", added_lines=2, patch="p1")],
+            [FileDiff(path="b.py", old_path="a.py", added_lines=1, removed_lines=1, patch="p2")],
+        ]
+    )
+    assert len(merged) == 1
+    assert merged[0].path == "b.py"
+    assert (merged[0].added_lines, merged[0].removed_lines) == (3, 1)
+    assert merged[0].patch == "p1\np2"
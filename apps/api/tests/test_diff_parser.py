@@ -0,0 +1,136 @@
+"""Tests for the offset-based unified diff parser."""
+
+from __future__ import annotations
+
+from zloth_api.services.diff_parser import (
+    iter_diff_stream,
+    iter_unified_diff,
+    parse_unified_diff,
+)
+
+GIT_DIFF = b"""diff --git a/src/app.py b/src/app.py
+index 1111111..2222222 100644
+--- a/src/app.py
++++ b/src/app.py
+@@ -1,3 +1,3 @@
+ import os
+--- not a header, just a removed line starting with dashes
++++ not a header, just an added line starting with pluses
+@@ -10,2 +10,3 @@ def main():
+ x = 1
++y = 2
+\\ No newline at end of file
+diff --git a/old name.py b/new name.py
+similarity index 90%
+rename from old name.py
+rename to new name.py
+index 3333333..4444444 100644
+--- a/old name.py
++++ b/new name.py
+@@ -1 +1 @@
+-a
++b
+diff --git a/logo.png b/logo.png
+new file mode 100644
+index 0000000..5555555
+Binary files /dev/null and b/logo.png differ
+diff --git a/added.txt b/added.txt
+new file mode 100644
+index 0000000..6666666
+--- /dev/null
++++ b/added.txt
+@@ -0,0 +1,2 @@
++one
++two
+diff --git a/gone.txt b/gone.txt
+deleted file mode 100644
+index 7777777..0000000
+--- a/gone.txt
++++ /dev/null
+@@ -1 +0,0 @@
+-bye
+diff --git a/moved.txt b/dir/moved.txt
+similarity index 100%
+rename from moved.txt
+rename to dir/moved.txt
+"""
+
+
+class TestGitDiff:
+    def test_paths_and_counts(self) -> None:
+        files = parse_unified_diff(GIT_DIFF)
+        summary = [(f.path, f.old_path, f.added_lines, f.removed_lines) for f in files]
+        assert summary == [
+            ("src/app.py", None, 2, 1),
+            ("new name.py", "old name.py", 1, 1),
+            ("logo.png", None, 0, 0),
+            ("added.txt", None, 2, 0),
+            ("gone.txt", None, 0, 1),
+            ("dir/moved.txt", "moved.txt", 0, 0),
+        ]
+
+    def test_spans_reference_source_buffer(self) -> None:
+        spans = list(iter_unified_diff(GIT_DIFF))
+        assert all(span.buffer is GIT_DIFF for span in spans)
+        assert spans[2].binary
+        assert spans[0].patch.startswith("diff --git a/src/app.py")
+        assert spans[0].patch.endswith("\\ No newline at end of file")
+        assert b"".join(bytes(s.raw) + b"\n" for s in spans) == GIT_DIFF
+
+    def test_str_and_bytes_agree(self) -> None:
+        assert parse_unified_diff(GIT_DIFF.decode()) == parse_unified_diff(GIT_DIFF)
+
+    def test_stream_matches_buffer(self) -> None:
+        expected = parse_unified_diff(GIT_DIFF)
+        for size in (1, 7, 64, len(GIT_DIFF)):
+            chunks = (GIT_DIFF[i : i + size] for i in range(0, len(GIT_DIFF), size))
+            streamed = [span.to_file_diff() for span in iter_diff_stream(chunks)]
+            assert streamed == expected
+
+    def test_stream_caps_each_file(self) -> None:
+        expected = parse_unified_diff(GIT_DIFF)
+        chunks = (GIT_DIFF[i : i + 7] for i in range(0, len(GIT_DIFF), 7))
+        spans = list(iter_diff_stream(chunks, max_file_bytes=60))
+        assert [s.path for s in spans] == [f.path for f in expected]
+        assert all(len(s.raw) <= 60 for s in spans)
+        assert spans[0].truncated
+        assert spans[0].patch.startswith("diff --git a/src/app.py")
+        uncapped = list(iter_diff_stream([GIT_DIFF], max_file_bytes=len(GIT_DIFF)))
+        assert [s.to_file_diff() for s in uncapped] == expected
+        assert not any(s.truncated for s in uncapped)
+
+
+class TestHeaderlessDiff:
+    def test_llm_style_patch(self) -> None:
+        patch = "\n".join(
+            [
+                "Here is the patch:",
+                "--- a/foo.py",
+                "+++ b/foo.py",
+                "@@ -1,1 +1,1 @@",  # wrong counts are ignored
+                "-old",
+                "-- removed line with dashes",
+                "++ added line with pluses",
+                "+new",
+                "--- /dev/null",
+                "+++ b/new.py",
+                "@@",
+                "+created",
+            ]
+        )
+        files = parse_unified_diff(patch)
+        assert [(f.path, f.added_lines, f.removed_lines) for f in files] == [
+            ("foo.py", 2, 2),
+            ("new.py", 1, 0),
+        ]
+        assert files[0].patch.startswith("--- a/foo.py")
+        assert files[1].patch.endswith("+created")
+
+    def test_deleted_file(self) -> None:
+        patch = "--- a/old.py\n+++ /dev/null\n@@ -1,2 +0,0 @@\n-a\n-b\n"
+        files = parse_unified_diff(patch)
+        assert [(f.path, f.removed_lines) for f in files] == [("old.py", 2)]
+
+    def test_empty(self) -> None:
+        assert parse_unified_diff("") == []
+        assert parse_unified_diff("no diff here\n") == []
@@ -0,0 +1,120 @@
+"""Tests for CLI executor admission control."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from zloth_api.domain.enums import ExecutorPriority, ExecutorType
+from zloth_api.services.executor_admission import (
+    ExecutorAdmissionController,
+    HostLoad,
+)
+
+CLAUDE = ExecutorType.CLAUDE_CODE
+CODEX = ExecutorType.CODEX_CLI
+
+
+def _controller(
+    host: list[HostLoad] | None = None, **kwargs: object
+) -> ExecutorAdmissionController:
+    load = host or [HostLoad(available_memory_mb=None, load_per_cpu=None)]
+    return ExecutorAdmissionController(host_load=lambda: load[0], **kwargs)  # type: ignore[arg-type]
+
+
+async def _settle() -> None:
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_limits_per_type_and_repo_and_priority_order() -> None:
+    admission = _controller(max_concurrent=3, max_per_type={"claude_code": 2}, max_per_repo=2)
+    admitted: list[str] = []
+
+    async def launch(
+        name: str, executor: ExecutorType, repo: str, priority: ExecutorPriority
+    ) -> None:
+        await admission.acquire(executor, repo=repo, priority=priority)
+        admitted.append(name)
+
+    tasks = [
+        asyncio.create_task(launch("c1", CLAUDE, "r1", ExecutorPriority.RUN)),
+        asyncio.create_task(launch("c2", CLAUDE, "r2", ExecutorPriority.RUN)),
+        # Claude is at its type limit; codex on another repo still starts
+        asyncio.create_task(launch("c3", CLAUDE, "r3", ExecutorPriority.REVIEW)),
+        asyncio.create_task(launch("x1", CODEX, "r1", ExecutorPriority.RUN)),
+        # Global limit reached: queued by priority
+        asyncio.create_task(launch("x2", CODEX, "r3", ExecutorPriority.REVIEW)),
+        asyncio.create_task(launch("x3", CODEX, "r4", ExecutorPriority.USER)),
+    ]
+    await _settle()
+    assert admitted == ["c1", "c2", "x1"]
+    status = admission.status()
+    assert status.running == 3 and status.queued == 3
+    assert status.running_by_repo == {"r1": 2, "r2": 1}
+
+    # Highest priority first; c3 still waits for a claude slot
+    admission.release(CODEX, repo="r1")
+    await _settle()
+    assert admitted[3:] == ["x3"]
+
+    admission.release(CLAUDE, repo="r1")
+    await _settle()
+    assert admitted[4:] == ["c3"]
+
+    admission.release(CLAUDE, repo="r2")
+    await _settle()
+    assert admitted[5:] == ["x2"]
+    await asyncio.gather(*tasks)
+
+
+@pytest.mark.asyncio
+async def test_host_load_holds_launches_until_headroom() -> None:
+    host = [HostLoad(available_memory_mb=3500, load_per_cpu=0.5)]
+    admission = _controller(
+        host,
+        max_concurrent=10,
+        min_available_memory_mb=1000,
+        memory_per_launch_mb=1000,
+        max_load_per_cpu=2.0,
+    )
+
+    # The first launch is never held back; recent launches count as used memory
+    for _ in range(3):
+        await asyncio.wait_for(admission.acquire(CLAUDE), 1)
+    waiting = asyncio.create_task(admission.acquire(CLAUDE))
+    await _settle()
+    assert not waiting.done()
+    assert admission.status().host_deferrals >= 1
+
+    # More memory but CPU overloaded: still held
+    host[0] = HostLoad(available_memory_mb=16000, load_per_cpu=3.0)
+    admission.release(CLAUDE)
+    await _settle()
+    assert not waiting.done()
+
+    host[0] = HostLoad(available_memory_mb=16000, load_per_cpu=1.0)
+    admission.release(CLAUDE)
+    await asyncio.wait_for(waiting, 1)
+    assert admission.status().running == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_leak_a_slot() -> None:
+    admission = _controller(max_concurrent=1)
+
+    async with admission.slot(CLAUDE, repo="r1"):
+        waiting = asyncio.create_task(admission.acquire(CODEX, repo="r1"))
+        await _settle()
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+
+    status = admission.status()
+    assert status.running == 0 and status.queued == 0
+    assert status.running_by_type == {} and status.running_by_repo == {}
+    async with asyncio.timeout(1):
+        async with admission.slot(CODEX):
+            assert admission.status().running_by_type == {CODEX: 1}
@@ -0,0 +1,93 @@
+"""Tests for the shared executor streaming pipeline and registry."""
+
+from __future__ import annotations
+
+import stat
+import sys
+from pathlib import Path
+
+import pytest
+
+from zloth_api.domain.enums import ExecutorType
+from zloth_api.executors import (
+    CodexExecutor,
+    GeminiExecutor,
+    GeminiOptions,
+    create_executor,
+    create_executors,
+    registered_executor_types,
+)
+from zloth_api.executors.process_isolation import ProcessIsolator
+from zloth_api.services.executor_admission import ExecutorAdmissionController
+
+pytestmark = pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Linux only")
+
+# One line well past the old 1 MB readline limit, then a few short ones
+FAKE_CLI = f"""#!{sys.executable}
+import sys
+
+sys.stdout.write("x" * (2 * 1024 * 1024) + "\\n")
+for i in range(5):
+    sys.stdout.write(f"line {{i}}\\n")
+sys.stdout.write("no trailing newline")
+sys.exit(int(sys.argv[1] == "fail"))
+"""
+
+
+@pytest.fixture
+def executor(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> GeminiExecutor:
+    monkeypatch.setattr("zloth_api.executors.output_spool.settings.data_dir", tmp_path)
+    cli = tmp_path / "gemini"
+    cli.write_text(FAKE_CLI)
+    cli.chmod(cli.stat().st_mode | stat.S_IEXEC)
+    return GeminiExecutor(
+        GeminiOptions(gemini_cli_path=str(cli), max_output_lines=3),
+        admission=ExecutorAdmissionController(max_concurrent=1),
+        isolator=ProcessIsolator(mode="off"),
+    )
+
+
+@pytest.mark.asyncio
+async def test_long_lines_stream_without_a_line_limit(
+    executor: GeminiExecutor, tmp_path: Path
+) -> None:
+    displayed: list[str] = []
+
+    async def on_output(text: str) -> None:
+        displayed.append(text)
+
+    result = await executor.execute(tmp_path, "go", on_output=on_output)
+    assert result.success, result.error
+    assert result.stats is not None and result.stats.wall_time_ms is not None
+    # Display is capped at max_output_lines
+    assert len(displayed) == 3
+    assert len(displayed[0]) == 2 * 1024 * 1024
+    assert displayed[1:] == ["line 0", "line 1"]
+
+    failed = await executor.execute(tmp_path, "fail", on_output=on_output)
+    assert not failed.success
+    assert failed.error is not None
+    assert failed.error.startswith("Gemini CLI exited with code 1")
+    assert failed.error.endswith("no trailing newline")
+
+
+def test_registry_creates_every_cli_executor(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("zloth_api.executors.base_executor.settings.codex_cli_path", "/opt/codex")
+    assert set(registered_executor_types()) == {
+        ExecutorType.CLAUDE_CODE,
+        ExecutorType.CODEX_CLI,
+        ExecutorType.GEMINI_CLI,
+    }
+
+    codex = create_executor(ExecutorType.CODEX_CLI, timeout_seconds=60)
+    assert isinstance(codex, CodexExecutor)
+    assert codex.cli_path == "/opt/codex"
+    assert codex.options.timeout_seconds == 60
+    assert {e.display_name for e in create_executors().values()} == {
+        "Claude Code",
+        "Codex",
+        "Gemini",
+    }
+
+    with pytest.raises(ValueError, match="Executor not available"):
+        create_executor(ExecutorType.PATCH_AGENT)
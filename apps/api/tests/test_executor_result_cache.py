@@ -0,0 +1,126 @@
+"""Tests for the content-addressed CLI run result cache."""
+
+from __future__ import annotations
+
+import stat
+import sys
+from pathlib import Path
+
+import git
+import pytest
+
+from zloth_api.domain.enums import ExecutorType
+from zloth_api.executors import GeminiExecutor, GeminiOptions
+from zloth_api.services.executor_result_cache import ExecutorResultCache, ResultCacheKey
+from zloth_api.services.git_service import GitService
+from zloth_api.storage.dao import ExecutorResultCacheDAO
+from zloth_api.storage.db import Database
+
+
+def _repo(path: Path) -> git.Repo:
+    repo = git.Repo.init(path)
+    repo.git.config("user.email", "test@example.com")
+    repo.git.config("user.name", "Test")
+    (path / "app.py").write_text("print('hello')\n")
+    repo.git.add("-A")
+    repo.git.commit("-m", "init")
+    return repo
+
+
+def _key(tree_hash: str, instruction: str = "Add a greeting", **overrides: str) -> ResultCacheKey:
+    fields = {"repo_id": "repo-1", "model": None, **overrides}
+    return ResultCacheKey(
+        tree_hash=tree_hash,
+        instruction=instruction,
+        executor_type=ExecutorType.CLAUDE_CODE,
+        **fields,
+    )
+
+
+@pytest.mark.asyncio
+async def test_cached_patch_reproduces_the_run(test_db: Database, tmp_path: Path) -> None:
+    git_service = GitService()
+    cache = ExecutorResultCache(ExecutorResultCacheDAO(test_db))
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+    repo = _repo(workspace)
+    tree_hash = await git_service.get_tree_hash(workspace)
+    assert tree_hash is not None
+
+    # What a CLI run would leave staged: an edit, a new file and a binary file
+    (workspace / "app.py").write_text("print('hello, world')\n")
+    (workspace / "notes.md").write_text("notes\n")
+    (workspace / "logo.bin").write_bytes(bytes(range(256)))
+    await git_service.stage_all(workspace)
+    patch = await git_service.get_staged_patch(workspace)
+    assert await cache.put(_key(tree_hash), patch, "Greets the world")
+    repo.git.reset("--hard")
+    repo.git.clean("-fd")
+
+    # Same repository, tree, executor and model; whitespace-only instruction changes
+    cached = await cache.get(_key(tree_hash, "  Add a greeting \r\n"))
+    assert cached is not None and cached.summary == "Greets the world"
+    await git_service.apply_patch(workspace, cached.patch)
+    assert (workspace / "app.py").read_text() == "print('hello, world')\n"
+    assert (workspace / "logo.bin").read_bytes() == bytes(range(256))
+    assert sorted(repo.git.diff("--cached", "--name-only").split()) == [
+        "app.py",
+        "logo.bin",
+        "notes.md",
+    ]
+
+    # Never served for another repository, tree, instruction or model
+    assert await cache.get(_key(tree_hash, repo_id="repo-2")) is None
+    assert await cache.get(_key("0" * 40)) is None
+    assert await cache.get(_key(tree_hash, "Add a farewell")) is None
+    assert await cache.get(_key(tree_hash, model="other-model")) is None
+
+    stats = await cache.stats()
+    assert (stats.hits, stats.misses, stats.stores, stats.entries) == (1, 4, 1, 1)
+    assert stats.hit_rate == pytest.approx(0.2)
+
+
+@pytest.mark.asyncio
+async def test_size_and_ttl_eviction(test_db: Database) -> None:
+    cache = ExecutorResultCache(ExecutorResultCacheDAO(test_db), max_bytes=250)
+    for tree in ("a", "b"):
+        assert await cache.put(_key(tree * 40), b"x" * 100, None)
+    # Using "a" makes "b" the least recently used entry
+    assert await cache.get(_key("a" * 40)) is not None
+    assert await cache.put(_key("c" * 40), b"x" * 100, None)
+    assert not await cache.put(_key("d" * 40), b"x" * 500, None)
+
+    assert await cache.get(_key("b" * 40)) is None
+    assert await cache.get(_key("a" * 40)) is not None
+    stats = await cache.stats()
+    assert (stats.entries, stats.size_bytes, stats.evictions) == (2, 200, 1)
+
+    # Expired entries are not served
+    cache.ttl_seconds = -1
+    assert await cache.get(_key("c" * 40)) is None
+    await cache.invalidate(_key("a" * 40))
+    assert (await cache.stats()).entries == 1
+
+
+@pytest.mark.asyncio
+async def test_entries_are_keyed_by_the_model_the_cli_runs(
+    test_db: Database, tmp_path: Path
+) -> None:
+    cli = tmp_path / "gemini"
+    cli.write_text(f"#!{sys.executable}\nprint('gemini 1.2.3')\n")
+    cli.chmod(cli.stat().st_mode | stat.S_IEXEC)
+    cache = ExecutorResultCache(ExecutorResultCacheDAO(test_db))
+
+    async def key_for(model: str | None) -> ResultCacheKey:
+        executor = GeminiExecutor(GeminiOptions(gemini_cli_path=str(cli), model=model))
+        identity = await executor.model_identity()
+        assert identity is not None
+        return _key("a" * 40, model=identity)
+
+    flash, pro, default = await key_for("flash"), await key_for("pro"), await key_for(None)
+    assert default.model == "default (gemini 1.2.3)"
+    assert await cache.put(flash, b"patch", None)
+
+    assert await cache.get(pro) is None
+    assert await cache.get(default) is None
+    assert await cache.get(flash) is not None
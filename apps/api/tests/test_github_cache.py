@@ -0,0 +1,76 @@
+"""Tests for the GitHub conditional-request (ETag) cache."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from zloth_api.services.github_cache import GitHubResponseCache
+from zloth_api.services.github_service import GITHUB_API_HEADERS, GITHUB_API_URL, GitHubService
+from zloth_api.storage.dao import GitHubHTTPCacheDAO
+from zloth_api.storage.db import Database
+
+
+def _service(test_db: Database, handler: httpx.MockTransport) -> GitHubService:
+    service = GitHubService(test_db)
+    service._http_client = httpx.AsyncClient(
+        base_url=GITHUB_API_URL, headers=GITHUB_API_HEADERS, transport=handler
+    )
+    service._get_installation_token = AsyncMock(return_value="tok")  # type: ignore[method-assign]
+    return service
+
+
+@pytest.mark.asyncio
+async def test_not_modified_is_served_from_cache(test_db: Database) -> None:
+    seen: list[httpx.Request] = []
+    state = {"etag": '"v1"', "body": {"state": "open"}}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        if request.headers.get("If-None-Match") == state["etag"]:
+            return httpx.Response(304, headers={"ETag": state["etag"]})
+        return httpx.Response(200, json=state["body"], headers={"ETag": state["etag"]})
+
+    service = _service(test_db, httpx.MockTransport(handler))
+
+    for _ in range(3):
+        assert await service._github_request("GET", "/repos/o/r/pulls/1") == {"state": "open"}
+    assert "If-None-Match" not in seen[0].headers
+    assert [r.headers.get("If-None-Match") for r in seen[1:]] == ['"v1"', '"v1"']
+
+    # A changed resource is re-downloaded and replaces the entry
+    state.update(etag='"v2"', body={"state": "closed"})
+    assert await service._github_request("GET", "/repos/o/r/pulls/1") == {"state": "closed"}
+    assert await service._github_request("GET", "/repos/o/r/pulls/1") == {"state": "closed"}
+
+    stats = service.cache_stats()
+    assert (stats.hits, stats.misses, stats.entries) == (3, 2, 1)
+
+    # Query parameters are part of the key; non-GET requests bypass the cache
+    await service._github_request("GET", "/repos/o/r/pulls", params={"page": 2})
+    await service._github_request("POST", "/repos/o/r/pulls", json={})
+    assert "If-None-Match" not in seen[-1].headers
+    assert service.cache_stats().entries == 2
+    await service.aclose()
+
+
+@pytest.mark.asyncio
+async def test_lru_bounds_and_persistence(test_db: Database) -> None:
+    cache = GitHubResponseCache(max_entries=2, max_bytes=1024, dao=GitHubHTTPCacheDAO(test_db))
+    for key in ("a", "b", "c"):
+        await cache.put(key, etag=f'"{key}"', last_modified=None, body="{}")
+    await cache.put("huge", etag='"h"', last_modified=None, body="x" * 2048)
+
+    stats = cache.stats()
+    assert (stats.entries, stats.evictions) == (2, 1)
+    assert await cache.get("huge") is None
+
+    # Evicted from memory, but still revalidatable from SQLite
+    restored = await cache.get("a")
+    assert restored is not None
+    assert restored.validator_headers() == {"If-None-Match": '"a"'}
+
+    await cache.clear()
+    assert await cache.get("b") is None
@@ -0,0 +1,137 @@
+"""Tests for the GitHub App credential manager."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import httpx
+import jwt
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from zloth_api.services.github_credentials import AppCredentials, GitHubCredentialManager
+from zloth_api.services.github_service import GITHUB_API_URL
+
+PRIVATE_KEY = (
+    rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    .private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    .decode()
+)
+
+INSTALLATIONS = [
+    {"id": 11, "account": {"login": "Octo-Org"}},
+    {"id": 22, "account": {"login": "octocat"}},
+]
+
+
+class FakeGitHub:
+    """Records app-authenticated requests and answers them."""
+
+    def __init__(self, token_lifetime: timedelta = timedelta(hours=1)):
+        self.token_lifetime = token_lifetime
+        self.minted: list[str] = []
+        self.installation_lists = 0
+        self.jwts: set[str] = set()
+        self.credential_loads = 0
+
+    async def load_credentials(self) -> AppCredentials:
+        self.credential_loads += 1
+        return ("123", PRIVATE_KEY, None)
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        app_jwt = request.headers["Authorization"].removeprefix("Bearer ")
+        assert jwt.decode(app_jwt, options={"verify_signature": False})["iss"] == "123"
+        self.jwts.add(app_jwt)
+        if request.url.path == "/app/installations":
+            self.installation_lists += 1
+            return httpx.Response(200, json=INSTALLATIONS)
+        installation_id = request.url.path.split("/")[3]
+        token = f"tok-{installation_id}-{len(self.minted)}"
+        self.minted.append(token)
+        expires_at = datetime.now(UTC) + self.token_lifetime
+        return httpx.Response(
+            201, json={"token": token, "expires_at": expires_at.isoformat().replace("+00:00", "Z")}
+        )
+
+    def manager(self, **kwargs: float) -> GitHubCredentialManager:
+        client = httpx.AsyncClient(
+            base_url=GITHUB_API_URL, transport=httpx.MockTransport(self.handler)
+        )
+        return GitHubCredentialManager(self.load_credentials, lambda: client, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_mint() -> None:
+    github = FakeGitHub()
+    manager = github.manager()
+
+    tokens = await asyncio.gather(*(manager.token("11") for _ in range(10)))
+    assert set(tokens) == {"tok-11-0"}
+
+    # Cached until expiry; the signer is built once and its JWT reused
+    assert await manager.token("11") == "tok-11-0"
+    assert await manager.token("22") == "tok-22-1"
+    assert github.minted == ["tok-11-0", "tok-22-1"]
+    assert github.credential_loads == 1
+    assert len(github.jwts) == 1
+
+    manager.invalidate()
+    assert await manager.token("11") == "tok-11-2"
+    assert github.credential_loads == 2
+    await manager.aclose()
+
+
+@pytest.mark.asyncio
+async def test_tokens_in_use_are_refreshed_before_expiry() -> None:
+    github = FakeGitHub(token_lifetime=timedelta(seconds=120))
+    # Refresh becomes due 0.2s after minting
+    manager = github.manager(refresh_margin_seconds=119.8)
+
+    assert await manager.token("11") == "tok-11-0"
+    await asyncio.sleep(0.1)
+    assert await manager.token("11") == "tok-11-0"  # Used -> refreshed when due
+
+    for _ in range(50):
+        if len(github.minted) == 2:
+            break
+        await asyncio.sleep(0.02)
+    assert github.minted == ["tok-11-0", "tok-11-1"]
+
+    # Callers get the refreshed token without waiting on a mint
+    assert await manager.token("11") == "tok-11-1"
+    assert len(github.minted) == 2
+    await manager.aclose()
+
+
+@pytest.mark.asyncio
+async def test_owner_mapping_is_cached() -> None:
+    now = [1000.0]
+    github = FakeGitHub()
+    manager = github.manager(installation_ttl_seconds=600)
+    manager._clock = lambda: now[0]
+
+    assert await manager.installation_for_owner("octo-org") == "11"
+    assert await manager.installation_for_owner("OctoCat") == "22"
+    assert github.installation_lists == 1
+
+    # Unknown owners refresh the list at most once per minute
+    assert await manager.installation_for_owner("someone") is None
+    assert await manager.installation_for_owner("someone") is None
+    assert github.installation_lists == 1
+    now[0] += 61
+    assert await manager.installation_for_owner("someone") is None
+    assert github.installation_lists == 2
+
+    now[0] += 600
+    assert await manager.installation_for_owner("octo-org") == "11"
+    assert github.installation_lists == 3
+
+    # Without a configured installation the first one is used
+    assert await manager.token() == "tok-11-0"
+    await manager.aclose()
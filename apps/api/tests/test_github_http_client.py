@@ -0,0 +1,61 @@
+"""Tests for the pooled GitHub API HTTP client."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from zloth_api.services.github_service import GITHUB_API_HEADERS, GITHUB_API_URL, GitHubService
+from zloth_api.storage.db import Database
+from zloth_api.utils.http_client import build_http_client
+
+
+@pytest.mark.asyncio
+async def test_client_is_reused_until_closed(test_db: Database) -> None:
+    service = GitHubService(test_db)
+
+    client = service.http_client
+    assert service.http_client is client
+    assert str(client.base_url).rstrip("/") == GITHUB_API_URL
+
+    await service.aclose()
+    assert client.is_closed
+    assert service.http_client is not client
+    await service.aclose()
+
+
+@pytest.mark.asyncio
+async def test_requests_share_one_client(test_db: Database) -> None:
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"ok": True})
+
+    service = GitHubService(test_db)
+    service._http_client = httpx.AsyncClient(
+        base_url=GITHUB_API_URL,
+        headers=GITHUB_API_HEADERS,
+        transport=httpx.MockTransport(handler),
+    )
+    service._get_installation_token = AsyncMock(return_value="tok")  # type: ignore[method-assign]
+
+    for _ in range(3):
+        assert await service._github_request("GET", "/repos/o/r/pulls/1") == {"ok": True}
+
+    assert [str(r.url) for r in seen] == ["https://api.github.com/repos/o/r/pulls/1"] * 3
+    assert all(r.headers["Authorization"] == "Bearer tok" for r in seen)
+    assert all(r.headers["X-GitHub-Api-Version"] == "2022-11-28" for r in seen)
+    await service.aclose()
+
+
+@pytest.mark.asyncio
+async def test_build_http_client_falls_back_without_h2(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("zloth_api.utils.http_client.http2_available", lambda: False)
+    client = build_http_client()
+    try:
+        assert client.timeout.connect is not None
+    finally:
+        await client.aclose()
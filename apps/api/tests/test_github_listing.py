@@ -0,0 +1,170 @@
+"""Tests for cached repository and branch listings."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from zloth_api.services.github_listing import (
+    PARTIAL_LISTING_TTL_SECONDS,
+    ListingCache,
+    PrefixIndex,
+)
+from zloth_api.services.github_service import GITHUB_API_HEADERS, GITHUB_API_URL, GitHubService
+from zloth_api.storage.db import Database
+
+
+def _repo(i: int, owner: str) -> dict:
+    return {
+        "id": i,
+        "name": f"repo-{i:03d}",
+        "full_name": f"{owner}/repo-{i:03d}",
+        "owner": {"login": owner},
+        "default_branch": "main",
+        "private": False,
+    }
+
+
+# Installation 1 has 250 repositories (3 pages); installation 2 shares one of them
+REPOS = {"1": [_repo(i, "octo-org") for i in range(250)], "2": [_repo(7, "octo-org")]}
+BRANCHES = ["main", "develop"] + [f"feature/{i:03d}" for i in range(228)]
+
+
+class FakeGitHub:
+    def __init__(self, failing: set[str] | None = None) -> None:
+        self.requests: list[httpx.Request] = []
+        self.failing = failing or set()
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        page = int(request.url.params["page"])
+        per_page = int(request.url.params["per_page"])
+        start = (page - 1) * per_page
+        if request.url.path == "/installation/repositories":
+            installation_id = request.headers["Authorization"].removeprefix("Bearer tok-")
+            if installation_id in self.failing:
+                return httpx.Response(404, json={"message": "Not Found"})
+            repos = REPOS[installation_id]
+            return httpx.Response(
+                200,
+                json={"total_count": len(repos), "repositories": repos[start : start + per_page]},
+            )
+        return httpx.Response(200, json=[{"name": b} for b in BRANCHES[start : start + per_page]])
+
+    def service(self, db: Database) -> GitHubService:
+        service = GitHubService(db)
+        service._http_client = httpx.AsyncClient(
+            base_url=GITHUB_API_URL,
+            headers=GITHUB_API_HEADERS,
+            transport=httpx.MockTransport(self.handler),
+        )
+        service._get_app_credentials = AsyncMock(  # type: ignore[method-assign]
+            return_value=("123", "key", None)
+        )
+        service._list_installations = AsyncMock(  # type: ignore[method-assign]
+            return_value=[{"id": 1}, {"id": 2}]
+        )
+        service._get_installation_token = AsyncMock(  # type: ignore[method-assign]
+            side_effect=lambda installation_id=None: f"tok-{installation_id}"
+        )
+        service._get_installation_for_owner = AsyncMock(  # type: ignore[method-assign]
+            return_value="1"
+        )
+        return service
+
+
+@pytest.mark.asyncio
+async def test_listings_are_paginated_cached_and_searchable(test_db: Database) -> None:
+    github = FakeGitHub()
+    service = github.service(test_db)
+
+    repos = await service.list_repos()
+    assert len(repos) == 250
+    assert [r.id for r in repos[:3]] == [0, 1, 2]
+    # 3 pages of installation 1, 1 page of installation 2
+    assert len(github.requests) == 4
+
+    branches = await service.list_branches("octo-org", "repo-001")
+    assert branches == BRANCHES
+    # 3 pages, and one window of concurrent pages past the end
+    branch_requests = len(github.requests) - 4
+    assert branch_requests <= 6
+
+    # Served from the cache, searched server-side
+    assert [r.full_name for r in await service.list_repos("REPO-24")] == [
+        f"octo-org/repo-{i}" for i in range(240, 250)
+    ]
+    assert [r.name for r in await service.list_repos("octo-org/repo-00", limit=2)] == [
+        "repo-000",
+        "repo-001",
+    ]
+    assert await service.list_branches("Octo-Org", "Repo-001", "feature/22") == [
+        f"feature/{i}" for i in range(220, 228)
+    ]
+    assert len(github.requests) == 4 + branch_requests
+
+    # An explicit refresh reloads the listing
+    await service.list_repos(refresh=True)
+    assert len(github.requests) == 8 + branch_requests
+    await service.aclose()
+
+
+@pytest.mark.asyncio
+async def test_failed_installations_are_not_cached_for_the_full_ttl(test_db: Database) -> None:
+    partial = FakeGitHub(failing={"2"}).service(test_db)
+    assert len(await partial.list_repos()) == 250
+    assert partial.listings._entries["repos"].ttl == PARTIAL_LISTING_TTL_SECONDS
+    await partial.aclose()
+
+    failed = FakeGitHub(failing={"1", "2"}).service(test_db)
+    with pytest.raises(httpx.HTTPStatusError):
+        await failed.list_repos()
+    assert "repos" not in failed.listings._entries
+    await failed.aclose()
+
+
+@pytest.mark.asyncio
+async def test_stale_listing_is_served_while_refreshing() -> None:
+    now = [0.0]
+    cache = ListingCache(ttl_seconds=60, clock=lambda: now[0])
+    loads: list[int] = []
+    release = asyncio.Event()
+
+    async def load() -> PrefixIndex[str]:
+        loads.append(len(loads))
+        if len(loads) > 1:
+            await release.wait()
+        return PrefixIndex([f"v{len(loads)}"], lambda item: (item,))
+
+    # Concurrent misses share one load
+    first = await asyncio.gather(*(cache.get("k", load) for _ in range(5)))
+    assert {index.items[0] for index in first} == {"v1"}
+    assert loads == [0]
+
+    now[0] += 61
+    stale = await asyncio.wait_for(cache.get("k", load), 1)
+    assert stale.items == ["v1"]
+    await asyncio.sleep(0)
+    assert len(loads) == 2  # Refresh started in the background
+
+    release.set()
+    for _ in range(50):
+        if (await cache.get("k", load)).items == ["v2"]:
+            break
+        await asyncio.sleep(0.01)
+    assert (await cache.get("k", load)).items == ["v2"]
+    assert len(loads) == 2
+    await cache.aclose()
+
+
+def test_prefix_index_matches_any_key_once() -> None:
+    index = PrefixIndex(["Alpha/app", "alpha/api", "beta/alpha"], lambda s: (s, s.split("/")[1]))
+
+    assert index.search("ALPHA") == ["beta/alpha", "alpha/api", "Alpha/app"]
+    assert index.search("ap") == ["alpha/api", "Alpha/app"]
+    assert index.search("alpha/", limit=1) == ["alpha/api"]
+    assert index.search("zeta") == []
+    assert index.search(None, limit=2) == ["Alpha/app", "alpha/api"]
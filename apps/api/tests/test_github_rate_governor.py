@@ -0,0 +1,127 @@
+"""Tests for the GitHub rate-limit governor."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from zloth_api.domain.enums import GitHubRequestPriority
+from zloth_api.services.github_rate_governor import GitHubRateGovernor
+from zloth_api.services.github_service import GITHUB_API_HEADERS, GITHUB_API_URL, GitHubService
+from zloth_api.storage.db import Database
+
+
+@pytest.mark.asyncio
+async def test_requests_are_granted_by_priority() -> None:
+    governor = GitHubRateGovernor(burst=1, rate_per_second=50)
+    await governor.acquire("1")  # Drain the bucket
+
+    order: list[GitHubRequestPriority] = []
+
+    async def request(priority: GitHubRequestPriority) -> None:
+        await governor.acquire("1", priority=priority)
+        order.append(priority)
+
+    tasks = [
+        asyncio.create_task(request(p))
+        for p in (
+            GitHubRequestPriority.BACKGROUND,
+            GitHubRequestPriority.CI_POLLING,
+            GitHubRequestPriority.USER,
+            GitHubRequestPriority.MERGE_GATE,
+        )
+    ]
+    await asyncio.sleep(0)
+    assert governor.status()[0].queue_depth == 4
+
+    await asyncio.wait_for(asyncio.gather(*tasks), 1)
+    assert order == [
+        GitHubRequestPriority.USER,
+        GitHubRequestPriority.MERGE_GATE,
+        GitHubRequestPriority.CI_POLLING,
+        GitHubRequestPriority.BACKGROUND,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_background_waits_when_budget_is_low() -> None:
+    governor = GitHubRateGovernor(burst=10, rate_per_second=10)
+    reset = str(int(time.time()) + 600)
+    governor.record_response(
+        "1",
+        "core",
+        200,
+        {"X-RateLimit-Limit": "100", "X-RateLimit-Remaining": "15", "X-RateLimit-Reset": reset},
+    )
+
+    background = asyncio.create_task(
+        governor.acquire("1", priority=GitHubRequestPriority.BACKGROUND)
+    )
+    await asyncio.wait_for(governor.acquire("1", priority=GitHubRequestPriority.USER), 0.5)
+    await asyncio.sleep(0.05)
+    assert not background.done()
+
+    (status,) = governor.status()
+    assert (status.limit, status.remaining) == (100, 14)
+    assert status.queued == {GitHubRequestPriority.BACKGROUND: 1}
+
+    background.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await background
+    assert governor.status()[0].queue_depth == 0
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_responses_back_off() -> None:
+    governor = GitHubRateGovernor(max_backoff_seconds=60)
+
+    assert not governor.record_response("1", "core", 403, {})  # Permission error
+    assert governor.record_response("1", "core", 429, {"Retry-After": "30"})
+    assert governor.status()[0].backoff_seconds == pytest.approx(30, abs=1)
+
+    # Backoff doubles on repeated limits and resets after a success
+    assert governor.record_response("1", "core", 403, {"X-RateLimit-Remaining": "0"})
+    assert governor.status()[0].backoff_seconds == pytest.approx(60, abs=1)
+    governor.record_response("1", "core", 200, {})
+    assert governor._buckets[("1", "core")].backoff == 0
+
+
+@pytest.mark.asyncio
+async def test_secondary_rate_limit_without_headers_backs_off() -> None:
+    governor = GitHubRateGovernor(max_backoff_seconds=600)
+    body = '{"message": "You have exceeded a secondary rate limit. Please wait a few minutes."}'
+
+    assert governor.record_response("1", "core", 403, {}, body=body)
+    assert governor.status()[0].backoff_seconds == pytest.approx(60, abs=1)
+    assert not governor.record_response("1", "core", 403, {}, body='{"message": "Forbidden"}')
+
+
+@pytest.mark.asyncio
+async def test_github_request_retries_after_rate_limit(test_db: Database) -> None:
+    responses = [
+        httpx.Response(429, headers={"Retry-After": "1"}),
+        httpx.Response(200, json={"ok": True}, headers={"X-RateLimit-Remaining": "4999"}),
+    ]
+
+    service = GitHubService(test_db)
+    service._http_client = httpx.AsyncClient(
+        base_url=GITHUB_API_URL,
+        headers=GITHUB_API_HEADERS,
+        transport=httpx.MockTransport(lambda request: responses.pop(0)),
+    )
+    service._get_installation_token = AsyncMock(return_value="tok")  # type: ignore[method-assign]
+    service.rate_governor = GitHubRateGovernor(max_backoff_seconds=0.01)
+
+    result = await service._github_request(
+        "GET", "/repos/o/r", installation_id="7", priority=GitHubRequestPriority.CI_POLLING
+    )
+
+    assert result == {"ok": True}
+    assert not responses
+    (status,) = service.rate_limit_status()
+    assert (status.installation, status.resource, status.remaining) == ("7", "core", 4999)
+    await service.aclose()
@@ -1,10 +1,19 @@
 from __future__ import annotations
 
 import asyncio
+from pathlib import Path
 
 import pytest
 
+from zloth_api.config import settings
+from zloth_api.domain.enums import ExecutorType, JobKind, JobStatus
+from zloth_api.domain.models import Job
+from zloth_api.executors.process_isolation import ProcessIsolator
+from zloth_api.executors.process_registry import get_process_registry
+from zloth_api.queue.sqlite import SQLiteQueue
+from zloth_api.services import job_worker as job_worker_module
 from zloth_api.services.job_worker import JobWorker
+from zloth_api.storage.db import Database
 
 
 class _FlakyQueue:
@@ -32,3 +41,47 @@ async def test_worker_survives_dequeue_exception() -> None:
 
     assert worker.is_running is True
     await worker.stop()
+
+
+@pytest.mark.asyncio
+async def test_cancel_reaches_a_job_running_in_another_worker(
+    test_db: Database, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "worker_cancel_poll_interval_seconds", 0.02)
+    monkeypatch.setattr(job_worker_module, "CANCEL_GRACE_SECONDS", 0.2)
+    started = asyncio.Event()
+    processes = []
+
+    async def handler(job: Job) -> None:
+        isolated = await ProcessIsolator(mode="off").spawn(
+            ["sleep", "60"], ExecutorType.CLAUDE_CODE
+        )
+        get_process_registry().register(isolated)
+        processes.append(isolated.process)
+        started.set()
+        # Stops waiting on cancellation but leaves the process running
+        await asyncio.shield(isolated.process.wait())
+
+    # The worker owning the job has its own connection, like a separate process
+    worker_db = Database(db_path=tmp_path / "test.db")
+    await worker_db.connect()
+    owner = JobWorker(
+        queue=SQLiteQueue(worker_db),
+        handlers={JobKind.RUN_EXECUTE: handler},
+        poll_interval_seconds=0.01,
+    )
+    api = JobWorker(queue=SQLiteQueue(test_db), handlers={})
+    try:
+        await api.queue.enqueue(kind=JobKind.RUN_EXECUTE, ref_id="run-1")
+        owner.start()
+        await asyncio.wait_for(started.wait(), timeout=5)
+
+        assert await api.cancel_ref(kind=JobKind.RUN_EXECUTE, ref_id="run-1")
+
+        assert processes[0].returncode is not None
+        job = await api.queue.get_by_ref(kind=JobKind.RUN_EXECUTE, ref_id="run-1")
+        assert job is not None and job.status == JobStatus.CANCELED
+        assert not await api.cancel_ref(kind=JobKind.RUN_EXECUTE, ref_id="run-1")
+    finally:
+        await owner.stop()
+        await worker_db.disconnect()
@@ -0,0 +1,109 @@
+"""Tests for merge gate evaluation."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from zloth_api.services.merge_gate_service import MergeGateService
+from zloth_api.services.settings_service import SettingsService
+
+PR_DATA = {"head": {"sha": "abc123"}, "mergeable": True, "mergeable_state": "clean"}
+
+
+def _gate(github: AsyncMock) -> MergeGateService:
+    return MergeGateService(github, AsyncMock(), SettingsService())
+
+
+@pytest.mark.asyncio
+async def test_pr_is_fetched_once_and_ci_result_cached_per_sha() -> None:
+    github = AsyncMock()
+    github.get_pull_request.return_value = PR_DATA
+    github.get_commit_status.side_effect = ["pending", "success"]
+    gate = _gate(github)
+
+    result = await gate.check_all_conditions(1, "o/r", 0.9)
+    assert not result.can_merge
+    assert result.failed == ["CI Green"]
+    assert [c.name for c in result.conditions] == [
+        "CI Green",
+        "Review Score",
+        "No Conflicts",
+        "PR Mergeable",
+    ]
+
+    # Pending CI is looked up again; a finished run is cached for the SHA
+    for _ in range(3):
+        result = await gate.check_all_conditions(1, "o/r", 0.9)
+        assert result.can_merge
+
+    assert github.get_pull_request.await_count == 4
+    assert github.get_commit_status.await_count == 2
+    github.get_commit_status.assert_awaited_with("o/r", "abc123", priority="merge_gate")
+
+    # A new push changes the head SHA and invalidates the cached CI result
+    github.get_pull_request.return_value = {**PR_DATA, "head": {"sha": "def456"}}
+    github.get_commit_status.side_effect = ["failure"]
+    result = await gate.check_all_conditions(1, "o/r", 0.9)
+    assert result.failed == ["CI Green"]
+
+
+@pytest.mark.asyncio
+async def test_failed_ci_is_checked_again_after_a_rerun() -> None:
+    github = AsyncMock()
+    github.get_pull_request.return_value = PR_DATA
+    # Failed jobs are re-run on GitHub and pass on the same head SHA
+    github.get_commit_status.side_effect = ["failure", "success"]
+    gate = _gate(github)
+
+    result = await gate.check_all_conditions(1, "o/r", 0.9)
+    assert result.failed == ["CI Green"]
+
+    result = await gate.check_all_conditions(1, "o/r", 0.9)
+    assert result.can_merge
+    assert github.get_commit_status.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_fail_fast_skips_remaining_checks() -> None:
+    started = asyncio.Event()
+
+    async def slow_pull_request(*args: object, **kwargs: object) -> dict:
+        started.set()
+        await asyncio.sleep(10)
+        return PR_DATA
+
+    github = AsyncMock()
+    github.get_pull_request.side_effect = slow_pull_request
+    gate = _gate(github)
+
+    # A low review score fails the gate without waiting for GitHub
+    result = await asyncio.wait_for(gate.check_all_conditions(1, "o/r", 0.1, fail_fast=True), 1)
+    assert started.is_set()
+    assert not result.can_merge
+    assert [c.name for c in result.conditions] == ["Review Score"]
+
+    # Conflicts make the CI status lookup unnecessary
+    github.get_pull_request.side_effect = None
+    github.get_pull_request.return_value = {
+        **PR_DATA,
+        "mergeable": False,
+        "mergeable_state": "dirty",
+    }
+    result = await gate.check_all_conditions(1, "o/r", 0.9, fail_fast=True)
+    assert result.failed == ["No Conflicts", "PR Mergeable"]
+    github.get_commit_status.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_pr_fetch_error_fails_github_conditions() -> None:
+    github = AsyncMock()
+    github.get_pull_request.side_effect = RuntimeError("boom")
+    gate = _gate(github)
+
+    result = await gate.check_all_conditions(1, "o/r", 0.9)
+
+    assert result.failed == ["CI Green", "No Conflicts", "PR Mergeable"]
+    assert all("boom" in (c.message or "") for c in result.conditions if not c.passed)
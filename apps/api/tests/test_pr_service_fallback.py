@@ -1,4 +1,4 @@
-"""Tests for PRService fallback description generation with templates."""
+"""Tests for PRService fallbacks: template descriptions and patch application."""
 
 from __future__ import annotations
 
@@ -7,7 +7,8 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from zloth_api.domain.enums import ExecutorType
-from zloth_api.domain.models import PR, Run
+from zloth_api.domain.models import PR, PRUpdate, Run
+from zloth_api.errors import ValidationError
 from zloth_api.services.pr_service import PRService
 
 
@@ -151,3 +152,22 @@ class TestFallbackDescriptionWithTemplate:
         )
         # Should use zloth default format
         assert "## Summary" in result
+
+
+class TestUpdateWithTruncatedPatch:
+    """Truncated run patches are never applied to a PR branch."""
+
+    @pytest.mark.asyncio
+    async def test_refuses_truncated_patch(self, pr_service: PRService) -> None:
+        pr_service.pr_dao.get.return_value = MagicMock(spec=PR, task_id="task-1", branch="pr")
+        run = MagicMock(spec=Run)
+        run.commit_sha = "abc1234"
+        run.working_branch = "other"
+        run.patch = SAMPLE_DIFF
+        run.patch_truncated = True
+        pr_service.run_dao.get.return_value = run
+
+        with pytest.raises(ValidationError, match="truncated"):
+            await pr_service.update("task-1", "pr-1", PRUpdate(selected_run_id="run-1"))
+
+        pr_service.git_service.checkout.assert_not_called()
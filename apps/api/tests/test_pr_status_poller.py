@@ -0,0 +1,135 @@
+"""Tests for batched PR status polling."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from zloth_api.domain.models import PR
+from zloth_api.services.github_service import GITHUB_API_HEADERS, GITHUB_API_URL, GitHubService
+from zloth_api.services.pr_status_poller import PRStatusPoller
+from zloth_api.storage.db import Database
+
+
+def _pr(owner: str, repo: str, number: int) -> PR:
+    return PR(
+        id=f"{repo}-{number}",
+        task_id="task",
+        number=number,
+        url=f"https://github.com/{owner}/{repo}/pull/{number}",
+        branch=f"zloth/{number}",
+        title="t",
+        body=None,
+        latest_commit="abc",
+        status="open",
+        created_at=datetime(2024, 1, 1),
+        updated_at=datetime(2024, 1, 1),
+    )
+
+
+def _graphql_handler(requests: list[dict]) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        requests.append(payload)
+        nodes: dict[str, object] = {}
+        for number in map(int, re.findall(r"pullRequest\(number: (\d+)\)", payload["query"])):
+            if number == 404:
+                nodes[f"pr{number}"] = None
+                continue
+            nodes[f"pr{number}"] = {
+                "number": number,
+                "state": "MERGED" if number % 10 == 0 else "OPEN",
+                "merged": number % 10 == 0,
+                "mergedAt": None,
+                "mergeable": "UNKNOWN" if number % 2 else "MERGEABLE",
+                "headRefOid": f"sha{number}",
+            }
+        return httpx.Response(200, json={"data": {"repository": nodes}})
+
+    return httpx.MockTransport(handler)
+
+
+def _service(test_db: Database, transport: httpx.MockTransport) -> GitHubService:
+    service = GitHubService(test_db)
+    service._http_client = httpx.AsyncClient(
+        base_url=GITHUB_API_URL, headers=GITHUB_API_HEADERS, transport=transport
+    )
+    service._get_installation_token = AsyncMock(return_value="tok")  # type: ignore[method-assign]
+    service._get_installation_for_owner = AsyncMock(return_value="1")  # type: ignore[method-assign]
+    return service
+
+
+@pytest.mark.asyncio
+async def test_statuses_are_fetched_in_batches(test_db: Database) -> None:
+    requests: list[dict] = []
+    service = _service(test_db, _graphql_handler(requests))
+
+    statuses = await service.get_pull_request_statuses("o", "r", [*range(1, 251), 404])
+
+    assert len(requests) == 3
+    assert requests[0]["variables"] == {"owner": "o", "name": "r"}
+    assert len(statuses) == 250 and 404 not in statuses
+    assert statuses[10] == {
+        "state": "closed",
+        "merged": True,
+        "merged_at": None,
+        "mergeable": True,
+        "head_sha": "sha10",
+        "ci_state": "pending",
+    }
+    assert statuses[3]["mergeable"] is None
+    await service.aclose()
+
+
+@pytest.mark.asyncio
+async def test_poll_groups_prs_by_repository(test_db: Database) -> None:
+    requests: list[dict] = []
+    service = _service(test_db, _graphql_handler(requests))
+    prs = [_pr("o", "a", n) for n in range(1, 151)] + [_pr("o", "b", n) for n in range(1, 31)]
+    prs.append(_pr("o", "c", 5))
+    prs.append(PR(**{**_pr("o", "d", 1).model_dump(), "url": "not-a-url"}))
+    pr_dao = AsyncMock()
+    pr_dao.list_open.return_value = prs
+
+    poller = PRStatusPoller(pr_dao, service)
+    await poller._poll_open_prs()
+
+    # Two batches for repo "a", one each for "b" and "c"; the invalid URL is skipped
+    assert len(requests) == 4
+    updated = {call.args for call in pr_dao.update_status.await_args_list}
+    expected = {
+        (f"{repo}-{n}", "merged")
+        for repo, top in (("a", 150), ("b", 30))
+        for n in range(10, top + 1, 10)
+    }
+    assert updated == expected
+    await service.aclose()
+
+
+@pytest.mark.asyncio
+async def test_stop_cancels_in_flight_poll(test_db: Database) -> None:
+    started = asyncio.Event()
+
+    async def slow_statuses(*args: object, **kwargs: object) -> dict:
+        started.set()
+        await asyncio.sleep(3600)
+        return {}
+
+    github = AsyncMock()
+    github.get_pull_request_statuses.side_effect = slow_statuses
+    pr_dao = AsyncMock()
+    pr_dao.list_open.return_value = [_pr("o", "a", 1), _pr("o", "b", 2)]
+
+    poller = PRStatusPoller(pr_dao, github)
+    poller.start()
+    await asyncio.wait_for(started.wait(), 1)
+    await asyncio.wait_for(poller.stop(), 1)
+
+    assert poller._task is None
+    pr_dao.update_status.assert_not_awaited()
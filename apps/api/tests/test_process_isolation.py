@@ -0,0 +1,152 @@
+"""Tests for executor process isolation and resource accounting."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from zloth_api.domain.enums import ExecutorType
+from zloth_api.domain.models import RunResourceUsage
+from zloth_api.executors.process_isolation import ProcessIsolator, merge_usage
+
+pytestmark = pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Linux only")
+
+
+def _alive(pid: int) -> bool:
+    try:
+        stat = Path(f"/proc/{pid}/stat").read_text()
+    except OSError:
+        return False
+    return stat.rpartition(")")[2].split()[0] != "Z"
+
+
+@pytest.mark.asyncio
+async def test_rlimit_mode_kills_process_tree_and_samples_usage() -> None:
+    isolator = ProcessIsolator(mode="rlimit", sample_interval=0.05)
+    assert isolator.mode == "rlimit"
+
+    # The shell leaves a background child behind and prints its PID
+    isolated = await isolator.spawn(
+        ["sh", "-c", "sleep 30 & echo $!; i=0; while [ $i -lt 20000 ]; do i=$((i+1)); done"],
+        ExecutorType.CLAUDE_CODE,
+        stdout=asyncio.subprocess.PIPE,
+    )
+    assert isolated.process.stdout is not None
+    child_pid = int((await isolated.process.stdout.readline()).decode())
+    await asyncio.sleep(0.2)
+    assert os.getpgid(child_pid) == isolated.pid
+
+    usage = await isolated.finish()
+    assert usage is not None and usage.isolation == "rlimit"
+    assert usage.peak_memory_bytes and usage.peak_memory_bytes > 0
+    for _ in range(50):
+        if not _alive(child_pid):
+            break
+        await asyncio.sleep(0.02)
+    assert not _alive(child_pid)
+    assert await isolated.finish() is usage
+
+
+@pytest.mark.asyncio
+async def test_rlimit_mode_limits_children_started_right_away(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        "zloth_api.executors.process_isolation.settings.executor_resource_limits",
+        {"codex_cli": {"memory_max_mb": 512, "cpu_weight": 50}},
+    )
+    isolator = ProcessIsolator(mode="rlimit", sample_interval=0.05)
+
+    # The child is started before the parent could be limited after exec
+    isolated = await isolator.spawn(
+        ["sh", "-c", "sleep 30 & echo $!; wait"],
+        ExecutorType.CODEX_CLI,
+        stdout=asyncio.subprocess.PIPE,
+    )
+    assert isolated.process.stdout is not None
+    child_pid = int((await isolated.process.stdout.readline()).decode())
+    limits = Path(f"/proc/{child_pid}/limits").read_text()
+    (data_line,) = [line for line in limits.splitlines() if line.startswith("Max data size")]
+    assert data_line.split()[3:5] == [str(512 * 1024 * 1024)] * 2
+    # The wrapper execs the CLI, and the CLI is niced (cpu.weight 50 -> nice 3)
+    assert os.getpgid(child_pid) == isolated.pid
+    fields = Path(f"/proc/{child_pid}/stat").read_text().rpartition(")")[2].split()
+    assert int(fields[16]) == os.getpriority(os.PRIO_PROCESS, 0) + 3
+    await isolated.finish()
+
+
+@pytest.mark.asyncio
+async def test_cgroup_mode_applies_limits_and_reads_usage(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # A fake delegated cgroup v2 hierarchy: the limit files exist, the kernel does not
+    (tmp_path / "cgroup.controllers").write_text("cpu memory pids io\n")
+    root = tmp_path / "zloth"
+    monkeypatch.setattr(
+        "zloth_api.executors.process_isolation.settings.executor_resource_limits",
+        {"codex_cli": {"memory_max_mb": 256, "pids_max": 0}},
+    )
+    original_mkdir = Path.mkdir
+
+    def mkdir_with_interface_files(self: Path, *args: object, **kwargs: object) -> None:
+        original_mkdir(self, *args, **kwargs)  # type: ignore[arg-type]
+        if self.parent == root:
+            for name in ("cpu.weight", "memory.max", "pids.max", "cgroup.procs"):
+                (self / name).write_text("max\n")
+
+    monkeypatch.setattr(Path, "mkdir", mkdir_with_interface_files)
+
+    isolator = ProcessIsolator(mode="auto", cgroup_root=root)
+    assert isolator.mode == "cgroup"
+    assert (root / "cgroup.subtree_control").exists()
+
+    isolated = await isolator.spawn(["true"], ExecutorType.CODEX_CLI)
+    cgroup = isolated.cgroup_path
+    assert cgroup is not None and cgroup.parent == root
+    assert (cgroup / "cpu.weight").read_text() == "50"
+    assert (cgroup / "memory.max").read_text() == str(256 * 1024 * 1024)
+    assert (cgroup / "pids.max").read_text() == "max\n"  # 0 = unlimited
+
+    await isolated.process.wait()
+    # The wrapper joined the cgroup before exec
+    assert (cgroup / "cgroup.procs").read_text().strip() == str(isolated.pid)
+
+    (cgroup / "memory.peak").write_text("1048576\n")
+    (cgroup / "cpu.stat").write_text("usage_usec 3500000\nuser_usec 2500000\nsystem_usec 1000000\n")
+    (cgroup / "io.stat").write_text(
+        "8:0 rbytes=4096 wbytes=8192 rios=1 wios=2\n8:16 rbytes=1 wbytes=2 rios=1 wios=1\n"
+    )
+    # finish() reads the usage first; the fake directory is then emptied so that
+    # removing the cgroup succeeds, as it would on a real cgroupfs
+    finishing = asyncio.create_task(isolated.finish())
+    while not finishing.done():
+        await asyncio.sleep(0.01)
+        for path in cgroup.glob("*"):
+            path.unlink()
+    assert await finishing == RunResourceUsage(
+        isolation="cgroup",
+        peak_memory_bytes=1048576,
+        cpu_user_seconds=2.5,
+        cpu_system_seconds=1.0,
+        io_read_bytes=4097,
+        io_write_bytes=8194,
+    )
+    assert not cgroup.exists()
+
+
+def test_merge_usage_adds_times_and_keeps_peak() -> None:
+    first = RunResourceUsage(isolation="rlimit", peak_memory_bytes=300, cpu_user_seconds=1.0)
+    second = RunResourceUsage(
+        isolation="rlimit", peak_memory_bytes=200, cpu_user_seconds=0.5, io_read_bytes=10
+    )
+
+    merged = merge_usage(first, second)
+    assert merged is not None
+    assert merged.peak_memory_bytes == 300
+    assert merged.cpu_user_seconds == 1.5
+    assert merged.io_read_bytes == 10
+    assert merge_usage(None, second) is second
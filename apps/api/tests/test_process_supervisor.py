@@ -0,0 +1,78 @@
+"""Tests for the executor process supervisor (timeouts and stall events)."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+
+import pytest
+
+from zloth_api.domain.enums import ExecutorType
+from zloth_api.executors.process_isolation import IsolatedProcess, ProcessIsolator
+from zloth_api.executors.process_supervisor import ProcessSupervisor
+
+pytestmark = pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Linux only")
+
+
+async def _spawn(script: str) -> IsolatedProcess:
+    isolator = ProcessIsolator(mode="off")
+    return await isolator.spawn(
+        ["sh", "-c", script], ExecutorType.CLAUDE_CODE, stdout=asyncio.subprocess.PIPE
+    )
+
+
+async def _collect(lines: list[bytes], line: bytes) -> None:
+    lines.append(line)
+
+
+@pytest.mark.asyncio
+async def test_stall_event_then_resume_and_exit_code() -> None:
+    isolated = await _spawn("echo one; sleep 0.5; echo two; exit 3")
+    lines: list[bytes] = []
+    events: list[str] = []
+
+    async def on_event(event: str, message: str) -> None:
+        events.append(event)
+
+    supervisor = ProcessSupervisor(10, idle_timeout=5, stall_warning=0.2, grace_seconds=1)
+    result = await supervisor.run(isolated, lambda line: _collect(lines, line), on_event)
+
+    assert lines == [b"one\n", b"two\n"]
+    assert events == ["stalled", "resumed"]
+    assert not result.timed_out and result.error is None
+    assert result.returncode == 3
+    await isolated.finish()
+
+
+@pytest.mark.asyncio
+async def test_idle_timeout_terminates_with_sigterm_first() -> None:
+    # The CLI traps SIGTERM and reports it, so the soft termination is observable
+    isolated = await _spawn("trap 'echo terminated; exit 143' TERM; echo started; sleep 30 & wait")
+    lines: list[bytes] = []
+
+    supervisor = ProcessSupervisor(10, idle_timeout=0.3, stall_warning=0, grace_seconds=2)
+    started = time.monotonic()
+    result = await supervisor.run(isolated, lambda line: _collect(lines, line))
+
+    assert time.monotonic() - started < 2
+    assert result.timeout == "idle"
+    assert result.error == "No output for 0.3 seconds; the CLI was terminated as stalled"
+    assert result.returncode == 143
+    assert lines == [b"started\n"]
+    await isolated.finish()
+
+
+@pytest.mark.asyncio
+async def test_total_timeout_kills_after_grace_period() -> None:
+    # SIGTERM is ignored, so the tree has to be killed
+    isolated = await _spawn("trap '' TERM; while true; do echo tick; sleep 0.05; done")
+
+    supervisor = ProcessSupervisor(0.4, idle_timeout=5, stall_warning=0, grace_seconds=0.2)
+    result = await supervisor.run(isolated, lambda line: asyncio.sleep(0))
+
+    assert result.timeout == "total"
+    assert result.error == "Execution timed out after 0.4 seconds"
+    assert result.returncode == -9
+    assert result.output_lines > 0
+    await isolated.finish()
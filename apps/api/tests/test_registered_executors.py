@@ -0,0 +1,138 @@
+"""Tests that services accept any executor in the registry, not only the built-in CLIs."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Self
+from unittest.mock import AsyncMock
+
+import pytest
+
+from zloth_api.domain.enums import ExecutorType, ReviewStatus, RunStatus
+from zloth_api.domain.models import Repo, Review, RunCreate
+from zloth_api.executors import registry
+from zloth_api.executors.base_executor import BaseExecutor, ExecutorResult, OutputCallback
+from zloth_api.executors.process_supervisor import EventCallback
+from zloth_api.services.repo_service import RepoService
+from zloth_api.services.review_service import ReviewService
+from zloth_api.services.run_service import RunService
+from zloth_api.services.workspace_adapters import ExecutionWorkspaceInfo
+from zloth_api.services.workspace_service import WorkspaceService
+from zloth_api.storage.dao import JobDAO, MessageDAO, RepoDAO, ReviewDAO, RunDAO, TaskDAO
+from zloth_api.storage.db import Database
+
+REVIEW_JSON = {
+    "overall_summary": "Looks good",
+    "overall_score": 0.8,
+    "feedbacks": [],
+}
+
+
+class StubExecutor(BaseExecutor):
+    """Executor registered under a type none of the built-in CLIs use."""
+
+    executor_type = ExecutorType.PATCH_AGENT
+    display_name = "Stub"
+    calls: list[dict[str, Any]] = []
+
+    @classmethod
+    def from_settings(cls, **options: Any) -> Self:
+        return cls()
+
+    async def _execute(
+        self,
+        worktree_path: Path,
+        instruction: str,
+        on_output: OutputCallback | None,
+        resume_session_id: str | None,
+        read_only: bool,
+        on_event: EventCallback | None,
+        session_key: str | None,
+    ) -> ExecutorResult:
+        self.calls.append({"worktree_path": worktree_path, "read_only": read_only})
+        return ExecutorResult(
+            success=True,
+            summary="",
+            patch="",
+            files_changed=[],
+            logs=[json.dumps(REVIEW_JSON)],
+        )
+
+
+@pytest.fixture
+def stub_executor(monkeypatch: pytest.MonkeyPatch) -> type[StubExecutor]:
+    monkeypatch.setitem(registry._EXECUTORS, ExecutorType.PATCH_AGENT, StubExecutor)
+    monkeypatch.setattr(StubExecutor, "calls", [])
+    return StubExecutor
+
+
+@pytest.mark.asyncio
+async def test_registered_executor_runs_and_reviews(
+    tmp_path: Path, test_db: Database, stub_executor: type[StubExecutor]
+) -> None:
+    repo = await RepoDAO(test_db).create("https://github.com/o/r", "main", "abc", "/tmp/src")
+    task = await TaskDAO(test_db).create(repo_id=repo.id)
+    run_dao = RunDAO(test_db)
+    repo_service = AsyncMock(spec=RepoService)
+    repo_service.get.return_value = repo
+    run_service = RunService(
+        run_dao=run_dao,
+        task_dao=TaskDAO(test_db),
+        job_dao=JobDAO(test_db),
+        repo_service=repo_service,
+        workspace_service=WorkspaceService(workspaces_dir=tmp_path / "workspaces"),
+    )
+
+    async def create_workspace(
+        run_id: str, repo: Repo, base_ref: str, sparse_paths: list[str] | None = None
+    ) -> ExecutionWorkspaceInfo:
+        return ExecutionWorkspaceInfo(
+            path=tmp_path / f"run_{run_id}",
+            branch_name=f"zloth/{run_id[:8]}",
+            base_branch=base_ref,
+            created_at=datetime.utcnow(),
+        )
+
+    run_service.workspace_manager.create_workspace = create_workspace  # type: ignore[method-assign]
+
+    runs = await run_service.create_runs(
+        task.id, RunCreate(instruction="do it", executor_types=[ExecutorType.PATCH_AGENT])
+    )
+
+    assert [(run.executor_type, run.status) for run in runs] == [
+        (ExecutorType.PATCH_AGENT, RunStatus.QUEUED)
+    ]
+
+    # A review by the registered executor goes through the executor, not the
+    # built-in fallback analysis
+    review_dao = ReviewDAO(test_db)
+    review = await review_dao.create(
+        Review(
+            id="review-1",
+            task_id=task.id,
+            target_run_ids=[runs[0].id],
+            executor_type=ExecutorType.PATCH_AGENT,
+            model_id=None,
+            model_name=None,
+            status=ReviewStatus.QUEUED,
+            created_at=datetime.utcnow(),
+        )
+    )
+    review_service = ReviewService(
+        review_dao=review_dao,
+        run_dao=run_dao,
+        task_dao=TaskDAO(test_db),
+        message_dao=MessageDAO(test_db),
+        job_dao=JobDAO(test_db),
+    )
+
+    await review_service._execute_review(review, runs)
+
+    assert [call["read_only"] for call in stub_executor.calls] == [True]
+    stored = await review_dao.get(review.id)
+    assert stored is not None
+    assert stored.status == ReviewStatus.SUCCEEDED
+    assert stored.overall_summary == "Looks good"
+    assert stored.overall_score == 0.8
@@ -0,0 +1,149 @@
+"""Tests for sparse checkout profiles and partial clone workspaces."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import git
+import pytest
+
+from zloth_api.services.sparse_checkout import (
+    find_paths_outside_cone,
+    is_in_sparse_cone,
+    normalize_sparse_paths,
+)
+from zloth_api.services.workspace_service import WorkspaceService
+
+_GIT_USER_NAME = "Test User"
+_GIT_USER_EMAIL = "test@example.com"
+
+
+def _configure_git_identity(repo: git.Repo) -> None:
+    """Set ``user.name`` and ``user.email`` on a repo (local scope)."""
+    with repo.config_writer() as cw:
+        cw.set_value("user", "name", _GIT_USER_NAME)
+        cw.set_value("user", "email", _GIT_USER_EMAIL)
+
+
+def _create_monorepo_remote(tmp_path: Path) -> Path:
+    """Create a bare remote with a few top-level service directories."""
+    seed_path = tmp_path / "_seed"
+    seed_repo = git.Repo.init(seed_path)
+    _configure_git_identity(seed_repo)
+    seed_repo.git.checkout("-b", "main")
+
+    files = {
+        "README.md": "# Monorepo\n",
+        "services/api/main.py": "print('api')\n",
+        "services/web/app.ts": "console.log('web')\n",
+        "libs/shared/util.py": "VALUE = 1\n",
+    }
+    for rel, content in files.items():
+        path = seed_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    seed_repo.index.add(list(files))
+    seed_repo.index.commit("Initial commit")
+
+    remote_path = tmp_path / "remote.git"
+    remote = git.Repo.clone_from(str(seed_path), str(remote_path), bare=True)
+    # Required for --filter=blob:none against a local remote
+    with remote.config_writer() as cw:
+        cw.set_value("uploadpack", "allowFilter", "true")
+    return remote_path
+
+
+class TestNormalizeSparsePaths:
+    def test_files_become_parent_directories(self) -> None:
+        assert normalize_sparse_paths(["services/api/main.py", "libs/shared/"]) == [
+            "libs/shared",
+            "services/api",
+        ]
+
+    def test_drops_root_files_globs_and_parent_refs(self) -> None:
+        assert normalize_sparse_paths(["README.md", "src/*.py", "../etc", "", "/"]) == []
+
+    def test_keeps_dot_directories_and_removes_nested(self) -> None:
+        assert normalize_sparse_paths([".github", "services", "services/api/x.py"]) == [
+            ".github",
+            "services",
+        ]
+
+
+class TestIsInSparseCone:
+    def test_cone_membership(self) -> None:
+        cone = ["services/api"]
+        assert is_in_sparse_cone("README.md", cone)
+        assert is_in_sparse_cone("services/api/main.py", cone)
+        assert is_in_sparse_cone("services/api/deep/mod.py", cone)
+        # Immediate files of ancestors are included in cone mode
+        assert is_in_sparse_cone("services/BUILD", cone)
+        assert not is_in_sparse_cone("services/web/app.ts", cone)
+        assert not is_in_sparse_cone("libs/shared/util.py", cone)
+
+
+class TestSparseWorkspace:
+    @pytest.mark.asyncio
+    async def test_create_workspace_with_sparse_profile(self, tmp_path: Path) -> None:
+        remote_path = _create_monorepo_remote(tmp_path)
+        service = WorkspaceService(workspaces_dir=tmp_path / "workspaces")
+
+        info = await service.create_workspace(
+            repo_url=str(remote_path),
+            base_branch="main",
+            run_id="sparse01",
+            auth_url=f"file://{remote_path}",
+            sparse_paths=["services/api/main.py"],
+        )
+
+        assert (info.path / "README.md").exists()
+        assert (info.path / "services/api/main.py").exists()
+        assert not (info.path / "services/web").exists()
+        assert not (info.path / "libs").exists()
+        assert await service.get_sparse_paths(info.path) == ["services/api"]
+
+        repo = git.Repo(info.path)
+        assert repo.git.config("--get", "remote.origin.promisor") == "true"
+        assert repo.active_branch.name == info.branch_name
+
+    @pytest.mark.asyncio
+    async def test_new_files_outside_cone_are_hydrated_before_staging(self, tmp_path: Path) -> None:
+        remote_path = _create_monorepo_remote(tmp_path)
+        service = WorkspaceService(workspaces_dir=tmp_path / "workspaces")
+        info = await service.create_workspace(
+            repo_url=str(remote_path),
+            base_branch="main",
+            run_id="sparse02",
+            auth_url=f"file://{remote_path}",
+            sparse_paths=["services/api"],
+        )
+        _configure_git_identity(git.Repo(info.path))
+
+        new_file = info.path / "libs/shared/new_module.py"
+        new_file.parent.mkdir(parents=True, exist_ok=True)
+        new_file.write_text("NEW = True\n")
+        assert find_paths_outside_cone(git.Repo(info.path)) == ["libs/shared/new_module.py"]
+
+        added = await service.hydrate_sparse_checkout(info.path)
+        assert added == ["libs/shared"]
+        # Existing tracked files of the hydrated directory are materialized lazily
+        assert (info.path / "libs/shared/util.py").read_text() == "VALUE = 1\n"
+
+        await service.stage_all(info.path)
+        diff = await service.get_diff(info.path, staged=True)
+        assert "libs/shared/new_module.py" in diff
+
+    @pytest.mark.asyncio
+    async def test_full_checkout_without_profile(self, tmp_path: Path) -> None:
+        remote_path = _create_monorepo_remote(tmp_path)
+        service = WorkspaceService(workspaces_dir=tmp_path / "workspaces")
+        info = await service.create_workspace(
+            repo_url=str(remote_path),
+            base_branch="main",
+            run_id="full0001",
+            auth_url=f"file://{remote_path}",
+        )
+
+        assert (info.path / "services/web/app.ts").exists()
+        assert await service.get_sparse_paths(info.path) is None
+        assert await service.hydrate_sparse_checkout(info.path, paths=["libs/x"]) == []
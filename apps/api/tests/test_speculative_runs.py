@@ -0,0 +1,205 @@
+"""Tests for speculative coding runs (first acceptable result wins)."""
+
+from __future__ import annotations
+
+import sys
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from pydantic import ValidationError
+
+from zloth_api.config import Settings
+from zloth_api.domain.enums import ExecutorType, ReviewStatus, RunStatus
+from zloth_api.domain.models import FileDiff, ReviewCreate, Run, RunCreate
+from zloth_api.services.speculative_runs import SpeculativeRunner
+
+
+def _run(run_id: str, executor_type: ExecutorType, worktree: Path) -> Run:
+    return Run(
+        id=run_id,
+        task_id="task-1",
+        model_id=None,
+        model_name=None,
+        provider=None,
+        executor_type=executor_type,
+        instruction="Add a feature",
+        base_ref="main",
+        status=RunStatus.RUNNING,
+        worktree_path=str(worktree),
+        working_branch=f"zloth/{run_id}",
+        created_at=datetime.utcnow(),
+    )
+
+
+class FakeRunService:
+    """Runs finish when a test moves them to a terminal status."""
+
+    def __init__(self, runs: list[Run]):
+        self.runs = {run.id: run for run in runs}
+        self.created: list[RunCreate] = []
+        self.cancelled: list[str] = []
+        self.cleaned_up: list[str] = []
+
+    async def create_runs(self, task_id: str, data: RunCreate) -> list[Run]:
+        self.created.append(data)
+        return list(self.runs.values())
+
+    async def get(self, run_id: str) -> Run:
+        return self.runs[run_id]
+
+    def finish(self, run_id: str, status: RunStatus, *, changed: bool = True) -> None:
+        run = self.runs[run_id]
+        files = [FileDiff(path="app.py", added_lines=1)] if changed else []
+        self.runs[run_id] = run.model_copy(update={"status": status, "files_changed": files})
+
+    async def cancel(self, run_id: str) -> bool:
+        if self.runs[run_id].status != RunStatus.RUNNING:
+            return False
+        self.cancelled.append(run_id)
+        self.finish(run_id, RunStatus.CANCELED)
+        return True
+
+    async def cleanup_workspace(self, run_id: str) -> bool:
+        self.cleaned_up.append(run_id)
+        return True
+
+
+@pytest.mark.asyncio
+async def test_first_acceptable_run_wins_and_the_rest_are_cancelled(tmp_path: Path) -> None:
+    for name in ("a", "b", "c", "d"):
+        (tmp_path / name).mkdir()
+    runs = FakeRunService(
+        [
+            _run("run-a", ExecutorType.CLAUDE_CODE, tmp_path / "a"),
+            _run("run-b", ExecutorType.CODEX_CLI, tmp_path / "b"),
+            _run("run-c", ExecutorType.CLAUDE_CODE, tmp_path / "c"),
+            _run("run-d", ExecutorType.GEMINI_CLI, tmp_path / "d"),
+        ]
+    )
+    (tmp_path / "b" / "broken").touch()
+    task_dao = AsyncMock()
+    task_dao.get.return_value = SimpleNamespace(workspace_path=None, working_branch=None)
+    runner = SpeculativeRunner(
+        runs,  # type: ignore[arg-type]
+        AsyncMock(),
+        task_dao,
+        # The check fails in workspace "b"
+        check_command=f"{sys.executable} -c \"import os; exit(os.path.exists('broken'))\"",
+        check_timeout_seconds=30,
+        poll_interval=0.01,
+    )
+    types = [run.executor_type for run in runs.runs.values()]
+    assert await runner.can_speculate("task-1", types)
+
+    # A and D fail, B fails its check and C made no changes: nothing is accepted
+    runs.finish("run-a", RunStatus.FAILED)
+    runs.finish("run-b", RunStatus.SUCCEEDED)
+    runs.finish("run-c", RunStatus.SUCCEEDED, changed=False)
+    runs.finish("run-d", RunStatus.FAILED)
+    result = await runner.run("task-1", "Add a feature", types)
+
+    assert result.winner is None
+    assert "no changes" in result.error and "check failed" in result.error
+    assert runs.cancelled == [] and runs.cleaned_up == []
+
+    # C succeeds with changes while D is still stuck: D is cancelled, the
+    # finished runs' workspaces are cleaned up and C's becomes the task's
+    runs.finish("run-c", RunStatus.SUCCEEDED)
+    runs.finish("run-d", RunStatus.RUNNING)
+    result = await runner.run("task-1", "Add a feature", types)
+
+    assert result.winner is not None and result.winner.id == "run-c"
+    assert result.cancelled_run_ids == ["run-d"]
+    assert sorted(runs.cleaned_up) == ["run-a", "run-b"]
+    task_dao.update_workspace.assert_awaited_once_with(
+        "task-1", workspace_path=str(tmp_path / "c"), working_branch="zloth/run-c"
+    )
+    assert runs.created[-1].executor_types == types
+
+
+class FakeReviewService:
+    """Reviews of run-a finish at once; the others stay queued until cancelled."""
+
+    def __init__(self) -> None:
+        self.reviews: dict[str, SimpleNamespace] = {}
+        self.cancelled: list[str] = []
+
+    async def create_review(self, task_id: str, data: ReviewCreate) -> SimpleNamespace:
+        run_id = data.target_run_ids[0]
+        done = run_id == "run-a"
+        review = SimpleNamespace(
+            id=f"review-{run_id}",
+            status=ReviewStatus.SUCCEEDED if done else ReviewStatus.QUEUED,
+            overall_score=0.9,
+        )
+        self.reviews[review.id] = review
+        return review
+
+    async def get(self, review_id: str) -> SimpleNamespace:
+        return self.reviews[review_id]
+
+    async def cancel_review(self, review_id: str) -> bool:
+        review = self.reviews[review_id]
+        if review.status != ReviewStatus.QUEUED:
+            return False
+        self.cancelled.append(review_id)
+        review.status = ReviewStatus.CANCELED
+        return True
+
+
+@pytest.mark.asyncio
+async def test_losing_fast_reviews_are_cancelled(tmp_path: Path) -> None:
+    runs = FakeRunService(
+        [
+            _run("run-a", ExecutorType.CLAUDE_CODE, tmp_path),
+            _run("run-b", ExecutorType.CODEX_CLI, tmp_path),
+        ]
+    )
+    runs.finish("run-a", RunStatus.SUCCEEDED)
+    runs.finish("run-b", RunStatus.SUCCEEDED)
+    reviews = FakeReviewService()
+    runner = SpeculativeRunner(
+        runs,  # type: ignore[arg-type]
+        reviews,  # type: ignore[arg-type]
+        AsyncMock(),
+        check_command="",
+        poll_interval=0.01,
+    )
+
+    result = await runner.run(
+        "task-1",
+        "Add a feature",
+        [ExecutorType.CLAUDE_CODE, ExecutorType.CODEX_CLI],
+        review=True,
+        min_review_score=0.5,
+    )
+
+    assert result.winner is not None and result.winner.id == "run-a"
+    assert reviews.cancelled == ["review-run-b"]
+
+
+@pytest.mark.asyncio
+async def test_no_speculation_on_a_fixed_workspace() -> None:
+    task_dao = AsyncMock()
+    task_dao.get.return_value = SimpleNamespace(workspace_path="/ws", working_branch="b")
+    runner = SpeculativeRunner(AsyncMock(), AsyncMock(), task_dao)
+    types = [ExecutorType.CLAUDE_CODE, ExecutorType.CODEX_CLI]
+    assert not await runner.can_speculate("task-1", types)
+    task_dao.get.return_value = SimpleNamespace(workspace_path=None, working_branch=None)
+    assert not await runner.can_speculate("task-1", types[:1])
+
+
+def test_unknown_speculative_executor_is_rejected_at_startup(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("ZLOTH_AGENTIC_SPECULATIVE_EXECUTORS", '["claude_code", "codex"]')
+    with pytest.raises(ValidationError):
+        Settings()
+    monkeypatch.setenv("ZLOTH_AGENTIC_SPECULATIVE_EXECUTORS", '["claude_code", "codex_cli"]')
+    assert Settings().agentic_speculative_executors == [
+        ExecutorType.CLAUDE_CODE,
+        ExecutorType.CODEX_CLI,
+    ]
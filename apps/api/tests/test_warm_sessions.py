@@ -0,0 +1,99 @@
+"""Tests for long-lived (warm) Claude Code sessions."""
+
+from __future__ import annotations
+
+import stat
+import sys
+from pathlib import Path
+
+import pytest
+
+from zloth_api.domain.enums import ExecutorType
+from zloth_api.executors.claude_code_executor import ClaudeCodeExecutor, ClaudeCodeOptions
+from zloth_api.executors.process_isolation import ProcessIsolator
+from zloth_api.executors.warm_sessions import WarmSessionPool
+from zloth_api.services.executor_admission import ExecutorAdmissionController
+
+pytestmark = pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Linux only")
+
+SESSION = "0b7c6c8e-3f7a-4a51-9d1e-2f4e0c1d9a10"
+
+# Answers every stream-json input line with one assistant text and a result,
+# reporting its PID and turn number
+FAKE_CLI = f"""#!{sys.executable}
+import json, os, sys
+
+for turn, _ in enumerate(sys.stdin, 1):
+    text = f"pid {{os.getpid()}} turn {{turn}}"
+    content = [{{"type": "text", "text": text}}]
+    print(json.dumps({{"type": "assistant", "message": {{"content": content}}}}))
+    print(json.dumps({{"type": "result", "session_id": "{SESSION}", "num_turns": turn}}))
+    sys.stdout.flush()
+"""
+
+
+@pytest.fixture
+def executor(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> ClaudeCodeExecutor:
+    monkeypatch.setattr(
+        "zloth_api.executors.claude_code_executor.settings.executor_warm_sessions", True
+    )
+    monkeypatch.setattr("zloth_api.executors.output_spool.settings.data_dir", tmp_path)
+    cli = tmp_path / "claude"
+    cli.write_text(FAKE_CLI)
+    cli.chmod(cli.stat().st_mode | stat.S_IEXEC)
+    return ClaudeCodeExecutor(
+        ClaudeCodeOptions(claude_cli_path=str(cli)),
+        admission=ExecutorAdmissionController(max_concurrent=1),
+        isolator=ProcessIsolator(mode="off"),
+        warm_sessions=WarmSessionPool(ttl_seconds=600, max_sessions=2),
+    )
+
+
+@pytest.mark.asyncio
+async def test_follow_up_reuses_the_running_cli(
+    executor: ClaudeCodeExecutor, tmp_path: Path
+) -> None:
+    pool = executor.warm_sessions
+    displayed: list[str] = []
+
+    async def on_output(text: str) -> None:
+        displayed.append(text)
+
+    first = await executor.execute(tmp_path, "first", on_output=on_output, session_key="task-1")
+    assert first.success and first.session_id == SESSION
+    assert len(pool) == 1
+
+    second = await executor.execute(
+        tmp_path, "second", on_output=on_output, resume_session_id=SESSION, session_key="task-1"
+    )
+    assert second.success
+    assert second.stats is not None and second.stats.num_turns == 2
+    pid = displayed[0].split()[1]
+    assert displayed == [f"pid {pid} turn 1", f"pid {pid} turn 2"]
+
+    # A different conversation (or a fresh one) recycles the session
+    third = await executor.execute(tmp_path, "third", on_output=on_output, session_key="task-1")
+    assert third.success
+    assert displayed[-1].endswith("turn 1") and displayed[-1] != displayed[0]
+    assert len(pool) == 1
+
+    await pool.close_all()
+    assert len(pool) == 0
+
+
+@pytest.mark.asyncio
+async def test_idle_sessions_are_recycled(executor: ClaudeCodeExecutor, tmp_path: Path) -> None:
+    pool = executor.warm_sessions
+    for task in ("task-1", "task-2", "task-3"):
+        assert (await executor.execute(tmp_path, "go", session_key=task)).success
+    # At most max_sessions are kept; the least recently used went first
+    assert len(pool) == 2
+    assert await pool.checkout(("task-1", ExecutorType.CLAUDE_CODE)) is None
+
+    session = await pool.checkout(("task-2", ExecutorType.CLAUDE_CODE))
+    assert session is not None and session.alive
+    await pool.checkin(session)
+
+    pool.ttl_seconds = 0
+    assert await pool.reap_idle() == 2
+    assert not session.alive and len(pool) == 0
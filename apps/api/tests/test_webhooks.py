@@ -0,0 +1,205 @@
+"""Tests for signed GitHub webhook ingestion."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import hmac
+import json
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from zloth_api.config import settings
+from zloth_api.domain.models import PR, CIResult, WebhookIngestResponse
+from zloth_api.routes import webhooks
+from zloth_api.services.ci_polling_service import CIPollingService
+from zloth_api.services.pr_status_poller import PRStatusPoller
+from zloth_api.services.webhook_service import WebhookService
+from zloth_api.storage.dao import WebhookDeliveryDAO
+from zloth_api.storage.db import Database
+
+FIXTURES = Path(__file__).parent / "fixtures" / "webhooks"
+SECRET = "test-secret"
+REPO_URL = "https://github.com/octo-org/hello-world"
+
+
+def _fixture(name: str) -> bytes:
+    return (FIXTURES / name).read_bytes()
+
+
+def _pr(number: int = 42, status: str = "open") -> PR:
+    return PR(
+        id=f"pr-{number}",
+        task_id="task-1",
+        number=number,
+        url=f"{REPO_URL}/pull/{number}",
+        branch="zloth/add-login",
+        title="Add login page",
+        body=None,
+        latest_commit="d6fde92930d4715a2b49857d24b940956b26d2d3",
+        status=status,
+        created_at=datetime(2024, 5, 1),
+        updated_at=datetime(2024, 5, 1),
+    )
+
+
+def _service(
+    test_db: Database,
+    ci_poller: CIPollingService | MagicMock | None = None,
+    pr_dao: AsyncMock | None = None,
+) -> WebhookService:
+    pr_dao = pr_dao or AsyncMock()
+    return WebhookService(
+        delivery_dao=WebhookDeliveryDAO(test_db),
+        pr_dao=pr_dao,
+        ci_check_dao=AsyncMock(),
+        ci_polling_service=ci_poller or MagicMock(),
+        pr_status_poller=PRStatusPoller(pr_dao, AsyncMock()),
+        ci_check_service=AsyncMock(),
+    )
+
+
+def _headers(body: bytes, event: str, delivery_id: str, secret: str = SECRET) -> dict[str, str]:
+    signature = "sha256=" + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    return {
+        "X-GitHub-Event": event,
+        "X-GitHub-Delivery": delivery_id,
+        "X-Hub-Signature-256": signature,
+    }
+
+
+@pytest.mark.asyncio
+async def test_route_verifies_and_deduplicates(
+    test_db: Database, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "webhook_secret", SECRET)
+    service = _service(test_db)
+    service.dispatch = AsyncMock()  # type: ignore[method-assign]
+
+    app = FastAPI()
+    app.include_router(webhooks.router, prefix="/v1")
+    app.dependency_overrides[webhooks.get_webhook_service] = lambda: service
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+    body = _fixture("check_suite_completed.json")
+    url = "/v1/webhooks/github"
+
+    response = await client.post(
+        url, content=body, headers=_headers(body, "check_suite", "d-1", "bad")
+    )
+    assert response.status_code == 401
+
+    response = await client.post(url, content=body, headers=_headers(body, "check_suite", "d-1"))
+    assert response.status_code == 202
+    assert response.json()["status"] == "accepted"
+
+    # GitHub redelivery of the same delivery ID is acknowledged but not processed again
+    response = await client.post(url, content=body, headers=_headers(body, "check_suite", "d-1"))
+    assert response.json()["status"] == "duplicate"
+
+    response = await client.post(url, content=b"{}", headers=_headers(b"{}", "issues", "d-2"))
+    assert response.json()["status"] == "ignored"
+
+    headers = _headers(body, "check_suite", "d-3")
+    del headers["X-GitHub-Delivery"]
+    response = await client.post(url, content=body, headers=headers)
+    assert response.status_code == 400
+
+    await client.aclose()
+    await service.drain()
+    service.dispatch.assert_awaited_once()
+    delivery = await WebhookDeliveryDAO(test_db).get("d-1")
+    assert delivery is not None
+    assert (delivery.event, delivery.action, delivery.status) == (
+        "check_suite",
+        "completed",
+        "processed",
+    )
+
+
+@pytest.mark.asyncio
+async def test_check_suite_event_triggers_immediate_ci_check(test_db: Database) -> None:
+    github = AsyncMock()
+    github.get_pull_request_statuses.return_value = {
+        42: {"head_sha": "d6fde92930d4715a2b49857d24b940956b26d2d3", "ci_state": "success"}
+    }
+    github._github_request.return_value = {
+        "check_runs": [{"name": "test", "conclusion": "success"}]
+    }
+    ci_poller = CIPollingService(github)
+    # Without the webhook the PR would not be polled for minutes
+    ci_poller._min_interval = ci_poller._poll_interval = ci_poller._max_interval = 600
+
+    results: list[CIResult] = []
+    completed = asyncio.Event()
+
+    async def on_complete(result: CIResult) -> None:
+        results.append(result)
+        completed.set()
+
+    await ci_poller.start_polling("task-1", 42, "octo-org/hello-world", on_complete)
+    pr_dao = AsyncMock()
+    pr_dao.get_by_url.return_value = _pr()
+    service = _service(test_db, ci_poller, pr_dao)
+    service.ci_check_dao.get_latest_pending_by_pr_id.return_value = object()
+
+    result = await service.ingest("d-1", "check_suite", _fixture("check_suite_completed.json"))
+    assert result == WebhookIngestResponse(
+        status="accepted", event="check_suite", delivery_id="d-1"
+    )
+    await asyncio.wait_for(completed.wait(), 1)
+
+    assert results[0].success
+    github.get_pull_request_statuses.assert_awaited_once()
+    pr_dao.get_by_url.assert_awaited_with(f"{REPO_URL}/pull/42")
+    service.ci_check_service.check_ci.assert_awaited_once_with("task-1", "pr-42", force=True)
+    await service.drain()
+    await ci_poller.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_pr_and_push_events(test_db: Database) -> None:
+    ci_poller = MagicMock()
+    pr_dao = AsyncMock()
+    pr_dao.get_by_url.return_value = _pr()
+    pr_dao.list_open_by_branch.return_value = [_pr()]
+    service = _service(test_db, ci_poller, pr_dao)
+
+    await service.dispatch("pull_request", json.loads(_fixture("pull_request_closed.json")))
+    pr_dao.update_status.assert_awaited_once_with("pr-42", "merged")
+
+    await service.dispatch("push", json.loads(_fixture("push.json")))
+    pr_dao.list_open_by_branch.assert_awaited_once_with(REPO_URL, "zloth/add-login")
+    ci_poller.notify_event.assert_called_with("octo-org/hello-world", pr_numbers=[42])
+
+    await service.dispatch("status", json.loads(_fixture("status.json")))
+    ci_poller.notify_event.assert_called_with(
+        "octo-org/hello-world", head_sha="d6fde92930d4715a2b49857d24b940956b26d2d3"
+    )
+
+
+@pytest.mark.asyncio
+async def test_unprocessed_deliveries_are_replayed(test_db: Database) -> None:
+    dao = WebhookDeliveryDAO(test_db)
+    body = _fixture("check_run_completed.json").decode()
+    assert await dao.create_if_absent("d-1", "check_run", "completed", body)
+    assert not await dao.create_if_absent("d-1", "check_run", "completed", body)
+
+    ci_poller = MagicMock()
+    service = _service(test_db, ci_poller)
+    service.pr_dao.get_by_url.return_value = None
+
+    assert await service.replay_pending() == 1
+    ci_poller.notify_event.assert_called_once_with(
+        "octo-org/hello-world",
+        pr_numbers=[42],
+        head_sha="d6fde92930d4715a2b49857d24b940956b26d2d3",
+    )
+    delivery = await dao.get("d-1")
+    assert delivery is not None and delivery.status == "processed"
+    assert await service.replay_pending() == 0
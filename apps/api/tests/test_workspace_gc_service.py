@@ -0,0 +1,167 @@
+"""Tests for the workspace garbage collector."""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+import git
+import pytest
+
+from zloth_api.config import settings
+from zloth_api.domain.enums import ExecutorType, RunStatus, TaskBaseKanbanStatus
+from zloth_api.services.git_service import GitService
+from zloth_api.services.workspace_gc_service import WorkspaceGCService
+from zloth_api.services.workspace_service import WorkspaceService
+from zloth_api.storage.dao import RepoDAO, RunDAO, TaskDAO, WorkspaceUsageDAO
+from zloth_api.storage.db import Database
+
+
+def _make_dir(path: Path, size: int = 4096, age_seconds: int = 0) -> Path:
+    path.mkdir(parents=True)
+    (path / "data.bin").write_bytes(b"x" * size)
+    if age_seconds:
+        old = time.time() - age_seconds
+        os.utime(path, (old, old))
+    return path
+
+
+@pytest.fixture
+def gc_env(tmp_path: Path, test_db: Database) -> tuple[WorkspaceGCService, Path]:
+    workspaces_dir = tmp_path / "workspaces"
+    workspaces_dir.mkdir()
+    workspace_service = WorkspaceService(workspaces_dir=workspaces_dir)
+    git_service = GitService(workspaces_dir=workspaces_dir, worktrees_dir=tmp_path / "worktrees")
+    service = WorkspaceGCService(WorkspaceUsageDAO(test_db), workspace_service, git_service)
+    return service, workspaces_dir
+
+
+async def _task_with_workspace(
+    db: Database,
+    repo_id: str,
+    path: Path,
+    *,
+    status: RunStatus = RunStatus.SUCCEEDED,
+    archived: bool = False,
+) -> str:
+    task_dao = TaskDAO(db)
+    run_dao = RunDAO(db)
+    task = await task_dao.create(repo_id=repo_id, title="t")
+    await task_dao.update_workspace(task.id, workspace_path=str(path), working_branch="zloth/x")
+    if archived:
+        await task_dao.update_kanban_status(task.id, TaskBaseKanbanStatus.ARCHIVED)
+    run = await run_dao.create(
+        task_id=task.id,
+        instruction="do it",
+        executor_type=ExecutorType.CLAUDE_CODE,
+        worktree_path=str(path),
+    )
+    await run_dao.update_status(run.id, status)
+    return task.id
+
+
+@pytest.mark.asyncio
+async def test_reclaims_old_orphans_only(
+    gc_env: tuple[WorkspaceGCService, Path], test_db: Database
+) -> None:
+    service, workspaces_dir = gc_env
+    old_orphan = _make_dir(workspaces_dir / "run_orphan01", age_seconds=7200)
+    young_orphan = _make_dir(workspaces_dir / "run_orphan02")
+    not_a_workspace = _make_dir(workspaces_dir / "some-repo-clone", age_seconds=7200)
+
+    # A run row exists but its workspace is still being cloned
+    repo = await RepoDAO(test_db).create("https://github.com/o/r", "main", "abc", "/tmp/src")
+    task = await TaskDAO(test_db).create(repo_id=repo.id)
+    run = await RunDAO(test_db).create(task_id=task.id, instruction="x")
+    in_flight = _make_dir(workspaces_dir / f"run_{run.id}", age_seconds=7200)
+
+    stats = await service.sweep()
+
+    assert not old_orphan.exists()
+    assert young_orphan.exists()
+    assert not_a_workspace.exists()
+    assert in_flight.exists()
+    assert stats.orphans_removed == 1
+    assert stats.orphan_bytes > 0
+
+
+@pytest.mark.asyncio
+async def test_quota_evicts_lru_and_skips_busy(
+    gc_env: tuple[WorkspaceGCService, Path],
+    test_db: Database,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    service, workspaces_dir = gc_env
+    repo = await RepoDAO(test_db).create("https://github.com/o/r", "main", "abc", "/tmp/src")
+
+    busy = _make_dir(workspaces_dir / "run_busy", size=64 * 1024)
+    await _task_with_workspace(test_db, repo.id, busy, status=RunStatus.RUNNING, archived=True)
+    oldest = _make_dir(workspaces_dir / "run_oldest", size=64 * 1024)
+    await _task_with_workspace(test_db, repo.id, oldest, archived=True)
+    newest = _make_dir(workspaces_dir / "run_newest", size=64 * 1024)
+    await _task_with_workspace(test_db, repo.id, newest, archived=True)
+    active = _make_dir(workspaces_dir / "run_active", size=64 * 1024)
+    await _task_with_workspace(test_db, repo.id, active)
+
+    # Quota allows three and a half of the four 64 KiB workspaces
+    monkeypatch.setattr(settings, "workspace_quota_gb", 224 * 1024 / 1024**3)
+    monkeypatch.setattr(settings, "workspace_repo_quota_gb", 0.0)
+
+    stats = await service.sweep()
+
+    assert busy.exists()
+    assert not oldest.exists()
+    assert newest.exists()
+    assert active.exists()  # recently used, not archived -> never evictable
+    assert stats.evicted_workspaces == 1
+
+    usage = await service.get_usage()
+    assert usage.workspace_count == 3
+    assert usage.repos[0].repo_id == repo.id
+    assert usage.total_bytes <= (usage.quota_bytes or 0)
+
+
+@pytest.mark.asyncio
+async def test_keeps_workspace_with_unpushed_changes(
+    gc_env: tuple[WorkspaceGCService, Path],
+    test_db: Database,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    service, workspaces_dir = gc_env
+    repo = await RepoDAO(test_db).create("https://github.com/o/r", "main", "abc", "/tmp/src")
+
+    path = workspaces_dir / "run_unpushed"
+    work = git.Repo.init(path)
+    with work.config_writer() as cw:
+        cw.set_value("user", "name", "Test User")
+        cw.set_value("user", "email", "test@example.com")
+    (path / "file.txt").write_text("local only\n")
+    work.index.add(["file.txt"])
+    work.index.commit("Local commit")
+    await _task_with_workspace(test_db, repo.id, path, archived=True)
+
+    monkeypatch.setattr(settings, "workspace_quota_gb", 1 / 1024**3)
+
+    stats = await service.sweep()
+
+    assert path.exists()
+    assert stats.evicted_workspaces == 0
+    assert stats.skipped_unpushed == 1
+
+
+@pytest.mark.asyncio
+async def test_expires_unused_seed_clones(gc_env: tuple[WorkspaceGCService, Path]) -> None:
+    service, workspaces_dir = gc_env
+    expired = _make_dir(
+        workspaces_dir / ".seeds" / "repo1-main",
+        age_seconds=(settings.workspace_seed_expiry_hours + 1) * 3600,
+    )
+    fresh = _make_dir(workspaces_dir / ".seeds" / "repo1-dev")
+
+    stats = await service.sweep()
+
+    assert not expired.exists()
+    assert fresh.exists()
+    assert stats.seeds_removed == 1
+    assert stats.seed_bytes > 0
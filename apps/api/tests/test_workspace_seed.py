@@ -0,0 +1,153 @@
+"""Tests for shared seed clones used to prepare run workspaces in parallel."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import git
+import pytest
+
+from zloth_api.domain.enums import ExecutorType, RunStatus
+from zloth_api.domain.models import Repo, RunCreate
+from zloth_api.services.repo_service import RepoService
+from zloth_api.services.run_service import RunService
+from zloth_api.services.run_workspace_manager import RunWorkspaceManager
+from zloth_api.services.workspace_adapters import CloneWorkspaceAdapter, ExecutionWorkspaceInfo
+from zloth_api.services.workspace_service import WorkspaceService
+from zloth_api.storage.dao import JobDAO, RepoDAO, RunDAO, TaskDAO
+from zloth_api.storage.db import Database
+
+
+def _create_remote(tmp_path: Path) -> Path:
+    seed_path = tmp_path / "_src"
+    src = git.Repo.init(seed_path)
+    with src.config_writer() as cw:
+        cw.set_value("user", "name", "Test User")
+        cw.set_value("user", "email", "test@example.com")
+    src.git.checkout("-b", "main")
+    (seed_path / "README.md").write_text("# Repo\n")
+    src.index.add(["README.md"])
+    src.index.commit("Initial commit")
+    remote_path = tmp_path / "remote.git"
+    git.Repo.clone_from(str(seed_path), str(remote_path), bare=True)
+    return remote_path
+
+
+def _repo(remote: Path) -> Repo:
+    return Repo(
+        id="repo1",
+        repo_url=str(remote),
+        default_branch="main",
+        latest_commit="abc",
+        workspace_path=str(remote),
+        created_at=datetime.utcnow(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_workspaces_fork_from_seed(tmp_path: Path) -> None:
+    remote = _create_remote(tmp_path)
+    service = WorkspaceService(workspaces_dir=tmp_path / "workspaces")
+
+    seed = await service.prepare_seed(str(remote), "main", "repo1-main")
+    infos = await asyncio.gather(
+        *(
+            service.create_workspace(str(remote), "main", f"run{i}xxxxxx", seed_path=seed)
+            for i in range(3)
+        )
+    )
+
+    assert len({info.path for info in infos}) == 3
+    for info in infos:
+        work = git.Repo(info.path)
+        assert work.active_branch.name == info.branch_name
+        assert work.remotes.origin.url == str(remote)
+        assert (info.path / "README.md").exists()
+        assert work.git.rev_parse("origin/main") == git.Repo(remote).git.rev_parse("main")
+
+    # A refresh picks up new commits on the base branch
+    pusher = git.Repo.clone_from(str(remote), tmp_path / "pusher")
+    with pusher.config_writer() as cw:
+        cw.set_value("user", "name", "Test User")
+        cw.set_value("user", "email", "test@example.com")
+    (tmp_path / "pusher" / "new.txt").write_text("new\n")
+    pusher.index.add(["new.txt"])
+    pusher.index.commit("New commit")
+    pusher.remotes.origin.push("main")
+
+    await service.prepare_seed(str(remote), "main", "repo1-main")
+    info = await service.create_workspace(str(remote), "main", "run9xxxxxx", seed_path=seed)
+    assert (info.path / "new.txt").exists()
+
+
+@pytest.mark.asyncio
+async def test_prepare_base_fetches_once_for_concurrent_runs(tmp_path: Path) -> None:
+    remote = _create_remote(tmp_path)
+    service = WorkspaceService(workspaces_dir=tmp_path / "workspaces")
+    adapter = CloneWorkspaceAdapter(service, AsyncMock())
+    prepare_seed = AsyncMock(wraps=service.prepare_seed)
+    service.prepare_seed = prepare_seed  # type: ignore[method-assign]
+    manager = RunWorkspaceManager(run_dao=AsyncMock(), workspace_adapter=adapter, git_service=None)
+
+    repo = _repo(remote)
+    infos = await asyncio.gather(
+        *(manager.create_workspace(f"run{i}xxxxxx", repo, "main") for i in range(3))
+    )
+
+    assert prepare_seed.await_count == 1
+    assert len({info.path for info in infos}) == 3
+    assert all((info.path / "README.md").exists() for info in infos)
+
+
+@pytest.mark.asyncio
+async def test_parallel_create_runs_records_failed_workspace(
+    tmp_path: Path, test_db: Database
+) -> None:
+    repo = await RepoDAO(test_db).create("https://github.com/o/r", "main", "abc", "/tmp/src")
+    task = await TaskDAO(test_db).create(repo_id=repo.id)
+    run_dao = RunDAO(test_db)
+    repo_service = AsyncMock(spec=RepoService)
+    repo_service.get.return_value = repo
+    service = RunService(
+        run_dao=run_dao,
+        task_dao=TaskDAO(test_db),
+        job_dao=JobDAO(test_db),
+        repo_service=repo_service,
+        workspace_service=WorkspaceService(workspaces_dir=tmp_path / "workspaces"),
+    )
+
+    async def create_workspace(
+        run_id: str, repo: Repo, base_ref: str, sparse_paths: list[str] | None = None
+    ) -> ExecutionWorkspaceInfo:
+        run = await run_dao.get(run_id)
+        assert run is not None
+        if run.executor_type == ExecutorType.CODEX_CLI:
+            raise RuntimeError("clone failed")
+        return ExecutionWorkspaceInfo(
+            path=tmp_path / f"run_{run_id}",
+            branch_name=f"zloth/{run_id[:8]}",
+            base_branch=base_ref,
+            created_at=datetime.utcnow(),
+        )
+
+    service.workspace_manager.create_workspace = create_workspace  # type: ignore[method-assign]
+
+    runs = await service.create_runs(
+        task.id,
+        RunCreate(
+            instruction="do it",
+            executor_types=[ExecutorType.CLAUDE_CODE, ExecutorType.CODEX_CLI],
+        ),
+    )
+
+    by_executor = {run.executor_type: run for run in runs}
+    assert by_executor[ExecutorType.CLAUDE_CODE].status == RunStatus.QUEUED
+    failed = by_executor[ExecutorType.CODEX_CLI]
+    assert failed.status == RunStatus.FAILED
+    assert failed.error and "clone failed" in failed.error
+    updated_task = await TaskDAO(test_db).get(task.id)
+    assert updated_task is not None
+    assert updated_task.workspace_path == by_executor[ExecutorType.CLAUDE_CODE].worktree_path
@@ -155,6 +155,7 @@ export interface OutputLine {
   line_number: number;
   content: string;
   timestamp: number;
+  event?: string | null; // Process event such as "stalled" (null for CLI output)
 }
 
 // Pull Request
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Benchmark the unified diff parser against the previous line-splitting parser.
+
+Generates a synthetic multi-megabyte ``git diff`` and reports wall time
+(best of N) and peak traced memory for:
+  - legacy: the previous ``split("\\n")`` / ``"\\n".join`` implementation
+    (formerly duplicated in diff_parser, BaseExecutor and PatchAgent)
+  - parse_unified_diff: offset-based parser, materializing FileDiff patches
+  - iter_unified_diff: offset-based parser, spans only (no patch strings)
+  - iter_diff_stream: incremental parsing from 64 KiB chunks
+
+Usage:
+    python scripts/bench_diff_parser.py
+    python scripts/bench_diff_parser.py --files 2000 --lines 400 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "apps" / "api" / "src"))
+
+from zloth_api.domain.models import FileDiff  # noqa: E402
+from zloth_api.services.diff_parser import (  # noqa: E402
+    iter_diff_stream,
+    iter_unified_diff,
+    parse_unified_diff,
+)
+
+
+def legacy_parse_unified_diff(diff: str) -> list[FileDiff]:
+    """The previous parser, kept verbatim for comparison."""
+    files: list[FileDiff] = []
+    current_file: str | None = None
+    current_patch_lines: list[str] = []
+    added_lines = 0
+    removed_lines = 0
+
+    for line in (diff or "").split("\n"):
+        if line.startswith("--- a/"):
+            if current_file:
+                files.append(
+                    FileDiff(
+                        path=current_file,
+                        added_lines=added_lines,
+                        removed_lines=removed_lines,
+                        patch="\n".join(current_patch_lines),
+                    )
+                )
+            current_patch_lines = [line]
+            current_file = None
+            added_lines = 0
+            removed_lines = 0
+        elif line.startswith("+++ b/"):
+            current_file = line[6:]
+            current_patch_lines.append(line)
+        elif line.startswith("--- /dev/null"):
+            current_patch_lines = [line]
+            current_file = None
+            added_lines = 0
+            removed_lines = 0
+        elif current_file:
+            current_patch_lines.append(line)
+            if line.startswith("+") and not line.startswith("+++"):
+                added_lines += 1
+            elif line.startswith("-") and not line.startswith("---"):
+                removed_lines += 1
+
+    if current_file:
+        files.append(
+            FileDiff(
+                path=current_file,
+                added_lines=added_lines,
+                removed_lines=removed_lines,
+                patch="\n".join(current_patch_lines),
+            )
+        )
+    return files
+
+
+def make_diff(num_files: int, lines_per_file: int) -> bytes:
+    """Build a synthetic git diff with modified, added and renamed files."""
+    out: list[str] = []
+    for i in range(num_files):
+        path = f"src/pkg{i % 50}/module_{i}.py"
+        out.append(f"diff --git a/{path} b/{path}")
+        out.append("index 1234567..89abcde 100644")
+        out.append(f"--- a/{path}")
+        out.append(f"+++ b/{path}")
+        for h in range(0, lines_per_file, 20):
+            out.append(f"@@ -{h + 1},20 +{h + 1},20 @@ def func_{h}():")
+            for j in range(10):
+                out.append(f"     value_{j} = compute({h}, {j})  # context line")
+            for j in range(5):
+                out.append(f"-    old_{j} = legacy_call({i}, {j})")
+                out.append(f"+    new_{j} = modern_call({i}, {j}, flag=True)")
+    return ("\n".join(out) + "\n").encode()
+
+
+def measure(fn: Callable[[], Any], repeat: int) -> tuple[float, float]:
+    """Return (best wall time in ms, peak traced memory in MiB)."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best * 1000, peak / 1024**2
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--files", type=int, default=1000, help="Number of changed files")
+    parser.add_argument("--lines", type=int, default=200, help="Diff lines per file")
+    parser.add_argument("--repeat", type=int, default=3, help="Timing repetitions")
+    args = parser.parse_args()
+
+    diff_bytes = make_diff(args.files, args.lines)
+    diff_str = diff_bytes.decode()
+    chunk = 64 * 1024
+
+    def stream() -> int:
+        chunks = (diff_bytes[i : i + chunk] for i in range(0, len(diff_bytes), chunk))
+        return sum(1 for _ in iter_diff_stream(chunks))
+
+    cases: list[tuple[str, Callable[[], Any]]] = [
+        ("legacy (split/join)", lambda: legacy_parse_unified_diff(diff_str)),
+        ("parse_unified_diff", lambda: parse_unified_diff(diff_str)),
+        ("iter_unified_diff", lambda: list(iter_unified_diff(diff_bytes))),
+        ("iter_diff_stream", stream),
+    ]
+
+    counts = {len(legacy_parse_unified_diff(diff_str)), len(parse_unified_diff(diff_bytes))}
+    print(f"Diff size: {len(diff_bytes) / 1024**2:.1f} MiB, files: {counts}")
+    print(f"{'parser':<22}{'time (ms)':>12}{'peak (MiB)':>14}")
+    for name, fn in cases:
+        elapsed, peak = measure(fn, args.repeat)
+        print(f"{name:<22}{elapsed:>12.1f}{peak:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Send a signed GitHub webhook delivery to a local zloth API.
+
+Stands in for GitHub when developing the webhook ingestion path: the payload
+is signed with HMAC-SHA256 (``X-Hub-Signature-256``) like GitHub does, and a
+delivery ID is attached so deduplication can be exercised by resending with
+the same ``--delivery-id``.
+
+Usage:
+    # Send a recorded payload (event inferred from the file name)
+    python scripts/send_webhook.py apps/api/tests/fixtures/webhooks/check_suite_completed.json
+
+    # Explicit event, secret and delivery ID
+    python scripts/send_webhook.py payload.json --event push --secret s3cret \\
+        --delivery-id 72d3162e-cc78-11e3-81ab-4c9367dc0958
+
+The secret defaults to ZLOTH_WEBHOOK_SECRET; the server must run with
+ZLOTH_WEBHOOKS_ENABLED=true and the same secret.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import hmac
+import os
+import re
+import sys
+import uuid
+from pathlib import Path
+
+import httpx
+
+DEFAULT_URL = "http://localhost:8000/v1/webhooks/github"
+KNOWN_EVENTS = ("check_suite", "check_run", "pull_request", "status", "push")
+
+
+def infer_event(path: Path) -> str | None:
+    """Infer the event name from a fixture file name (e.g. check_run_completed.json)."""
+    for event in sorted(KNOWN_EVENTS, key=len, reverse=True):
+        if re.match(rf"{event}(_|$)", path.stem):
+            return event
+    return None
+
+
+def sign(secret: str, body: bytes) -> str:
+    """Compute the X-Hub-Signature-256 header value."""
+    return "sha256=" + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("payload", type=Path, help="JSON payload file")
+    parser.add_argument("--url", default=DEFAULT_URL, help=f"Webhook URL (default: {DEFAULT_URL})")
+    parser.add_argument(
+        "--secret",
+        default=os.environ.get("ZLOTH_WEBHOOK_SECRET", ""),
+        help="Webhook secret (default: $ZLOTH_WEBHOOK_SECRET)",
+    )
+    parser.add_argument("--event", help="X-GitHub-Event (default: inferred from file name)")
+    parser.add_argument("--delivery-id", help="X-GitHub-Delivery (default: random UUID)")
+    args = parser.parse_args()
+
+    event = args.event or infer_event(args.payload)
+    if not event:
+        print(f"Cannot infer event from {args.payload.name}; pass --event", file=sys.stderr)
+        return 2
+    if not args.secret:
+        print("No secret given; set ZLOTH_WEBHOOK_SECRET or pass --secret", file=sys.stderr)
+        return 2
+
+    body = args.payload.read_bytes()
+    delivery_id = args.delivery_id or str(uuid.uuid4())
+    headers = {
+        "Content-Type": "application/json",
+        "User-Agent": "GitHub-Hookshot/zloth-dev",
+        "X-GitHub-Event": event,
+        "X-GitHub-Delivery": delivery_id,
+        "X-Hub-Signature-256": sign(args.secret, body),
+    }
+
+    response = httpx.post(args.url, content=body, headers=headers, timeout=10)
+    print(f"{response.status_code} {event} {delivery_id}")
+    print(response.text)
+    return 0 if response.is_success else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())